@@ -211,10 +211,70 @@ const BiddingList = {
         this.loadStats();
         this.loadBiddingList();
         
+        // Subscribe to live bidding changes (목록/통계 polling 대신 push)
+        this.connectLive();
+        
         // Update UI based on login state
         this.updateAuthUI();
     },
     
+    liveSource: null,
+    liveReloadTimer: null,
+    
+    /**
+     * Subscribe to /api/live/biddings (Server-Sent Events)
+     * 입찰 수/평균가는 해당 행만 갱신, 상태/마감 변경은 목록과 통계를 다시 조회
+     */
+    connectLive() {
+        if (typeof EventSource === 'undefined') return;
+        
+        if (this.liveSource) this.liveSource.close();
+        
+        const params = new URLSearchParams();
+        if (this.filters.shipping_type) params.append('shipping_type', this.filters.shipping_type);
+        
+        this.liveSource = new EventSource(`${QUOTE_API_BASE}/api/live/biddings?${params}`);
+        this.liveSource.addEventListener('bidding', (e) => this.applyLiveEvent(JSON.parse(e.data)));
+        this.liveSource.addEventListener('resync', () => this.scheduleLiveReload());
+    },
+    
+    /**
+     * Apply a pushed bidding snapshot to the visible row
+     */
+    applyLiveEvent(event) {
+        const row = document.querySelector(`#biddingTableBody tr[data-bidding-id="${event.bidding_id}"]`);
+        
+        if (row && row.dataset.status === event.status) {
+            const bidCount = row.querySelector('.bid-count');
+            const avgPrice = row.querySelector('.avg-price');
+            if (bidCount) bidCount.textContent = event.bid_count;
+            if (avgPrice) {
+                avgPrice.textContent = event.avg_bid_price
+                    ? `$${Math.round(event.avg_bid_price).toLocaleString('en-US')}`
+                    : '-';
+            }
+            this.scheduleLiveReload(true);
+            return;
+        }
+        
+        // 새 비딩이거나 상태/마감이 바뀜 → 현재 필터로 다시 조회
+        this.scheduleLiveReload();
+    },
+    
+    /**
+     * Debounce reloads when several events arrive together
+     * @param {boolean} statsOnly - 통계만 다시 조회
+     */
+    scheduleLiveReload(statsOnly = false) {
+        if (this.liveReloadTimer && statsOnly) return;
+        clearTimeout(this.liveReloadTimer);
+        this.liveReloadTimer = setTimeout(() => {
+            this.liveReloadTimer = null;
+            this.loadStats();
+            if (!statsOnly) this.loadBiddingList();
+        }, 1000);
+    },
+    
     /**
      * Load freight codes from API
      * @param {string} shippingType - ocean, air, truck (optional)
@@ -508,6 +568,7 @@ const BiddingList = {
         this.filters.search = document.getElementById('filterSearch').value.trim();
         this.currentPage = 1;
         this.loadBiddingList();
+        this.connectLive();
     },
 
     /**
@@ -633,7 +694,7 @@ const BiddingList = {
             : '-';
 
         return `
-            <tr class="${rowClass}">
+            <tr class="${rowClass}" data-bidding-id="${item.id}" data-status="${effectiveStatus}">
                 <td>
                     <span class="bidding-no ${isExpired ? 'expired-text' : ''}" onclick="BiddingList.openDetailModal('${item.bidding_no}')">
                         ${item.bidding_no}
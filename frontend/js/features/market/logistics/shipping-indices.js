@@ -38,6 +38,9 @@ const INDEX_DESCRIPTIONS = {
     bdi: 'The Baltic Dry Index (BDI) has been used by the Baltic Exchange since November 1, 1999, replacing the BFI (Baltic Freight Index) which tracked dry cargo freight rates since 1985. Using January 4, 1985 as the base (1000), it is a composite index of time charter rates by vessel type: Baltic Capesize Index (BCI), Baltic Panamax Index (BPI), Baltic Supramax Index (BSI), and Baltic Handysize Index (BHSI). The BDI is calculated by averaging these four indices with equal weights and multiplying by the BDI factor.'
 };
 
+// Server-side LTTB downsampling target (about one point per 2px of chart width)
+const SHIPPING_CHART_MAX_POINTS = 600;
+
 // Chart colors
 const INDEX_COLORS = {
     scfi: '#3B82F6',  // Blue
@@ -55,7 +58,7 @@ const INDEX_COLORS = {
 async function fetchShippingIndexChartData(indexType, period) {
     try {
         const response = await fetch(
-            `${SHIPPING_INDICES_API_BASE}/${indexType}/chart-data?period=${period}`
+            `${SHIPPING_INDICES_API_BASE}/${indexType}/chart-data?period=${period}&max_points=${SHIPPING_CHART_MAX_POINTS}&compact=true`
         );
         
         if (!response.ok) {
@@ -81,7 +84,7 @@ function renderShippingIndexChart(indexType, chartData) {
     const svgId = `${indexType}-chart-svg`;
     const svg = document.getElementById(svgId);
     
-    if (!svg || !chartData || !chartData.data || chartData.data.length === 0) {
+    if (!svg || !chartData || !chartData.values || chartData.values.length === 0) {
         console.warn(`No data available for ${indexType.toUpperCase()} chart`);
         return;
     }
@@ -348,8 +351,11 @@ function updateShippingIndexUI(indexType, chartData) {
     if (!chartData || !chartData.stats) return;
     
     const stats = chartData.stats;
-    const data = chartData.data || [];
-    const latest = data.length > 0 ? data[data.length - 1] : null;
+    const values = chartData.values || [];
+    const labels = chartData.labels || [];
+    const latest = values.length > 0
+        ? { current_index: values[values.length - 1], index_date: labels[labels.length - 1] }
+        : null;
     
     // Update main value
     const mainValueEl = document.getElementById(`${indexType}-chart-main-value`);
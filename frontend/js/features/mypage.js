@@ -15,6 +15,27 @@ const MyPage = {
         this.checkAuth();
         this.setupNavigation();
         this.loadDashboard();
+        this.connectLive();
+    },
+    
+    /**
+     * Subscribe to message/notification arrivals (unread badge polling 대신 push)
+     */
+    connectLive() {
+        if (typeof EventSource === 'undefined' || !this.currentUser) return;
+        
+        const params = new URLSearchParams({
+            user_type: this.currentUser.userType,
+            user_id: this.currentUser.id,
+            biddings: false
+        });
+        const source = new EventSource(`${this.API_BASE}/live/biddings?${params}`);
+        
+        source.addEventListener('inbox', (e) => {
+            const event = JSON.parse(e.data);
+            if (event.kind === 'message') this.loadMessages();
+            if (this.currentSection === 'dashboard') this.loadDashboard();
+        });
     },
     
     /**
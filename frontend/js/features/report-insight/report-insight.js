@@ -355,6 +355,9 @@ function renderFeaturedCard(report) {
 function renderReportCard(report) {
     const isBookmarked = bookmarkedIds.has(report.id);
     const hasPdf = report.has_pdf || (report.file && report.file.download_url);
+    // Search highlights arrive HTML-escaped with matches wrapped in <mark>
+    const titleHtml = report.highlight?.title || escapeHtml(report.title);
+    const summaryHtml = report.highlight?.summary || escapeHtml(report.summary || '');
     
     return `
         <div class="report-card" onclick="viewReport('${report.id}')">
@@ -377,8 +380,8 @@ function renderReportCard(report) {
             <div class="report-card-body">
                 <span class="report-card-category ${report.category}">${formatCategory(report.category)}</span>
                 <div class="report-card-org">${escapeHtml(report.organization)}</div>
-                <div class="report-card-title">${escapeHtml(report.title)}</div>
-                <div class="report-card-summary">${escapeHtml(report.summary || '')}</div>
+                <div class="report-card-title">${titleHtml}</div>
+                <div class="report-card-summary">${summaryHtml}</div>
                 <div class="report-card-footer">
                     <span class="report-card-date">
                         <i class="fas fa-calendar"></i>
@@ -481,6 +484,16 @@ function searchReports() {
     const searchInput = document.getElementById('searchInput');
     currentSearch = searchInput ? searchInput.value.trim() : '';
     currentPage = 1;
+    
+    // Rank search results by relevance; go back to newest when the search is cleared
+    const sortSelect = document.getElementById('sortSelect');
+    if (currentSearch && currentSort === 'newest') {
+        currentSort = 'relevance';
+    } else if (!currentSearch && currentSort === 'relevance') {
+        currentSort = 'newest';
+    }
+    if (sortSelect) sortSelect.value = currentSort;
+    
     loadReports();
 }
 
@@ -522,11 +535,15 @@ function clearFilters() {
     currentSearch = '';
     currentCategory = 'all';
     currentPage = 1;
+    if (currentSort === 'relevance') currentSort = 'newest';
     
     // Reset UI
     const searchInput = document.getElementById('searchInput');
     if (searchInput) searchInput.value = '';
     
+    const sortSelect = document.getElementById('sortSelect');
+    if (sortSelect) sortSelect.value = currentSort;
+    
     const dateFromInput = document.getElementById('dateFrom');
     if (dateFromInput) dateFromInput.value = '';
     
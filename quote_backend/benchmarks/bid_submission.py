@@ -0,0 +1,161 @@
+"""
+Bid Submission Benchmark
+동시 입찰 제출: 기존 5회 조회 + INSERT 경로 vs 캐시 확인 + 조건부 INSERT … SELECT
+
+- legacy: 포워더 조회 → 비딩 조회 → 마감 확인 → 기존 입찰 조회 → INSERT (이전 구현, 유니크 제약 없음)
+- conditional: main.submit_bid (validation_cache + INSERT … SELECT … RETURNING + 유니크 제약)
+
+같은 (비딩, 포워더) 조합을 여러 스레드가 동시에 제출하도록 시도 횟수를 겹치게 만들어
+중복 입찰 수와 초당 처리량을 비교합니다.
+
+Usage (quote_backend 디렉토리에서):
+    python -m benchmarks.bid_submission
+    python -m benchmarks.bid_submission --threads 16 --biddings 50 --forwarders 40 --repeat 2
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import create_engine, func, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base, configure_engine, run_write  # noqa: E402
+from models import Bid, Bidding, Forwarder, QuoteRequest  # noqa: E402
+from query_cache import validation_cache  # noqa: E402
+from schemas import BidCreate  # noqa: E402
+
+
+def _engine(db_path: str, unique: bool):
+    engine = configure_engine(create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False}))
+    Base.metadata.create_all(engine)
+    if not unique:
+        # legacy 스키마 재현: 유니크 제약 없는 bids
+        with engine.begin() as conn:
+            ddl = conn.exec_driver_sql("SELECT sql FROM sqlite_master WHERE name = 'bids'").scalar()
+            conn.exec_driver_sql("DROP TABLE bids")
+            conn.exec_driver_sql(re.sub(r",\s*CONSTRAINT uq_bid_bidding_forwarder UNIQUE \([^)]*\)", "", ddl))
+    return engine
+
+
+def seed(engine, biddings: int, forwarders: int):
+    deadline = datetime.now() + timedelta(days=3)
+    with engine.begin() as conn:
+        conn.execute(insert(QuoteRequest), [{
+            "id": i, "request_number": f"QR-{i:08d}", "trade_mode": "export", "shipping_type": "ocean",
+            "load_type": "FCL", "pol": "KRPUS", "pod": "USLAX", "etd": deadline, "customer_id": 1,
+        } for i in range(1, biddings + 1)])
+        conn.execute(insert(Bidding), [{
+            "id": i, "bidding_no": f"B{i:08d}", "quote_request_id": i, "status": "open", "deadline": deadline,
+        } for i in range(1, biddings + 1)])
+        conn.execute(insert(Forwarder), [{
+            "id": i, "company": f"FW{i}", "name": f"fw{i}", "email": f"fw{i}@example.com", "phone": "010",
+        } for i in range(1, forwarders + 1)])
+
+
+def legacy_submit_bid(bid_data: BidCreate, forwarder_id: int, db):
+    """이전 구현: 5회 조회 후 INSERT"""
+    forwarder = db.query(Forwarder).filter(Forwarder.id == forwarder_id).first()
+    if not forwarder:
+        raise HTTPException(status_code=404, detail="Forwarder not found")
+    bidding = db.query(Bidding).filter(Bidding.id == bid_data.bidding_id).first()
+    if not bidding:
+        raise HTTPException(status_code=404, detail="Bidding not found")
+    if bidding.status != "open":
+        raise HTTPException(status_code=400, detail="Bidding is not open for bids")
+    if bidding.deadline and datetime.now() > bidding.deadline:
+        raise HTTPException(status_code=400, detail="Bidding deadline has passed")
+    existing_bid = db.query(Bid).filter(
+        Bid.bidding_id == bid_data.bidding_id,
+        Bid.forwarder_id == forwarder_id
+    ).first()
+    if existing_bid:
+        raise HTTPException(status_code=400, detail="You have already submitted a bid.")
+    bid = Bid(bidding_id=bid_data.bidding_id, forwarder_id=forwarder_id, total_amount=bid_data.total_amount,
+              status="submitted", submitted_at=datetime.now())
+    db.add(bid)
+    run_write(db.commit)
+    db.refresh(bid)
+    return bid
+
+
+def run_mode(mode: str, tmp_dir: str, threads: int, biddings: int, forwarders: int, repeat: int) -> dict:
+    from main import submit_bid
+
+    engine = _engine(os.path.join(tmp_dir, f"{mode}.db"), unique=(mode == "conditional"))
+    seed(engine, biddings, forwarders)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    validation_cache.invalidate()
+    submit = legacy_submit_bid if mode == "legacy" else submit_bid
+
+    # 모든 (비딩, 포워더) 조합을 repeat번씩 → 같은 조합이 여러 스레드에서 겹침
+    attempts = [(b, f) for _ in range(repeat) for b in range(1, biddings + 1) for f in range(1, forwarders + 1)]
+    chunks = [attempts[i::threads] for i in range(threads)]
+    accepted = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        barrier.wait()
+        for bidding_id, forwarder_id in chunks[index]:
+            db = factory()
+            try:
+                submit(BidCreate(bidding_id=bidding_id, total_amount=1000.0), forwarder_id, db)
+                accepted[index] += 1
+            except HTTPException:
+                pass
+            finally:
+                db.close()
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    db = factory()
+    rows = db.query(func.count(Bid.id)).scalar()
+    pairs = db.query(Bid.bidding_id, Bid.forwarder_id).distinct().count()
+    db.close()
+    engine.dispose()
+
+    return {
+        "mode": mode,
+        "attempts": len(attempts),
+        "accepted": sum(accepted),
+        "duplicates": rows - pairs,
+        "seconds": round(elapsed, 3),
+        "attempts_per_sec": round(len(attempts) / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent bid submission benchmark")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--biddings", type=int, default=25)
+    parser.add_argument("--forwarders", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=2, help="submissions per (bidding, forwarder) pair")
+    args = parser.parse_args()
+
+    print(f"threads={args.threads} biddings={args.biddings} forwarders={args.forwarders} repeat={args.repeat}")
+    print(f"{'mode':<13}{'attempts':>10}{'accepted':>10}{'duplicates':>12}{'seconds':>10}{'attempts/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mode in ("legacy", "conditional"):
+            r = run_mode(mode, tmp_dir, args.threads, args.biddings, args.forwarders, args.repeat)
+            print(f"{r['mode']:<13}{r['attempts']:>10}{r['accepted']:>10}{r['duplicates']:>12}"
+                  f"{r['seconds']:>10}{r['attempts_per_sec']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Synthetic Data Generators
+벤치마크용 합성 마켓플레이스 데이터. 같은 seed면 항상 같은 데이터를 만듭니다.
+
+- 기준 데이터 (항구/컨테이너/트럭/인코텀즈 seed_data)
+- 화주 1명, 포워더, 견적 요청 + 화물 + 비딩 (최근 12개월, 상태 혼합)
+- 비딩마다 입찰 bids_per_bidding개, 낙찰 비딩은 낙찰 입찰 1개 + 나머지 rejected, 낙찰 비딩의 평점
+- 포워더 1의 알림 (최대 200개)
+
+이미 설정된 QUOTE_DATABASE_URL을 그대로 쓰므로 임시 DB를 가리키게 한 뒤 호출하세요.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict
+
+ROUTES = [("KRPUS", "USLAX"), ("KRPUS", "NLRTM"), ("CNSHA", "KRPUS"), ("KRPUS", "JPYOK"), ("KRPUS", "DEHAM"),
+          ("VNSGN", "KRPUS"), ("KRPUS", "SGSIN"), ("USNYC", "KRPUS"), ("KRPUS", "CNNBO"), ("KRPUS", "AEJEA")]
+
+# (shipping_type, load_type, 비딩 번호 운송 코드)
+MODES = [("ocean", "FCL", "SEA"), ("ocean", "FCL", "SEA"), ("ocean", "LCL", "SEA"), ("air", "AIR", "AIR"),
+         ("truck", "FTL", "TRK")]
+CONTAINER_TYPES = ["20GP", "40GP", "40HC", "40' HC", "20'GP", "45HC"]
+TRUCK_TYPES = ["1T", "5T", "11T", "25T"]
+
+
+def _cargo(rng: random.Random, quote_request_id: int, shipping_type: str, load_type: str) -> list:
+    rows = []
+    for row_index in range(rng.randint(1, 3)):
+        # executemany는 모든 행의 키가 같아야 해서 운송 방식별 컬럼도 None으로 채움
+        row = {"quote_request_id": quote_request_id, "row_index": row_index, "qty": rng.randint(1, 4),
+               "gross_weight": rng.randint(500, 20000), "cbm": round(rng.uniform(1, 60), 2),
+               "container_type": None, "truck_type": None, "chargeable_weight": None}
+        if load_type == "FCL":
+            row["container_type"] = rng.choice(CONTAINER_TYPES)
+        elif load_type == "FTL":
+            row["truck_type"] = rng.choice(TRUCK_TYPES)
+        elif shipping_type == "air":
+            row["chargeable_weight"] = rng.randint(50, 3000)
+        rows.append(row)
+    return rows
+
+
+def seed_marketplace(biddings: int, forwarders: int, bids_per_bidding: int, seed: int = 5) -> Dict:
+    """
+    기준 데이터 + 합성 비딩/입찰/평점을 저장합니다.
+
+    Returns:
+        {"customer_id", "forwarder_id", "bidding_no"} - 시나리오에서 쓸 대표 ID
+    """
+    from sqlalchemy import bindparam, insert, update
+
+    from database import SessionLocal, engine
+    from models import Bid, Bidding, CargoDetail, Customer, Forwarder, Notification, QuoteRequest, Rating
+    from seed_data import seed_container_types, seed_incoterms, seed_ports, seed_truck_types
+
+    db = SessionLocal()
+    try:
+        for seed_fn in (seed_ports, seed_container_types, seed_truck_types, seed_incoterms):
+            seed_fn(db)
+    finally:
+        db.close()
+
+    bids_per_bidding = min(bids_per_bidding, forwarders)
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    with engine.begin() as conn:
+        conn.execute(insert(Customer), [{
+            "id": 1, "company": "벤치마크화주(주)", "name": "화주", "email": "shipper@example.com", "phone": "010",
+        }])
+        conn.execute(insert(Forwarder), [{
+            "id": i, "company": f"포워더{i} 로지스틱스", "name": f"fw{i}", "email": f"fw{i}@example.com",
+            "phone": "02-000-0000", "rating": round(rng.uniform(3, 5), 1), "rating_count": rng.randint(0, 50),
+        } for i in range(1, forwarders + 1)])
+
+        quote_rows, bidding_rows, cargo_rows, bid_rows, awards, rating_rows = [], [], [], [], [], []
+        bid_id = 0
+        for i in range(1, biddings + 1):
+            pol, pod = rng.choice(ROUTES)
+            shipping_type, load_type, mode_code = rng.choice(MODES)
+            trade_mode = "import" if pod == "KRPUS" else "export"
+            created_at = now - timedelta(days=rng.randint(0, 360), minutes=rng.randint(0, 1440))
+            etd = created_at + timedelta(days=rng.randint(7, 45))
+            status = rng.choice(["open", "open", "awarded", "awarded", "expired", "closed"])
+            quote_rows.append({
+                "id": i, "request_number": f"QR-{i:08d}", "trade_mode": trade_mode,
+                "shipping_type": shipping_type, "load_type": load_type, "incoterms": "FOB",
+                "pol": pol, "pod": pod, "etd": etd, "eta": etd + timedelta(days=20),
+                "customer_id": 1, "status": "processing", "created_at": created_at,
+            })
+            bidding_rows.append({
+                "id": i, "bidding_no": f"{'IM' if trade_mode == 'import' else 'EX'}{mode_code}{i:05d}",
+                "quote_request_id": i, "status": status, "deadline": etd - timedelta(days=3),
+                "created_at": created_at,
+            })
+            cargo_rows.extend(_cargo(rng, i, shipping_type, load_type))
+
+            bidders = rng.sample(range(1, forwarders + 1), bids_per_bidding)
+            winner = bidders[0] if status == "awarded" and bidders else None
+            for forwarder_id in bidders:
+                bid_id += 1
+                amount = round(rng.uniform(800, 5000), 2)
+                bid_status = "submitted"
+                if winner is not None:
+                    bid_status = "awarded" if forwarder_id == winner else "rejected"
+                bid_rows.append({
+                    "id": bid_id, "bidding_id": i, "forwarder_id": forwarder_id, "total_amount": amount,
+                    "total_amount_krw": round(amount * 1350), "status": bid_status,
+                    "submitted_at": created_at + timedelta(hours=rng.randint(1, 72)),
+                })
+                if forwarder_id == winner:
+                    awards.append({"bidding_id": i, "bid_id": bid_id})
+                    rating_rows.append({
+                        "bidding_id": i, "forwarder_id": forwarder_id, "customer_id": 1,
+                        "score": rng.choice([3.0, 3.5, 4.0, 4.5, 5.0]), "price_score": rng.randint(3, 5),
+                        "service_score": rng.randint(3, 5), "punctuality_score": rng.randint(3, 5),
+                        "communication_score": rng.randint(3, 5), "comment": "벤치마크 평가",
+                        "is_visible": True, "created_at": etd,
+                    })
+
+        conn.execute(insert(QuoteRequest), quote_rows)
+        conn.execute(insert(Bidding), bidding_rows)
+        conn.execute(insert(CargoDetail), cargo_rows)
+        if bid_rows:
+            conn.execute(insert(Bid), bid_rows)
+        if awards:
+            conn.execute(update(Bidding).where(Bidding.id == bindparam("bidding_id")).values(
+                awarded_bid_id=bindparam("bid_id")), awards)
+        if rating_rows:
+            conn.execute(insert(Rating), rating_rows)
+        conn.execute(insert(Notification), [{
+            "recipient_type": "forwarder", "recipient_id": 1, "notification_type": "new_bidding",
+            "title": f"새 비딩 등록: {row['bidding_no']}", "message": "관심 노선에 새 비딩이 등록되었습니다.",
+        } for row in bidding_rows[:200]])
+
+    return {"customer_id": 1, "forwarder_id": 1, "bidding_no": bidding_rows[0]["bidding_no"]}
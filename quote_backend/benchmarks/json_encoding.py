@@ -0,0 +1,142 @@
+"""
+JSON Encoding / Compression Benchmark
+가장 큰 JSON 응답 10개에 대해 인코딩 시간(json vs orjson)과 전송 바이트(원본/gzip/br)를 비교합니다.
+
+후보 엔드포인트를 TestClient로 한 번씩 호출해 응답 크기로 상위 10개를 고르고,
+응답을 다시 파싱한 객체를 반복 인코딩합니다.
+- json: Starlette JSONResponse.render (이전 기본 응답 클래스)
+- orjson: json_response.FastJSONResponse.render
+- gzip / br: orjson 본문을 compression.py 설정(레벨/품질)으로 압축한 크기와 시간
+- wire: Accept-Encoding: br, gzip으로 실제 앱에 요청했을 때 받은 본문 크기
+
+임시 SQLite DB에 기준 데이터(seed_data)와 합성 비딩/입찰을 채웁니다.
+(응답 모델 검증/jsonable_encoder 비용은 두 방식에 공통이므로 포함하지 않습니다.)
+
+Usage (quote_backend 디렉토리에서):
+    python -m benchmarks.json_encoding
+    python -m benchmarks.json_encoding --biddings 2000 --forwarders 60 --repeat 50 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CANDIDATES = [
+    '/api/ports?limit=500',
+    '/api/container-types',
+    '/api/incoterms',
+    '/api/freight-codes',
+    '/api/quote/requests?limit=200',
+    '/api/quote/biddings?limit=200',
+    '/api/bidding/list?limit=100',
+    '/api/bidding/stats',
+    '/api/bid/my-bids?forwarder_id=1&limit=100',
+    '/api/bidding/{bidding_no}/bids',
+    '/api/shipper/biddings?customer_id=1&limit=100',
+    '/api/shipper/biddings/stats?customer_id=1',
+    '/api/shipper/bidding/{bidding_no}/bids?customer_id=1',
+    '/api/notifications?recipient_type=forwarder&recipient_id=1&limit=100',
+    '/api/dashboard/shipper/volume-trend?customer_id=1',
+    '/api/dashboard/forwarder/route-stats?forwarder_id=1&limit=50',
+]
+
+TOP_N = 10
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def measure(client, url: str, repeat: int) -> dict:
+    from fastapi.responses import JSONResponse
+
+    import compression
+    from json_response import dumps
+
+    obj = client.get(url, headers={'Accept-Encoding': 'identity'}).json()
+    stdlib = JSONResponse(None)
+
+    orjson_bytes = dumps(obj)
+    result = {
+        'url': url,
+        'json_ms': _median_ms(lambda: stdlib.render(obj), repeat),
+        'orjson_ms': _median_ms(lambda: dumps(obj), repeat),
+        'json_bytes': len(stdlib.render(obj)),
+        'orjson_bytes': len(orjson_bytes),
+        'gzip_bytes': len(compression.compress(orjson_bytes, 'gzip')),
+        'gzip_ms': _median_ms(lambda: compression.compress(orjson_bytes, 'gzip'), repeat),
+    }
+    if compression.brotli is not None:
+        result['br_bytes'] = len(compression.compress(orjson_bytes, 'br'))
+        result['br_ms'] = _median_ms(lambda: compression.compress(orjson_bytes, 'br'), repeat)
+
+    # httpx가 본문을 풀어버리므로 Content-Length로 전송 크기 확인
+    wire = client.get(url, headers={'Accept-Encoding': 'br, gzip'})
+    result['wire_bytes'] = int(wire.headers.get('content-length', len(wire.content)))
+    result['wire_encoding'] = wire.headers.get('content-encoding', 'identity')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="json vs orjson encode time and gzip/br wire bytes")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--biddings", type=int, default=1000)
+    parser.add_argument("--forwarders", type=int, default=40)
+    parser.add_argument("--bids", type=int, default=8, help="bids per bidding")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["QUOTE_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'quote.db')}"
+        os.environ["EMAIL_OUTBOX_WORKER"] = "false"
+
+        from fastapi.testclient import TestClient
+
+        from benchmarks.generators import seed_marketplace
+        from main import app
+
+        bidding_no = seed_marketplace(args.biddings, args.forwarders, args.bids)["bidding_no"]
+        sizes = {}
+        with TestClient(app, raise_server_exceptions=False) as client:
+            for url in CANDIDATES:
+                url = url.format(bidding_no=bidding_no)
+                response = client.get(url, headers={'Accept-Encoding': 'identity'})
+                if response.status_code == 200 and response.headers.get('content-type') == 'application/json':
+                    sizes[url] = len(response.content)
+            largest = sorted(sizes, key=sizes.get, reverse=True)[:TOP_N]
+            results = [measure(client, url, args.repeat) for url in largest]
+
+    if args.json:
+        print(json.dumps({'results': results}, indent=2))
+        return
+
+    has_br = 'br_bytes' in results[0] if results else False
+    header = f"{'endpoint':<58}{'json_ms':>9}{'orjson_ms':>10}{'json_B':>9}{'orjson_B':>9}{'gzip_B':>8}{'gzip_ms':>8}"
+    if has_br:
+        header += f"{'br_B':>8}{'br_ms':>7}"
+    print(header + f"{'wire_B':>8}")
+    for r in results:
+        line = (f"{r['url'][:57]:<58}{r['json_ms']:>9}{r['orjson_ms']:>10}{r['json_bytes']:>9}"
+                f"{r['orjson_bytes']:>9}{r['gzip_bytes']:>8}{r['gzip_ms']:>8}")
+        if has_br:
+            line += f"{r['br_bytes']:>8}{r['br_ms']:>7}"
+        print(line + f"{r['wire_bytes']:>8}")
+
+    total = {key: sum(r[key] for r in results) for key in ('json_ms', 'orjson_ms', 'json_bytes', 'wire_bytes')}
+    print(f"total: encode {total['json_ms']:.2f} → {total['orjson_ms']:.2f} ms, "
+          f"wire {total['json_bytes'] / 1024:.0f} → {total['wire_bytes'] / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Live Clients Load Test
+uvicorn 워커 1개가 /api/live/biddings SSE 구독자를 몇 명까지 감당하는지 측정
+
+- 서버: 별도 프로세스에서 main.app + 벤치마크용 발행 경로(/bench/publish) 실행
+- 클라이언트: 이 프로세스에서 N개의 SSE 연결 (asyncio + httpx 스트리밍)
+- 연결이 모두 열린 뒤 초당 --rate 건의 비딩 이벤트를 --events 건 발행하고
+  클라이언트별 수신 지연(발행 → 수신)과 누락 수를 집계
+
+p95 지연이 --budget-ms 이하이고 누락이 없으면 "ok"로 표시합니다.
+
+Usage (quote_backend 디렉토리에서):
+    python -m benchmarks.live_clients
+    python -m benchmarks.live_clients --clients 100 500 1000 2000 --events 20 --rate 10
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(port: int):
+    import uvicorn
+
+    from live_events import broker
+    from main import app
+
+    def publish(seq: int):
+        broker.publish({"type": "bidding", "bidding_id": 1, "shipping_type": "ocean",
+                        "seq": seq, "sent_at": time.time()})
+        return {"subscribers": broker.subscriber_count}
+
+    app.add_api_route("/bench/publish", publish, methods=["POST"])
+    app.add_api_route("/bench/subscribers", lambda: {"subscribers": broker.subscriber_count}, methods=["GET"])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+async def _client(http, url: str, expected: int, connected: asyncio.Event, latencies: list, received: list,
+                  ready_count: list, total: int):
+    seen = 0
+    try:
+        async with http.stream("GET", url) as response:
+            data = None
+            async for line in response.aiter_lines():
+                if line.startswith("retry:"):
+                    ready_count[0] += 1
+                    if ready_count[0] == total:
+                        connected.set()
+                elif line.startswith("data: "):
+                    data = json.loads(line[len("data: "):])
+                elif line == "" and data is not None:
+                    latencies.append(time.time() - data["sent_at"])
+                    seen += 1
+                    data = None
+                    if seen == expected:
+                        break
+    except Exception:
+        pass
+    received.append(seen)
+
+
+async def run_level(base: str, clients: int, events: int, rate: float, connect_timeout: float) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(connect_timeout, read=None)
+    latencies, received, ready = [], [], [0]
+    connected = asyncio.Event()
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as http:
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(_client(http, f"{base}/api/live/biddings?shipping_type=ocean", events,
+                                             connected, latencies, received, ready, clients))
+                 for _ in range(clients)]
+        try:
+            await asyncio.wait_for(connected.wait(), connect_timeout)
+        except asyncio.TimeoutError:
+            pass
+        connect_seconds = time.perf_counter() - started
+
+        async with httpx.AsyncClient(timeout=30) as control:
+            for seq in range(events):
+                await control.post(f"{base}/bench/publish", params={"seq": seq})
+                await asyncio.sleep(1 / rate)
+
+        done, pending = await asyncio.wait(tasks, timeout=max(5.0, clients / 200))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    missing = clients * events - sum(received)
+    p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+    p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else float("nan")
+    return {
+        "clients": clients,
+        "connected": ready[0],
+        "connect_s": round(connect_seconds, 2),
+        "delivered": len(latencies),
+        "missing": missing,
+        "p50_ms": round(p50, 1),
+        "p95_ms": round(p95, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SSE subscribers per worker load test")
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=10.0, help="events per second")
+    parser.add_argument("--budget-ms", type=float, default=500.0, help="p95 delivery latency budget")
+    parser.add_argument("--connect-timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    base = f"http://127.0.0.1:{port}"
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            break
+        except OSError:
+            time.sleep(0.2)
+
+    print(f"events={args.events} rate={args.rate}/s budget p95<={args.budget_ms}ms (1 uvicorn worker)")
+    print(f"{'clients':>8}{'connected':>11}{'connect_s':>11}{'delivered':>11}{'missing':>9}"
+          f"{'p50_ms':>9}{'p95_ms':>9}  verdict")
+    try:
+        for clients in args.clients:
+            r = asyncio.run(run_level(base, clients, args.events, args.rate, args.connect_timeout))
+            ok = r["connected"] == clients and r["missing"] == 0 and r["p95_ms"] <= args.budget_ms
+            print(f"{r['clients']:>8}{r['connected']:>11}{r['connect_s']:>11}{r['delivered']:>11}{r['missing']:>9}"
+                  f"{r['p50_ms']:>9}{r['p95_ms']:>9}  {'ok' if ok else 'over'}")
+            time.sleep(1)  # 이전 단계 연결 정리
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Scheduler Jobs Benchmark
+100k 비딩 기준 마감 처리 작업의 건별 ORM 루프 vs 일괄 SQL 비교
+
+- legacy: 대상 비딩을 모두 로드해 한 건씩 status 변경 + Notification 객체 추가 (이전 구현)
+- set-based: scheduler.auto_expire_biddings (INSERT … SELECT + UPDATE)
+
+배송/분쟁 작업도 같은 DB에서 일괄 처리 시간을 함께 측정합니다.
+
+Usage (quote_backend 디렉토리에서):
+    python -m benchmarks.scheduler_jobs
+    python -m benchmarks.scheduler_jobs --biddings 100000 --overdue-ratio 0.5
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database import Base, configure_engine  # noqa: E402
+from models import Bidding, QuoteRequest, Contract, Shipment, Settlement, Notification  # noqa: E402
+import scheduler  # noqa: E402
+
+BATCH = 10000
+
+
+def _engine(db_path: str):
+    return configure_engine(create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False}))
+
+
+def seed(db_path: str, biddings: int, overdue_ratio: float):
+    """비딩/견적 + 배송/정산 데이터를 bulk INSERT로 생성"""
+    engine = _engine(db_path)
+    Base.metadata.create_all(engine)
+    now = datetime.now()
+    overdue_every = max(1, round(1 / overdue_ratio)) if overdue_ratio > 0 else 0
+    side = max(1, biddings // 10)  # 배송/정산 행 수
+
+    with engine.begin() as conn:
+        for start in range(0, biddings, BATCH):
+            ids = range(start + 1, min(start + BATCH, biddings) + 1)
+            conn.execute(insert(QuoteRequest), [{
+                "id": i, "request_number": f"QR-{i:08d}", "trade_mode": "export", "shipping_type": "ocean",
+                "load_type": "FCL", "pol": "KRPUS", "pod": "USLAX", "etd": now, "customer_id": i % 1000 + 1,
+            } for i in ids])
+            conn.execute(insert(Bidding), [{
+                "id": i, "bidding_no": f"B{i:08d}", "quote_request_id": i, "status": "open",
+                "deadline": now - timedelta(hours=1) if overdue_every and i % overdue_every == 0 else now + timedelta(days=3),
+            } for i in ids])
+
+        conn.execute(insert(Contract), [{
+            "id": i, "contract_no": f"CT-{i:08d}", "bidding_id": i, "awarded_bid_id": i,
+            "customer_id": i % 1000 + 1, "forwarder_id": i % 200 + 1, "total_amount_krw": 1000000,
+        } for i in range(1, side + 1)])
+        conn.execute(insert(Shipment), [{
+            "id": i, "shipment_no": f"SH-{i:08d}", "contract_id": i, "current_status": "delivered",
+            "actual_delivery": now - timedelta(days=10 if i % 2 else 20),
+            "delivery_confirmed": False, "reminder_sent": False,
+        } for i in range(1, side + 1)])
+        conn.execute(insert(Settlement), [{
+            "id": i, "settlement_no": f"ST-D-{i:08d}", "contract_id": side + i, "forwarder_id": 1, "customer_id": 1,
+            "total_amount_krw": 1, "net_amount": 1, "status": "disputed", "disputed_at": now - timedelta(days=10),
+        } for i in range(1, side + 1)])
+
+    engine.dispose()
+
+
+def legacy_auto_expire(session_factory) -> int:
+    """이전 구현: 대상 비딩을 로드해 한 건씩 처리"""
+    db = session_factory()
+    try:
+        now = datetime.now()
+        expired = db.query(Bidding).filter(
+            Bidding.status == "open",
+            Bidding.deadline < now,
+            Bidding.deadline.isnot(None)
+        ).all()
+        for bidding in expired:
+            bidding.status = "expired"
+            quote_request = bidding.quote_request
+            if quote_request and quote_request.customer_id:
+                db.add(Notification(
+                    recipient_type="customer",
+                    recipient_id=quote_request.customer_id,
+                    notification_type="bidding_expired",
+                    title="비딩이 마감되었습니다",
+                    message=f"비딩번호 {bidding.bidding_no}의 입찰 마감 기한이 종료되었습니다.",
+                    related_type="bidding",
+                    related_id=bidding.id
+                ))
+        db.commit()
+        return len(expired)
+    finally:
+        db.close()
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def run_benchmark(biddings: int = 100000, overdue_ratio: float = 0.5) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        seed_path = os.path.join(tmp_dir, 'seed.db')
+        seed(seed_path, biddings, overdue_ratio)
+
+        for mode in ('legacy', 'set-based'):
+            db_path = os.path.join(tmp_dir, f'{mode}.db')
+            shutil.copy(seed_path, db_path)
+            engine = _engine(db_path)
+            factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            scheduler.SessionLocal = factory
+
+            if mode == 'legacy':
+                count, elapsed = _timed(lambda: legacy_auto_expire(factory))
+                results.append({'job': 'auto_expire_biddings', 'mode': mode, 'rows': count, 'seconds': round(elapsed, 3)})
+            else:
+                for name, job in (
+                    ('auto_expire_biddings', scheduler.auto_expire_biddings),
+                    ('check_delivery_reminders', scheduler.check_delivery_reminders),
+                    ('check_dispute_deadlines', scheduler.check_dispute_deadlines),
+                ):
+                    outcome, elapsed = _timed(job)
+                    rows = outcome if isinstance(outcome, int) else sum(outcome.values())
+                    results.append({'job': name, 'mode': mode, 'rows': rows, 'seconds': round(elapsed, 3)})
+            engine.dispose()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scheduler job benchmark')
+    parser.add_argument('--biddings', type=int, default=100000)
+    parser.add_argument('--overdue-ratio', type=float, default=0.5, help='share of overdue open biddings')
+    args = parser.parse_args()
+
+    import logging
+    logging.getLogger('scheduler').setLevel(logging.WARNING)
+
+    print(f"biddings={args.biddings} overdue_ratio={args.overdue_ratio}")
+    print(f"{'job':<28}{'mode':<12}{'rows':>10}{'seconds':>10}")
+    for r in run_benchmark(args.biddings, args.overdue_ratio):
+        print(f"{r['job']:<28}{r['mode']:<12}{r['rows']:>10}{r['seconds']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark Suite (quote_backend)
+비딩 목록, 포워더 프로필, 화주/포워더 분석 API를 같은 합성 마켓플레이스 데이터로 측정하고 JSON 기준선과 비교합니다.
+
+데이터는 benchmarks.generators.seed_marketplace가 --seed로 임시 SQLite DB에 만들며 규모는 --scale로 정합니다.
+요청은 TestClient로 보내고 SQL 문 수는 응답의 Server-Timing 헤더(telemetry.TelemetryMiddleware)에서 읽습니다.
+query_budget은 경고만 남기도록 끕니다 (예산을 넘는 분석 API도 측정).
+
+    api.bidding_*    포워더용 비딩 목록 (전체/내 입찰 표시/필터)
+    api.forwarder_*  포워더 프로필, 내 입찰, 포워더 분석
+    api.shipper_*    화주 비딩 목록, 화주 분석
+    api.dashboard_*  대시보드 집계
+
+결과는 benchmarks/baselines/<scale>-<commit>.json에 저장되고, compare는 median이 --threshold 이상 느려지거나
+SQL 문 수가 늘어난 시나리오를 회귀로 표시하고 종료 코드 1을 돌려줍니다.
+
+Usage (quote_backend 디렉토리에서):
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run --scale small --repeat 20
+    python -m benchmarks.suite run --scale medium --only api.bidding --output /tmp/after.json
+    python -m benchmarks.suite compare benchmarks/baselines/small-abc1234.json /tmp/after.json --threshold 0.15
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.benchmark_harness import main as harness_main, scenario
+
+BASELINE_DIR = Path(__file__).parent / 'baselines'
+
+SCALES = {
+    'small': {'biddings': 500, 'forwarders': 20, 'bids_per_bidding': 5},
+    'medium': {'biddings': 3000, 'forwarders': 60, 'bids_per_bidding': 8},
+    'large': {'biddings': 15000, 'forwarders': 150, 'bids_per_bidding': 10},
+}
+
+
+@contextmanager
+def build_context(scale: dict, seed: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ['QUOTE_DATABASE_URL'] = f"sqlite:///{os.path.join(tmp_dir, 'quote.db')}"
+        os.environ['EMAIL_OUTBOX_WORKER'] = 'false'
+        os.environ['QUERY_BUDGET_ENFORCE'] = 'false'
+
+        from fastapi.testclient import TestClient
+
+        from benchmarks.generators import seed_marketplace
+        from main import app
+
+        ids = seed_marketplace(scale['biddings'], scale['forwarders'], scale['bids_per_bidding'], seed)
+        with TestClient(app) as client:
+            yield SimpleNamespace(client=client, **ids)
+
+
+def _get(ctx, url: str):
+    url = url.format(**vars(ctx))
+    return lambda: ctx.client.get(url)
+
+
+# ============================================================
+# Bidding list (forwarders)
+# ============================================================
+
+@scenario('api.bidding_list', 'GET /api/bidding/list (100 per page)')
+def api_bidding_list(ctx):
+    return _get(ctx, '/api/bidding/list?limit=100')
+
+
+@scenario('api.bidding_list_forwarder', 'GET /api/bidding/list with my_bid_status')
+def api_bidding_list_forwarder(ctx):
+    return _get(ctx, '/api/bidding/list?limit=100&forwarder_id={forwarder_id}')
+
+
+@scenario('api.bidding_list_filtered', 'GET /api/bidding/list?status=open&shipping_type=ocean')
+def api_bidding_list_filtered(ctx):
+    return _get(ctx, '/api/bidding/list?limit=50&status=open&shipping_type=ocean')
+
+
+@scenario('api.bidding_bids', 'GET /api/bidding/{bidding_no}/bids')
+def api_bidding_bids(ctx):
+    return _get(ctx, '/api/bidding/{bidding_no}/bids')
+
+
+# ============================================================
+# Forwarder
+# ============================================================
+
+@scenario('api.forwarder_profile', 'GET /api/forwarders/{id}/profile')
+def api_forwarder_profile(ctx):
+    return _get(ctx, '/api/forwarders/{forwarder_id}/profile')
+
+
+@scenario('api.forwarder_my_bids', 'GET /api/bid/my-bids (100 per page)')
+def api_forwarder_my_bids(ctx):
+    return _get(ctx, '/api/bid/my-bids?forwarder_id={forwarder_id}&limit=100')
+
+
+@scenario('api.forwarder_summary', 'GET /api/analytics/forwarder/summary')
+def api_forwarder_summary(ctx):
+    return _get(ctx, '/api/analytics/forwarder/summary?forwarder_id={forwarder_id}')
+
+
+@scenario('api.forwarder_competitiveness', 'GET /api/analytics/forwarder/competitiveness')
+def api_forwarder_competitiveness(ctx):
+    return _get(ctx, '/api/analytics/forwarder/competitiveness?forwarder_id={forwarder_id}')
+
+
+@scenario('api.forwarder_rating_trend', 'GET /api/analytics/forwarder/rating-trend')
+def api_forwarder_rating_trend(ctx):
+    return _get(ctx, '/api/analytics/forwarder/rating-trend?forwarder_id={forwarder_id}')
+
+
+# ============================================================
+# Shipper
+# ============================================================
+
+@scenario('api.shipper_biddings', 'GET /api/shipper/biddings (100 per page)')
+def api_shipper_biddings(ctx):
+    return _get(ctx, '/api/shipper/biddings?customer_id={customer_id}&limit=100')
+
+
+@scenario('api.shipper_summary', 'GET /api/analytics/shipper/summary')
+def api_shipper_summary(ctx):
+    return _get(ctx, '/api/analytics/shipper/summary?customer_id={customer_id}')
+
+
+@scenario('api.shipper_monthly_trend', 'GET /api/analytics/shipper/monthly-trend')
+def api_shipper_monthly_trend(ctx):
+    return _get(ctx, '/api/analytics/shipper/monthly-trend?customer_id={customer_id}')
+
+
+@scenario('api.shipper_route_stats', 'GET /api/analytics/shipper/route-stats')
+def api_shipper_route_stats(ctx):
+    return _get(ctx, '/api/analytics/shipper/route-stats?customer_id={customer_id}')
+
+
+@scenario('api.shipper_forwarder_ranking', 'GET /api/analytics/shipper/forwarder-ranking')
+def api_shipper_forwarder_ranking(ctx):
+    return _get(ctx, '/api/analytics/shipper/forwarder-ranking?customer_id={customer_id}')
+
+
+# ============================================================
+# Dashboard (forwarder/route-stats는 Contract.final_price_krw 참조 오류로 제외)
+# ============================================================
+
+@scenario('api.dashboard_volume_trend', 'GET /api/dashboard/shipper/volume-trend')
+def api_dashboard_volume_trend(ctx):
+    return _get(ctx, '/api/dashboard/shipper/volume-trend?customer_id={customer_id}')
+
+
+if __name__ == '__main__':
+    harness_main('quote_backend', SCALES, build_context, BASELINE_DIR)
@@ -13,6 +13,8 @@ from datetime import datetime, timedelta
 import uuid
 
 from database import get_db
+from json_response import FastJSONResponse
+from telemetry import query_budget
 from commerce_models import (
     Company, CompanyCertification, CommerceUser, Category, Product,
     ProductRFQ, ProductRFQItem, ProductRFQInvitation,
@@ -61,7 +63,9 @@ import bcrypt
 # ROUTER SETUP
 # ==========================================
 
-router = APIRouter(prefix="/api/commerce", tags=["B2B Commerce"])
+router = APIRouter(
+    prefix="/api/commerce", tags=["B2B Commerce"], default_response_class=FastJSONResponse
+)
 
 
 # ==========================================
@@ -342,6 +346,7 @@ def create_product(data: ProductCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/products", response_model=ProductListResponse)
+@query_budget(4)
 def list_products(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
@@ -390,7 +395,10 @@ def list_products(
     # Pagination
     total = query.count()
     total_pages = (total + page_size - 1) // page_size
-    products = query.offset((page - 1) * page_size).limit(page_size).all()
+    products = query.options(
+        joinedload(Product.company),
+        joinedload(Product.category)
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
     # Add company and category names
     result = []
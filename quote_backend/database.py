@@ -1,35 +1,85 @@
 """
 Database Configuration - Quote Request System
-SQLite for local development, can be switched to MySQL/PostgreSQL for production
+SQLite for local development, PostgreSQL for production (QUOTE_DATABASE_URL)
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, String
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 import os
+import sys
 from pathlib import Path
 
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)  # 저장소 루트의 shared 패키지
+
+# SQLite connection profile + single writer thread, shared with the news server
+from shared.sqlite_profile import WriteQueue, configure_engine  # noqa: E402
+
 # Database URL - Use SQLite with absolute path for reliability
 # Get the directory where this file is located
 DB_DIR = Path(__file__).parent
 DB_PATH = DB_DIR / "quote.db"
 
-# Force SQLite for local development (ignore DATABASE_URL env var if it's PostgreSQL)
-env_db_url = os.getenv("DATABASE_URL", "")
-if env_db_url.startswith("postgresql") or env_db_url.startswith("mysql"):
-    # Use SQLite instead for local development
-    DATABASE_URL = f"sqlite:///{DB_PATH}"
-else:
-    DATABASE_URL = env_db_url if env_db_url else f"sqlite:///{DB_PATH}"
-
-# Create engine with appropriate settings
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL, 
-        connect_args={"check_same_thread": False}  # SQLite specific
-    )
-else:
-    engine = create_engine(DATABASE_URL)
+# PostgreSQL pool settings (ignored for SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))       # seconds to wait for a pooled connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))     # recycle connections older than 30 min
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "15000"))
+
+
+def normalize_database_url(url: str) -> str:
+    """Map Heroku-style postgres:// URLs to the psycopg2 driver"""
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+psycopg2://", 1)
+    return url
+
+
+def resolve_database_url() -> str:
+    """
+    Resolve the quote database URL.
+    
+    - QUOTE_DATABASE_URL: explicit quote DB (PostgreSQL supported)
+    - DATABASE_URL: used only if it is not PostgreSQL/MySQL, because the news
+      server shares that variable for its own database
+    - default: quote.db next to this file
+    """
+    quote_db_url = os.getenv("QUOTE_DATABASE_URL", "")
+    if quote_db_url:
+        return normalize_database_url(quote_db_url)
+    
+    env_db_url = os.getenv("DATABASE_URL", "")
+    if env_db_url and not env_db_url.startswith(("postgres", "mysql")):
+        return env_db_url
+    return f"sqlite:///{DB_PATH}"
+
+
+def engine_options(url: str) -> dict:
+    """create_engine() keyword arguments for the given backend"""
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}  # SQLite specific
+    
+    options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    if url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+
+DATABASE_URL = resolve_database_url()
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# Create engine with appropriate settings (SQLite: WAL profile on every new connection)
+engine = configure_engine(create_engine(DATABASE_URL, **engine_options(DATABASE_URL)))
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -47,6 +97,50 @@ def get_db():
         db.close()
 
 
+# Hot write paths (bid submission/update) hand their whole write unit
+# (write statements + commit) to this thread, so concurrent requests never
+# race for the SQLite write lock.
+write_queue = WriteQueue(name="quote-db-writer")
+
+
+def run_write(fn, *args, **kwargs):
+    """Serialize a write unit (a closure that writes and commits) through the single writer thread"""
+    if not IS_SQLITE:
+        return fn(*args, **kwargs)
+    return write_queue.run(fn, *args, **kwargs)
+
+
+# ==========================================
+# PORTABLE SQL HELPERS
+# ==========================================
+
+class year_month(FunctionElement):
+    """
+    'YYYY-MM' bucket of a date/datetime column, portable across backends.
+    
+    SQLite stores datetimes as text, so extract() relies on strftime() there;
+    this renders the native function for each dialect instead.
+    """
+    type = String()
+    inherit_cache = True
+    name = "year_month"
+
+
+@compiles(year_month)
+def _year_month_default(element, compiler, **kw):
+    return "strftime('%%Y-%%m', %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(year_month, "postgresql")
+def _year_month_postgresql(element, compiler, **kw):
+    return "to_char(%s, 'YYYY-MM')" % compiler.process(element.clauses, **kw)
+
+
+@compiles(year_month, "mysql")
+def _year_month_mysql(element, compiler, **kw):
+    return "DATE_FORMAT(%s, '%%%%Y-%%%%m')" % compiler.process(element.clauses, **kw)
+
+
 def init_db():
     """Initialize database - create all tables"""
     from models import Base  # Import here to avoid circular imports
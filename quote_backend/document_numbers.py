@@ -0,0 +1,85 @@
+"""
+Document Numbers - 문서 번호 발급기
+비딩/견적요청/계약 번호를 document_sequences 카운터에서 발급
+
+    seq = next_sequence(db, "QR-", period="20260103", initial=lambda: 0)
+
+카운터 증가는 UPDATE … RETURNING 한 번이고, 접두어/기간의 첫 발급 때만 행을 만듭니다
+(INSERT … ON CONFLICT DO NOTHING). 기존 데이터가 있는 DB는 initial()이 돌려준
+마지막 번호부터 이어서 발급합니다.
+
+- SQLite: 호출자 트랜잭션 안에서 증가 (DB 쓰기 잠금이 하나뿐이라 별도 연결은 교착)
+- 그 외: 별도 짧은 트랜잭션에서 증가 후 즉시 commit → 카운터 행 잠금을 요청 트랜잭션 동안 잡지 않음
+  (호출자가 롤백하면 번호가 비지만 중복은 없음)
+"""
+
+from typing import Callable, Optional
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import DocumentSequence
+
+
+def _insert_ignore(dialect_name: str):
+    if dialect_name == "sqlite":
+        return sqlite.insert(DocumentSequence).on_conflict_do_nothing()
+    if dialect_name == "postgresql":
+        return postgresql.insert(DocumentSequence).on_conflict_do_nothing()
+    return insert(DocumentSequence).prefix_with("IGNORE")
+
+
+def _increment(conn: Connection, prefix: str, period: str, step: int) -> Optional[int]:
+    return conn.execute(
+        update(DocumentSequence)
+        .where(DocumentSequence.prefix == prefix, DocumentSequence.period == period)
+        .values(value=DocumentSequence.value + step)
+        .returning(DocumentSequence.value)
+    ).scalar()
+
+
+def _allocate(conn: Connection, prefix: str, period: str, step: int, initial: Callable[[], int]) -> int:
+    value = _increment(conn, prefix, period, step)
+    if value is None:
+        try:
+            conn.execute(_insert_ignore(conn.dialect.name).values(prefix=prefix, period=period, value=initial()))
+        except IntegrityError:
+            pass  # 다른 프로세스가 먼저 생성
+        value = _increment(conn, prefix, period, step)
+    return value
+
+
+def next_sequence(db: Session, prefix: str, period: str = "", initial: Callable[[], int] = lambda: 0,
+                  step: int = 1) -> int:
+    """
+    prefix/period 카운터를 step만큼 올리고 새 값(마지막 발급 번호) 반환
+
+    step > 1이면 (반환값 - step + 1) ~ 반환값 범위를 한 번에 예약합니다.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return _allocate(db.connection(), prefix, period, step, initial)
+
+    with db.get_bind().connect() as conn:
+        value = _allocate(conn, prefix, period, step, initial)
+        conn.commit()
+        return value
+
+
+def last_issued(db: Session, column, prefix: str, default: int = 0) -> int:
+    """
+    기존 번호 중 prefix 뒤 숫자의 최댓값 (카운터 첫 생성 시 이어 붙일 시작점)
+
+    자릿수가 늘어난 번호(…-999 → …-1000)도 길이 우선 정렬로 올바르게 찾습니다.
+    """
+    last = db.query(column).filter(column.like(f"{prefix}%")).order_by(
+        func.length(column).desc(), column.desc()
+    ).first()
+    if not last:
+        return default
+    try:
+        return int(last[0][len(prefix):])
+    except ValueError:
+        return default
@@ -1,14 +1,30 @@
 """
 Email Service - 이메일 알림 서비스
 실제 배포 시 SMTP 설정 필요
+
+요청 핸들러는 enqueue_email()로 email_outbox 행을 업무 데이터와 같은 트랜잭션에 기록하고,
+OutboxSender가 백그라운드에서 인증된 SMTP 연결 하나를 재사용해 일괄 발송합니다 (재시도/백오프 포함).
 """
 
 import smtplib
+from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List
+from functools import lru_cache
+from typing import Callable, Dict, Optional, List, Tuple
+import json
 import logging
 import os
+import threading
+import time
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, run_write
+from models import EmailOutbox
+from telemetry import external_call
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -24,6 +40,19 @@ FROM_NAME = os.getenv("FROM_NAME", "AAL Logistics Platform")
 # 개발 모드 (실제 이메일 발송 안함)
 DEV_MODE = os.getenv("EMAIL_DEV_MODE", "true").lower() == "true"
 
+# SMTP 연결 재사용 설정
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+SMTP_IDLE_CHECK_SECONDS = float(os.getenv("SMTP_IDLE_CHECK_SECONDS", "30"))  # 이 시간 이상 쉬면 NOOP으로 연결 확인
+
+# Outbox 발송 설정
+OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+OUTBOX_POLL_SECONDS = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+OUTBOX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30"))  # 30초, 1분, 2분, ... 최대 1시간
+OUTBOX_BACKOFF_MAX_SECONDS = 3600
+OUTBOX_CLAIM_SECONDS = 300  # 발송 중 프로세스가 죽으면 이 시간 뒤 다른 발송기가 다시 가져감
+
 
 class EmailTemplate:
     """이메일 템플릿 정의"""
@@ -210,6 +239,115 @@ class EmailTemplate:
         return EmailTemplate.base_template(content, "분쟁 해결 알림")
 
 
+# ==========================================
+# SMTP CONNECTION
+# ==========================================
+
+def build_message(to_email: str, subject: str, html_content: str, cc: Optional[List[str]] = None) -> MIMEMultipart:
+    """HTML 이메일 메시지 생성"""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = f"{FROM_NAME} <{FROM_EMAIL}>"
+    msg["To"] = to_email
+    
+    if cc:
+        msg["Cc"] = ", ".join(cc)
+    
+    msg.attach(MIMEText(html_content, "html", "utf-8"))
+    return msg
+
+
+class SMTPConnection:
+    """
+    인증된 SMTP 연결 1개를 재사용
+    
+    메시지마다 접속 + STARTTLS + 로그인을 반복하지 않고, 끊긴 경우에만 다시 연결합니다.
+    일정 시간 유휴 상태였으면 NOOP으로 살아 있는지 먼저 확인합니다.
+    """
+    
+    def __init__(
+        self,
+        host: str = SMTP_HOST,
+        port: int = SMTP_PORT,
+        user: str = SMTP_USER,
+        password: str = SMTP_PASSWORD,
+        starttls: bool = SMTP_STARTTLS,
+        timeout: float = SMTP_TIMEOUT,
+        idle_check_seconds: float = SMTP_IDLE_CHECK_SECONDS
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_check_seconds = idle_check_seconds
+        self.connects = 0
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                server.starttls()
+            if self.user and self.password:
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.connects += 1
+        return server
+    
+    def _discard(self):
+        if self._server is not None:
+            try:
+                self._server.close()
+            except Exception:
+                pass
+            self._server = None
+    
+    def _ensure(self) -> smtplib.SMTP:
+        if self._server is not None and time.monotonic() - self._last_used > self.idle_check_seconds:
+            try:
+                alive = self._server.noop()[0] == 250
+            except (smtplib.SMTPException, OSError):
+                alive = False
+            if not alive:
+                self._discard()
+        
+        if self._server is None:
+            self._server = self._connect()
+        return self._server
+    
+    def send(self, from_addr: str, recipients: List[str], message: str):
+        """메시지 발송 (서버가 연결을 끊었으면 한 번 재연결 후 재시도)"""
+        with self._lock, external_call("smtp"):
+            for attempt in range(2):
+                server = self._ensure()
+                try:
+                    server.sendmail(from_addr, recipients, message)
+                    self._last_used = time.monotonic()
+                    return
+                except smtplib.SMTPServerDisconnected:
+                    self._discard()
+                    if attempt:
+                        raise
+    
+    def close(self):
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    pass
+                self._discard()
+
+
+smtp_connection = SMTPConnection()
+
+
 class EmailService:
     """이메일 발송 서비스"""
     
@@ -229,27 +367,8 @@ class EmailService:
             return True
         
         try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = f"{FROM_NAME} <{FROM_EMAIL}>"
-            msg["To"] = to_email
-            
-            if cc:
-                msg["Cc"] = ", ".join(cc)
-            
-            html_part = MIMEText(html_content, "html", "utf-8")
-            msg.attach(html_part)
-            
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.starttls()
-                if SMTP_USER and SMTP_PASSWORD:
-                    server.login(SMTP_USER, SMTP_PASSWORD)
-                
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                
-                server.sendmail(FROM_EMAIL, recipients, msg.as_string())
+            msg = build_message(to_email, subject, html_content, cc)
+            smtp_connection.send(FROM_EMAIL, [to_email] + (cc or []), msg.as_string())
             
             logger.info(f"Email sent successfully to: {to_email}")
             return True
@@ -304,6 +423,234 @@ class EmailService:
         return cls.send_email(to_email, f"[AAL] 분쟁 해결 완료 - {settlement_no}", html)
 
 
+# ==========================================
+# EMAIL OUTBOX
+# ==========================================
+
+# 템플릿 이름 → (본문 렌더러, 제목 생성기); 인자는 EmailTemplate 메서드의 키워드 인자
+OUTBOX_TEMPLATES: Dict[str, Tuple[Callable[..., str], Callable[[dict], str]]] = {
+    "bidding_created": (
+        EmailTemplate.bidding_created,
+        lambda c: f"[AAL] 견적 요청 등록 완료 - {c['bidding_no']}"),
+    "new_bid_received": (
+        EmailTemplate.new_bid_received,
+        lambda c: f"[AAL] 새 입찰 도착 - {c['bidding_no']}"),
+    "bid_awarded": (
+        EmailTemplate.bid_awarded,
+        lambda c: f"[AAL] 🎉 입찰 선정 알림 - {c['bidding_no']}"),
+    "delivery_reminder": (
+        EmailTemplate.delivery_reminder,
+        lambda c: f"[AAL] 배송 완료 확인 요청 - {c['shipment_no']}"),
+    "settlement_dispute": (
+        EmailTemplate.settlement_dispute,
+        lambda c: f"[AAL] 정산 분쟁 {'제기' if c.get('is_forwarder', True) else '접수'} - {c['settlement_no']}"),
+    "dispute_resolved": (
+        EmailTemplate.dispute_resolved,
+        lambda c: f"[AAL] 분쟁 해결 완료 - {c['settlement_no']}"),
+}
+
+
+@lru_cache(maxsize=512)
+def _render_cached(template: str, context_json: str) -> str:
+    render, _ = OUTBOX_TEMPLATES[template]
+    return render(**json.loads(context_json))
+
+
+def render_email(template: str, context_json: str) -> str:
+    """outbox 본문 렌더링 (같은 템플릿 + 인자는 캐시된 HTML 재사용)"""
+    return _render_cached(template, context_json)
+
+
+def enqueue_email(db: Session, to_email: Optional[str], template: str,
+                  cc: Optional[List[str]] = None, **context) -> Optional[EmailOutbox]:
+    """
+    이메일을 outbox에 추가
+    
+    세션에 행만 추가하고 commit은 호출자 트랜잭션에 맡깁니다.
+    업무 데이터가 롤백되면 메일도 함께 사라지고, commit되면 발송기가 가져갑니다.
+    """
+    if template not in OUTBOX_TEMPLATES:
+        raise ValueError(f"Unknown email template: {template}")
+    if not to_email:
+        return None
+    
+    _, subject = OUTBOX_TEMPLATES[template]
+    entry = EmailOutbox(
+        to_email=to_email,
+        cc=",".join(cc) if cc else None,
+        subject=subject(context),
+        template=template,
+        context=json.dumps(context, ensure_ascii=False, sort_keys=True, default=str),
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.now()
+    )
+    db.add(entry)
+    return entry
+
+
+def _is_permanent_failure(error: Exception) -> bool:
+    """수신자 거부 / 5xx 응답은 재시도해도 같은 결과"""
+    if isinstance(error, (smtplib.SMTPRecipientsRefused, KeyError, TypeError, ValueError)):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and 500 <= error.smtp_code < 600
+
+
+class OutboxSender:
+    """
+    email_outbox 발송기
+    
+    due 상태 행을 claim_token으로 한 번에 점유(UPDATE 1회)한 뒤 하나의 SMTP 연결로 보내고,
+    실패한 행은 지수 백오프로 next_attempt_at을 미룹니다. 여러 프로세스가 동시에 돌아도
+    같은 행을 두 번 점유하지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        session_factory=None,
+        connection: Optional[SMTPConnection] = None,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds: int = OUTBOX_BACKOFF_SECONDS,
+        dev_mode: bool = DEV_MODE
+    ):
+        self.session_factory = session_factory or SessionLocal
+        self.connection = connection or smtp_connection
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.dev_mode = dev_mode
+    
+    def backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.backoff_seconds * 2 ** (attempts - 1), OUTBOX_BACKOFF_MAX_SECONDS))
+    
+    def _claim(self, db: Session) -> List[EmailOutbox]:
+        now = datetime.now()
+        token = uuid.uuid4().hex
+        due = (EmailOutbox.status.in_(("pending", "sending")), EmailOutbox.next_attempt_at <= now)
+        batch = (
+            db.query(EmailOutbox.id)
+            .filter(*due)
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(self.batch_size)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(batch), *due)
+            .values(status="sending", claim_token=token,
+                    next_attempt_at=now + timedelta(seconds=OUTBOX_CLAIM_SECONDS))
+            .execution_options(synchronize_session=False)
+        )
+        run_write(db.commit)
+        return db.query(EmailOutbox).filter(EmailOutbox.claim_token == token).order_by(EmailOutbox.id).all()
+    
+    def _deliver(self, entry: EmailOutbox):
+        html = render_email(entry.template, entry.context)
+        cc = entry.cc.split(",") if entry.cc else []
+        
+        if self.dev_mode:
+            logger.info(f"[DEV MODE] Outbox email #{entry.id} would be sent to: {entry.to_email} ({entry.subject})")
+            return
+        
+        msg = build_message(entry.to_email, entry.subject, html, cc)
+        self.connection.send(FROM_EMAIL, [entry.to_email] + cc, msg.as_string())
+    
+    def send_batch(self) -> Dict[str, int]:
+        """점유한 배치 1개 발송 → {"sent", "retry", "failed"}"""
+        counts = {"sent": 0, "retry": 0, "failed": 0}
+        db = self.session_factory()
+        try:
+            entries = self._claim(db)
+            if not entries:
+                return counts
+            
+            for entry in entries:
+                entry.attempts += 1
+                entry.claim_token = None
+                try:
+                    self._deliver(entry)
+                except Exception as e:
+                    entry.last_error = f"{type(e).__name__}: {e}"[:1000]
+                    if _is_permanent_failure(e) or entry.attempts >= self.max_attempts:
+                        entry.status = "failed"
+                        counts["failed"] += 1
+                        logger.error(f"[Outbox] Email #{entry.id} to {entry.to_email} failed: {e}")
+                    else:
+                        entry.status = "pending"
+                        entry.next_attempt_at = datetime.now() + self.backoff(entry.attempts)
+                        counts["retry"] += 1
+                        logger.warning(f"[Outbox] Email #{entry.id} retry in {self.backoff(entry.attempts)}: {e}")
+                else:
+                    entry.status = "sent"
+                    entry.sent_at = datetime.now()
+                    entry.last_error = None
+                    counts["sent"] += 1
+            
+            run_write(db.commit)
+            return counts
+        
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
+    def drain(self) -> Dict[str, int]:
+        """due 행이 없을 때까지 배치 반복"""
+        totals = {"sent": 0, "retry": 0, "failed": 0}
+        while True:
+            counts = self.send_batch()
+            for key, value in counts.items():
+                totals[key] += value
+            if sum(counts.values()) < self.batch_size:
+                return totals
+
+
+class OutboxWorker:
+    """OutboxSender를 주기적으로 실행하는 백그라운드 스레드"""
+    
+    def __init__(self, sender: Optional[OutboxSender] = None, poll_seconds: float = OUTBOX_POLL_SECONDS):
+        self.sender = sender or OutboxSender()
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+    
+    def notify(self):
+        """새 행이 commit됐을 때 다음 폴링을 기다리지 않고 발송"""
+        self._wake.set()
+    
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.sender.connection.close()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                counts = self.sender.drain()
+                if any(counts.values()):
+                    logger.info(f"[Outbox] {counts}")
+            except Exception as e:
+                logger.error(f"[Outbox] Drain failed: {e}")
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+
+
+outbox_worker = OutboxWorker()
+
+
 # 테스트
 if __name__ == "__main__":
     # 개발 모드 테스트
@@ -0,0 +1,58 @@
+"""
+JSON Response - orjson 기반 기본 응답 클래스
+엔드포인트가 반환한 dict/list/모델을 json.dumps 대신 orjson으로 JSON bytes로 만듭니다.
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    router = APIRouter(..., default_response_class=FastJSONResponse)
+
+Default(FastJSONResponse)(placeholder)로는 지정할 수 없습니다. 라우트 데코레이터의 기본값
+Default(JSONResponse)가 앱/라우터의 placeholder보다 우선하기 때문입니다.
+
+엔드포인트에서 FastJSONResponse(content)를 직접 반환하면 jsonable_encoder 단계도 건너뜁니다
+(datetime/date/UUID/Enum/dataclass는 orjson이, Decimal/Pydantic 모델은 _default가 처리).
+orjson이 설치되어 있지 않으면 Starlette JSONResponse와 같은 json.dumps 인코딩을 씁니다.
+"""
+
+from decimal import Decimal
+from typing import Any
+import json
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def _default(value: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 값 (jsonable_encoder와 같은 결과)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """content → JSON bytes (orjson 우선, 64비트 초과 정수 등은 json.dumps)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 렌더링하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
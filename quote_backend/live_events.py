@@ -0,0 +1,329 @@
+"""
+Live Events - 비딩 목록/알림 실시간 push
+입찰 수/상태/마감 변경과 알림·메시지 도착을 SSE 구독자에게 전달 (목록·배지 polling 대체)
+
+    sub = broker.subscribe(bidding_filter(shipping_type="ocean"))
+    event = await sub.get(timeout=15)
+
+쓰기 경로는 직접 publish하지 않습니다. 세션이 flush한 Bidding/Bid/Notification/Message를 기록해 두었다가
+commit 이후에 한 번의 조회로 비딩 스냅샷을 만들어 보냅니다 (롤백된 변경은 보내지 않음).
+ORM 객체 없이 실행한 UPDATE/INSERT는 track_biddings(db, *ids)로 알려줍니다.
+
+- LIVE_BROKER_URL 미설정: 프로세스 내 브로커 (워커 1개)
+- LIVE_BROKER_URL=redis://…: Redis pub/sub으로 워커/스케줄러 프로세스 간 전달
+  (redis 패키지 필요, Valkey/KeyDB 등 Redis 호환 서버 사용 가능)
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+import asyncio
+import json
+import logging
+import os
+import threading
+
+from sqlalchemy import and_, event, func, select
+from sqlalchemy.orm import Session
+
+from models import Bid, Bidding, Message, Notification, QuoteRequest
+
+logger = logging.getLogger(__name__)
+
+LIVE_BROKER_URL = os.getenv("LIVE_BROKER_URL", "")
+LIVE_CHANNEL = os.getenv("LIVE_CHANNEL", "live_events")
+LIVE_KEEPALIVE_SECONDS = float(os.getenv("LIVE_KEEPALIVE_SECONDS", "15"))
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "100"))  # 구독자별 미전송 이벤트 상한
+LIVE_RETRY_MS = int(os.getenv("LIVE_RETRY_MS", "3000"))  # EventSource 재연결 대기
+
+_BIDDINGS_KEY = "live_events_biddings"
+_INBOX_KEY = "live_events_inbox"
+
+# Message는 shipper, Notification은 customer로 화주를 표기
+RECIPIENT_ALIASES = {"shipper": "customer", "customer": "shipper"}
+
+Matcher = Callable[[dict], bool]
+
+
+# ==========================================
+# SUBSCRIPTIONS / BROKER
+# ==========================================
+
+class Subscription:
+    """구독자 1명의 이벤트 큐 (이벤트 루프 소유, 다른 스레드에서는 put만 호출)"""
+
+    def __init__(self, matcher: Matcher, loop: asyncio.AbstractEventLoop, maxsize: int = LIVE_QUEUE_SIZE):
+        self.matcher = matcher
+        self.loop = loop
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._events: deque = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, event: dict):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: dict):
+        if len(self._events) >= self.maxsize:
+            # 느린 클라이언트: 쌓인 이벤트 대신 전체 재조회 요청 한 건
+            self._events.clear()
+            self.dropped += 1
+            event = {"type": "resync"}
+        self._events.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        if not self._events:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._events.popleft()
+
+
+class InProcessBroker:
+    """프로세스 내 fan-out 브로커 (publish는 어느 스레드에서나 호출 가능)"""
+
+    def __init__(self):
+        self._subscribers: set = set()
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, matcher: Matcher, maxsize: int = LIVE_QUEUE_SIZE) -> Subscription:
+        """이벤트 루프 안에서 호출"""
+        subscription = Subscription(matcher, asyncio.get_running_loop(), maxsize)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def wants_events(self) -> bool:
+        """구독자가 없으면 commit 후 스냅샷 조회 생략"""
+        return bool(self._subscribers)
+
+    def publish(self, event: dict):
+        self._fan_out(event)
+
+    def _fan_out(self, event: dict):
+        self.published += 1
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            if subscription.matcher(event):
+                try:
+                    subscription.put(event)
+                except RuntimeError:
+                    # 루프가 이미 닫힌 구독자
+                    self.unsubscribe(subscription)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class RedisBroker(InProcessBroker):
+    """Redis pub/sub 채널을 거쳐 fan-out (다른 워커/스케줄러 프로세스의 이벤트 포함)"""
+
+    def __init__(self, url: str, channel: str = LIVE_CHANNEL):
+        super().__init__()
+        import redis  # 선택 의존성: LIVE_BROKER_URL을 쓸 때만 필요
+
+        self.channel = channel
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def wants_events(self) -> bool:
+        return True  # 다른 프로세스의 구독자는 알 수 없음
+
+    def publish(self, event: dict):
+        self._client.publish(self.channel, json.dumps(event, default=str))
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        self._thread = threading.Thread(target=self._listen, name="live-events-redis", daemon=True)
+        self._thread.start()
+
+    def _listen(self):
+        try:
+            for message in self._pubsub.listen():
+                try:
+                    self._fan_out(json.loads(message["data"]))
+                except (TypeError, ValueError):
+                    logger.warning("Ignoring malformed live event: %r", message.get("data"))
+        except Exception as e:  # 연결 종료(stop) 포함
+            logger.info(f"Live event listener stopped: {e}")
+
+    def stop(self):
+        if self._pubsub is not None:
+            self._pubsub.close()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def create_broker(url: str = LIVE_BROKER_URL) -> InProcessBroker:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBroker(url)
+    return InProcessBroker()
+
+
+broker = create_broker()
+
+
+# ==========================================
+# FILTERS / FORMAT
+# ==========================================
+
+def bidding_filter(
+    bidding_ids: Optional[Iterable[int]] = None,
+    shipping_type: Optional[str] = None,
+    recipient_type: Optional[str] = None,
+    recipient_id: Optional[int] = None,
+    biddings: bool = True,
+) -> Matcher:
+    """
+    구독 조건 → 이벤트 matcher
+
+    - bidding_ids: 상세 화면처럼 특정 비딩만 (없으면 목록 전체, shipping_type으로 좁힘)
+    - recipient_type/recipient_id: 해당 사용자의 알림/메시지 도착 이벤트 포함
+    - biddings=False: 비딩 이벤트 제외 (알림 배지만 필요한 화면)
+    상태 필터는 적용하지 않습니다 (open → awarded처럼 목록에서 빠지는 변경도 전달해야 함).
+    """
+    ids = set(bidding_ids or ())
+    recipients = set()
+    if recipient_type and recipient_id is not None:
+        recipients = {(recipient_type, recipient_id), (RECIPIENT_ALIASES.get(recipient_type, recipient_type), recipient_id)}
+
+    def matches(event: dict) -> bool:
+        kind = event.get("type")
+        if kind == "bidding":
+            if not biddings:
+                return False
+            if ids:
+                return event["bidding_id"] in ids
+            return not shipping_type or event.get("shipping_type") == shipping_type
+        if kind == "inbox":
+            return (event["recipient_type"], event["recipient_id"]) in recipients
+        return True
+
+    return matches
+
+
+def format_sse(event: dict) -> str:
+    """SSE 프레임 (event 이름 = type)"""
+    return f"event: {event.get('type', 'message')}\ndata: {json.dumps(event, default=str, ensure_ascii=False)}\n\n"
+
+
+async def sse_stream(subscription: Subscription, is_disconnected: Callable[[], Awaitable[bool]],
+                     keepalive: float = LIVE_KEEPALIVE_SECONDS) -> AsyncIterator[str]:
+    """
+    구독 이벤트를 SSE 프레임으로 (이벤트가 없으면 keepalive 주석), 연결이 끊기면 구독 해제
+
+    재연결 시 클라이언트는 목록을 한 번 다시 읽고 이후 변경만 받습니다 (이벤트 재전송 없음).
+    """
+    try:
+        yield f"retry: {LIVE_RETRY_MS}\n\n"
+        while not await is_disconnected():
+            event = await subscription.get(keepalive)
+            yield format_sse(event) if event is not None else ": keepalive\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+# ==========================================
+# SESSION HOOKS
+# ==========================================
+
+def track_biddings(db: Session, *bidding_ids: int):
+    """ORM 객체 없이 변경한 비딩을 commit 후 발행 대상에 추가"""
+    db.info.setdefault(_BIDDINGS_KEY, set()).update(i for i in bidding_ids if i is not None)
+
+
+def bidding_snapshots(conn, bidding_ids: Iterable[int]) -> Dict[int, dict]:
+    """비딩별 현재 상태/마감/입찰 수/평균가 (한 번의 조회)"""
+    submitted = and_(Bid.bidding_id == Bidding.id, Bid.status == "submitted")
+    rows = conn.execute(
+        select(
+            Bidding.id, Bidding.bidding_no, Bidding.status, Bidding.deadline, QuoteRequest.shipping_type,
+            select(func.count(Bid.id)).where(submitted).scalar_subquery(),
+            select(func.avg(Bid.total_amount)).where(submitted).scalar_subquery(),
+        )
+        .join(QuoteRequest, QuoteRequest.id == Bidding.quote_request_id)
+        .where(Bidding.id.in_(list(bidding_ids)))
+    )
+    now = datetime.now()
+    return {
+        row[0]: {
+            "type": "bidding",
+            "bidding_id": row[0],
+            "bidding_no": row[1],
+            "status": "expired" if row[2] == "open" and row[3] and row[3] <= now else row[2],
+            "deadline": row[3].isoformat() if row[3] else None,
+            "shipping_type": row[4],
+            "bid_count": row[5],
+            "avg_bid_price": round(float(row[6]), 2) if row[6] else None,
+        }
+        for row in rows
+    }
+
+
+def _record(session: Session, instances):
+    for instance in instances:
+        if isinstance(instance, Bidding):
+            track_biddings(session, instance.id)
+        elif isinstance(instance, Bid):
+            track_biddings(session, instance.bidding_id)
+        elif isinstance(instance, (Notification, Message)):
+            session.info.setdefault(_INBOX_KEY, set()).add((
+                "notification" if isinstance(instance, Notification) else "message",
+                instance.recipient_type,
+                instance.recipient_id,
+            ))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed(session, flush_context):
+    for instances in (session.new, session.dirty, session.deleted):
+        _record(session, instances)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session):
+    bidding_ids = session.info.pop(_BIDDINGS_KEY, None)
+    inbox = session.info.pop(_INBOX_KEY, None)
+    if not (bidding_ids or inbox) or not broker.wants_events:
+        return
+    try:
+        if bidding_ids:
+            with session.get_bind().engine.connect() as conn:
+                for snapshot in bidding_snapshots(conn, bidding_ids).values():
+                    broker.publish(snapshot)
+        for kind, recipient_type, recipient_id in inbox or ():
+            broker.publish({"type": "inbox", "kind": kind,
+                            "recipient_type": recipient_type, "recipient_id": recipient_id})
+    except Exception as e:
+        # 실시간 알림 실패가 이미 commit된 요청을 실패시키지 않도록
+        logger.warning(f"Failed to publish live events: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session):
+    session.info.pop(_BIDDINGS_KEY, None)
+    session.info.pop(_INBOX_KEY, None)
@@ -3,16 +3,17 @@ FastAPI Backend - Quote Request System
 Main Application Entry Point
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
-from typing import List, Optional
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session, contains_eager, selectinload
+from sqlalchemy import or_, and_, case, exists, func, insert, literal, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+from typing import List, NamedTuple, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import random
-import string
 import os
 import requests
 from functools import lru_cache
@@ -79,7 +80,7 @@ def get_bok_exchange_rate(currency: str, cache_key: str = None) -> float:
         # 기본값 반환
         return default_rates.get(currency.upper(), 1.0)
 
-from database import get_db, engine
+from database import get_db, engine, run_write, year_month
 from models import (
     Base, Port, ContainerType, TruckType, Incoterm, Customer, QuoteRequest, 
     CargoDetail, Bidding, Forwarder, Bid, Notification, Rating,
@@ -135,7 +136,14 @@ from schemas import (
     # Forwarder Profile schemas
     ForwarderProfileResponse, ForwarderTopRoute, ForwarderShippingModeStats, ForwarderReviewItem
 )
-from pdf_generator import RFQPDFGenerator
+from email_service import enqueue_email, outbox_worker
+from query_cache import stats_cache, validation_cache, watch_tables
+from route_catalogue import get_route_catalogue
+from document_numbers import last_issued, next_sequence
+from live_events import bidding_filter, broker as live_broker, sse_stream, track_biddings
+from json_response import FastJSONResponse
+from telemetry import TelemetryMiddleware, metrics_response, query_budget
+from compression import CompressionMiddleware
 import hashlib
 import secrets
 import bcrypt
@@ -183,7 +191,9 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="AAL Quote & Commerce API",
     description="API for international shipping quotes and B2B commerce",
-    version="2.0.0"
+    version="2.0.0",
+    # 응답 JSON 인코딩은 orjson (json_response.py)
+    default_response_class=FastJSONResponse,
 )
 
 # CORS Configuration
@@ -202,9 +212,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 1KB 이상 JSON/텍스트 응답 brotli/gzip 압축 (SSE/파일 스트림 제외)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 지연시간/SQL 문 수 → GET /metrics (Prometheus), query_budget 검사 (가장 바깥)
+app.add_middleware(TelemetryMiddleware)
+
 # Register Commerce Router
 app.include_router(commerce_router)
 
+# 이메일 outbox 발송 스레드 (EMAIL_OUTBOX_WORKER=false면 별도 프로세스에서 실행)
+EMAIL_OUTBOX_WORKER = os.getenv("EMAIL_OUTBOX_WORKER", "true").lower() == "true"
+
+
+@app.on_event("startup")
+def start_email_outbox_worker():
+    if EMAIL_OUTBOX_WORKER:
+        outbox_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_email_outbox_worker():
+    outbox_worker.stop()
+
+
+@app.on_event("startup")
+def start_live_broker():
+    live_broker.start()
+
+
+@app.on_event("shutdown")
+def stop_live_broker():
+    live_broker.stop()
+
 
 # ==========================================
 # UTILITY FUNCTIONS
@@ -286,47 +326,62 @@ def normalize_container_type(value: str) -> str:
     return mapping.get(normalized, value)
 
 
-def find_container_type(db: Session, ct_value: str):
+class CatalogType(NamedTuple):
+    """컨테이너/트럭 타입 기준 데이터 한 행 (화면 표시용 필드만)"""
+    code: str
+    name: str
+    abbreviation: Optional[str]
+
+
+def _type_catalog(db: Session, model) -> List[CatalogType]:
+    """
+    컨테이너/트럭 타입 전체 목록 (작은 기준 테이블이라 통째로 캐시, 테이블 변경 commit 시 무효화)
+    
+    목록 화면이 값마다 DB를 조회하지 않도록 검색은 메모리에서 합니다.
+    """
+    return stats_cache.get_or_set("type_catalog", model.__tablename__, lambda: [
+        CatalogType(row.code, row.name, row.abbreviation)
+        for row in db.query(model.code, model.name, model.abbreviation).order_by(model.id).all()
+    ])
+
+
+watch_tables(stats_cache, "type_catalog", "container_types", "truck_types")
+
+
+def find_container_type(db: Session, ct_value: str) -> Optional[CatalogType]:
     """
-    다양한 방식으로 컨테이너 타입 검색 (code, abbreviation, name)
+    다양한 방식으로 컨테이너 타입 검색 (code → abbreviation → name(대소문자 무시) → 정규화 후 abbreviation)
     """
     if not ct_value:
         return None
     
-    # 1. 먼저 code로 정확히 검색
-    container = db.query(ContainerType).filter(
-        ContainerType.code == ct_value
-    ).first()
-    if container:
-        return container
-    
-    # 2. abbreviation으로 검색
-    container = db.query(ContainerType).filter(
-        ContainerType.abbreviation == ct_value
-    ).first()
-    if container:
-        return container
-    
-    # 3. name으로 검색 (대소문자 무시)
-    container = db.query(ContainerType).filter(
-        func.lower(ContainerType.name) == ct_value.lower()
-    ).first()
-    if container:
-        return container
-    
-    # 4. 정규화된 값으로 다시 검색
+    catalog = _type_catalog(db, ContainerType)
+    lowered = ct_value.lower()
     normalized = normalize_container_type(ct_value)
-    if normalized != ct_value:
-        # abbreviation으로 검색 (정규화 후)
-        container = db.query(ContainerType).filter(
-            ContainerType.abbreviation == normalized
-        ).first()
+    for matches in (
+        lambda ct: ct.code == ct_value,
+        lambda ct: ct.abbreviation == ct_value,
+        lambda ct: ct.name.lower() == lowered,
+        lambda ct: normalized != ct_value and ct.abbreviation == normalized,
+    ):
+        container = next((ct for ct in catalog if matches(ct)), None)
         if container:
             return container
     
     return None
 
 
+def find_truck_type(db: Session, tt_value: str) -> Optional[CatalogType]:
+    """
+    다양한 방식으로 트럭 타입 검색 (code, abbreviation, name)
+    """
+    lowered = tt_value.lower()
+    return next((
+        tt for tt in _type_catalog(db, TruckType)
+        if tt.code == tt_value or tt.abbreviation == tt_value or tt.name.lower() == lowered
+    ), None)
+
+
 def generate_cargo_summary(
     shipping_type: str, 
     load_type: str, 
@@ -410,12 +465,7 @@ def generate_cargo_summary(
             # Get abbreviations from database
             summaries = []
             for tt_value, data in truck_counts.items():
-                # 다양한 방식으로 트럭 타입 검색
-                truck = db.query(TruckType).filter(
-                    (TruckType.code == tt_value) |
-                    (TruckType.abbreviation == tt_value) |
-                    (func.lower(TruckType.name) == tt_value.lower())
-                ).first()
+                truck = find_truck_type(db, tt_value)
                 
                 if truck and truck.abbreviation:
                     abbr = truck.abbreviation
@@ -442,11 +492,14 @@ def generate_cargo_summary(
         return None
 
 
-def generate_request_number() -> str:
-    """Generate unique request number: QR-YYYYMMDD-XXX"""
+def generate_request_number(db: Session) -> str:
+    """Generate unique request number: QR-YYYYMMDD-XXX (일별 카운터)"""
     date_str = datetime.now().strftime("%Y%m%d")
-    random_str = ''.join(random.choices(string.digits, k=3))
-    return f"QR-{date_str}-{random_str}"
+    seq = next_sequence(
+        db, "QR-", date_str,
+        initial=lambda: last_issued(db, QuoteRequest.request_number, f"QR-{date_str}-")
+    )
+    return f"QR-{date_str}-{str(seq).zfill(3)}"
 
 
 def parse_datetime(date_str: str) -> datetime:
@@ -498,19 +551,13 @@ def generate_bidding_no(trade_mode: str, shipping_type: str, db: Session) -> str
     
     prefix = trade_map.get(trade_mode, "XX") + ship_map.get(shipping_type, "XXX")
     
-    # Find the last bidding number with this prefix
-    last_bidding = db.query(Bidding).filter(
-        Bidding.bidding_no.like(f"{prefix}%")
-    ).order_by(Bidding.bidding_no.desc()).first()
-    
-    if last_bidding:
-        # Extract sequence and increment
-        last_seq = int(last_bidding.bidding_no[-5:])
-        new_seq = str(last_seq + 1).zfill(5)
-    else:
-        new_seq = "00000"
+    # 접두어별 카운터 (처음이면 기존 마지막 번호부터, 없으면 00000부터)
+    seq = next_sequence(
+        db, prefix,
+        initial=lambda: last_issued(db, Bidding.bidding_no, prefix, default=-1)
+    )
     
-    return f"{prefix}{new_seq}"
+    return f"{prefix}{str(seq).zfill(5)}"
 
 
 def calculate_deadline(etd: datetime, shipping_type: str) -> datetime:
@@ -657,11 +704,7 @@ def submit_quote_request(
             customer.phone = request_data.customer.phone
         
         # Generate request number
-        request_number = generate_request_number()
-        
-        # Ensure unique request number
-        while db.query(QuoteRequest).filter(QuoteRequest.request_number == request_number).first():
-            request_number = generate_request_number()
+        request_number = generate_request_number(db)
         
         # Parse dates (both ETD and ETA are required)
         etd = parse_datetime(request_data.etd)
@@ -734,6 +777,7 @@ def submit_quote_request(
             # Refresh quote_request to include relationships
             db.refresh(quote_request)
             
+            from pdf_generator import RFQPDFGenerator  # ReportLab: PDF 생성 때만 import
             pdf_generator = RFQPDFGenerator(bidding_no, quote_request, deadline)
             pdf_generator.generate(pdf_path)
         except Exception as pdf_error:
@@ -863,6 +907,7 @@ def update_quote_request(
         
         try:
             db.refresh(quote_request)
+            from pdf_generator import RFQPDFGenerator
             pdf_generator = RFQPDFGenerator(bidding_no, quote_request, deadline)
             pdf_generator.generate(pdf_path)
             bidding.pdf_path = pdf_path
@@ -1179,6 +1224,7 @@ def get_forwarder_profile_basic(
 # ==========================================
 
 @app.get("/api/forwarders/{forwarder_id}/profile", response_model=ForwarderProfileResponse, tags=["Forwarder Profile"])
+@query_budget(8)
 def get_forwarder_profile(
     forwarder_id: int,
     limit_reviews: int = 10,
@@ -1197,29 +1243,40 @@ def get_forwarder_profile(
     if not forwarder:
         raise HTTPException(status_code=404, detail="Forwarder not found")
     
-    # 모든 입찰 조회 (submitted 또는 awarded)
-    bids = db.query(Bid).filter(
+    # 모든 입찰 조회 (submitted 또는 awarded) - 루트/운송 모드 집계용 견적 요청 정보를 한 번에 조인
+    bids = db.query(
+        Bid.status, QuoteRequest.id.label("quote_request_id"),
+        QuoteRequest.pol, QuoteRequest.pod, QuoteRequest.shipping_type
+    ).outerjoin(
+        Bidding, Bidding.id == Bid.bidding_id
+    ).outerjoin(
+        QuoteRequest, QuoteRequest.id == Bidding.quote_request_id
+    ).filter(
         Bid.forwarder_id == forwarder_id,
         Bid.status.in_(["submitted", "awarded"])
-    ).all()
+    ).order_by(Bid.id).all()
     
     total_bids = len(bids)
     total_awarded = sum(1 for b in bids if b.status == "awarded")
     award_rate = (total_awarded / total_bids * 100) if total_bids > 0 else 0.0
     
-    # 주요 루트 계산 (입찰 이력 기반)
+    # 주요 루트 / 운송 모드별 집계 (입찰 이력 기반, 견적 요청이 없는 입찰은 제외)
     route_counts = {}
+    shipping_mode_counts = {}
     for bid in bids:
-        bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-            if quote_req:
-                route_key = (quote_req.pol, quote_req.pod)
-                if route_key not in route_counts:
-                    route_counts[route_key] = {"count": 0, "awarded": 0}
-                route_counts[route_key]["count"] += 1
-                if bid.status == "awarded":
-                    route_counts[route_key]["awarded"] += 1
+        if bid.quote_request_id is None:
+            continue
+        route_key = (bid.pol, bid.pod)
+        if route_key not in route_counts:
+            route_counts[route_key] = {"count": 0, "awarded": 0}
+        route_counts[route_key]["count"] += 1
+        mode = bid.shipping_type
+        if mode not in shipping_mode_counts:
+            shipping_mode_counts[mode] = {"count": 0, "awarded": 0}
+        shipping_mode_counts[mode]["count"] += 1
+        if bid.status == "awarded":
+            route_counts[route_key]["awarded"] += 1
+            shipping_mode_counts[mode]["awarded"] += 1
     
     # Top 5 루트 정렬
     top_routes = []
@@ -1232,20 +1289,6 @@ def get_forwarder_profile(
             awarded_count=data["awarded"]
         ))
     
-    # 운송 모드별 통계
-    shipping_mode_counts = {}
-    for bid in bids:
-        bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-            if quote_req:
-                mode = quote_req.shipping_type
-                if mode not in shipping_mode_counts:
-                    shipping_mode_counts[mode] = {"count": 0, "awarded": 0}
-                shipping_mode_counts[mode]["count"] += 1
-                if bid.status == "awarded":
-                    shipping_mode_counts[mode]["awarded"] += 1
-    
     shipping_mode_stats = []
     for mode, data in shipping_mode_counts.items():
         percentage = (data["count"] / total_bids * 100) if total_bids > 0 else 0.0
@@ -1289,16 +1332,25 @@ def get_forwarder_profile(
         Rating.is_visible == True
     ).order_by(Rating.created_at.desc()).limit(limit_reviews).all()
     
+    # 리뷰의 비딩/견적 요청/화주 정보를 한 번에 조회
+    review_biddings = {}
+    review_customers = {}
+    if reviews_query:
+        review_biddings = {
+            bidding.id: (bidding, quote_req)
+            for bidding, quote_req in db.query(Bidding, QuoteRequest).outerjoin(
+                QuoteRequest, QuoteRequest.id == Bidding.quote_request_id
+            ).filter(Bidding.id.in_({r.bidding_id for r in reviews_query})).all()
+        }
+        review_customers = {
+            customer.id: customer
+            for customer in db.query(Customer).filter(Customer.id.in_({r.customer_id for r in reviews_query})).all()
+        }
+    
     reviews = []
     for r in reviews_query:
-        # 비딩 정보 조회
-        bidding = db.query(Bidding).filter(Bidding.id == r.bidding_id).first()
-        quote_req = None
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-        
-        # 화주 정보 조회
-        customer = db.query(Customer).filter(Customer.id == r.customer_id).first()
+        bidding, quote_req = review_biddings.get(r.bidding_id, (None, None))
+        customer = review_customers.get(r.customer_id)
         customer_company_masked = mask_company_name(customer.company) if customer else "***"
         
         reviews.append(ForwarderReviewItem(
@@ -1353,53 +1405,46 @@ def get_bidding_stats(db: Session = Depends(get_db)):
     - awarded_count: 낙찰 완료 건수
     - failed_count: 유찰/마감 건수 (closed + cancelled + expired + 마감일 지난 open)
     """
+    return stats_cache.get_or_set("bidding_stats", None, lambda: _compute_bidding_stats(db))
+
+
+def _compute_bidding_stats(db: Session) -> BiddingStatsResponse:
+    """상태별 건수를 SUM(CASE …) 한 번으로 집계 (idx_bidding_status_deadline 스캔)"""
     now = datetime.now()
     tomorrow = now + timedelta(hours=24)
-    
-    total_count = db.query(Bidding).count()
-    
-    # open_count: status가 'open'이고 마감일이 아직 지나지 않은 것
-    open_count = db.query(Bidding).filter(
-        Bidding.status == "open",
-        or_(
-            Bidding.deadline == None,
-            Bidding.deadline > now
-        )
-    ).count()
-    
-    # closing_soon_count: status가 'open'이고 24시간 이내 마감 예정
-    closing_soon_count = db.query(Bidding).filter(
-        Bidding.status == "open",
-        Bidding.deadline <= tomorrow,
-        Bidding.deadline > now
-    ).count()
-    
-    awarded_count = db.query(Bidding).filter(Bidding.status == "awarded").count()
-    
-    # failed_count: closed, cancelled, expired 상태 + 마감일이 지난 open 상태
-    explicitly_failed = db.query(Bidding).filter(
-        Bidding.status.in_(["closed", "cancelled", "expired"])
-    ).count()
-    
-    # 마감일이 지났지만 아직 status가 'open'인 것들도 마감으로 카운트
-    expired_but_open = db.query(Bidding).filter(
-        Bidding.status == "open",
-        Bidding.deadline != None,
-        Bidding.deadline <= now
-    ).count()
-    
-    failed_count = explicitly_failed + expired_but_open
+    is_open = Bidding.status == "open"
+    
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+    
+    row = db.query(
+        func.count(),
+        # open_count: status가 'open'이고 마감일이 아직 지나지 않은 것
+        count_if(and_(is_open, or_(Bidding.deadline == None, Bidding.deadline > now))),
+        # closing_soon_count: status가 'open'이고 24시간 이내 마감 예정
+        count_if(and_(is_open, Bidding.deadline <= tomorrow, Bidding.deadline > now)),
+        count_if(Bidding.status == "awarded"),
+        # failed_count: closed, cancelled, expired 상태 + 마감일이 지났지만 아직 'open'인 것
+        count_if(or_(
+            Bidding.status.in_(["closed", "cancelled", "expired"]),
+            and_(is_open, Bidding.deadline != None, Bidding.deadline <= now)
+        )),
+    ).select_from(Bidding).one()
     
     return BiddingStatsResponse(
-        total_count=total_count,
-        open_count=open_count,
-        closing_soon_count=closing_soon_count,
-        awarded_count=awarded_count,
-        failed_count=failed_count
+        total_count=row[0],
+        open_count=row[1],
+        closing_soon_count=row[2],
+        awarded_count=row[3],
+        failed_count=row[4]
     )
 
 
+watch_tables(stats_cache, "bidding_stats", "biddings")
+
+
 @app.get("/api/bidding/list", response_model=BiddingListResponse, tags=["Bidding List"])
+@query_budget(10)
 def get_bidding_list(
     status: Optional[str] = None,
     shipping_type: Optional[str] = None,
@@ -1482,39 +1527,53 @@ def get_bidding_list(
     
     # Apply pagination
     offset = (page - 1) * limit
-    biddings = query.order_by(Bidding.created_at.desc()).offset(offset).limit(limit).all()
+    biddings = query.options(
+        contains_eager(Bidding.quote_request).contains_eager(QuoteRequest.customer),
+        contains_eager(Bidding.quote_request).selectinload(QuoteRequest.cargo_details)
+    ).order_by(Bidding.created_at.desc()).offset(offset).limit(limit).all()
+    
+    # 페이지 단위로 입찰 수/평균가, 내 입찰, 항구 이름을 한 번에 조회
+    bidding_ids = [b.id for b in biddings]
+    bid_stats = {}
+    my_bids = {}
+    ports = {}
+    if biddings:
+        bid_stats = {
+            row.bidding_id: row
+            for row in db.query(
+                Bid.bidding_id,
+                func.count(Bid.id).label("bid_count"),
+                func.avg(Bid.total_amount).label("avg_amount")
+            ).filter(
+                Bid.bidding_id.in_(bidding_ids),
+                Bid.status == "submitted"
+            ).group_by(Bid.bidding_id).all()
+        }
+        
+        if forwarder_id:
+            for bidding_id, bid_status in db.query(Bid.bidding_id, Bid.status).filter(
+                Bid.bidding_id.in_(bidding_ids),
+                Bid.forwarder_id == forwarder_id
+            ).order_by(Bid.id).all():
+                my_bids.setdefault(bidding_id, bid_status)
+        
+        port_codes = {code for b in biddings for code in (b.quote_request.pol, b.quote_request.pod)}
+        ports = {port.code: port for port in db.query(Port).filter(Port.code.in_(port_codes)).all()}
     
     # Build response
     items = []
     for b in biddings:
         qr = b.quote_request
         
-        # Count bids for this bidding
-        bid_count = db.query(Bid).filter(
-            Bid.bidding_id == b.id,
-            Bid.status == "submitted"
-        ).count()
-        
-        # Calculate average bid price
+        # Bid count / average bid price (submitted only)
+        stats = bid_stats.get(b.id)
+        bid_count = stats.bid_count if stats else 0
         avg_bid_price = None
         if bid_count > 0:
-            from sqlalchemy import func
-            avg_result = db.query(func.avg(Bid.total_amount)).filter(
-                Bid.bidding_id == b.id,
-                Bid.status == "submitted",
-                Bid.total_amount.isnot(None)
-            ).scalar()
-            avg_bid_price = round(float(avg_result), 2) if avg_result else None
+            avg_bid_price = round(float(stats.avg_amount), 2) if stats.avg_amount else None
         
         # Check if forwarder has already bid
-        my_bid_status = None
-        if forwarder_id:
-            my_bid = db.query(Bid).filter(
-                Bid.bidding_id == b.id,
-                Bid.forwarder_id == forwarder_id
-            ).first()
-            if my_bid:
-                my_bid_status = my_bid.status
+        my_bid_status = my_bids.get(b.id) if forwarder_id else None
         
         # Determine effective status (expired if deadline passed and still open)
         effective_status = b.status
@@ -1531,8 +1590,8 @@ def get_bidding_list(
         )
         
         # Get port names for POL/POD
-        pol_port = db.query(Port).filter(Port.code == qr.pol).first()
-        pod_port = db.query(Port).filter(Port.code == qr.pod).first()
+        pol_port = ports.get(qr.pol)
+        pod_port = ports.get(qr.pod)
         
         pol_name = f"{pol_port.name}, {pol_port.country}".upper() if pol_port else None
         pod_name = f"{pod_port.name}, {pod_port.country}".upper() if pod_port else None
@@ -1564,6 +1623,39 @@ def get_bidding_list(
     )
 
 
+@app.get("/api/live/biddings", tags=["Bidding List"])
+async def stream_bidding_events(
+    request: Request,
+    bidding_id: Optional[List[int]] = Query(None),
+    shipping_type: Optional[str] = None,
+    user_type: Optional[str] = None,
+    user_id: Optional[int] = None,
+    biddings: bool = True
+):
+    """
+    비딩 변경 실시간 구독 (Server-Sent Events)
+    
+    - bidding_id: 특정 비딩만 구독 (여러 개 가능, 없으면 목록 전체)
+    - shipping_type: 목록 구독 시 운송 유형 필터
+    - user_type/user_id: 해당 사용자의 알림·메시지 도착(inbox) 이벤트 포함
+    - biddings: false면 inbox 이벤트만 (마이페이지 배지)
+    
+    이벤트: bidding (입찰 수/평균가/상태/마감), inbox (알림/메시지 도착), resync (전체 재조회 필요)
+    """
+    subscription = live_broker.subscribe(bidding_filter(
+        bidding_ids=bidding_id,
+        shipping_type=shipping_type,
+        recipient_type=user_type,
+        recipient_id=user_id,
+        biddings=biddings
+    ))
+    return StreamingResponse(
+        sse_stream(subscription, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/api/bidding/{bidding_no}/detail", response_model=BiddingDetailResponse, tags=["Bidding List"])
 def get_bidding_detail(
     bidding_no: str,
@@ -1715,6 +1807,47 @@ def get_bidding_detail(
 # BID ENDPOINTS (for Forwarders)
 # ==========================================
 
+def _forwarder_exists(db: Session, forwarder_id: int) -> bool:
+    """포워더 존재 여부 (짧은 TTL 캐시)"""
+    return validation_cache.get_or_set(
+        "forwarder_exists", forwarder_id,
+        lambda: db.query(Forwarder.id).filter(Forwarder.id == forwarder_id).first() is not None
+    )
+
+
+def _bidding_state(db: Session, bidding_id: int, fresh: bool = False):
+    """비딩 (status, deadline) (짧은 TTL 캐시, 없으면 None)"""
+    state = None if fresh else validation_cache.get("bidding_state", bidding_id)
+    if state is None:
+        row = db.query(Bidding.status, Bidding.deadline).filter(Bidding.id == bidding_id).first()
+        state = (row.status, row.deadline) if row else ()
+        validation_cache.set("bidding_state", bidding_id, state)
+    return state or None
+
+
+def _raise_if_not_biddable(state, closed_detail: str = "Bidding is not open for bids"):
+    if state is None:
+        raise HTTPException(status_code=404, detail="Bidding not found")
+    status, deadline = state
+    if status != "open":
+        raise HTTPException(status_code=400, detail=closed_detail)
+    if deadline and datetime.now() > deadline:
+        raise HTTPException(status_code=400, detail="Bidding deadline has passed")
+
+
+def _bidding_open(bidding_id_column, now: datetime):
+    """입찰 가능한 비딩 조건 (INSERT … SELECT / UPDATE … WHERE EXISTS에 사용)"""
+    return and_(
+        Bidding.id == bidding_id_column,
+        Bidding.status == "open",
+        or_(Bidding.deadline == None, Bidding.deadline >= now)
+    )
+
+
+watch_tables(validation_cache, "forwarder_exists", "forwarders")
+watch_tables(validation_cache, "bidding_state", "biddings")
+
+
 @app.post("/api/bid/submit", response_model=BidSubmitResponse, tags=["Bid"])
 def submit_bid(
     bid_data: BidCreate,
@@ -1727,65 +1860,76 @@ def submit_bid(
     - forwarder_id: 포워더 ID (헤더 또는 쿼리로 전달)
     - 마감 전까지만 제출 가능
     - 동일 포워더가 동일 비딩에 중복 제출 불가 (수정은 PUT 사용)
+    
+    포워더/비딩 확인은 캐시로 먼저 거르고, 실제 입찰은 비딩이 열려 있을 때만 행을 만드는
+    INSERT … SELECT 한 번으로 처리합니다. 중복 제출은 (bidding_id, forwarder_id) 유니크 제약이 막습니다.
     """
     try:
-        # Verify forwarder exists
-        forwarder = db.query(Forwarder).filter(Forwarder.id == forwarder_id).first()
-        if not forwarder:
+        # Verify forwarder exists / bidding is open (cached)
+        if not _forwarder_exists(db, forwarder_id):
             raise HTTPException(status_code=404, detail="Forwarder not found")
         
-        # Verify bidding exists and is open
-        bidding = db.query(Bidding).filter(Bidding.id == bid_data.bidding_id).first()
-        if not bidding:
-            raise HTTPException(status_code=404, detail="Bidding not found")
-        
-        if bidding.status != "open":
-            raise HTTPException(status_code=400, detail="Bidding is not open for bids")
+        _raise_if_not_biddable(_bidding_state(db, bid_data.bidding_id))
         
-        # Check deadline
-        if bidding.deadline and datetime.now() > bidding.deadline:
-            raise HTTPException(status_code=400, detail="Bidding deadline has passed")
+        # Parse validity date
+        validity_date = None
+        if bid_data.validity_date:
+            validity_date = parse_datetime(bid_data.validity_date)
         
-        # Check for existing bid
-        existing_bid = db.query(Bid).filter(
-            Bid.bidding_id == bid_data.bidding_id,
-            Bid.forwarder_id == forwarder_id
-        ).first()
+        now = datetime.now()
+        values = {
+            "bidding_id": bid_data.bidding_id,
+            "forwarder_id": forwarder_id,
+            "total_amount": bid_data.total_amount,
+            "freight_charge": bid_data.freight_charge,
+            "local_charge": bid_data.local_charge,
+            "other_charge": bid_data.other_charge,
+            "validity_date": validity_date,
+            "transit_time": bid_data.transit_time,
+            "remark": bid_data.remark,
+            "status": "submitted",
+            "submitted_at": now,
+        }
+        columns = Bid.__table__.c
+        
+        def insert_and_commit():
+            # Create bid only while the bidding is open (conditional insert)
+            bid = db.scalars(
+                insert(Bid).from_select(
+                    list(values),
+                    select(*[literal(value, columns[name].type) for name, value in values.items()])
+                    .where(_bidding_open(bid_data.bidding_id, now))
+                ).returning(Bid)
+            ).first()
+            if bid is None:
+                db.rollback()
+                return None
+            
+            response = BidSubmitResponse(
+                success=True,
+                message="Bid submitted successfully",
+                bid=BidResponse.model_validate(bid)
+            )
+            track_biddings(db, bid.bidding_id)
+            db.commit()
+            return response
         
-        if existing_bid:
+        # INSERT부터 commit까지 한 단위로 단일 writer 스레드에서 실행 (SQLite 쓰기 잠금 경합 방지)
+        try:
+            response = run_write(insert_and_commit)
+        except IntegrityError:
+            db.rollback()
             raise HTTPException(
                 status_code=400, 
                 detail="You have already submitted a bid. Use PUT /api/bid/{bid_id} to update."
             )
         
-        # Parse validity date
-        validity_date = None
-        if bid_data.validity_date:
-            validity_date = parse_datetime(bid_data.validity_date)
+        if response is None:
+            # 캐시 이후 마감/낙찰됨 → 최신 상태로 사유 안내
+            _raise_if_not_biddable(_bidding_state(db, bid_data.bidding_id, fresh=True))
+            raise HTTPException(status_code=409, detail="Bidding changed while submitting, please retry")
         
-        # Create bid
-        bid = Bid(
-            bidding_id=bid_data.bidding_id,
-            forwarder_id=forwarder_id,
-            total_amount=bid_data.total_amount,
-            freight_charge=bid_data.freight_charge,
-            local_charge=bid_data.local_charge,
-            other_charge=bid_data.other_charge,
-            validity_date=validity_date,
-            transit_time=bid_data.transit_time,
-            remark=bid_data.remark,
-            status="submitted",
-            submitted_at=datetime.now()
-        )
-        db.add(bid)
-        db.commit()
-        db.refresh(bid)
-        
-        return BidSubmitResponse(
-            success=True,
-            message="Bid submitted successfully",
-            bid=BidResponse.model_validate(bid)
-        )
+        return response
         
     except HTTPException:
         raise
@@ -1807,48 +1951,69 @@ def update_bid(
     - 본인의 입찰만 수정 가능
     - 마감 전까지만 수정 가능
     - 낙찰/거절된 입찰은 수정 불가
+    
+    조건부 UPDATE 한 번으로 수정하고, 조건이 맞지 않을 때만 사유를 조회합니다.
     """
     try:
-        # Get bid
-        bid = db.query(Bid).filter(Bid.id == bid_id).first()
-        if not bid:
-            raise HTTPException(status_code=404, detail="Bid not found")
-        
-        # Verify ownership
-        if bid.forwarder_id != forwarder_id:
-            raise HTTPException(status_code=403, detail="You can only update your own bids")
-        
-        # Check bid status
-        if bid.status in ["awarded", "rejected"]:
-            raise HTTPException(status_code=400, detail=f"Cannot update bid with status '{bid.status}'")
-        
-        # Check bidding deadline
-        bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-        if bidding.deadline and datetime.now() > bidding.deadline:
-            raise HTTPException(status_code=400, detail="Bidding deadline has passed")
-        
-        if bidding.status != "open":
-            raise HTTPException(status_code=400, detail="Bidding is no longer open")
-        
-        # Update bid
-        bid.total_amount = bid_data.total_amount
-        bid.freight_charge = bid_data.freight_charge
-        bid.local_charge = bid_data.local_charge
-        bid.other_charge = bid_data.other_charge
+        now = datetime.now()
+        values = {
+            "total_amount": bid_data.total_amount,
+            "freight_charge": bid_data.freight_charge,
+            "local_charge": bid_data.local_charge,
+            "other_charge": bid_data.other_charge,
+            "transit_time": bid_data.transit_time,
+            "remark": bid_data.remark,
+            "updated_at": now,
+        }
         if bid_data.validity_date:
-            bid.validity_date = parse_datetime(bid_data.validity_date)
-        bid.transit_time = bid_data.transit_time
-        bid.remark = bid_data.remark
-        bid.updated_at = datetime.now()
+            values["validity_date"] = parse_datetime(bid_data.validity_date)
+        
+        def update_and_commit():
+            bid = db.scalars(
+                update(Bid)
+                .where(
+                    Bid.id == bid_id,
+                    Bid.forwarder_id == forwarder_id,
+                    Bid.status.notin_(["awarded", "rejected"]),
+                    exists().where(_bidding_open(Bid.bidding_id, now))
+                )
+                .values(**values)
+                .returning(Bid)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).first()
+            if bid is None:
+                db.rollback()
+                return None
+            
+            response = BidSubmitResponse(
+                success=True,
+                message="Bid updated successfully",
+                bid=BidResponse.model_validate(bid)
+            )
+            track_biddings(db, bid.bidding_id)
+            db.commit()
+            return response
         
-        db.commit()
-        db.refresh(bid)
+        # UPDATE부터 commit까지 한 단위로 단일 writer 스레드에서 실행
+        response = run_write(update_and_commit)
         
-        return BidSubmitResponse(
-            success=True,
-            message="Bid updated successfully",
-            bid=BidResponse.model_validate(bid)
-        )
+        if response is None:
+            bid = db.query(Bid).filter(Bid.id == bid_id).first()
+            if not bid:
+                raise HTTPException(status_code=404, detail="Bid not found")
+            
+            # Verify ownership
+            if bid.forwarder_id != forwarder_id:
+                raise HTTPException(status_code=403, detail="You can only update your own bids")
+            
+            # Check bid status
+            if bid.status in ["awarded", "rejected"]:
+                raise HTTPException(status_code=400, detail=f"Cannot update bid with status '{bid.status}'")
+            
+            _raise_if_not_biddable(_bidding_state(db, bid.bidding_id, fresh=True), "Bidding is no longer open")
+            raise HTTPException(status_code=409, detail="Bid changed while updating, please retry")
+        
+        return response
         
     except HTTPException:
         raise
@@ -2027,10 +2192,19 @@ def award_bid(
             other_bid.status = "rejected"
             other_bid.updated_at = datetime.now()
         
-        db.commit()
-        
-        # Get forwarder info for response
+        # Get forwarder info for response + award email (same transaction)
         forwarder = db.query(Forwarder).filter(Forwarder.id == bid.forwarder_id).first()
+        if forwarder:
+            quote_req = bidding.quote_request
+            enqueue_email(
+                db, forwarder.email, "bid_awarded",
+                forwarder_name=forwarder.name, bidding_no=bidding_no,
+                cargo_type=quote_req.load_type if quote_req else "", pol=quote_req.pol if quote_req else "",
+                pod=quote_req.pod if quote_req else "", amount=f"₩{float(bid.total_amount):,.0f}"
+            )
+        
+        db.commit()
+        outbox_worker.notify()
         
         return APIResponse(
             success=True,
@@ -2046,6 +2220,9 @@ def award_bid(
         
     except HTTPException:
         raise
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Bidding was modified by another request, please reload")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to award bid: {str(e)}")
@@ -2080,7 +2257,11 @@ def close_bidding(
         bid.status = "rejected"
         bid.updated_at = datetime.now()
     
-    db.commit()
+    try:
+        db.commit()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Bidding was modified by another request, please reload")
     
     return APIResponse(
         success=True,
@@ -2389,22 +2570,13 @@ def get_freight_estimate(
     else:
         check_date = datetime.now()
     
-    # Find valid rate sheet
-    sheet = db.query(OceanRateSheet).filter(
-        OceanRateSheet.pol_id == pol_port.id,
-        OceanRateSheet.pod_id == pod_port.id,
-        OceanRateSheet.is_active == True,
-        OceanRateSheet.valid_from <= check_date,
-        OceanRateSheet.valid_to >= check_date
-    ).first()
+    # Find valid rate sheet (메모리 구간 카탈로그에서 O(1) 조회)
+    catalogue = get_route_catalogue(db)
+    sheet = catalogue.find_sheet(pol_port.code, pod_port.code, check_date.date())
     
     if not sheet:
         # 해당 구간의 다른 유효한 운임이 있는지 확인
-        available_sheet = db.query(OceanRateSheet).filter(
-            OceanRateSheet.pol_id == pol_port.id,
-            OceanRateSheet.pod_id == pod_port.id,
-            OceanRateSheet.is_active == True
-        ).order_by(OceanRateSheet.valid_from.desc()).first()
+        available_sheet = catalogue.latest_sheet(pol_port.code, pod_port.code)
         
         # 기본 비용 조회 (DOC, SEAL, THC)
         default_charges = get_default_charges(db, container_type)
@@ -2560,33 +2732,22 @@ def get_freight_estimate(
 
 
 @app.get("/api/freight/routes", tags=["Quick Quotation"])
-def get_available_routes(db: Session = Depends(get_db)):
+def get_available_routes(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Quick Quotation 가능한 구간 목록 조회
-    """
-    today = datetime.now()
     
-    sheets = db.query(OceanRateSheet).filter(
-        OceanRateSheet.is_active == True,
-        OceanRateSheet.valid_from <= today,
-        OceanRateSheet.valid_to >= today
-    ).all()
+    날짜별 메모리 카탈로그에서 응답하며, 운임표가 바뀌지 않았으면 If-None-Match에 304로 응답
+    """
+    catalogue = get_route_catalogue(db)
     
-    routes = []
-    for sheet in sheets:
-        routes.append({
-            "pol_code": sheet.pol.code,
-            "pol_name": sheet.pol.name,
-            "pod_code": sheet.pod.code,
-            "pod_name": sheet.pod.name,
-            "carrier": sheet.carrier,
-            "valid_from": sheet.valid_from.strftime("%Y-%m-%d"),
-            "valid_to": sheet.valid_to.strftime("%Y-%m-%d")
-        })
+    if request.headers.get("if-none-match") == catalogue.etag:
+        return Response(status_code=304, headers={"ETag": catalogue.etag})
     
+    response.headers["ETag"] = catalogue.etag
+    response.headers["Cache-Control"] = "no-cache"
     return {
-        "count": len(routes),
-        "routes": routes
+        "count": len(catalogue.routes),
+        "routes": catalogue.routes
     }
 
 
@@ -2725,12 +2886,18 @@ def health_check(db: Session = Depends(get_db)):
     """Health check endpoint"""
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        db.execute(text("SELECT 1"))
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "database": str(e)}
 
 
+@app.get("/metrics", tags=["System"], include_in_schema=False)
+def metrics():
+    """Prometheus metrics (route latency, SQL statements per request, slowest statements)"""
+    return metrics_response()
+
+
 # ==========================================
 # SHIPPER BIDDING MANAGEMENT ENDPOINTS
 # ==========================================
@@ -3146,7 +3313,17 @@ def award_bid(
             )
             db.add(reject_notification)
         
+        # 6. 선정 메일 (outbox, 같은 트랜잭션)
+        forwarder = db.query(Forwarder).filter(Forwarder.id == awarded_bid.forwarder_id).first()
+        if forwarder:
+            enqueue_email(
+                db, forwarder.email, "bid_awarded",
+                forwarder_name=forwarder.name, bidding_no=bidding_no, cargo_type=quote_req.load_type,
+                pol=quote_req.pol, pod=quote_req.pod, amount=f"₩{float(awarded_bid.total_amount):,.0f}"
+            )
+        
         db.commit()
+        outbox_worker.notify()
         
         return AwardBidResponse(
             success=True,
@@ -3156,6 +3333,9 @@ def award_bid(
             notification_sent=True
         )
         
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="다른 요청이 먼저 비딩을 변경했습니다. 새로고침 후 다시 시도해 주세요.")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to award bid: {str(e)}")
@@ -3428,170 +3608,6 @@ def get_bidding_rating(
     )
 
 
-# ==========================================
-# FORWARDER PROFILE ENDPOINT
-# ==========================================
-
-@app.get("/api/forwarders/{forwarder_id}/profile", response_model=ForwarderProfileResponse, tags=["Forwarder Profile"])
-def get_forwarder_profile(
-    forwarder_id: int,
-    limit_reviews: int = 10,
-    db: Session = Depends(get_db)
-):
-    """
-    포워더 프로필 상세 조회
-    
-    - 포워더 기본 정보 및 평점
-    - 주요 운송 루트 (Top 5)
-    - 운송 모드별 통계
-    - 최근 리뷰 목록
-    """
-    # 포워더 조회
-    forwarder = db.query(Forwarder).filter(Forwarder.id == forwarder_id).first()
-    if not forwarder:
-        raise HTTPException(status_code=404, detail="Forwarder not found")
-    
-    # 모든 입찰 조회 (submitted 또는 awarded)
-    bids = db.query(Bid).filter(
-        Bid.forwarder_id == forwarder_id,
-        Bid.status.in_(["submitted", "awarded"])
-    ).all()
-    
-    total_bids = len(bids)
-    total_awarded = sum(1 for b in bids if b.status == "awarded")
-    award_rate = (total_awarded / total_bids * 100) if total_bids > 0 else 0.0
-    
-    # 주요 루트 계산 (입찰 이력 기반)
-    route_counts = {}
-    for bid in bids:
-        bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-            if quote_req:
-                route_key = (quote_req.pol, quote_req.pod)
-                if route_key not in route_counts:
-                    route_counts[route_key] = {"count": 0, "awarded": 0}
-                route_counts[route_key]["count"] += 1
-                if bid.status == "awarded":
-                    route_counts[route_key]["awarded"] += 1
-    
-    # Top 5 루트 정렬
-    top_routes = []
-    sorted_routes = sorted(route_counts.items(), key=lambda x: x[1]["count"], reverse=True)[:5]
-    for (pol, pod), data in sorted_routes:
-        top_routes.append(ForwarderTopRoute(
-            pol=pol,
-            pod=pod,
-            count=data["count"],
-            awarded_count=data["awarded"]
-        ))
-    
-    # 운송 모드별 통계
-    shipping_mode_counts = {}
-    for bid in bids:
-        bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-            if quote_req:
-                mode = quote_req.shipping_type
-                if mode not in shipping_mode_counts:
-                    shipping_mode_counts[mode] = {"count": 0, "awarded": 0}
-                shipping_mode_counts[mode]["count"] += 1
-                if bid.status == "awarded":
-                    shipping_mode_counts[mode]["awarded"] += 1
-    
-    shipping_mode_stats = []
-    for mode, data in shipping_mode_counts.items():
-        percentage = (data["count"] / total_bids * 100) if total_bids > 0 else 0.0
-        shipping_mode_stats.append(ForwarderShippingModeStats(
-            shipping_type=mode,
-            count=data["count"],
-            percentage=round(percentage, 1),
-            awarded_count=data["awarded"]
-        ))
-    
-    # 정렬: count 기준 내림차순
-    shipping_mode_stats.sort(key=lambda x: x.count, reverse=True)
-    
-    # 평점 조회 및 분석
-    ratings = db.query(Rating).filter(
-        Rating.forwarder_id == forwarder_id,
-        Rating.is_visible == True
-    ).all()
-    
-    score_distribution = {}
-    price_scores = []
-    service_scores = []
-    punctuality_scores = []
-    communication_scores = []
-    
-    for r in ratings:
-        score_key = str(float(r.score))
-        score_distribution[score_key] = score_distribution.get(score_key, 0) + 1
-        if r.price_score:
-            price_scores.append(float(r.price_score))
-        if r.service_score:
-            service_scores.append(float(r.service_score))
-        if r.punctuality_score:
-            punctuality_scores.append(float(r.punctuality_score))
-        if r.communication_score:
-            communication_scores.append(float(r.communication_score))
-    
-    # 리뷰 목록 조회 (최신순)
-    reviews_query = db.query(Rating).filter(
-        Rating.forwarder_id == forwarder_id,
-        Rating.is_visible == True
-    ).order_by(Rating.created_at.desc()).limit(limit_reviews).all()
-    
-    reviews = []
-    for r in reviews_query:
-        # 비딩 정보 조회
-        bidding = db.query(Bidding).filter(Bidding.id == r.bidding_id).first()
-        quote_req = None
-        if bidding:
-            quote_req = db.query(QuoteRequest).filter(QuoteRequest.id == bidding.quote_request_id).first()
-        
-        # 화주 정보 조회
-        customer = db.query(Customer).filter(Customer.id == r.customer_id).first()
-        customer_company_masked = mask_company_name(customer.company) if customer else "***"
-        
-        reviews.append(ForwarderReviewItem(
-            id=r.id,
-            score=float(r.score),
-            price_score=float(r.price_score) if r.price_score else None,
-            service_score=float(r.service_score) if r.service_score else None,
-            punctuality_score=float(r.punctuality_score) if r.punctuality_score else None,
-            communication_score=float(r.communication_score) if r.communication_score else None,
-            comment=r.comment,
-            bidding_no=bidding.bidding_no if bidding else "",
-            pol=quote_req.pol if quote_req else "",
-            pod=quote_req.pod if quote_req else "",
-            shipping_type=quote_req.shipping_type if quote_req else "",
-            created_at=r.created_at,
-            customer_company_masked=customer_company_masked
-        ))
-    
-    return ForwarderProfileResponse(
-        forwarder_id=forwarder.id,
-        company=forwarder.company,
-        company_masked=mask_company_name(forwarder.company),
-        rating=float(forwarder.rating) if forwarder.rating else 3.0,
-        rating_count=forwarder.rating_count or 0,
-        avg_price_score=sum(price_scores) / len(price_scores) if price_scores else None,
-        avg_service_score=sum(service_scores) / len(service_scores) if service_scores else None,
-        avg_punctuality_score=sum(punctuality_scores) / len(punctuality_scores) if punctuality_scores else None,
-        avg_communication_score=sum(communication_scores) / len(communication_scores) if communication_scores else None,
-        score_distribution=score_distribution,
-        total_bids=total_bids,
-        total_awarded=total_awarded,
-        award_rate=round(award_rate, 1),
-        top_routes=top_routes,
-        shipping_mode_stats=shipping_mode_stats,
-        reviews=reviews,
-        member_since=forwarder.created_at
-    )
-
-
 # ==========================================
 # ANALYTICS ENDPOINTS - SHIPPER
 # ==========================================
@@ -4392,14 +4408,11 @@ def get_forwarder_rating_trend(
 def generate_contract_no(db: Session) -> str:
     """Generate unique Contract Number: CT-YYYYMMDD-XXX"""
     date_str = datetime.now().strftime("%Y%m%d")
-    
-    # Get max sequence for today
-    today_contracts = db.query(Contract).filter(
-        Contract.contract_no.like(f"CT-{date_str}-%")
-    ).count()
-    
-    seq = str(today_contracts + 1).zfill(3)
-    return f"CT-{date_str}-{seq}"
+    seq = next_sequence(
+        db, "CT-", date_str,
+        initial=lambda: last_issued(db, Contract.contract_no, f"CT-{date_str}-")
+    )
+    return f"CT-{date_str}-{str(seq).zfill(3)}"
 
 
 @app.get("/api/contract/{contract_id}", response_model=ContractDetailResponse, tags=["Contract"])
@@ -5003,24 +5016,43 @@ def get_settlement_summary(
     db: Session = Depends(get_db)
 ):
     """정산 요약 (대시보드용)"""
-    query = db.query(Settlement)
+    return stats_cache.get_or_set(
+        "settlement_summary", (user_type, user_id),
+        lambda: _compute_settlement_summary(db, user_type, user_id)
+    )
+
+
+def _compute_settlement_summary(db: Session, user_type: str, user_id: int) -> SettlementSummary:
+    """완료/대기 금액과 건수를 SUM(CASE …) 한 번으로 집계"""
+    pending_statuses = ["pending", "requested", "processing"]
+    is_completed = Settlement.status == "completed"
+    is_pending = Settlement.status.in_(pending_statuses)
+    
+    query = db.query(
+        func.coalesce(func.sum(case((is_completed, Settlement.net_amount), else_=0)), 0),
+        func.coalesce(func.sum(case((is_pending, Settlement.net_amount), else_=0)), 0),
+        func.coalesce(func.sum(case((is_completed, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((is_pending, 1), else_=0)), 0),
+    ).filter(Settlement.status.in_(["completed"] + pending_statuses))
     
     if user_type == "shipper":
         query = query.filter(Settlement.customer_id == user_id)
     else:
         query = query.filter(Settlement.forwarder_id == user_id)
     
-    completed = query.filter(Settlement.status == "completed").all()
-    pending = query.filter(Settlement.status.in_(["pending", "requested", "processing"])).all()
+    total_completed, total_pending, count_completed, count_pending = query.one()
     
     return SettlementSummary(
-        total_completed=sum(float(s.net_amount) for s in completed),
-        total_pending=sum(float(s.net_amount) for s in pending),
-        count_completed=len(completed),
-        count_pending=len(pending)
+        total_completed=float(total_completed),
+        total_pending=float(total_pending),
+        count_completed=count_completed,
+        count_pending=count_pending
     )
 
 
+watch_tables(stats_cache, "settlement_summary", "settlements")
+
+
 # ==========================================
 # MESSAGE ENDPOINTS
 # ==========================================
@@ -5685,26 +5717,44 @@ def resubmit_bid(
     db: Session = Depends(get_db)
 ):
     """입찰 재제출"""
-    bid = db.query(Bid).filter(
-        Bid.id == bid_id,
-        Bid.forwarder_id == forwarder_id
-    ).first()
-    
-    if not bid:
-        raise HTTPException(status_code=404, detail="Bid not found")
+    now = datetime.now()
     
-    if bid.status not in ["draft", "rejected"]:
-        raise HTTPException(status_code=400, detail=f"Cannot resubmit bid with status: {bid.status}")
+    def update_and_commit():
+        bidding_id = db.execute(
+            update(Bid)
+            .where(
+                Bid.id == bid_id,
+                Bid.forwarder_id == forwarder_id,
+                Bid.status.in_(["draft", "rejected"]),
+                ~exists().where(Bidding.id == Bid.bidding_id, Bidding.status != "open")
+            )
+            .values(status="submitted", submitted_at=now)
+            .returning(Bid.bidding_id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if bidding_id is None:
+            db.rollback()
+            return None
+        
+        track_biddings(db, bidding_id)
+        db.commit()
+        return bidding_id
     
-    bidding = db.query(Bidding).filter(Bidding.id == bid.bidding_id).first()
-    if bidding and bidding.status != "open":
+    # UPDATE부터 commit까지 한 단위로 단일 writer 스레드에서 실행
+    if run_write(update_and_commit) is None:
+        bid = db.query(Bid).filter(
+            Bid.id == bid_id,
+            Bid.forwarder_id == forwarder_id
+        ).first()
+        
+        if not bid:
+            raise HTTPException(status_code=404, detail="Bid not found")
+        
+        if bid.status not in ["draft", "rejected"]:
+            raise HTTPException(status_code=400, detail=f"Cannot resubmit bid with status: {bid.status}")
+        
         raise HTTPException(status_code=400, detail="Bidding is not open")
     
-    bid.status = "submitted"
-    bid.submitted_at = datetime.now()
-    
-    db.commit()
-    
     return {"success": True, "message": "Bid resubmitted"}
 
 
@@ -5956,8 +6006,17 @@ def file_dispute(
     )
     db.add(notification)
     
+    forwarder = db.query(Forwarder).filter(Forwarder.id == settlement.forwarder_id).first()
+    if forwarder:
+        enqueue_email(
+            db, forwarder.email, "settlement_dispute",
+            recipient_name=forwarder.company, settlement_no=settlement.settlement_no,
+            dispute_reason=reason, is_forwarder=True
+        )
+    
     db.commit()
     db.refresh(settlement)
+    outbox_worker.notify()
     
     return {
         "success": True,
@@ -6079,8 +6138,22 @@ def resolve_dispute(
         )
         db.add(notification)
     
+    final_amount_label = f"₩{float(settlement.adjusted_amount or settlement.net_amount or 0):,.0f}"
+    for recipient in (
+        db.query(Customer).filter(Customer.id == settlement.customer_id).first(),
+        db.query(Forwarder).filter(Forwarder.id == settlement.forwarder_id).first()
+    ):
+        if recipient:
+            enqueue_email(
+                db, recipient.email, "dispute_resolved",
+                recipient_name=recipient.company, settlement_no=settlement.settlement_no,
+                resolution_type=resolution_type, resolution_note=resolution_note,
+                final_amount=final_amount_label
+            )
+    
     db.commit()
     db.refresh(settlement)
+    outbox_worker.notify()
     
     return {
         "success": True,
@@ -6287,15 +6360,15 @@ def get_shipper_volume_trend(
         end_date = datetime.now()
     
     # Query awarded contracts with cargo details
-    from sqlalchemy import func, extract
+    from sqlalchemy import func
     
+    month_bucket = year_month(Contract.confirmed_at)
     contracts = db.query(
-        extract('year', Contract.confirmed_at).label('year'),
-        extract('month', Contract.confirmed_at).label('month'),
+        month_bucket.label('month'),
         func.sum(CargoDetail.qty).label('total_qty'),
         func.sum(CargoDetail.cbm).label('total_cbm'),
         func.sum(CargoDetail.gross_weight).label('total_kgs')
-    ).join(Bid, Contract.bid_id == Bid.id
+    ).join(Bid, Contract.awarded_bid_id == Bid.id
     ).join(Bidding, Bid.bidding_id == Bidding.id
     ).join(QuoteRequest, Bidding.quote_request_id == QuoteRequest.id
     ).join(CargoDetail, CargoDetail.quote_request_id == QuoteRequest.id
@@ -6303,17 +6376,13 @@ def get_shipper_volume_trend(
         QuoteRequest.customer_id == customer_id,
         Contract.confirmed_at >= start_date,
         Contract.confirmed_at <= end_date
-    ).group_by(
-        extract('year', Contract.confirmed_at),
-        extract('month', Contract.confirmed_at)
-    ).order_by('year', 'month').all()
+    ).group_by(month_bucket).order_by(month_bucket).all()
     
     # Format response
     data = []
     for row in contracts:
-        month_str = f"{int(row.year)}-{int(row.month):02d}"
         data.append({
-            "month": month_str,
+            "month": row.month,
             "teu": int(row.total_qty or 0),
             "cbm": float(row.total_cbm or 0),
             "kgs": float(row.total_kgs or 0)
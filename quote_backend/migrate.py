@@ -272,6 +272,26 @@ def run_migration():
         else:
             print(f"Note: {e}")
     
+    # Add version column to biddings table (optimistic locking)
+    try:
+        cursor.execute("ALTER TABLE biddings ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        print("Added version column to biddings table")
+    except sqlite3.OperationalError as e:
+        if "duplicate column name" in str(e).lower():
+            print("version column already exists in biddings table")
+        else:
+            print(f"Note: {e}")
+    
+    # One bid per forwarder per bidding
+    try:
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_bid_bidding_forwarder
+            ON bids(bidding_id, forwarder_id)
+        """)
+        print("Created unique index for bids table")
+    except sqlite3.IntegrityError as e:
+        print(f"Note: duplicate bids exist, resolve them and re-run to create the unique index ({e})")
+    
     conn.commit()
     conn.close()
     print("\nMigration completed successfully!")
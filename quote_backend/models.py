@@ -3,10 +3,11 @@ Database Models - Quote Request System
 Reference Data (Master Tables) + Transaction Tables
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, DECIMAL
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, DECIMAL, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
+from datetime import datetime
 import enum
 
 
@@ -391,6 +392,7 @@ class Bidding(Base):
     deadline = Column(DateTime, nullable=True)  # Quotation submission deadline
     status = Column(String(20), default="open")  # open, closed, awarded, cancelled, expired
     awarded_bid_id = Column(Integer, ForeignKey("bids.id"), nullable=True)  # 낙찰된 입찰 ID
+    version = Column(Integer, nullable=False, default=0, server_default="0")  # 낙관적 잠금 (상태 변경마다 +1)
     
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
@@ -401,6 +403,14 @@ class Bidding(Base):
     bids = relationship("Bid", back_populates="bidding", foreign_keys="Bid.bidding_id")
     awarded_bid = relationship("Bid", foreign_keys=[awarded_bid_id], post_update=True)
     
+    # Indexes (마감 스케줄러: status='open' AND deadline < now, /api/bidding/stats 집계)
+    __table_args__ = (
+        Index('idx_bidding_status_deadline', 'status', 'deadline'),
+    )
+    
+    # ORM UPDATE는 WHERE version = :읽은 값 으로 실행 → 동시 낙찰/마감은 한쪽이 StaleDataError
+    __mapper_args__ = {"version_id_col": version}
+    
     def __repr__(self):
         return f"<Bidding {self.bidding_no}>"
 
@@ -472,6 +482,11 @@ class Bid(Base):
     bidding = relationship("Bidding", back_populates="bids", foreign_keys=[bidding_id])
     forwarder = relationship("Forwarder", back_populates="bids")
     
+    # 포워더당 비딩 1건 (동시 제출도 DB에서 차단)
+    __table_args__ = (
+        UniqueConstraint('bidding_id', 'forwarder_id', name='uq_bid_bidding_forwarder'),
+    )
+    
     def __repr__(self):
         return f"<Bid #{self.id} for Bidding #{self.bidding_id} by Forwarder #{self.forwarder_id}>"
 
@@ -641,7 +656,7 @@ class Shipment(Base):
     shipment_no = Column(String(20), unique=True, nullable=False, index=True)  # SH-YYYYMMDD-XXX
     
     # 관련 정보
-    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False)
+    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False, index=True)
     
     # 현재 상태
     current_status = Column(String(30), default="booked")
@@ -716,7 +731,7 @@ class Settlement(Base):
     settlement_no = Column(String(20), unique=True, nullable=False, index=True)  # ST-YYYYMMDD-XXX
     
     # 관련 정보
-    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False)
+    contract_id = Column(Integer, ForeignKey("contracts.id"), nullable=False, index=True)
     forwarder_id = Column(Integer, ForeignKey("forwarders.id"), nullable=False)
     customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)
     
@@ -760,6 +775,12 @@ class Settlement(Base):
     forwarder = relationship("Forwarder")
     customer = relationship("Customer")
     
+    # Indexes (정산 요약: 화주/포워더별 status 집계)
+    __table_args__ = (
+        Index('idx_settlement_customer_status', 'customer_id', 'status'),
+        Index('idx_settlement_forwarder_status', 'forwarder_id', 'status'),
+    )
+    
     def __repr__(self):
         return f"<Settlement {self.settlement_no} status={self.status}>"
 
@@ -1008,4 +1029,82 @@ class TruckingRate(Base):
     origin_port = relationship("Port", lazy="joined")
     
     def __repr__(self):
-        return f"<TruckingRate {self.origin_port_id}->{self.dest_province} {self.dest_city}: 20ft={self.rate_20ft}>"
\ No newline at end of file
+        return f"<TruckingRate {self.origin_port_id}->{self.dest_province} {self.dest_city}: 20ft={self.rate_20ft}>"
+
+
+# ==========================================
+# SCHEDULER
+# ==========================================
+
+class SchedulerLease(Base):
+    """
+    Scheduler Lease - 스케줄 작업 실행권
+    여러 프로세스가 같은 작업을 동시에 실행하지 않도록 작업별 1행으로 소유자와 만료 시각을 기록
+    """
+    __tablename__ = "scheduler_leases"
+    
+    name = Column(String(50), primary_key=True)  # auto_expire_biddings, ...
+    owner = Column(String(100), nullable=False)  # hostname:pid:token
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<SchedulerLease {self.name} owner={self.owner} until={self.expires_at}>"
+
+
+# ==========================================
+# DOCUMENT NUMBERS
+# ==========================================
+
+class DocumentSequence(Base):
+    """
+    Document Sequence - 문서 번호 카운터
+    접두어/기간별 마지막 발급 번호 1행 (UPDATE … RETURNING으로 원자적 증가)
+    """
+    __tablename__ = "document_sequences"
+    
+    prefix = Column(String(20), primary_key=True)  # QR-, CT-, EXSEA, ...
+    period = Column(String(8), primary_key=True, default="")  # YYYYMMDD ('' = 기간 구분 없음)
+    value = Column(Integer, nullable=False, default=0)  # 마지막으로 발급한 번호
+    
+    def __repr__(self):
+        return f"<DocumentSequence {self.prefix}{self.period}={self.value}>"
+
+
+# ==========================================
+# EMAIL OUTBOX
+# ==========================================
+
+class EmailOutbox(Base):
+    """
+    Email Outbox - 발송 대기 이메일
+    요청 핸들러가 업무 데이터와 같은 트랜잭션에 기록하고, 백그라운드 발송기(email_service.OutboxSender)가 전송
+    """
+    __tablename__ = "email_outbox"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # 수신자 / 내용 (본문은 발송 시 template + context로 렌더링)
+    to_email = Column(String(255), nullable=False)
+    cc = Column(Text, nullable=True)  # 콤마 구분
+    subject = Column(String(255), nullable=False)
+    template = Column(String(50), nullable=False)  # bid_awarded, settlement_dispute, ...
+    context = Column(Text, nullable=False)  # 템플릿 인자 JSON
+    
+    # 발송 상태
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.now)  # 재시도/점유 만료 시각
+    claim_token = Column(String(32), nullable=True, index=True)  # 발송기가 점유한 배치 식별자
+    last_error = Column(Text, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index('idx_email_outbox_due', 'status', 'next_attempt_at'),
+    )
+    
+    def __repr__(self):
+        return f"<EmailOutbox #{self.id} {self.template} to {self.to_email} ({self.status})>"
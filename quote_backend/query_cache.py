@@ -0,0 +1,121 @@
+"""
+Query Cache - 대시보드/카탈로그 조회 결과 캐시
+짧은 TTL 메모리 캐시 + 테이블 변경 commit 시 자동 무효화
+
+    stats_cache.get_or_set("bidding_stats", key, lambda: compute())
+    watch_tables(stats_cache, "bidding_stats", "biddings")
+
+세션에서 해당 테이블의 행을 추가/수정/삭제(ORM flush 또는 update()/insert() 일괄 실행)한 뒤
+commit하면 연결된 namespace가 비워집니다. 롤백된 변경은 무효화하지 않습니다.
+"""
+
+from collections import defaultdict
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "15"))  # 초
+VALIDATION_CACHE_TTL = float(os.getenv("VALIDATION_CACHE_TTL", "5"))  # 초 (입찰 제출 전 포워더/비딩 확인)
+
+_TOUCHED_KEY = "query_cache_touched_tables"
+
+
+class TTLCache:
+    """namespace별 TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float = STATS_CACHE_TTL, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, key: Hashable = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                for stale in [k for k, (expires, _) in self._entries.items() if expires < now]:
+                    del self._entries[stale]
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[(namespace, key)] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def get_or_set(self, namespace: str, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        value = self.get(namespace, key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = factory()
+        self.set(namespace, key, value, ttl)
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """namespace 전체 삭제 (None이면 모두)"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[key]
+
+
+stats_cache = TTLCache()
+validation_cache = TTLCache(ttl=VALIDATION_CACHE_TTL, max_entries=4096)
+
+# 테이블명 → [(cache, namespace)]
+_watchers: Dict[str, Set[Tuple[int, str]]] = defaultdict(set)
+_caches: Dict[int, TTLCache] = {}
+
+
+def watch_tables(cache: TTLCache, namespace: str, *tables: str):
+    """tables 변경이 commit되면 cache의 namespace 무효화"""
+    _caches[id(cache)] = cache
+    for table in tables:
+        _watchers[table].add((id(cache), namespace))
+
+
+def _touched(session: Session) -> set:
+    return session.info.setdefault(_TOUCHED_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session, flush_context):
+    touched = _touched(session)
+    for instance in chain(session.new, session.dirty, session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table in _watchers:
+            touched.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_tables(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and table.name in _watchers:
+            _touched(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session):
+    for table in session.info.pop(_TOUCHED_KEY, ()):
+        for cache_id, namespace in _watchers.get(table, ()):
+            _caches[cache_id].invalidate(namespace)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop(_TOUCHED_KEY, None)
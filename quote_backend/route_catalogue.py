@@ -0,0 +1,103 @@
+"""
+Route Catalogue - Quick Quotation 가능 구간 메모리 카탈로그
+
+활성 해상 운임표(OceanRateSheet)를 POL/POD 포트와 조인한 쿼리 한 번으로 읽어
+(pol_code, pod_code) → 운임표 목록 딕셔너리로 보관합니다.
+
+- /api/freight/routes: 오늘 유효한 구간 목록 + ETag
+- /api/freight/estimate: 구간/날짜별 유효 운임표 O(1) 조회
+
+카탈로그는 날짜(유효기간 기준일)별로 캐시되어 자정이 지나면 새로 만들어지고,
+ocean_rate_sheets / ports 변경이 commit되면 즉시 무효화됩니다.
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import hashlib
+import json
+
+from sqlalchemy.orm import Session, aliased
+
+from models import OceanRateSheet, Port
+from query_cache import TTLCache, watch_tables
+
+# 같은 프로세스 밖(시드 스크립트 등)에서 바뀐 운임표도 늦어도 1시간 안에 반영
+CATALOGUE_TTL = 3600
+
+catalogue_cache = TTLCache(ttl=CATALOGUE_TTL, max_entries=8)
+watch_tables(catalogue_cache, "routes", "ocean_rate_sheets", "ports")
+
+
+class RateSheetEntry(NamedTuple):
+    """카탈로그에 보관하는 운임표 헤더 (OceanRateSheet와 같은 속성명)"""
+    id: int
+    carrier: str
+    valid_from: datetime
+    valid_to: datetime
+    pol_code: str
+    pol_name: str
+    pod_code: str
+    pod_name: str
+
+    def is_valid_on(self, day: date) -> bool:
+        return self.valid_from.date() <= day <= self.valid_to.date()
+
+
+class RouteCatalogue:
+    """기준일의 구간 카탈로그 (불변; 변경 시 새로 생성)"""
+
+    def __init__(self, day: date, sheets: List[RateSheetEntry]):
+        self.day = day
+        self.by_route: Dict[Tuple[str, str], List[RateSheetEntry]] = {}
+        for sheet in sorted(sheets, key=lambda s: s.valid_from, reverse=True):
+            self.by_route.setdefault((sheet.pol_code, sheet.pod_code), []).append(sheet)
+
+        self.routes = [
+            {
+                "pol_code": sheet.pol_code,
+                "pol_name": sheet.pol_name,
+                "pod_code": sheet.pod_code,
+                "pod_name": sheet.pod_name,
+                "carrier": sheet.carrier,
+                "valid_from": sheet.valid_from.strftime("%Y-%m-%d"),
+                "valid_to": sheet.valid_to.strftime("%Y-%m-%d")
+            }
+            for sheet in sorted(sheets, key=lambda s: s.id)
+            if sheet.is_valid_on(day)
+        ]
+        payload = json.dumps(self.routes, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        self.etag = f'"{hashlib.sha1(payload).hexdigest()[:16]}"'
+
+    def find_sheet(self, pol_code: str, pod_code: str, day: Optional[date] = None) -> Optional[RateSheetEntry]:
+        """day에 유효한 운임표 (여러 개면 가장 최근 시작)"""
+        day = day or self.day
+        for sheet in self.by_route.get((pol_code.upper(), pod_code.upper()), ()):
+            if sheet.is_valid_on(day):
+                return sheet
+        return None
+
+    def latest_sheet(self, pol_code: str, pod_code: str) -> Optional[RateSheetEntry]:
+        """유효기간과 무관하게 가장 최근 운임표 (유효기간 안내용)"""
+        sheets = self.by_route.get((pol_code.upper(), pod_code.upper()))
+        return sheets[0] if sheets else None
+
+    def is_quotable(self, pol_code: str, pod_code: str, day: Optional[date] = None) -> bool:
+        return self.find_sheet(pol_code, pod_code, day) is not None
+
+
+def load_catalogue(db: Session, day: date) -> RouteCatalogue:
+    """활성 운임표 + POL/POD 포트를 조인 쿼리 한 번으로 로드"""
+    pol = aliased(Port)
+    pod = aliased(Port)
+    rows = db.query(
+        OceanRateSheet.id, OceanRateSheet.carrier, OceanRateSheet.valid_from, OceanRateSheet.valid_to,
+        pol.code, pol.name, pod.code, pod.name
+    ).join(pol, OceanRateSheet.pol_id == pol.id).join(pod, OceanRateSheet.pod_id == pod.id).filter(
+        OceanRateSheet.is_active == True
+    ).all()
+    return RouteCatalogue(day, [RateSheetEntry(*row) for row in rows])
+
+
+def get_route_catalogue(db: Session, day: Optional[date] = None) -> RouteCatalogue:
+    day = day or date.today()
+    return catalogue_cache.get_or_set("routes", day.isoformat(), lambda: load_catalogue(db, day))
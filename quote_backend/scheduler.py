@@ -1,18 +1,48 @@
 """
 Scheduler Module - 자동화 작업 정의
 백그라운드에서 주기적으로 실행되는 작업들
+
+각 작업은 대상 행을 Python으로 읽어 한 건씩 수정하지 않고,
+INSERT … SELECT (알림/정산 일괄 생성) + UPDATE (상태 일괄 변경) 몇 개로 처리합니다.
+작업마다 scheduler_leases 행을 잡아 여러 프로세스가 동시에 실행하지 않도록 합니다.
 """
 
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import logging
+import os
+import socket
+import uuid
+
+from sqlalchemy import String, and_, case, cast, exists, func, insert, literal, or_, select, union_all, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database import SessionLocal
-from models import Bidding, Shipment, Settlement, Contract, Notification, Customer, Forwarder
-import logging
+from live_events import track_biddings
+from models import (
+    Bidding, QuoteRequest, Shipment, Settlement, Contract, Notification, SchedulerLease
+)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 작업 실행권 (lease) 설정
+LEASE_TTL = timedelta(minutes=30)  # 프로세스가 죽어도 이 시간이 지나면 다른 프로세스가 실행
+LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# INSERT … SELECT로 채우는 알림 컬럼 (is_read/created_at은 기본값)
+NOTIFICATION_COLUMNS = [
+    "recipient_type", "recipient_id", "notification_type",
+    "title", "message", "related_type", "related_id",
+]
+
+# 자동 생성 정산 컬럼
+SETTLEMENT_COLUMNS = [
+    "settlement_no", "contract_id", "forwarder_id", "customer_id",
+    "total_amount_krw", "service_fee", "net_amount", "status",
+]
+
 
 def get_db():
     """Get database session for scheduler tasks"""
@@ -24,54 +54,154 @@ def get_db():
         raise
 
 
-def auto_expire_biddings():
+# ==========================================
+# LEASE
+# ==========================================
+
+def acquire_lease(name: str, ttl: timedelta = LEASE_TTL, owner: str = LEASE_OWNER) -> bool:
     """
-    마감일 지난 비딩 자동 expired 처리
-    매 1시간마다 실행 권장
+    작업 실행권 획득
+    
+    만료됐거나 내가 가진 lease만 갱신하고, 행이 없으면 새로 만듭니다.
+    두 프로세스가 동시에 INSERT하면 PK 충돌로 한쪽만 성공합니다.
     """
     db = get_db()
     try:
         now = datetime.now()
+        result = db.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == name,
+                or_(SchedulerLease.expires_at < now, SchedulerLease.owner == owner)
+            )
+            .values(owner=owner, acquired_at=now, expires_at=now + ttl)
+            .execution_options(synchronize_session=False)
+        )
         
-        # 마감일 지난 open 상태 비딩 조회
-        expired_biddings = db.query(Bidding).filter(
-            Bidding.status == "open",
-            Bidding.deadline < now,
-            Bidding.deadline.isnot(None)
-        ).all()
-        
-        count = 0
-        for bidding in expired_biddings:
-            bidding.status = "expired"
-            
-            # 관련 화주에게 알림
-            quote_request = bidding.quote_request
-            if quote_request and quote_request.customer_id:
-                notification = Notification(
-                    recipient_type="customer",
-                    recipient_id=quote_request.customer_id,
-                    notification_type="bidding_expired",
-                    title="비딩이 마감되었습니다",
-                    message=f"비딩번호 {bidding.bidding_no}의 입찰 마감 기한이 종료되었습니다.",
-                    related_type="bidding",
-                    related_id=bidding.id
-                )
-                db.add(notification)
-            
-            count += 1
+        if result.rowcount == 0:
+            db.add(SchedulerLease(name=name, owner=owner, acquired_at=now, expires_at=now + ttl))
+            try:
+                db.flush()
+            except IntegrityError:
+                db.rollback()
+                return False
         
         db.commit()
-        logger.info(f"[Scheduler] Auto-expired {count} biddings")
-        return count
-        
-    except Exception as e:
-        db.rollback()
-        logger.error(f"[Scheduler] Error in auto_expire_biddings: {e}")
-        raise
+        return True
     finally:
         db.close()
 
 
+def release_lease(name: str, owner: str = LEASE_OWNER):
+    """작업 실행권 반납 (만료 처리)"""
+    db = get_db()
+    try:
+        db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.owner == owner)
+            .values(expires_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+@contextmanager
+def job_lease(name: str, ttl: timedelta = LEASE_TTL):
+    """with job_lease("job") as acquired: … (acquired가 False면 다른 프로세스가 실행 중)"""
+    acquired = acquire_lease(name, ttl)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            release_lease(name)
+
+
+def _begin_job_transaction(db: Session):
+    """
+    INSERT … SELECT와 UPDATE가 같은 대상 집합을 보도록 트랜잭션 시작
+    
+    SQLite는 첫 쓰기에서 DB 쓰기 잠금을 잡으므로 그대로 일관되고,
+    PostgreSQL은 REPEATABLE READ 스냅샷을 사용합니다 (동시 수정 시 직렬화 오류 → 다음 실행에서 재시도).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+
+def _bulk_update(db: Session, statement) -> int:
+    result = db.execute(statement.execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+def _text(value: str):
+    return literal(value, String)
+
+
+def _insert_notifications(db: Session, *selects):
+    """알림 일괄 생성 (INSERT … SELECT, 여러 SELECT는 UNION ALL)"""
+    source = selects[0] if len(selects) == 1 else select(union_all(*selects).subquery())
+    db.execute(insert(Notification).from_select(NOTIFICATION_COLUMNS, source))
+
+
+# ==========================================
+# JOBS
+# ==========================================
+
+def auto_expire_biddings():
+    """
+    마감일 지난 비딩 자동 expired 처리
+    매 1시간마다 실행 권장
+    """
+    with job_lease("auto_expire_biddings") as acquired:
+        if not acquired:
+            logger.info("[Scheduler] auto_expire_biddings is running elsewhere - skipped")
+            return 0
+        
+        db = get_db()
+        try:
+            _begin_job_transaction(db)
+            now = datetime.now()
+            
+            # 마감일 지난 open 상태 비딩
+            overdue = and_(
+                Bidding.status == "open",
+                Bidding.deadline < now,
+                Bidding.deadline.isnot(None)
+            )
+            
+            # 관련 화주에게 알림 (일괄 생성)
+            _insert_notifications(db, select(
+                _text("customer"),
+                QuoteRequest.customer_id,
+                _text("bidding_expired"),
+                _text("비딩이 마감되었습니다"),
+                _text("비딩번호 ") + Bidding.bidding_no + _text("의 입찰 마감 기한이 종료되었습니다."),
+                _text("bidding"),
+                Bidding.id,
+            ).select_from(Bidding).join(
+                QuoteRequest, QuoteRequest.id == Bidding.quote_request_id
+            ).where(overdue, QuoteRequest.customer_id.isnot(None)))
+            
+            expired_ids = db.scalars(
+                update(Bidding).where(overdue).values(status="expired", version=Bidding.version + 1)
+                .returning(Bidding.id).execution_options(synchronize_session=False)
+            ).all()
+            count = len(expired_ids)
+            track_biddings(db, *expired_ids)  # 목록 구독자에게 마감 반영
+            
+            db.commit()
+            logger.info(f"[Scheduler] Auto-expired {count} biddings")
+            return count
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[Scheduler] Error in auto_expire_biddings: {e}")
+            raise
+        finally:
+            db.close()
+
+
 def check_delivery_reminders():
     """
     배송 확인 알림 처리
@@ -79,115 +209,122 @@ def check_delivery_reminders():
     - 14일 경과: 자동 완료 처리
     매일 1회 실행 권장
     """
-    db = get_db()
-    try:
-        now = datetime.now()
-        seven_days_ago = now - timedelta(days=7)
-        fourteen_days_ago = now - timedelta(days=14)
-        
-        reminder_count = 0
-        auto_complete_count = 0
+    with job_lease("check_delivery_reminders") as acquired:
+        if not acquired:
+            logger.info("[Scheduler] check_delivery_reminders is running elsewhere - skipped")
+            return {"reminders": 0, "auto_completed": 0}
         
-        # === 7일 경과: 알림 발송 ===
-        pending_7days = db.query(Shipment).filter(
-            Shipment.current_status == "delivered",
-            Shipment.delivery_confirmed == False,
-            Shipment.actual_delivery <= seven_days_ago,
-            Shipment.actual_delivery > fourteen_days_ago,
-            Shipment.reminder_sent == False
-        ).all()
-        
-        for shipment in pending_7days:
-            # 화주에게 알림 발송
-            contract = db.query(Contract).filter(Contract.id == shipment.contract_id).first()
-            if contract:
-                notification = Notification(
-                    recipient_type="customer",
-                    recipient_id=contract.customer_id,
-                    notification_type="delivery_reminder",
-                    title="배송 완료 확인 요청",
-                    message=f"배송번호 {shipment.shipment_no}의 배송이 완료되었습니다. 7일 내 확인해주세요. 미확인 시 자동 완료 처리됩니다.",
-                    related_type="shipment",
-                    related_id=shipment.id
+        db = get_db()
+        try:
+            _begin_job_transaction(db)
+            now = datetime.now()
+            seven_days_ago = now - timedelta(days=7)
+            fourteen_days_ago = now - timedelta(days=14)
+            
+            has_contract = exists().where(Contract.id == Shipment.contract_id)
+            
+            # === 7일 경과: 알림 발송 ===
+            reminder_due = and_(
+                Shipment.current_status == "delivered",
+                Shipment.delivery_confirmed == False,
+                Shipment.actual_delivery <= seven_days_ago,
+                Shipment.actual_delivery > fourteen_days_ago,
+                Shipment.reminder_sent == False
+            )
+            
+            _insert_notifications(db, select(
+                _text("customer"),
+                Contract.customer_id,
+                _text("delivery_reminder"),
+                _text("배송 완료 확인 요청"),
+                _text("배송번호 ") + Shipment.shipment_no
+                + _text("의 배송이 완료되었습니다. 7일 내 확인해주세요. 미확인 시 자동 완료 처리됩니다."),
+                _text("shipment"),
+                Shipment.id,
+            ).select_from(Shipment).join(Contract, Contract.id == Shipment.contract_id).where(reminder_due))
+            
+            # 알림 발송 표시
+            reminder_count = _bulk_update(
+                db,
+                update(Shipment).where(reminder_due, has_contract).values(
+                    reminder_sent=True,
+                    reminder_sent_at=now
                 )
-                db.add(notification)
-                
-                # 알림 발송 표시
-                shipment.reminder_sent = True
-                shipment.reminder_sent_at = now
-                reminder_count += 1
-        
-        # === 14일 경과: 자동 완료 ===
-        pending_14days = db.query(Shipment).filter(
-            Shipment.current_status == "delivered",
-            Shipment.delivery_confirmed == False,
-            Shipment.actual_delivery <= fourteen_days_ago
-        ).all()
-        
-        for shipment in pending_14days:
-            # 자동 완료 처리
-            shipment.current_status = "completed"
-            shipment.delivery_confirmed = True
-            shipment.delivery_confirmed_at = now
-            shipment.auto_confirmed = True
+            )
+            
+            # === 14일 경과: 자동 완료 ===
+            auto_complete_due = and_(
+                Shipment.current_status == "delivered",
+                Shipment.delivery_confirmed == False,
+                Shipment.actual_delivery <= fourteen_days_ago
+            )
+            due_contract_ids = select(Shipment.contract_id).where(auto_complete_due)
+            
+            # 정산 자동 생성 (없는 경우) - ST-YYYYMMDD-XXX
+            settlement_no = (
+                _text(f"ST-{now.strftime('%Y%m%d')}-")
+                + case((Contract.id < 10, "00"), (Contract.id < 100, "0"), else_="")
+                + cast(Contract.id, String)
+            )
+            db.execute(insert(Settlement).from_select(SETTLEMENT_COLUMNS, select(
+                settlement_no,
+                Contract.id,
+                Contract.forwarder_id,
+                Contract.customer_id,
+                Contract.total_amount_krw,
+                literal(0),
+                Contract.total_amount_krw,
+                _text("pending"),
+            ).where(
+                Contract.id.in_(due_contract_ids),
+                ~exists().where(Settlement.contract_id == Contract.id)
+            )))
+            
+            # 양측에게 알림
+            auto_confirmed_message = _text("배송번호 ") + Shipment.shipment_no + _text("이 14일 경과로 자동 완료 처리되었습니다.")
+            _insert_notifications(
+                db,
+                select(
+                    _text("customer"),
+                    Contract.customer_id,
+                    _text("auto_delivery_confirmed"),
+                    _text("배송이 자동 완료 처리되었습니다"),
+                    auto_confirmed_message,
+                    _text("shipment"),
+                    Shipment.id,
+                ).select_from(Shipment).join(Contract, Contract.id == Shipment.contract_id).where(auto_complete_due),
+                select(
+                    _text("forwarder"),
+                    Contract.forwarder_id,
+                    _text("auto_delivery_confirmed"),
+                    _text("배송이 자동 완료 처리되었습니다"),
+                    auto_confirmed_message + _text(" 정산을 진행해주세요."),
+                    _text("shipment"),
+                    Shipment.id,
+                ).select_from(Shipment).join(Contract, Contract.id == Shipment.contract_id).where(auto_complete_due),
+            )
             
             # 계약 상태 업데이트
-            contract = db.query(Contract).filter(Contract.id == shipment.contract_id).first()
-            if contract:
-                contract.status = "completed"
-                
-                # 정산 자동 생성 (없는 경우)
-                existing_settlement = db.query(Settlement).filter(
-                    Settlement.contract_id == contract.id
-                ).first()
-                
-                if not existing_settlement:
-                    settlement = Settlement(
-                        settlement_no=f"ST-{now.strftime('%Y%m%d')}-{str(contract.id).zfill(3)}",
-                        contract_id=contract.id,
-                        forwarder_id=contract.forwarder_id,
-                        customer_id=contract.customer_id,
-                        total_amount_krw=contract.total_amount_krw,
-                        service_fee=0,
-                        net_amount=contract.total_amount_krw,
-                        status="pending"
-                    )
-                    db.add(settlement)
-                
-                # 양측에게 알림
-                notification_customer = Notification(
-                    recipient_type="customer",
-                    recipient_id=contract.customer_id,
-                    notification_type="auto_delivery_confirmed",
-                    title="배송이 자동 완료 처리되었습니다",
-                    message=f"배송번호 {shipment.shipment_no}이 14일 경과로 자동 완료 처리되었습니다.",
-                    related_type="shipment",
-                    related_id=shipment.id
-                )
-                notification_forwarder = Notification(
-                    recipient_type="forwarder",
-                    recipient_id=contract.forwarder_id,
-                    notification_type="auto_delivery_confirmed",
-                    title="배송이 자동 완료 처리되었습니다",
-                    message=f"배송번호 {shipment.shipment_no}이 14일 경과로 자동 완료 처리되었습니다. 정산을 진행해주세요.",
-                    related_type="shipment",
-                    related_id=shipment.id
-                )
-                db.add(notification_customer)
-                db.add(notification_forwarder)
+            _bulk_update(db, update(Contract).where(Contract.id.in_(due_contract_ids)).values(status="completed"))
             
-            auto_complete_count += 1
-        
-        db.commit()
-        logger.info(f"[Scheduler] Sent {reminder_count} reminders, auto-completed {auto_complete_count} shipments")
-        return {"reminders": reminder_count, "auto_completed": auto_complete_count}
+            # 배송 자동 완료 (대상 조건이 바뀌므로 마지막에 실행)
+            auto_complete_count = _bulk_update(db, update(Shipment).where(auto_complete_due).values(
+                current_status="completed",
+                delivery_confirmed=True,
+                delivery_confirmed_at=now,
+                auto_confirmed=True
+            ))
+            
+            db.commit()
+            logger.info(f"[Scheduler] Sent {reminder_count} reminders, auto-completed {auto_complete_count} shipments")
+            return {"reminders": reminder_count, "auto_completed": auto_complete_count}
         
-    except Exception as e:
-        db.rollback()
-        logger.error(f"[Scheduler] Error in check_delivery_reminders: {e}")
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[Scheduler] Error in check_delivery_reminders: {e}")
+            raise
+        finally:
+            db.close()
 
 
 def check_dispute_deadlines():
@@ -197,75 +334,82 @@ def check_dispute_deadlines():
     - 분쟁 제기 후 30일간 미해결 시 관리자 알림
     매일 1회 실행 권장
     """
-    db = get_db()
-    try:
-        now = datetime.now()
-        seven_days_ago = now - timedelta(days=7)
-        thirty_days_ago = now - timedelta(days=30)
+    with job_lease("check_dispute_deadlines") as acquired:
+        if not acquired:
+            logger.info("[Scheduler] check_dispute_deadlines is running elsewhere - skipped")
+            return {"auto_resolved": 0, "need_admin": 0}
         
-        auto_resolve_count = 0
-        admin_alert_count = 0
-        
-        # === 7일 무응답: 화주 주장 인정 ===
-        no_response_disputes = db.query(Settlement).filter(
-            Settlement.status == "disputed",
-            Settlement.disputed_at <= seven_days_ago,
-            Settlement.forwarder_response.is_(None),
-            Settlement.resolved_at.is_(None)
-        ).all()
-        
-        for settlement in no_response_disputes:
-            # 화주 주장 인정 - 자동 해결
-            settlement.status = "completed"
-            settlement.resolved_at = now
-            settlement.resolution_type = "auto_customer_favor"
-            settlement.resolution_note = "포워더 7일 무응답으로 화주 주장 인정"
+        db = get_db()
+        try:
+            _begin_job_transaction(db)
+            now = datetime.now()
+            seven_days_ago = now - timedelta(days=7)
+            thirty_days_ago = now - timedelta(days=30)
             
-            # 양측 알림
-            notification_customer = Notification(
-                recipient_type="customer",
-                recipient_id=settlement.customer_id,
-                notification_type="dispute_auto_resolved",
-                title="분쟁이 자동 해결되었습니다",
-                message=f"정산번호 {settlement.settlement_no}의 분쟁이 포워더 무응답으로 귀하의 주장대로 해결되었습니다.",
-                related_type="settlement",
-                related_id=settlement.id
+            # === 30일 미해결: 관리자 알림 대상 (자동 해결 전 기준) ===
+            # (관리자 시스템이 있다면 여기서 알림)
+            admin_alert_count = db.execute(
+                select(func.count(Settlement.id)).where(
+                    Settlement.status == "disputed",
+                    Settlement.disputed_at <= thirty_days_ago,
+                    Settlement.resolved_at.is_(None)
+                )
+            ).scalar() or 0
+            
+            # === 7일 무응답: 화주 주장 인정 ===
+            no_response = and_(
+                Settlement.status == "disputed",
+                Settlement.disputed_at <= seven_days_ago,
+                Settlement.forwarder_response.is_(None),
+                Settlement.resolved_at.is_(None)
             )
-            notification_forwarder = Notification(
-                recipient_type="forwarder",
-                recipient_id=settlement.forwarder_id,
-                notification_type="dispute_auto_resolved",
-                title="분쟁이 자동 해결되었습니다",
-                message=f"정산번호 {settlement.settlement_no}의 분쟁이 7일 무응답으로 화주 주장대로 해결되었습니다.",
-                related_type="settlement",
-                related_id=settlement.id
+            
+            # 양측 알림
+            _insert_notifications(
+                db,
+                select(
+                    _text("customer"),
+                    Settlement.customer_id,
+                    _text("dispute_auto_resolved"),
+                    _text("분쟁이 자동 해결되었습니다"),
+                    _text("정산번호 ") + Settlement.settlement_no
+                    + _text("의 분쟁이 포워더 무응답으로 귀하의 주장대로 해결되었습니다."),
+                    _text("settlement"),
+                    Settlement.id,
+                ).where(no_response),
+                select(
+                    _text("forwarder"),
+                    Settlement.forwarder_id,
+                    _text("dispute_auto_resolved"),
+                    _text("분쟁이 자동 해결되었습니다"),
+                    _text("정산번호 ") + Settlement.settlement_no
+                    + _text("의 분쟁이 7일 무응답으로 화주 주장대로 해결되었습니다."),
+                    _text("settlement"),
+                    Settlement.id,
+                ).where(no_response),
             )
-            db.add(notification_customer)
-            db.add(notification_forwarder)
-            auto_resolve_count += 1
-        
-        # === 30일 미해결: 관리자 알림 ===
-        # (관리자 시스템이 있다면 여기서 알림)
-        long_disputes = db.query(Settlement).filter(
-            Settlement.status == "disputed",
-            Settlement.disputed_at <= thirty_days_ago,
-            Settlement.resolved_at.is_(None)
-        ).count()
-        
-        if long_disputes > 0:
-            logger.warning(f"[Scheduler] {long_disputes} disputes pending for over 30 days - admin attention needed")
-            admin_alert_count = long_disputes
-        
-        db.commit()
-        logger.info(f"[Scheduler] Auto-resolved {auto_resolve_count} disputes, {admin_alert_count} need admin attention")
-        return {"auto_resolved": auto_resolve_count, "need_admin": admin_alert_count}
+            
+            # 화주 주장 인정 - 자동 해결
+            auto_resolve_count = _bulk_update(db, update(Settlement).where(no_response).values(
+                status="completed",
+                resolved_at=now,
+                resolution_type="auto_customer_favor",
+                resolution_note="포워더 7일 무응답으로 화주 주장 인정"
+            ))
+            
+            if admin_alert_count > 0:
+                logger.warning(f"[Scheduler] {admin_alert_count} disputes pending for over 30 days - admin attention needed")
+            
+            db.commit()
+            logger.info(f"[Scheduler] Auto-resolved {auto_resolve_count} disputes, {admin_alert_count} need admin attention")
+            return {"auto_resolved": auto_resolve_count, "need_admin": admin_alert_count}
         
-    except Exception as e:
-        db.rollback()
-        logger.error(f"[Scheduler] Error in check_dispute_deadlines: {e}")
-        raise
-    finally:
-        db.close()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[Scheduler] Error in check_dispute_deadlines: {e}")
+            raise
+        finally:
+            db.close()
 
 
 def run_all_scheduled_tasks():
@@ -0,0 +1,91 @@
+"""
+Request Telemetry - 라우트별 지연시간, SQL 문 수/시간 (ASGI 미들웨어)
+요청마다 SQL 문을 세고 Prometheus 텍스트 형식으로 GET /metrics에 노출합니다.
+
+    app.add_middleware(TelemetryMiddleware)
+
+    @app.get("/api/bidding/list")
+    @query_budget(10)                # 이 라우트의 SQL 문 상한
+    def get_bidding_list(...): ...
+
+집계/렌더링은 server와 같은 공용 코어(shared/telemetry.py)를 쓰고, 여기는 ASGI 연동만 둡니다.
+- 라우트 라벨은 경로 템플릿(/api/bidding/{bidding_no}/bids)이므로 값별로 시계열이 늘어나지 않음
+- 동기 엔드포인트는 스레드풀에서 실행되지만 contextvars가 복사되므로 같은 요청으로 집계됨
+- 응답에 Server-Timing 헤더(app/db)를 붙임
+
+집계는 프로세스별입니다 (uvicorn 워커마다 /metrics가 다름).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)  # 저장소 루트의 shared 패키지
+
+from shared.telemetry import (  # noqa: E402
+    METRICS_CONTENT_TYPE, NO_ROUTE, REQUEST_DURATION, REQUEST_STATEMENTS, REQUESTS_TOTAL, QueryBudgetExceeded,
+    RequestStats, _current, check_query_budget, count_queries, external_call, instrument_sqlalchemy,
+    normalize_statement, query_budget, record_statement, render_metrics, server_timing, slowest_statements,
+)
+
+
+# ============================================================
+# ASGI integration
+# ============================================================
+
+def _route_of(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or NO_ROUTE
+
+
+class TelemetryMiddleware:
+    """요청별 지연시간/SQL 문 수 기록, Server-Timing 헤더, query_budget 검사"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        instrument_sqlalchemy()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # 일반 응답은 엔드포인트가 끝난 뒤 시작 메시지가 오므로 SQL 집계가 끝난 상태
+                stats.route = _route_of(scope)
+                headers = MutableHeaders(raw=message["headers"])
+                headers["Server-Timing"] = server_timing(stats, time.perf_counter() - started)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            stats.route = _route_of(scope)
+            elapsed = time.perf_counter() - started
+            labels = (scope["method"], stats.route)
+            REQUEST_DURATION.observe(labels, elapsed)
+            REQUEST_STATEMENTS.observe(labels, stats.statements)
+            REQUESTS_TOTAL.inc((scope["method"], stats.route, str(status)))
+
+        check_query_budget(scope.get("endpoint"), stats, scope["method"])
+
+
+def metrics_response():
+    """GET /metrics 응답 (Prometheus 텍스트 형식)"""
+    from starlette.responses import Response
+
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -127,6 +127,28 @@ def test_db_session():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def session_factory(tmp_path):
+    """
+    File-backed SQLite database with every table and the WAL profile, as a sessionmaker.
+
+    Test modules that need seed rows or a patched SessionLocal override this
+    fixture and request it under the same name.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from database import Base, configure_engine
+    import models  # noqa: F401  (register tables on Base.metadata)
+
+    engine = configure_engine(create_engine(f"sqlite:///{tmp_path / 'quote.db'}",
+                                            connect_args={"check_same_thread": False}))
+    Base.metadata.create_all(bind=engine)
+
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    engine.dispose()
+
+
 # ============================================================
 # Markers
 # ============================================================
@@ -0,0 +1,104 @@
+"""
+Integration Tests for the Pooled SMTP Sender
+Runs the outbox against a local aiosmtpd server (pip install aiosmtpd); skipped when it is not installed.
+"""
+import pytest
+import socket
+import sys
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+aiosmtpd_controller = pytest.importorskip('aiosmtpd.controller')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import EmailOutbox
+
+pytestmark = pytest.mark.integration
+
+
+class CollectingHandler:
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        self.messages.append((envelope.rcpt_tos, envelope.content))
+        return '250 OK'
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = CollectingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname='127.0.0.1', port=_free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _connection(controller):
+    from email_service import SMTPConnection
+
+    return SMTPConnection(host=controller.hostname, port=controller.port, user='', password='', starttls=False)
+
+
+class TestPooledSmtp:
+
+    def test_outbox_drained_over_one_session(self, smtp_server, session_factory):
+        from email_service import OutboxSender, enqueue_email
+
+        controller, handler = smtp_server
+        session = session_factory()
+        for i in range(10):
+            enqueue_email(session, f'fw{i}@example.com', 'new_bid_received',
+                          customer_name='홍길동', bidding_no=f'B{i}', bid_count=i)
+        session.commit()
+        session.close()
+
+        connection = _connection(controller)
+        sender = OutboxSender(session_factory, connection, batch_size=4, dev_mode=False)
+
+        assert sender.drain() == {'sent': 10, 'retry': 0, 'failed': 0}
+        assert len(handler.messages) == 10
+        assert len(handler.sessions) == 1
+        assert connection.connects == 1
+
+        session = session_factory()
+        assert session.query(EmailOutbox).filter(EmailOutbox.status == 'sent').count() == 10
+        session.close()
+        connection.close()
+
+    def test_reconnects_after_server_drop(self, smtp_server):
+        from email_service import build_message
+
+        controller, handler = smtp_server
+        connection = _connection(controller)
+        msg = build_message('a@example.com', 'hi', '<p>hi</p>').as_string()
+
+        connection.send('noreply@example.com', ['a@example.com'], msg)
+        connection._server.sock.shutdown(socket.SHUT_RDWR)  # simulate the server dropping an idle connection
+        connection.send('noreply@example.com', ['a@example.com'], msg)
+
+        assert len(handler.messages) == 2
+        assert connection.connects == 2
+        connection.close()
@@ -0,0 +1,121 @@
+"""
+Integration Tests for the PostgreSQL Backend
+Runs against a throwaway database on a local PostgreSQL server.
+
+Set TEST_POSTGRES_URL to an admin URL (e.g. postgresql+psycopg2://postgres@localhost/postgres);
+a uniquely named database is created for the test session and dropped afterwards.
+"""
+import os
+import pytest
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+ADMIN_URL = os.getenv('TEST_POSTGRES_URL', '')
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not ADMIN_URL, reason='TEST_POSTGRES_URL not set'),
+]
+
+
+@pytest.fixture(scope='module')
+def postgres_url():
+    """Create and drop a throwaway database"""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.engine import make_url
+
+    from database import normalize_database_url
+
+    admin_url = make_url(normalize_database_url(ADMIN_URL))
+    db_name = f"quote_test_{uuid.uuid4().hex[:8]}"
+
+    admin = create_engine(admin_url, isolation_level='AUTOCOMMIT')
+    with admin.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+
+    yield admin_url.set(database=db_name).render_as_string(hide_password=False)
+
+    with admin.connect() as conn:
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)'))
+    admin.dispose()
+
+
+@pytest.fixture(scope='module')
+def migrated(postgres_url, tmp_path_factory):
+    """Seed a SQLite quote.db and COPY it into the throwaway database"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from database import Base
+    from migrate_to_postgres import migrate
+    from models import Port
+
+    source_url = f"sqlite:///{tmp_path_factory.mktemp('pg') / 'quote.db'}"
+    source = create_engine(source_url)
+    Base.metadata.create_all(source)
+    session = sessionmaker(bind=source)()
+    session.add_all([
+        Port(code=f'P{i:04d}', name=f'Port "{i}"', name_ko='' if i % 2 else None,
+             country='X', country_code='XX', port_type='ocean',
+             is_active=bool(i % 3), created_at=datetime(2025, 1 + i % 12, 1))
+        for i in range(120)
+    ])
+    session.commit()
+    session.close()
+    source.dispose()
+
+    return migrate(source_url, postgres_url, batch_size=50, log=lambda _: None)
+
+
+class TestPostgresBackend:
+
+    def test_copy_preserves_rows(self, postgres_url, migrated):
+        from sqlalchemy import create_engine, text
+
+        assert migrated['ports'] == 120
+
+        engine = create_engine(postgres_url)
+        with engine.connect() as conn:
+            assert conn.execute(text('SELECT COUNT(*) FROM ports')).scalar() == 120
+            assert conn.execute(text('SELECT COUNT(*) FROM ports WHERE name_ko IS NULL')).scalar() == 60
+            assert conn.execute(text("SELECT COUNT(*) FROM ports WHERE name_ko = ''")).scalar() == 60
+            assert conn.execute(text("SELECT name FROM ports WHERE code = 'P0007'")).scalar() == 'Port "7"'
+        engine.dispose()
+
+    def test_sequence_reset_after_copy(self, postgres_url, migrated):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from models import Port
+
+        engine = create_engine(postgres_url)
+        session = sessionmaker(bind=engine)()
+        port = Port(code='NEW01', name='New', country='X', country_code='XX', port_type='ocean')
+        session.add(port)
+        session.commit()
+
+        assert port.id > 120
+        session.close()
+        engine.dispose()
+
+    def test_pooled_engine_and_year_month(self, postgres_url, migrated):
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import sessionmaker
+
+        from database import engine_options, year_month
+        from models import Port
+
+        engine = create_engine(postgres_url, **engine_options(postgres_url))
+        session = sessionmaker(bind=engine)()
+
+        months = session.query(year_month(Port.created_at)).distinct().all()
+        assert ('2025-01',) in months
+        assert session.execute(text('SHOW statement_timeout')).scalar() != '0'
+
+        session.close()
+        engine.dispose()
@@ -0,0 +1,185 @@
+"""
+Unit Tests for the Bid Submission Path
+Tests for the conditional insert/update, the (bidding_id, forwarder_id) constraint
+and optimistic locking on Bidding.version
+"""
+import pytest
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.orm.exc import StaleDataError
+
+from models import Bid, Bidding, Forwarder, QuoteRequest
+from schemas import BidCreate, BidUpdate
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    from query_cache import validation_cache
+
+    session = session_factory()
+    session.add(QuoteRequest(id=1, request_number='QR-1', trade_mode='export', shipping_type='ocean',
+                             load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2026, 1, 1), customer_id=1))
+    session.add_all([
+        Bidding(id=1, bidding_no='EXSEA00001', quote_request_id=1, status='open',
+                deadline=datetime.now() + timedelta(days=1)),
+        Bidding(id=2, bidding_no='EXSEA00002', quote_request_id=1, status='open',
+                deadline=datetime.now() - timedelta(hours=1)),
+    ])
+    session.add_all([
+        Forwarder(id=i, company=f'FW{i}', name=f'fw{i}', email=f'fw{i}@example.com', phone='010')
+        for i in range(1, 21)
+    ])
+    session.commit()
+    session.close()
+    validation_cache.invalidate()
+
+    yield session_factory
+
+    validation_cache.invalidate()
+
+
+def _submit(session, forwarder_id, bidding_id=1, amount=1000.0):
+    from main import submit_bid
+
+    return submit_bid(BidCreate(bidding_id=bidding_id, total_amount=amount), forwarder_id, session)
+
+
+class TestSubmitBid:
+
+    def test_submit_and_duplicate(self, session_factory):
+        session = session_factory()
+        response = _submit(session, 1)
+
+        assert response.bid.forwarder_id == 1
+        assert response.bid.status == 'submitted'
+        assert response.bid.created_at is not None
+
+        with pytest.raises(HTTPException) as exc:
+            _submit(session, 1, amount=900.0)
+        assert exc.value.status_code == 400
+        assert 'already submitted' in exc.value.detail
+
+        assert session.query(Bid).count() == 1
+        session.close()
+
+    def test_rejects_unknown_forwarder_and_closed_bidding(self, session_factory):
+        session = session_factory()
+
+        with pytest.raises(HTTPException) as exc:
+            _submit(session, 999)
+        assert exc.value.status_code == 404
+
+        with pytest.raises(HTTPException) as exc:
+            _submit(session, 1, bidding_id=2)
+        assert exc.value.detail == 'Bidding deadline has passed'
+
+        with pytest.raises(HTTPException) as exc:
+            _submit(session, 1, bidding_id=404)
+        assert exc.value.status_code == 404
+        session.close()
+
+    def test_conditional_insert_beats_stale_cache(self, session_factory):
+        """Test a bidding closed behind the cache's back still refuses the bid"""
+        session = session_factory()
+        _submit(session, 1)  # warms the validation cache with status='open'
+
+        with session_factory().get_bind().begin() as conn:
+            conn.execute(text("UPDATE biddings SET status = 'awarded' WHERE id = 1"))
+
+        with pytest.raises(HTTPException) as exc:
+            _submit(session, 2)
+        assert exc.value.detail == 'Bidding is not open for bids'
+        assert session.query(Bid).filter(Bid.forwarder_id == 2).count() == 0
+        session.close()
+
+
+class TestUpdateBid:
+
+    def test_update_then_locked_after_award(self, session_factory):
+        from main import update_bid
+
+        session = session_factory()
+        bid_id = _submit(session, 1).bid.id
+
+        updated = update_bid(bid_id, BidUpdate(total_amount=800.0, remark='best'), 1, session)
+        assert updated.bid.total_amount == 800.0
+        assert updated.bid.remark == 'best'
+
+        with pytest.raises(HTTPException) as exc:
+            update_bid(bid_id, BidUpdate(total_amount=700.0), 2, session)
+        assert exc.value.status_code == 403
+
+        session.query(Bid).filter(Bid.id == bid_id).update({'status': 'awarded'})
+        session.commit()
+
+        with pytest.raises(HTTPException) as exc:
+            update_bid(bid_id, BidUpdate(total_amount=700.0), 1, session)
+        assert exc.value.detail == "Cannot update bid with status 'awarded'"
+        assert float(session.get(Bid, bid_id).total_amount) == 800.0
+        session.close()
+
+
+class TestOptimisticLocking:
+
+    def test_concurrent_status_change_is_stale(self, session_factory):
+        first, second = session_factory(), session_factory()
+        a = first.get(Bidding, 1)
+        b = second.get(Bidding, 1)
+
+        a.status = 'awarded'
+        first.commit()
+        assert a.version == 2  # version_id_col starts at 1 on insert
+
+        b.status = 'closed'
+        with pytest.raises(StaleDataError):
+            second.commit()
+
+        first.close()
+        second.close()
+
+
+class TestConcurrentSubmission:
+
+    def test_stress_no_duplicate_bids(self, session_factory):
+        """20 forwarders x 4 concurrent attempts each → exactly one bid per forwarder"""
+        outcomes = []
+        lock = threading.Lock()
+        start = threading.Barrier(8)
+
+        def worker(forwarder_ids):
+            start.wait()
+            for forwarder_id in forwarder_ids:
+                session = session_factory()
+                try:
+                    _submit(session, forwarder_id)
+                    result = 'ok'
+                except HTTPException as e:
+                    result = e.status_code
+                finally:
+                    session.close()
+                with lock:
+                    outcomes.append((forwarder_id, result))
+
+        attempts = [f for f in range(1, 21)] * 4
+        chunks = [attempts[i::8] for i in range(8)]
+        threads = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        session = session_factory()
+        pairs = session.query(Bid.bidding_id, Bid.forwarder_id).all()
+        session.close()
+
+        assert len(pairs) == len(set(pairs)) == 20
+        assert sum(1 for _, result in outcomes if result == 'ok') == 20
+        assert {result for _, result in outcomes if result != 'ok'} == {400}
@@ -0,0 +1,142 @@
+"""
+Unit Tests for Quote Backend Database Configuration
+Tests for URL resolution, engine options, portable SQL and the migration tool
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import column, create_engine, event, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, engine_options, resolve_database_url, year_month
+from models import Bid, Bidding, Customer, Forwarder, Port, QuoteRequest
+
+
+class TestDatabaseUrl:
+    """Tests for resolve_database_url / engine_options"""
+
+    def test_quote_database_url_takes_precedence(self, monkeypatch):
+        monkeypatch.setenv('QUOTE_DATABASE_URL', 'postgres://u:p@localhost/quote')
+        monkeypatch.setenv('DATABASE_URL', 'sqlite:///other.db')
+
+        assert resolve_database_url() == 'postgresql+psycopg2://u:p@localhost/quote'
+
+    def test_shared_postgres_database_url_is_ignored(self, monkeypatch):
+        """Test the news server's DATABASE_URL does not redirect the quote DB"""
+        monkeypatch.delenv('QUOTE_DATABASE_URL', raising=False)
+        monkeypatch.setenv('DATABASE_URL', 'postgresql://u:p@localhost/news')
+
+        assert resolve_database_url().startswith('sqlite:///')
+
+    def test_postgres_engine_options(self):
+        options = engine_options('postgresql+psycopg2://u:p@localhost/quote')
+
+        assert options['pool_pre_ping'] is True
+        assert options['pool_size'] > 0
+        assert 'statement_timeout' in options['connect_args']['options']
+
+    def test_sqlite_engine_options(self):
+        options = engine_options('sqlite:///quote.db')
+
+        assert options == {'connect_args': {'check_same_thread': False}}
+
+
+class TestYearMonth:
+    """Tests for the portable year_month() expression"""
+
+    def test_compiles_per_dialect(self):
+        query = select(year_month(column('confirmed_at')))
+
+        assert "strftime('%Y-%m', confirmed_at)" in str(query.compile(dialect=sqlite.dialect()))
+        assert "to_char(confirmed_at, 'YYYY-MM')" in str(query.compile(dialect=postgresql.dialect()))
+
+    def test_executes_on_sqlite(self):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        session.add(Port(code='KRPUS', name='Busan', country='South Korea', country_code='KR',
+                         port_type='ocean', created_at=datetime(2025, 3, 15, 10, 30)))
+        session.commit()
+
+        assert session.query(year_month(Port.created_at)).scalar() == '2025-03'
+        session.close()
+
+
+class TestMigrationTool:
+    """Tests for migrate_to_postgres helpers"""
+
+    def test_csv_field_distinguishes_null_and_empty(self):
+        from migrate_to_postgres import _csv_field
+
+        assert _csv_field(None) == ''
+        assert _csv_field('') == '""'
+        assert _csv_field('say "hi"') == '"say ""hi"""'
+        assert _csv_field(True) == '"t"'
+        assert _csv_field({'a': 1}) == '"{""a"": 1}"'
+
+    def test_migrate_sqlite_to_sqlite(self, tmp_path):
+        """Test the INSERT fallback path copies rows and verifies counts"""
+        from migrate_to_postgres import migrate
+
+        source_url = f"sqlite:///{tmp_path / 'source.db'}"
+        source = create_engine(source_url)
+        Base.metadata.create_all(source)
+        Session = sessionmaker(bind=source)
+        session = Session()
+        session.add_all([
+            Port(code=f'P{i:04d}', name=f'Port {i}', country='X', country_code='XX', port_type='ocean')
+            for i in range(25)
+        ])
+        # biddings.awarded_bid_id <-> bids.bidding_id 순환 FK
+        session.add(Customer(id=1, company='Shipper', name='c', email='c@example.com', phone='010'))
+        session.add(QuoteRequest(id=1, request_number='QR-1', trade_mode='export', shipping_type='ocean',
+                                 load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2026, 1, 1),
+                                 customer_id=1))
+        session.add(Forwarder(id=1, company='FW', name='fw', email='fw@example.com', phone='010'))
+        session.add_all([
+            Bidding(id=1, bidding_no='EXSEA00001', quote_request_id=1, status='awarded'),
+            Bidding(id=2, bidding_no='EXSEA00002', quote_request_id=1, status='open'),
+        ])
+        session.flush()
+        session.add(Bid(id=7, bidding_id=1, forwarder_id=1, total_amount=1000, status='awarded'))
+        session.flush()
+        session.get(Bidding, 1).awarded_bid_id = 7
+        session.commit()
+        session.close()
+        source.dispose()
+
+        def enforce_foreign_keys(dbapi_conn, _):
+            dbapi_conn.execute('PRAGMA foreign_keys=ON')
+
+        target_url = f"sqlite:///{tmp_path / 'target.db'}"
+        event.listen(Engine, 'connect', enforce_foreign_keys)
+        try:
+            copied = migrate(source_url, target_url, batch_size=10, log=lambda _: None)
+        finally:
+            event.remove(Engine, 'connect', enforce_foreign_keys)
+
+        assert copied['ports'] == 25
+        assert copied['biddings'] == 2 and copied['bids'] == 1
+        target = create_engine(target_url)
+        with target.connect() as conn:
+            awarded = conn.execute(text('SELECT id, awarded_bid_id FROM biddings ORDER BY id')).all()
+        target.dispose()
+        assert [tuple(row) for row in awarded] == [(1, 7), (2, None)]
+
+    def test_copy_plan_breaks_bidding_cycle(self):
+        """Test only the nullable side of the biddings/bids cycle is deferred"""
+        from migrate_to_postgres import copy_plan
+
+        tables, deferred = copy_plan(Base.metadata)
+        order = [table.name for table in tables]
+
+        assert deferred == {'biddings': ['awarded_bid_id']}
+        assert order.index('quote_requests') < order.index('biddings') < order.index('bids')
+        assert order.index('forwarders') < order.index('bids')
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the Document Number Allocator
+Tests for document_sequences counters, seeding from existing numbers and concurrent uniqueness
+"""
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from document_numbers import last_issued, next_sequence
+from models import Bidding, DocumentSequence, QuoteRequest
+
+
+class TestNextSequence:
+
+    def test_counters_per_prefix_and_period(self, session_factory):
+        session = session_factory()
+
+        assert [next_sequence(session, 'QR-', '20260101') for _ in range(3)] == [1, 2, 3]
+        assert next_sequence(session, 'QR-', '20260102') == 1
+        assert next_sequence(session, 'CT-', '20260101') == 1
+        assert next_sequence(session, 'QR-', '20260101', step=10) == 13
+        session.commit()
+
+        assert session.get(DocumentSequence, ('QR-', '20260101')).value == 13
+        session.close()
+
+    def test_rollback_releases_sqlite_allocation(self, session_factory):
+        """Test on SQLite the counter moves with the caller's transaction"""
+        session = session_factory()
+        assert next_sequence(session, 'CT-', '20260101') == 1
+        session.rollback()
+
+        assert next_sequence(session, 'CT-', '20260101') == 1
+        session.close()
+
+    def test_continues_from_existing_numbers(self, session_factory):
+        session = session_factory()
+        session.add(QuoteRequest(id=1, request_number='QR-20260101-041', trade_mode='export', shipping_type='ocean',
+                                 load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2026, 1, 5), customer_id=1))
+        session.add(Bidding(id=1, bidding_no='EXSEA00009', quote_request_id=1, status='open'))
+        session.flush()
+
+        assert last_issued(session, QuoteRequest.request_number, 'QR-20260101-') == 41
+        assert last_issued(session, QuoteRequest.request_number, 'QR-20260102-') == 0
+        assert last_issued(session, Bidding.bidding_no, 'IMAIR', default=-1) == -1
+
+        seq = next_sequence(session, 'EXSEA', initial=lambda: last_issued(session, Bidding.bidding_no, 'EXSEA', default=-1))
+        assert seq == 10
+        session.close()
+
+    def test_generators_use_counters(self, session_factory):
+        from main import generate_bidding_no, generate_contract_no, generate_request_number
+
+        session = session_factory()
+        today = datetime.now().strftime('%Y%m%d')
+
+        assert generate_bidding_no('export', 'ocean', session) == 'EXSEA00000'
+        assert generate_bidding_no('export', 'ocean', session) == 'EXSEA00001'
+        assert generate_bidding_no('import', 'air', session) == 'IMAIR00000'
+        assert generate_request_number(session) == f'QR-{today}-001'
+        assert generate_contract_no(session) == f'CT-{today}-001'
+        session.close()
+
+
+class TestConcurrentAllocation:
+
+    def test_threads_never_share_a_number(self, session_factory):
+        threads, per_thread = 8, 25
+        issued, latencies, errors = [], [], []
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                for _ in range(per_thread):
+                    session = session_factory()
+                    started = time.perf_counter()
+                    value = next_sequence(session, 'QR-', '20260101')
+                    session.commit()
+                    elapsed = time.perf_counter() - started
+                    session.close()
+                    with lock:
+                        issued.append(value)
+                        latencies.append(elapsed)
+            except Exception as e:  # pragma: no cover - surfaced by the assertion below
+                errors.append(e)
+
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+
+        assert errors == []
+        assert sorted(issued) == list(range(1, threads * per_thread + 1))
+
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        assert p95 < 1.0
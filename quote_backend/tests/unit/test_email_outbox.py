@@ -0,0 +1,179 @@
+"""
+Unit Tests for the Email Outbox
+Tests for enqueue_email, template rendering cache and OutboxSender retry/backoff
+"""
+import json
+import pytest
+import smtplib
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from models import EmailOutbox
+
+
+class RecordingConnection:
+    """SMTPConnection stand-in that records messages or raises the queued errors"""
+
+    def __init__(self, errors=None):
+        self.errors = list(errors or [])
+        self.sent = []
+
+    def send(self, from_addr, recipients, message):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((from_addr, recipients, message))
+
+    def close(self):
+        pass
+
+
+def _enqueue_award(session, to_email='fw@example.com', bidding_no='EXSEA00001'):
+    from email_service import enqueue_email
+
+    return enqueue_email(
+        session, to_email, 'bid_awarded',
+        forwarder_name='AAL물류', bidding_no=bidding_no, cargo_type='FCL',
+        pol='KRPUS', pod='USLAX', amount='₩1,000,000'
+    )
+
+
+class TestEnqueueEmail:
+
+    def test_rows_follow_caller_transaction(self, session_factory):
+        session = session_factory()
+        _enqueue_award(session)
+        session.rollback()
+        assert session.query(EmailOutbox).count() == 0
+
+        entry = _enqueue_award(session)
+        session.commit()
+
+        assert entry.status == 'pending'
+        assert entry.subject == '[AAL] 🎉 입찰 선정 알림 - EXSEA00001'
+        assert json.loads(entry.context)['pol'] == 'KRPUS'
+        session.close()
+
+    def test_unknown_template_and_missing_recipient(self, session_factory):
+        from email_service import enqueue_email
+
+        session = session_factory()
+        with pytest.raises(ValueError):
+            enqueue_email(session, 'a@example.com', 'no_such_template')
+        assert enqueue_email(session, None, 'bid_awarded') is None
+        session.close()
+
+
+class TestRenderCache:
+
+    def test_same_context_renders_once(self):
+        from email_service import _render_cached, render_email
+
+        context = json.dumps({'customer_name': '홍길동', 'bidding_no': 'B1', 'bid_count': 3}, sort_keys=True)
+        _render_cached.cache_clear()
+
+        first = render_email('new_bid_received', context)
+        second = render_email('new_bid_received', context)
+
+        assert first is second
+        assert _render_cached.cache_info().hits == 1
+        assert 'B1' in first
+
+
+class TestOutboxSender:
+
+    def test_batch_sent_over_one_connection(self, session_factory):
+        from email_service import OutboxSender
+
+        session = session_factory()
+        for i in range(5):
+            _enqueue_award(session, f'fw{i}@example.com', f'EXSEA0000{i}')
+        session.commit()
+        session.close()
+
+        connection = RecordingConnection()
+        sender = OutboxSender(session_factory, connection, batch_size=2, dev_mode=False)
+
+        assert sender.drain() == {'sent': 5, 'retry': 0, 'failed': 0}
+        assert [recipients for _, recipients, _ in connection.sent] == [[f'fw{i}@example.com'] for i in range(5)]
+
+        session = session_factory()
+        rows = session.query(EmailOutbox).all()
+        assert {r.status for r in rows} == {'sent'}
+        assert all(r.attempts == 1 and r.sent_at and r.claim_token is None for r in rows)
+        session.close()
+
+        assert sender.drain() == {'sent': 0, 'retry': 0, 'failed': 0}
+
+    def test_transient_error_backs_off_then_fails(self, session_factory):
+        from email_service import OutboxSender
+
+        session = session_factory()
+        _enqueue_award(session)
+        session.commit()
+        session.close()
+
+        connection = RecordingConnection(errors=[smtplib.SMTPServerDisconnected('gone')] * 2)
+        sender = OutboxSender(session_factory, connection, max_attempts=2, backoff_seconds=60, dev_mode=False)
+
+        started = datetime.now()
+        assert sender.send_batch() == {'sent': 0, 'retry': 1, 'failed': 0}
+
+        session = session_factory()
+        entry = session.query(EmailOutbox).one()
+        assert entry.status == 'pending'
+        assert entry.next_attempt_at >= started + timedelta(seconds=60)
+        assert 'SMTPServerDisconnected' in entry.last_error
+
+        # Not due yet
+        assert sender.send_batch() == {'sent': 0, 'retry': 0, 'failed': 0}
+
+        entry.next_attempt_at = datetime.now() - timedelta(seconds=1)
+        session.commit()
+        session.close()
+
+        assert sender.send_batch() == {'sent': 0, 'retry': 0, 'failed': 1}
+        session = session_factory()
+        assert session.query(EmailOutbox).one().status == 'failed'
+        session.close()
+
+    def test_recipient_refused_fails_immediately(self, session_factory):
+        from email_service import OutboxSender
+
+        session = session_factory()
+        _enqueue_award(session)
+        session.commit()
+        session.close()
+
+        refused = smtplib.SMTPRecipientsRefused({'fw@example.com': (550, b'no such user')})
+        sender = OutboxSender(session_factory, RecordingConnection(errors=[refused]), dev_mode=False)
+
+        assert sender.send_batch() == {'sent': 0, 'retry': 0, 'failed': 1}
+
+    def test_stale_claim_is_retaken(self, session_factory):
+        """Test rows left in 'sending' by a dead worker are picked up after the claim expires"""
+        from email_service import OutboxSender
+
+        session = session_factory()
+        entry = _enqueue_award(session)
+        entry.status = 'sending'
+        entry.claim_token = 'deadworker'
+        entry.next_attempt_at = datetime.now() - timedelta(seconds=1)
+        session.commit()
+        session.close()
+
+        connection = RecordingConnection()
+        assert OutboxSender(session_factory, connection, dev_mode=False).send_batch()['sent'] == 1
+        assert len(connection.sent) == 1
+
+    def test_backoff_is_capped(self):
+        from email_service import OUTBOX_BACKOFF_MAX_SECONDS, OutboxSender
+
+        sender = OutboxSender(connection=RecordingConnection(), backoff_seconds=30)
+
+        assert sender.backoff(1) == timedelta(seconds=30)
+        assert sender.backoff(3) == timedelta(seconds=120)
+        assert sender.backoff(20) == timedelta(seconds=OUTBOX_BACKOFF_MAX_SECONDS)
@@ -0,0 +1,192 @@
+"""
+Unit Tests for Live Bidding Events
+Tests for the in-process broker, subscription filters, SSE framing and commit-driven publishing
+"""
+import pytest
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import live_events
+from live_events import InProcessBroker, bidding_filter, format_sse, sse_stream, track_biddings
+from models import Bid, Bidding, Forwarder, Notification, QuoteRequest
+from schemas import BidCreate
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    from query_cache import validation_cache
+
+    session = session_factory()
+    session.add(QuoteRequest(id=1, request_number='QR-1', trade_mode='export', shipping_type='ocean',
+                             load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2026, 1, 1), customer_id=1))
+    session.add(QuoteRequest(id=2, request_number='QR-2', trade_mode='export', shipping_type='air',
+                             load_type='AIR', pol='ICN', pod='LAX', etd=datetime(2026, 1, 1), customer_id=1))
+    session.add_all([
+        Bidding(id=1, bidding_no='EXSEA00001', quote_request_id=1, status='open',
+                deadline=datetime.now() + timedelta(days=1)),
+        Bidding(id=2, bidding_no='EXAIR00001', quote_request_id=2, status='open',
+                deadline=datetime.now() + timedelta(days=1)),
+        Forwarder(id=1, company='FW1', name='fw1', email='fw1@example.com', phone='010'),
+    ])
+    session.commit()
+    session.close()
+    validation_cache.invalidate()
+
+    yield session_factory
+
+    validation_cache.invalidate()
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    fresh = InProcessBroker()
+    monkeypatch.setattr(live_events, "broker", fresh)
+    return fresh
+
+
+async def _drain(subscription, timeout=0.05):
+    events = []
+    while True:
+        item = await subscription.get(timeout)
+        if item is None:
+            return events
+        events.append(item)
+
+
+class TestFilters:
+
+    def test_list_and_bidding_filters(self):
+        ocean = {"type": "bidding", "bidding_id": 1, "shipping_type": "ocean"}
+        air = {"type": "bidding", "bidding_id": 2, "shipping_type": "air"}
+
+        assert bidding_filter()(ocean) and bidding_filter()(air)
+        assert bidding_filter(shipping_type="air")(air)
+        assert not bidding_filter(shipping_type="air")(ocean)
+        assert bidding_filter(bidding_ids=[1])(ocean)
+        assert not bidding_filter(bidding_ids=[1], shipping_type="ocean")(air)
+        assert not bidding_filter(recipient_type="forwarder", recipient_id=1, biddings=False)(ocean)
+
+    def test_inbox_filter_accepts_shipper_alias(self):
+        matcher = bidding_filter(recipient_type="shipper", recipient_id=7)
+
+        assert matcher({"type": "inbox", "kind": "message", "recipient_type": "shipper", "recipient_id": 7})
+        assert matcher({"type": "inbox", "kind": "notification", "recipient_type": "customer", "recipient_id": 7})
+        assert not matcher({"type": "inbox", "kind": "message", "recipient_type": "shipper", "recipient_id": 8})
+        assert not bidding_filter()({"type": "inbox", "recipient_type": "shipper", "recipient_id": 7})
+
+    def test_format_sse(self):
+        frame = format_sse({"type": "bidding", "bidding_no": "EXSEA00001"})
+        name, data = frame.rstrip("\n").split("\n")
+
+        assert name == "event: bidding"
+        assert json.loads(data[len("data: "):]) == {"type": "bidding", "bidding_no": "EXSEA00001"}
+        assert frame.endswith("\n\n")
+
+
+class TestBroker:
+
+    def test_publish_from_other_thread(self, broker):
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter(bidding_ids=[1]))
+            threads = [threading.Thread(target=broker.publish, args=({"type": "bidding", "bidding_id": i},))
+                       for i in (1, 2, 1)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            return await _drain(subscription)
+
+        assert asyncio.run(scenario()) == [{"type": "bidding", "bidding_id": 1}] * 2
+
+    def test_slow_subscriber_gets_resync(self, broker):
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter(), maxsize=3)
+            for i in range(5):
+                broker.publish({"type": "bidding", "bidding_id": i})
+            return subscription, await _drain(subscription)
+
+        subscription, events = asyncio.run(scenario())
+        assert events == [{"type": "resync"}, {"type": "bidding", "bidding_id": 4}]
+        assert subscription.dropped == 1
+
+    def test_sse_stream_keepalive_and_unsubscribe(self, broker):
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter())
+            disconnected = iter([False, False, True])
+
+            async def is_disconnected():
+                return next(disconnected)
+
+            broker.publish({"type": "bidding", "bidding_id": 1})
+            return [frame async for frame in sse_stream(subscription, is_disconnected, keepalive=0.01)]
+
+        frames = asyncio.run(scenario())
+        assert frames[0].startswith("retry: ")
+        assert frames[1].startswith("event: bidding\n")
+        assert frames[2] == ": keepalive\n\n"
+        assert broker.subscriber_count == 0
+
+
+class TestCommitPublishing:
+
+    def test_commit_publishes_snapshot_and_inbox(self, session_factory, broker):
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter(recipient_type="forwarder", recipient_id=1))
+            session = session_factory()
+            session.add(Bid(bidding_id=1, forwarder_id=1, total_amount=1200, status='submitted'))
+            session.add(Notification(recipient_type='forwarder', recipient_id=1,
+                                     notification_type='bid_awarded', title='t'))
+            session.commit()
+            session.close()
+            return await _drain(subscription)
+
+        bidding, inbox = sorted(asyncio.run(scenario()), key=lambda e: e["type"])
+        assert bidding["bidding_no"] == 'EXSEA00001'
+        assert bidding["shipping_type"] == 'ocean'
+        assert (bidding["status"], bidding["bid_count"], bidding["avg_bid_price"]) == ('open', 1, 1200.0)
+        assert inbox == {"type": "inbox", "kind": "notification", "recipient_type": "forwarder", "recipient_id": 1}
+
+    def test_rollback_and_tracked_bulk_update(self, session_factory, broker):
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter())
+            session = session_factory()
+            session.get(Bidding, 1).status = 'closed'
+            session.flush()
+            session.rollback()
+
+            session.execute(Bidding.__table__.update().where(Bidding.id == 2).values(status='expired'))
+            track_biddings(session, 2)
+            session.commit()
+            session.close()
+            return await _drain(subscription)
+
+        events = asyncio.run(scenario())
+        assert [(e["bidding_id"], e["status"]) for e in events] == [(2, 'expired')]
+
+    def test_submit_bid_pushes_bid_count(self, session_factory, broker):
+        from main import submit_bid
+
+        async def scenario():
+            subscription = broker.subscribe(bidding_filter(bidding_ids=[1]))
+            session = session_factory()
+            submit_bid(BidCreate(bidding_id=1, total_amount=900.0), 1, session)
+            session.close()
+            return await _drain(subscription)
+
+        events = asyncio.run(scenario())
+        assert [(e["bidding_id"], e["bid_count"]) for e in events] == [(1, 1)]
+
+    def test_no_snapshot_query_without_subscribers(self, session_factory, broker):
+        session = session_factory()
+        session.get(Bidding, 1).status = 'closed'
+        session.commit()
+        session.close()
+
+        assert broker.published == 0
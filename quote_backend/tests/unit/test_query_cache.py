@@ -0,0 +1,137 @@
+"""
+Unit Tests for the Query Cache and Dashboard Aggregates
+Tests for TTLCache, commit-driven invalidation and the SUM(CASE …) stats queries
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import update
+
+from models import Bidding, QuoteRequest, Settlement
+from query_cache import TTLCache, watch_tables
+
+
+def _bidding(session, bidding_id, status='open', deadline=None):
+    session.add(QuoteRequest(
+        id=bidding_id, request_number=f"QR-{bidding_id:05d}", trade_mode='export', shipping_type='ocean',
+        load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2025, 1, 1), customer_id=1
+    ))
+    session.add(Bidding(id=bidding_id, bidding_no=f"EXSEA{bidding_id:05d}", quote_request_id=bidding_id,
+                        status=status, deadline=deadline))
+
+
+class TestTTLCache:
+
+    def test_get_or_set_and_expiry(self):
+        cache = TTLCache(ttl=0.05)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_set('ns', 'k', factory) == 1
+        assert cache.get_or_set('ns', 'k', factory) == 1
+        time.sleep(0.06)
+        assert cache.get_or_set('ns', 'k', factory) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_invalidate_namespace_only(self):
+        cache = TTLCache(ttl=60)
+        cache.set('a', 1, 'x')
+        cache.set('b', 1, 'y')
+
+        cache.invalidate('a')
+
+        assert cache.get('a', 1) is None
+        assert cache.get('b', 1) == 'y'
+
+
+class TestCommitInvalidation:
+
+    def test_orm_and_bulk_writes_invalidate_after_commit(self, session_factory):
+        cache = TTLCache(ttl=60)
+        watch_tables(cache, 'test_biddings', 'biddings')
+
+        session = session_factory()
+        cache.set('test_biddings', None, 'cached')
+        _bidding(session, 1)
+        session.flush()
+        assert cache.get('test_biddings') == 'cached'  # not committed yet
+        session.commit()
+        assert cache.get('test_biddings') is None
+
+        cache.set('test_biddings', None, 'cached')
+        session.execute(update(Bidding).values(status='closed'))
+        session.commit()
+        assert cache.get('test_biddings') is None
+
+        cache.set('test_biddings', None, 'cached')
+        session.execute(update(Bidding).values(status='open'))
+        session.rollback()
+        session.commit()
+        assert cache.get('test_biddings') == 'cached'
+        session.close()
+
+    def test_unrelated_table_keeps_cache(self, session_factory):
+        cache = TTLCache(ttl=60)
+        watch_tables(cache, 'test_settlements', 'settlements')
+        cache.set('test_settlements', None, 'cached')
+
+        session = session_factory()
+        _bidding(session, 1)
+        session.commit()
+        session.close()
+
+        assert cache.get('test_settlements') == 'cached'
+
+
+class TestDashboardAggregates:
+
+    def test_bidding_stats_single_aggregate(self, session_factory):
+        from main import _compute_bidding_stats
+
+        now = datetime.now()
+        session = session_factory()
+        _bidding(session, 1, 'open', now + timedelta(days=3))
+        _bidding(session, 2, 'open', now + timedelta(hours=5))  # closing soon
+        _bidding(session, 3, 'open', None)
+        _bidding(session, 4, 'open', now - timedelta(hours=1))  # past deadline → failed
+        _bidding(session, 5, 'awarded', now - timedelta(days=1))
+        _bidding(session, 6, 'expired', now - timedelta(days=1))
+        _bidding(session, 7, 'cancelled', None)
+        session.commit()
+
+        stats = _compute_bidding_stats(session)
+
+        assert stats.total_count == 7
+        assert stats.open_count == 3
+        assert stats.closing_soon_count == 1
+        assert stats.awarded_count == 1
+        assert stats.failed_count == 3
+        session.close()
+
+    def test_settlement_summary_single_aggregate(self, session_factory):
+        from main import _compute_settlement_summary
+
+        session = session_factory()
+        rows = [('completed', 1000), ('completed', 500), ('pending', 300), ('processing', 200), ('disputed', 9999)]
+        for i, (status, amount) in enumerate(rows, start=1):
+            session.add(Settlement(settlement_no=f'ST-{i}', contract_id=i, forwarder_id=2, customer_id=1,
+                                   total_amount_krw=amount, net_amount=amount, status=status))
+        session.add(Settlement(settlement_no='ST-OTHER', contract_id=99, forwarder_id=3, customer_id=9,
+                               total_amount_krw=7, net_amount=7, status='completed'))
+        session.commit()
+
+        summary = _compute_settlement_summary(session, 'shipper', 1)
+
+        assert summary.total_completed == 1500.0
+        assert summary.total_pending == 500.0
+        assert (summary.count_completed, summary.count_pending) == (2, 2)
+        assert _compute_settlement_summary(session, 'forwarder', 3).count_completed == 1
+        session.close()
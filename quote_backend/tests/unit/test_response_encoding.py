@@ -0,0 +1,114 @@
+"""
+Unit Tests for Response Encoding
+Tests for the orjson FastJSONResponse and the brotli/gzip CompressionMiddleware
+"""
+import gzip
+import json
+import pytest
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+import compression
+from compression import CompressionMiddleware, choose_encoding
+from json_response import FastJSONResponse, dumps
+
+
+class Row(BaseModel):
+    route: str
+    rate: Decimal
+    updated_at: datetime
+
+
+ROWS = [{'route': f'KRPUS-USLAX-{i}', 'rate': Decimal('1250.50'), 'updated_at': datetime(2025, 1, 2, 3, 4, 5)}
+        for i in range(100)]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get('/rows')
+    def rows():
+        return {'items': ROWS}
+
+    @app.get('/models', response_model=List[Row])
+    def models():
+        return ROWS
+
+    @app.get('/small')
+    def small():
+        return {'ok': True}
+
+    @app.get('/stream')
+    def stream():
+        return StreamingResponse((f'data: {"x" * 600}\n\n' for _ in range(3)), media_type='text/event-stream')
+
+    return TestClient(app)
+
+
+class TestFastJSONResponse:
+
+    def test_same_json_as_jsonable_encoder(self, client):
+        """dict/response_model 응답이 기존 JSONResponse와 같은 값으로 디코드"""
+        rows = client.get('/rows', headers={'Accept-Encoding': 'identity'}).json()['items']
+        models = client.get('/models', headers={'Accept-Encoding': 'identity'}).json()
+
+        assert rows[0] == {'route': 'KRPUS-USLAX-0', 'rate': 1250.5, 'updated_at': '2025-01-02T03:04:05'}
+        assert models[0]['updated_at'] == '2025-01-02T03:04:05'
+
+    def test_direct_models_and_fallback(self):
+        """모델을 직접 렌더링하고, orjson이 거부하는 값은 json.dumps로"""
+        row = Row(route='부산', rate=Decimal('1.5'), updated_at=datetime(2025, 1, 1))
+
+        assert json.loads(dumps({'row': row})) == {'row': {'route': '부산', 'rate': '1.5',
+                                                           'updated_at': '2025-01-01T00:00:00'}}
+        assert '부산'.encode() in dumps({'port': '부산'})
+        assert dumps({'n': 2 ** 70}) == b'{"n":1180591620717411303424}'
+
+
+class TestCompressionMiddleware:
+
+    def test_gzip_large_json(self, client):
+        plain = client.get('/rows', headers={'Accept-Encoding': 'identity'})
+        response = client.get('/rows', headers={'Accept-Encoding': 'gzip'})
+
+        assert plain.headers.get('content-encoding') is None
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert int(response.headers['content-length']) < len(plain.content)
+        assert response.json() == plain.json()  # httpx가 gzip 해제
+
+    def test_brotli_preferred(self, client, monkeypatch):
+        pytest.importorskip('brotli')
+        response = client.get('/rows', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['content-encoding'] == 'br'
+
+        monkeypatch.setattr(compression, 'brotli', None)
+        assert client.get('/rows', headers={'Accept-Encoding': 'gzip, br'}).headers['content-encoding'] == 'gzip'
+
+    def test_small_and_streaming_untouched(self, client):
+        assert client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers.get('content-encoding') is None
+
+        stream = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+        assert stream.headers.get('content-encoding') is None
+        assert stream.text.count('data: ') == 3
+
+    def test_choose_encoding(self, monkeypatch):
+        monkeypatch.setattr(compression, 'brotli', None)
+        assert choose_encoding('gzip;q=0.5, deflate') == 'gzip'
+        assert choose_encoding('gzip;q=0') is None
+        assert choose_encoding('*') == 'gzip'
+        assert choose_encoding('') is None
+        assert gzip.decompress(compression.compress(b'x' * 2000, 'gzip')) == b'x' * 2000
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the Route Catalogue
+Tests for the single-query load, O(1) route lookup, invalidation and the ETag endpoint
+"""
+import pytest
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import event
+
+from models import OceanRateSheet, Port
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    from route_catalogue import catalogue_cache
+
+    session = session_factory()
+    for port_id, code in enumerate(['KRPUS', 'USLAX', 'NLRTM', 'CNSHA'], start=1):
+        session.add(Port(id=port_id, code=code, name=code.title(), country='X', country_code=code[:2], port_type='ocean'))
+    session.add_all([
+        OceanRateSheet(id=1, pol_id=1, pod_id=2, carrier='HMM',
+                       valid_from=datetime(2025, 1, 1), valid_to=datetime(2025, 1, 31)),
+        OceanRateSheet(id=2, pol_id=1, pod_id=2, carrier='HMM',
+                       valid_from=datetime(2025, 2, 1), valid_to=datetime(2025, 2, 28)),
+        OceanRateSheet(id=3, pol_id=1, pod_id=3, carrier='MSC',
+                       valid_from=datetime(2025, 1, 1), valid_to=datetime(2025, 3, 31)),
+        OceanRateSheet(id=4, pol_id=1, pod_id=4, carrier='HMM', is_active=False,
+                       valid_from=datetime(2025, 1, 1), valid_to=datetime(2025, 12, 31)),
+    ])
+    session.commit()
+    session.close()
+    catalogue_cache.invalidate()
+
+    yield session_factory
+
+    catalogue_cache.invalidate()
+
+
+class TestRouteCatalogue:
+
+    def test_loads_with_one_query(self, session_factory):
+        from route_catalogue import load_catalogue
+
+        session = session_factory()
+        statements = []
+        event.listen(session.get_bind(), 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        catalogue = load_catalogue(session, date(2025, 1, 15))
+
+        assert len(statements) == 1
+        assert [(r['pol_code'], r['pod_code']) for r in catalogue.routes] == [('KRPUS', 'USLAX'), ('KRPUS', 'NLRTM')]
+        assert catalogue.routes[0]['pol_name'] == 'Krpus'
+        session.close()
+
+    def test_find_sheet_by_route_and_date(self, session_factory):
+        from route_catalogue import get_route_catalogue
+
+        session = session_factory()
+        catalogue = get_route_catalogue(session, date(2025, 1, 15))
+
+        assert catalogue.find_sheet('krpus', 'uslax').id == 1
+        assert catalogue.find_sheet('KRPUS', 'USLAX', date(2025, 2, 28)).id == 2
+        assert catalogue.find_sheet('KRPUS', 'USLAX', date(2025, 4, 1)) is None
+        assert catalogue.latest_sheet('KRPUS', 'USLAX').id == 2
+        assert catalogue.is_quotable('KRPUS', 'CNSHA') is False  # inactive sheet
+        session.close()
+
+    def test_rebuilt_per_day_and_on_rate_sheet_commit(self, session_factory):
+        from route_catalogue import get_route_catalogue
+
+        session = session_factory()
+        first = get_route_catalogue(session, date(2025, 1, 15))
+        assert get_route_catalogue(session, date(2025, 1, 15)) is first
+        assert get_route_catalogue(session, date(2025, 2, 15)).etag != first.etag
+
+        sheet = session.get(OceanRateSheet, 3)
+        sheet.carrier = 'ONE'
+        session.commit()
+
+        rebuilt = get_route_catalogue(session, date(2025, 1, 15))
+        assert rebuilt is not first
+        assert rebuilt.etag != first.etag
+        assert rebuilt.find_sheet('KRPUS', 'NLRTM').carrier == 'ONE'
+        session.close()
+
+
+class TestRoutesEndpoint:
+
+    def test_etag_and_not_modified(self, session_factory):
+        from fastapi.testclient import TestClient
+        from database import get_db
+        from main import app
+
+        def override_get_db():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            client = TestClient(app)
+            response = client.get('/api/freight/routes')
+            etag = response.headers['etag']
+
+            assert response.status_code == 200
+            assert response.json()['count'] == len(response.json()['routes'])
+
+            cached = client.get('/api/freight/routes', headers={'If-None-Match': etag})
+            assert cached.status_code == 304
+            assert cached.content == b''
+        finally:
+            app.dependency_overrides.pop(get_db, None)
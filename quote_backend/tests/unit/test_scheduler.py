@@ -0,0 +1,187 @@
+"""
+Unit Tests for Quote Backend Scheduler Jobs
+Tests for set-based expiry / delivery / dispute jobs and the job lease
+"""
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from models import (
+    Bidding, QuoteRequest, Contract, Shipment, Settlement, Notification, SchedulerLease
+)
+
+
+@pytest.fixture
+def session_factory(session_factory, monkeypatch):
+    """Temp database (conftest) wired into the scheduler module"""
+    import scheduler
+
+    monkeypatch.setattr(scheduler, 'SessionLocal', session_factory)
+    return session_factory
+
+
+def _quote_request(session, qr_id, customer_id=1):
+    session.add(QuoteRequest(
+        id=qr_id, request_number=f"QR-{qr_id:05d}", trade_mode='export', shipping_type='ocean',
+        load_type='FCL', pol='KRPUS', pod='USLAX', etd=datetime(2025, 1, 1), customer_id=customer_id
+    ))
+
+
+def _contract(session, contract_id, customer_id=1, forwarder_id=2, amount=1000):
+    session.add(Contract(
+        id=contract_id, contract_no=f"CT-{contract_id:05d}", bidding_id=contract_id, awarded_bid_id=contract_id,
+        customer_id=customer_id, forwarder_id=forwarder_id, total_amount_krw=amount
+    ))
+
+
+class TestAutoExpireBiddings:
+
+    def test_expires_overdue_open_biddings(self, session_factory):
+        from scheduler import auto_expire_biddings
+
+        now = datetime.now()
+        session = session_factory()
+        for qr_id in range(1, 5):
+            _quote_request(session, qr_id, customer_id=10 + qr_id)
+        session.add_all([
+            Bidding(id=1, bidding_no='EXSEA00001', quote_request_id=1, deadline=now - timedelta(hours=1), status='open'),
+            Bidding(id=2, bidding_no='EXSEA00002', quote_request_id=2, deadline=now - timedelta(days=3), status='open'),
+            Bidding(id=3, bidding_no='EXSEA00003', quote_request_id=3, deadline=now + timedelta(days=1), status='open'),
+            Bidding(id=4, bidding_no='EXSEA00004', quote_request_id=4, deadline=now - timedelta(days=1), status='closed'),
+        ])
+        session.commit()
+        session.close()
+
+        assert auto_expire_biddings() == 2
+
+        session = session_factory()
+        statuses = {b.id: b.status for b in session.query(Bidding).all()}
+        assert statuses == {1: 'expired', 2: 'expired', 3: 'open', 4: 'closed'}
+
+        notifications = session.query(Notification).order_by(Notification.related_id).all()
+        assert [(n.recipient_id, n.related_id) for n in notifications] == [(11, 1), (12, 2)]
+        assert notifications[0].message == '비딩번호 EXSEA00001의 입찰 마감 기한이 종료되었습니다.'
+        assert notifications[0].is_read is False
+        session.close()
+
+        # Second run finds nothing
+        assert auto_expire_biddings() == 0
+
+
+class TestDeliveryReminders:
+
+    def test_reminders_and_auto_complete(self, session_factory):
+        from scheduler import check_delivery_reminders
+
+        now = datetime.now()
+        session = session_factory()
+        for contract_id in (1, 2, 3):
+            _contract(session, contract_id, customer_id=100 + contract_id, forwarder_id=200 + contract_id)
+        session.add_all([
+            # 7~14 days: reminder
+            Shipment(id=1, shipment_no='SH-1', contract_id=1, current_status='delivered',
+                     actual_delivery=now - timedelta(days=10), delivery_confirmed=False, reminder_sent=False),
+            # over 14 days: auto complete + settlement
+            Shipment(id=2, shipment_no='SH-2', contract_id=2, current_status='delivered',
+                     actual_delivery=now - timedelta(days=20), delivery_confirmed=False, reminder_sent=True),
+            # over 14 days with an existing settlement
+            Shipment(id=3, shipment_no='SH-3', contract_id=3, current_status='delivered',
+                     actual_delivery=now - timedelta(days=15), delivery_confirmed=False, reminder_sent=True),
+            Settlement(settlement_no='ST-EXISTING', contract_id=3, forwarder_id=203, customer_id=103,
+                       total_amount_krw=1000, net_amount=1000, status='pending'),
+        ])
+        session.commit()
+        session.close()
+
+        assert check_delivery_reminders() == {'reminders': 1, 'auto_completed': 2}
+
+        session = session_factory()
+        shipments = {s.id: s for s in session.query(Shipment).all()}
+        assert shipments[1].reminder_sent is True
+        assert shipments[1].current_status == 'delivered'
+        assert shipments[2].current_status == 'completed'
+        assert shipments[2].auto_confirmed is True
+        assert shipments[2].delivery_confirmed is True
+
+        contracts = {c.id: c.status for c in session.query(Contract).all()}
+        assert contracts == {1: 'pending', 2: 'completed', 3: 'completed'}
+
+        settlements = session.query(Settlement).order_by(Settlement.contract_id).all()
+        assert [s.contract_id for s in settlements] == [2, 3]
+        assert settlements[0].settlement_no == f"ST-{now.strftime('%Y%m%d')}-002"
+        assert settlements[0].net_amount == 1000
+
+        kinds = sorted((n.notification_type, n.recipient_type, n.related_id) for n in session.query(Notification))
+        assert kinds == [
+            ('auto_delivery_confirmed', 'customer', 2),
+            ('auto_delivery_confirmed', 'customer', 3),
+            ('auto_delivery_confirmed', 'forwarder', 2),
+            ('auto_delivery_confirmed', 'forwarder', 3),
+            ('delivery_reminder', 'customer', 1),
+        ]
+        session.close()
+
+
+class TestDisputeDeadlines:
+
+    def test_auto_resolve_and_admin_count(self, session_factory):
+        from scheduler import check_dispute_deadlines
+
+        now = datetime.now()
+        session = session_factory()
+        session.add_all([
+            Settlement(id=1, settlement_no='ST-1', contract_id=1, forwarder_id=2, customer_id=1,
+                       total_amount_krw=1, net_amount=1, status='disputed', disputed_at=now - timedelta(days=8)),
+            Settlement(id=2, settlement_no='ST-2', contract_id=2, forwarder_id=2, customer_id=1,
+                       total_amount_krw=1, net_amount=1, status='disputed', disputed_at=now - timedelta(days=40),
+                       forwarder_response='disagree'),
+            Settlement(id=3, settlement_no='ST-3', contract_id=3, forwarder_id=2, customer_id=1,
+                       total_amount_krw=1, net_amount=1, status='disputed', disputed_at=now - timedelta(days=2)),
+        ])
+        session.commit()
+        session.close()
+
+        assert check_dispute_deadlines() == {'auto_resolved': 1, 'need_admin': 1}
+
+        session = session_factory()
+        resolved = session.get(Settlement, 1)
+        assert resolved.status == 'completed'
+        assert resolved.resolution_type == 'auto_customer_favor'
+        assert session.get(Settlement, 3).status == 'disputed'
+        assert session.query(Notification).filter(Notification.related_id == 1).count() == 2
+        session.close()
+
+
+class TestJobLease:
+
+    def test_lease_blocks_other_owner_until_expiry(self, session_factory):
+        from scheduler import acquire_lease, release_lease
+
+        assert acquire_lease('job', owner='a') is True
+        assert acquire_lease('job', owner='b') is False
+        assert acquire_lease('job', owner='a') is True  # renew
+
+        release_lease('job', owner='a')
+        assert acquire_lease('job', owner='b') is True
+
+    def test_job_skipped_while_leased(self, session_factory):
+        from scheduler import auto_expire_biddings
+
+        session = session_factory()
+        session.add(SchedulerLease(name='auto_expire_biddings', owner='other-host:1:x',
+                                   acquired_at=datetime.now(), expires_at=datetime.now() + timedelta(minutes=5)))
+        _quote_request(session, 1)
+        session.add(Bidding(id=1, bidding_no='EXSEA00001', quote_request_id=1,
+                            deadline=datetime.now() - timedelta(hours=1), status='open'))
+        session.commit()
+        session.close()
+
+        assert auto_expire_biddings() == 0
+
+        session = session_factory()
+        assert session.get(Bidding, 1).status == 'open'
+        session.close()
@@ -0,0 +1,150 @@
+"""
+Unit Tests for Request Telemetry
+Tests for the TelemetryMiddleware (route labels, Server-Timing, query budgets, /metrics)
+and the statement counts of the bidding list / forwarder profile pages
+"""
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add quote_backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+import telemetry  # noqa: F401  (저장소 루트를 sys.path에 추가)
+from shared import telemetry as telemetry_core
+from telemetry import (
+    METRICS_CONTENT_TYPE, QueryBudgetExceeded, TelemetryMiddleware, count_queries, metrics_response, query_budget,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(telemetry_core, "QUERY_BUDGET_ENFORCE", True)
+    engine = create_engine("sqlite://")
+
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware)
+
+    @app.get("/items/{item_id}")
+    @query_budget(2)
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    @app.get("/metrics")
+    def metrics():
+        return metrics_response()
+
+    return TestClient(app)
+
+
+class TestTelemetryMiddleware:
+
+    def test_server_timing_counts_threadpool_statements(self, client):
+        response = client.get("/items/2")
+
+        assert response.status_code == 200
+        assert 'desc="2 statements"' in response.headers["server-timing"]
+
+    def test_route_label_uses_path_template(self, client):
+        client.get("/items/1")
+        client.get("/items/2")
+        body = client.get("/metrics").text
+
+        assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"}' in body
+        assert "/items/1" not in body
+
+    def test_budget_exceeded_raises_when_enforced(self, client):
+        with pytest.raises(QueryBudgetExceeded):
+            client.get("/items/3")
+
+    def test_budget_exceeded_logs_when_not_enforced(self, client, monkeypatch, caplog):
+        monkeypatch.setattr(telemetry_core, "QUERY_BUDGET_ENFORCE", False)
+        response = client.get("/items/3")
+
+        assert response.status_code == 200
+        assert "budget 2" in caplog.text
+
+    def test_metrics_content_type(self, client):
+        response = client.get("/metrics")
+
+        assert response.headers["content-type"] == METRICS_CONTENT_TYPE
+        assert "# TYPE db_statements_per_request histogram" in response.text
+
+
+@pytest.fixture
+def session_factory(session_factory):
+    from models import Bid, Bidding, CargoDetail, ContainerType, Customer, Forwarder, Port, QuoteRequest, Rating
+
+    session = session_factory()
+    now = datetime.now()
+    session.add(Customer(id=1, company="화주", name="c", email="c@example.com", phone="010"))
+    session.add_all([Forwarder(id=i, company=f"FW{i}", name=f"fw{i}", email=f"fw{i}@example.com", phone="010")
+                     for i in (1, 2)])
+    session.add_all([Port(code=code, name=code, country="KR", country_code="KR", port_type="ocean")
+                     for code in ("KRPUS", "USLAX")])
+    session.add(ContainerType(code="40HC", name="40ft High Cube", abbreviation="40'HC"))
+    for i in range(1, 41):
+        session.add(QuoteRequest(id=i, request_number=f"QR-{i}", trade_mode="export", shipping_type="ocean",
+                                 load_type="FCL", pol="KRPUS", pod="USLAX", etd=now, customer_id=1))
+        session.add(CargoDetail(quote_request_id=i, container_type="40HC", qty=i % 3 + 1))
+        session.add(Bidding(id=i, bidding_no=f"EXSEA{i:05d}", quote_request_id=i, status="open",
+                            deadline=now + timedelta(days=1), created_at=now - timedelta(minutes=i)))
+        for forwarder_id in (1, 2):
+            session.add(Bid(bidding_id=i, forwarder_id=forwarder_id, total_amount=1000 + i, status="submitted"))
+        session.add(Rating(bidding_id=i, forwarder_id=1, customer_id=1, score=4.5, is_visible=True,
+                           created_at=now - timedelta(hours=i)))
+    session.commit()
+    session.close()
+    return session_factory
+
+
+class TestPageStatementCounts:
+
+    def test_bidding_list_does_not_grow_with_page_size(self, session_factory):
+        from main import get_bidding_list
+        from query_cache import stats_cache
+
+        counts = []
+        for limit in (5, 40):
+            stats_cache.invalidate("type_catalog")  # 기준 데이터 캐시가 빈 최악의 경우로 측정
+            session = session_factory()
+            with count_queries() as stats:
+                response = get_bidding_list(limit=limit, forwarder_id=1, db=session)
+            session.close()
+            counts.append(stats.statements)
+
+            assert len(response.data) == limit
+            assert response.data[0].bid_count == 2
+            assert response.data[0].my_bid_status == "submitted"
+            assert response.data[0].pol_name == "KRPUS, KR"
+            assert response.data[0].cargo_summary == "40'HC × 2"
+
+        assert counts[0] == counts[1]
+        assert counts[1] <= get_bidding_list._query_budget
+
+    def test_forwarder_profile_does_not_grow_with_reviews(self, session_factory):
+        from main import get_forwarder_profile
+
+        counts = []
+        for limit_reviews in (1, 40):
+            session = session_factory()
+            with count_queries() as stats:
+                profile = get_forwarder_profile(1, limit_reviews=limit_reviews, db=session)
+            session.close()
+            counts.append(stats.statements)
+
+            assert profile.total_bids == 40
+            assert profile.top_routes[0].count == 40
+            assert len(profile.reviews) == limit_reviews
+            assert profile.reviews[0].bidding_no == "EXSEA00001"
+
+        assert counts[0] == counts[1]
+        assert counts[1] <= get_forwarder_profile._query_budget
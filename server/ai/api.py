@@ -13,13 +13,20 @@ Endpoints:
 import logging
 from flask import Blueprint, request, jsonify
 
-import gemini_backend
+from http_cache import NO_STORE, register_cache_policy
+from startup import lazy_module
+
+# Gemini SDK + AI Tools는 첫 AI 요청 때 import (서버 시작 시간에서 제외)
+gemini_backend = lazy_module('gemini_backend')
 
 logger = logging.getLogger(__name__)
 
 # Flask Blueprint
 ai_bp = Blueprint('ai', __name__, url_prefix='/api/ai')
 
+# 대화 응답은 요청마다 다르므로 저장하지 않음
+register_cache_policy(ai_bp, NO_STORE)
+
 
 @ai_bp.route('/chat', methods=['POST'])
 def ai_chat():
@@ -8,10 +8,14 @@ import re
 from datetime import datetime
 from flask import Blueprint, request, jsonify
 from .models import User, get_session, init_db, UserType
+from http_cache import NO_STORE, register_cache_policy
 
 # Flask Blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+# 사용자 정보/세션 응답은 저장하지 않음
+register_cache_policy(auth_bp, NO_STORE)
+
 
 def hash_password(password: str) -> str:
     """
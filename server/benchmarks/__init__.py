@@ -0,0 +1,11 @@
+"""
+Benchmarks - 앱별 합성 데이터(generators)와 시나리오(suite)
+측정/저장/비교 하네스는 저장소 루트의 shared/benchmark_harness.py를 함께 씁니다.
+"""
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)  # 저장소 루트의 shared 패키지
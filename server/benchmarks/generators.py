@@ -0,0 +1,159 @@
+"""
+Synthetic Data Generators
+벤치마크용 합성 데이터 생성기. 같은 seed면 항상 같은 데이터를 만듭니다.
+
+- GDELT: 61컬럼 export 파일 (tests/unit/test_gdelt_window.py와 같은 형식, 15분 슬라이스 디렉토리 구조)
+- 뉴스: 최근 24시간 기사 (분석기 입력 dict / news_intelligence DB 행)
+- 지수 시계열: SCFI/CCFI/BDI 일별 랜덤 워크 (shipping_indices DB 행)
+
+기사/지수 DB 시드는 이미 설정된 DB URL을 그대로 쓰므로 임시 DB를 가리키게 한 뒤 호출하세요.
+"""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+COUNTRIES = ['US', 'CN', 'KR', 'JP', 'DE', 'SG', 'NL', 'IN', 'BR', 'AE', 'PA', 'EG']
+
+NEWS_WORDS = ['port', 'strike', 'congestion', 'freight', 'rate', 'canal', 'container', 'vessel',
+              '운임', '항만', '파업', '물류', '선박', '해운', '컨테이너', '지연']
+
+HEADLINE_SUBJECTS = ['Busan port', 'Shanghai terminal', 'Suez Canal', 'Panama Canal', 'Rotterdam', 'LA/Long Beach',
+                     'Air cargo', 'Trucking', 'Rail freight', 'Container lines', '부산항', '인천공항 화물', '해운업계']
+HEADLINE_EVENTS = ['strike disrupts', 'congestion delays', 'freight rates surge on', 'tariff hike hits',
+                   'typhoon closes', 'capacity cut squeezes', 'blank sailings reduce', 'demand recovery lifts',
+                   '파업으로 차질', '운임 급등', '체선 심화', '물동량 회복']
+HEADLINE_OBJECTS = ['transpacific lanes', 'Asia-Europe trade', 'air freight', 'inland trucking', 'bulk shipping',
+                    'China exports', 'US imports', 'Korean exporters', 'semiconductor shipments', '수출 화주']
+
+
+def gdelt_row(rng: random.Random, day: str, critical_share: float = 1.0) -> str:
+    """
+    GDELT export 한 행 (탭 구분 61컬럼).
+
+    critical_share: GoldsteinScale이 -5 이하(알림 대상)인 행의 비율. 나머지는 -5~10 사이라 파서가 건너뜀
+    """
+    country = rng.choice(COUNTRIES)
+    row = [''] * 61
+    row[1] = day
+    row[6] = rng.choice(['GOVERNMENT', 'PROTESTER', 'MILITARY', 'UNION'])
+    row[7] = country
+    row[26] = rng.choice(['190', '145', '173', '112'])
+    row[29] = str(rng.choice([3, 4]))
+    if critical_share >= 1 or rng.random() < critical_share:
+        row[30] = str(round(rng.uniform(-10, -5), 1))
+    else:
+        row[30] = str(round(rng.uniform(-4.9, 10), 1))
+    row[31] = str(rng.randint(1, 50))
+    row[32] = str(rng.randint(1, 10))
+    row[33] = str(rng.randint(1, 40))
+    row[34] = str(round(rng.uniform(-8, 0), 2))
+    row[52] = f'Port City {rng.randint(1, 300)}, {country}'
+    row[53] = country
+    row[56] = str(round(rng.uniform(-40, 60), 4))
+    row[57] = str(round(rng.uniform(-120, 150), 4))
+    row[60] = f'https://news.example.com/{day}/{rng.randint(1, 10 ** 9)}'
+    return '\t'.join(row)
+
+
+def write_gdelt_exports(base_path: Path, slices: int, rows: int, seed: int = 7,
+                        critical_share: float = 1.0, start: datetime = datetime(2025, 1, 1)) -> List[Path]:
+    """base_path/default/events/YYYYMMDD/YYYYMMDDHHMMSS.export.CSV 파일을 15분 간격으로 생성"""
+    rng = random.Random(seed)
+    files = []
+    for i in range(slices):
+        key = (start + timedelta(minutes=15 * i)).strftime('%Y%m%d%H%M%S')
+        date_dir = base_path / 'default' / 'events' / key[:8]
+        date_dir.mkdir(parents=True, exist_ok=True)
+        lines = [gdelt_row(rng, key[:8], critical_share) for _ in range(rows)]
+        file_path = date_dir / f'{key}.export.CSV'
+        file_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        files.append(file_path)
+    return files
+
+
+def news_articles(count: int, seed: int = 11) -> List[Dict]:
+    """
+    분석기 입력 형식의 기사 dict (title, content_summary, source_name, url, news_type).
+
+    제목은 주제/사건/대상 조합이라 규칙 기반 분류/키워드 추출/유사 기사 묶음이 실제처럼 섞여 나옴
+    """
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        title = f"{rng.choice(HEADLINE_SUBJECTS)} {rng.choice(HEADLINE_EVENTS)} {rng.choice(HEADLINE_OBJECTS)}"
+        summary = ' '.join([title] + rng.choices(NEWS_WORDS + HEADLINE_OBJECTS, k=40))
+        articles.append({
+            'title': title,
+            'content_summary': summary,
+            'source_name': rng.choice(['FreightWaves', 'Splash247', '물류신문', '해양한국']),
+            'url': f'https://news.example.com/article/{seed}/{i}',
+            'news_type': rng.choice(['KR', 'GLOBAL']),
+        })
+    return articles
+
+
+def seed_news(articles: int, seed: int = 11):
+    """최근 24시간 안의 합성 기사를 news_intelligence DB에 저장 (목록/지도/워드클라우드 대상)"""
+    from news_intelligence.models import NewsArticle, get_session, init_database
+
+    init_database()
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    session = get_session()
+    try:
+        session.add_all([
+            NewsArticle(
+                title=' '.join(rng.choices(NEWS_WORDS, k=8)),
+                content_summary=' '.join(rng.choices(NEWS_WORDS, k=60)),
+                source_name=rng.choice(['FreightWaves', 'Splash247', '물류신문', '해양한국']),
+                url=f'https://news.example.com/article/{i}',
+                published_at_utc=now - timedelta(minutes=rng.randint(0, 23 * 60)),
+                collected_at_utc=now,
+                news_type=rng.choice(['KR', 'GLOBAL']),
+                category=rng.choice(['Crisis', 'Ocean', 'Air', 'Inland', 'Economy', 'ETC']),
+                is_crisis=rng.random() < 0.3,
+                country_tags=rng.sample(COUNTRIES, 2),
+                keywords=rng.sample(NEWS_WORDS, 5),
+                status='ACTIVE',
+            )
+            for i in range(articles)
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+
+def index_series(days: int, seed: int = 3, start_value: float = 1000.0, end: date = None) -> List[Dict]:
+    """오늘(end)까지 days일의 일별 지수 랜덤 워크 (downsample_rows/차트 API 입력 형식)"""
+    rng = random.Random(seed)
+    end = end or date.today()
+    value = start_value
+    rows = []
+    for offset in range(days - 1, -1, -1):
+        previous = value
+        value = max(100.0, round(value * (1 + rng.gauss(0, 0.015)), 2))
+        rows.append({
+            'index_date': (end - timedelta(days=offset)).isoformat(),
+            'current_index': value,
+            'previous_index': previous,
+            'change': round(value - previous, 2),
+            'change_rate': round((value - previous) / previous * 100, 2),
+        })
+    return rows
+
+
+def seed_shipping_indices(days: int, seed: int = 3):
+    """SCFI/CCFI/BDI 테이블에 days일치 시계열 저장 (지수마다 다른 seed)"""
+    from sqlalchemy import insert
+
+    from shipping_indices.models import BDIIndex, CCFIIndex, SCFIIndex, init_shipping_indices_database
+
+    engine = init_shipping_indices_database()
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        for offset, (model, start_value) in enumerate(((SCFIIndex, 2100.0), (CCFIIndex, 1300.0), (BDIIndex, 1500.0))):
+            rows = index_series(days, seed + offset, start_value)
+            conn.execute(insert(model), [dict(row, index_date=date.fromisoformat(row['index_date']), collected_at=now)
+                                         for row in rows])
@@ -0,0 +1,154 @@
+"""
+HTTP Cache Benchmark
+이전 방식(모든 응답 no-store → 재방문 때마다 전체 재요청) vs 블루프린트별 캐시 정책(ETag/304, max-age) 비교
+
+대시보드 + 리포트 페이지를 한 번 여는 요청 묶음(한 "방문")을 Flask 테스트 클라이언트로 보내고,
+재방문 시 브라우저가 하는 일을 흉내 냅니다.
+- no-store: 조건 없이 모든 요청을 다시 보냄 (이전 add_no_cache_headers 동작)
+- revalidate: 저장된 ETag로 If-None-Match 요청 (max-age가 지나 재검증하는 경우와 같음)
+- revalidate (cold validator): 위와 같되 매 방문마다 validator 재사용 값을 버림 (요청마다 DB 버전 조회)
+- max-age fresh: max-age 안에서는 브라우저가 요청 자체를 보내지 않음 (요청 수만 집계)
+
+네트워크는 포함하지 않으므로 지연 차이는 서버 처리 시간, 바이트 차이는 전송량 절감입니다.
+리포트는 임시 DB에 합성 데이터로 채우고, KCCI/해운지수는 저장소의 DB를 그대로 읽습니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.http_cache
+    python -m benchmarks.http_cache --visits 30 --reports 2000 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+VISIT = [
+    '/',
+    '/api/kcci/comprehensive?limit=500',
+    '/api/kcci/routes/latest',
+    '/api/kcci/stats',
+    '/api/shipping-indices/scfi/chart-data?period=1Y',
+    '/api/shipping-indices/ccfi/chart-data?period=1Y',
+    '/api/shipping-indices/bdi/chart-data?period=1Y',
+    '/api/news-intelligence/status',
+    '/api/news-intelligence/categories',
+    '/api/reports?page_size=12',
+    '/api/reports/filters',
+    '/api/reports/stats',
+]
+
+
+def _policies(app):
+    from http_cache import CachePolicy
+
+    return [
+        func.__self__
+        for funcs in app.before_request_funcs.values()
+        for func in funcs
+        if isinstance(getattr(func, '__self__', None), CachePolicy)
+    ]
+
+
+def visit(client, etags=None) -> dict:
+    """VISIT 요청 묶음을 순서대로 보내고 (ms, 본문 바이트, 200 수, 304 수, 받은 ETag)를 반환"""
+    started = time.perf_counter()
+    body_bytes, full, not_modified, received = 0, 0, 0, {}
+    for url in VISIT:
+        headers = {'If-None-Match': etags[url]} if etags and etags.get(url) else {}
+        response = client.get(url, headers=headers)
+        body_bytes += len(response.data)
+        if response.status_code == 304:
+            not_modified += 1
+        else:
+            full += 1
+        received[url] = response.headers.get('ETag') or (etags or {}).get(url)
+    return {
+        'ms': (time.perf_counter() - started) * 1000,
+        'bytes': body_bytes,
+        'full': full,
+        'not_modified': not_modified,
+        'etags': received,
+    }
+
+
+def measure(client, visits: int, etags=None, before_each=None) -> dict:
+    runs = []
+    for _ in range(visits):
+        if before_each:
+            before_each()
+        runs.append(visit(client, etags))
+    latencies = sorted(run['ms'] for run in runs)
+    return {
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(latencies[max(int(len(latencies) * 0.95) - 1, 0)], 2),
+        'bytes': runs[-1]['bytes'],
+        'full': runs[-1]['full'],
+        'not_modified': runs[-1]['not_modified'],
+    }
+
+
+def fresh_requests(client) -> int:
+    """max-age 안의 재방문에서 브라우저가 보내지 않는 요청 수"""
+    skipped = 0
+    for url in VISIT:
+        cache_control = client.get(url).headers.get('Cache-Control', '')
+        if 'max-age=' in cache_control and 'max-age=0' not in cache_control:
+            skipped += 1
+    return skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="no-store vs ETag/304 repeat visits")
+    parser.add_argument("--visits", type=int, default=30)
+    parser.add_argument("--reports", type=int, default=2000)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'reports.db')}"
+        os.environ["REPORT_STORE_DIR"] = os.path.join(tmp_dir, "report_files")
+        os.environ.setdefault("ECOS_API_KEY", "benchmark")
+
+        from benchmarks.report_search import seed
+        from main import app
+
+        seed(args.reports)
+        client = app.test_client()
+        policies = _policies(app)
+
+        def cold():
+            for policy in policies:
+                policy.invalidate()
+
+        first = visit(client)
+        measure(client, 3)  # warm-up
+        results = {
+            'no-store': measure(client, args.visits),
+            'revalidate': measure(client, args.visits, etags=first['etags']),
+            'revalidate (cold validator)': measure(client, args.visits, etags=first['etags'], before_each=cold),
+        }
+        skipped = fresh_requests(client)
+
+    for name, result in results.items():
+        result['mode'] = name
+
+    if args.json:
+        print(json.dumps({'requests_per_visit': len(VISIT), 'skipped_within_max_age': skipped,
+                          'results': list(results.values())}, indent=2))
+        return
+
+    print(f"requests/visit={len(VISIT)} visits={args.visits} reports={args.reports}")
+    print(f"{'mode':<30}{'p50_ms':>10}{'p95_ms':>10}{'bytes':>10}{'200':>6}{'304':>6}")
+    for r in results.values():
+        print(f"{r['mode']:<30}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['bytes']:>10}{r['full']:>6}{r['not_modified']:>6}")
+    print(f"max-age fresh: {skipped}/{len(VISIT)} requests not sent at all within max-age")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+JSON Encoding / Compression Benchmark
+가장 큰 JSON 응답 10개에 대해 인코딩 시간(json vs orjson)과 전송 바이트(원본/gzip/br)를 비교합니다.
+
+후보 엔드포인트를 Flask 테스트 클라이언트로 한 번씩 호출해 응답 크기로 상위 10개를 고르고,
+응답을 다시 파싱한 객체를 두 provider로 반복 인코딩합니다.
+- json: Flask DefaultJSONProvider (이전 동작, ensure_ascii=True)
+- orjson: json_provider.ORJSONProvider (UTF-8 그대로)
+- gzip / br: orjson 본문을 compression.py 설정(레벨/품질)으로 압축한 크기와 시간
+- wire: Accept-Encoding: br, gzip으로 실제 앱에 요청했을 때 받은 본문 크기
+
+리포트/뉴스/GDELT는 임시 디렉토리에 합성 데이터를 만들고, KCCI/해운지수는 저장소의 DB를 그대로 읽습니다.
+(응답을 파싱한 객체를 인코딩하므로 datetime 등은 이미 문자열인 상태입니다.)
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.json_encoding
+    python -m benchmarks.json_encoding --repeat 50 --reports 2000 --articles 3000 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+CANDIDATES = [
+    '/api/kcci/comprehensive?limit=500',
+    '/api/kcci/routes?limit=500',
+    '/api/kcci/routes/latest',
+    '/api/kcci/chart-data?period=ALL&include_routes=true',
+    '/api/kcci/logs?limit=100',
+    '/api/shipping-indices/scfi?limit=500',
+    '/api/shipping-indices/ccfi?limit=500',
+    '/api/shipping-indices/bdi?limit=500',
+    '/api/shipping-indices/scfi/chart-data?period=ALL',
+    '/api/shipping-indices/bdi/chart-data?period=ALL',
+    '/api/shipping-indices/all',
+    '/api/news-intelligence/articles?page_size=100',
+    '/api/news-intelligence/map',
+    '/api/news-intelligence/wordcloud',
+    '/api/news-intelligence/critical-alerts?limit=20&include_summary=true',
+    '/api/reports?page_size=100',
+    '/api/reports/filters',
+    '/api/global-alerts?max_alerts=1000',
+    '/api/global-alerts/grid?zoom=6',
+    '/api/global-alerts/stats/by-country',
+]
+
+TOP_N = 10
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def measure(app, client, url: str, repeat: int) -> dict:
+    from flask.json.provider import DefaultJSONProvider
+
+    import compression
+
+    payload = client.get(url).get_data()
+    obj = json.loads(payload)
+    stdlib = DefaultJSONProvider(app)
+    fast = app.json
+
+    json_bytes = stdlib.dumps(obj, separators=(',', ':')).encode('utf-8')
+    orjson_bytes = fast.dumps_bytes(obj)
+    result = {
+        'url': url,
+        'json_ms': _median_ms(lambda: stdlib.dumps(obj, separators=(',', ':')), repeat),
+        'orjson_ms': _median_ms(lambda: fast.dumps_bytes(obj), repeat),
+        'json_bytes': len(json_bytes),
+        'orjson_bytes': len(orjson_bytes),
+        'gzip_bytes': len(compression.compress(orjson_bytes, 'gzip')),
+        'gzip_ms': _median_ms(lambda: compression.compress(orjson_bytes, 'gzip'), repeat),
+    }
+    if compression.brotli is not None:
+        result['br_bytes'] = len(compression.compress(orjson_bytes, 'br'))
+        result['br_ms'] = _median_ms(lambda: compression.compress(orjson_bytes, 'br'), repeat)
+
+    wire = client.get(url, headers={'Accept-Encoding': 'br, gzip'})
+    result['wire_bytes'] = len(wire.get_data())
+    result['wire_encoding'] = wire.headers.get('Content-Encoding', 'identity')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="json vs orjson encode time and gzip/br wire bytes")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--reports", type=int, default=2000)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--gdelt-slices", type=int, default=8)
+    parser.add_argument("--gdelt-rows", type=int, default=400)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'reports.db')}"
+        os.environ["REPORT_STORE_DIR"] = os.path.join(tmp_dir, "report_files")
+        os.environ["GDELT_BASE_PATH"] = os.path.join(tmp_dir, "gdelt")
+        os.environ.setdefault("ECOS_API_KEY", "benchmark")
+
+        import news_intelligence.models as news_models
+        news_models._cached_db_url = f"sqlite:///{os.path.join(tmp_dir, 'news.db')}"
+
+        from benchmarks.generators import seed_news, write_gdelt_exports
+        from benchmarks.report_search import seed
+        from main import app
+
+        seed(args.reports)
+        seed_news(args.articles)
+        write_gdelt_exports(Path(tmp_dir) / "gdelt", args.gdelt_slices, args.gdelt_rows)
+
+        client = app.test_client()
+        sizes = {}
+        for url in CANDIDATES:
+            response = client.get(url)
+            if response.status_code == 200 and response.mimetype == 'application/json':
+                sizes[url] = len(response.get_data())
+        largest = sorted(sizes, key=sizes.get, reverse=True)[:TOP_N]
+        results = [measure(app, client, url, args.repeat) for url in largest]
+
+    if args.json:
+        print(json.dumps({'results': results}, indent=2))
+        return
+
+    has_br = 'br_bytes' in results[0] if results else False
+    header = f"{'endpoint':<58}{'json_ms':>9}{'orjson_ms':>10}{'json_B':>9}{'orjson_B':>9}{'gzip_B':>8}{'gzip_ms':>8}"
+    if has_br:
+        header += f"{'br_B':>8}{'br_ms':>7}"
+    print(header + f"{'wire_B':>8}")
+    for r in results:
+        line = (f"{r['url'][:57]:<58}{r['json_ms']:>9}{r['orjson_ms']:>10}{r['json_bytes']:>9}"
+                f"{r['orjson_bytes']:>9}{r['gzip_bytes']:>8}{r['gzip_ms']:>8}")
+        if has_br:
+            line += f"{r['br_bytes']:>8}{r['br_ms']:>7}"
+        print(line + f"{r['wire_bytes']:>8}")
+
+    total = {key: sum(r[key] for r in results) for key in ('json_ms', 'orjson_ms', 'json_bytes', 'wire_bytes')}
+    print(f"total: encode {total['json_ms']:.2f} → {total['orjson_ms']:.2f} ms, "
+          f"wire {total['json_bytes'] / 1024:.0f} → {total['wire_bytes'] / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Multi-worker Load Test
+현재 단일 프로세스 실행(main.py: Werkzeug app.run, debug) vs serve.py(gunicorn 워커 N개) 처리량 비교
+
+각 모드마다 서버를 별도 프로세스로 띄우고, 클라이언트 스레드들이 keep-alive 세션으로
+대표 엔드포인트(KCCI/해운지수 조회, 리포트 목록, 정적 페이지)를 번갈아 호출하며
+주어진 시간 동안의 초당 요청 수, 지연 p50/p95, 오류 수를 측정합니다.
+스케줄러와 Quote Backend는 양쪽 모두 끄고 웹 처리만 비교합니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.multiworker_load
+    python -m benchmarks.multiworker_load --clients 32 --duration 15 --workers 4 --threads 4 --json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+SERVER_DIR = Path(__file__).parent.parent
+
+ENDPOINTS = [
+    '/api/kcci/stats',
+    '/api/shipping-indices/bdi/chart-data?period=1Y',
+    '/api/shipping-indices/scfi?limit=100',
+    '/api/reports',
+    '/',
+]
+
+# main.py의 __main__ 실행과 같은 설정 (스케줄러/Quote Backend 제외)
+DEV_SERVER = (
+    "from config import DEBUG_MODE; from main import app; "
+    "app.run(port={port}, debug=DEBUG_MODE, use_reloader=False)"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, timeout: float = 60) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f'http://127.0.0.1:{port}/api/kcci/stats', timeout=2).status_code < 500:
+                return True
+        except requests.RequestException:
+            time.sleep(0.3)
+    return False
+
+
+def start_server(mode: str, port: int, workers: int, threads: int, tmp_dir: str) -> subprocess.Popen:
+    env = dict(os.environ, ECOS_API_KEY=os.environ.get('ECOS_API_KEY', 'benchmark'),
+               SCHEDULER_LEASE_PATH=os.path.join(tmp_dir, 'lease.db'),
+               CACHE_BACKEND_URL=f"sqlite:///{os.path.join(tmp_dir, 'cache.db')}" if mode == 'gunicorn' else 'memory://')
+    if mode == 'dev':
+        cmd = [sys.executable, '-c', DEV_SERVER.format(port=port)]
+    else:
+        cmd = [sys.executable, 'serve.py', '--server', mode, '--host', '127.0.0.1', '--port', str(port),
+               '--workers', str(workers), '--threads', str(threads), '--no-quote-backend', '--no-scheduler']
+    return subprocess.Popen(cmd, cwd=str(SERVER_DIR), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def run_load(port: int, clients: int, duration: float) -> dict:
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop = threading.Event()
+    base = f'http://127.0.0.1:{port}'
+
+    def client(index: int):
+        session = requests.Session()
+        local, failed, i = [], 0, index
+        while not stop.is_set():
+            url = base + ENDPOINTS[i % len(ENDPOINTS)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                response = session.get(url, timeout=30)
+                response.content
+                if response.status_code >= 500:
+                    failed += 1
+            except requests.RequestException:
+                failed += 1
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    pool = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for t in pool:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'requests': len(latencies),
+        'errors': errors[0],
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        'p95_ms': round(statistics.quantiles(latencies, n=20)[-1] * 1000, 1) if len(latencies) > 1 else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-process vs multi-worker throughput")
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--modes', nargs='+', default=['dev', 'gunicorn'], choices=['dev', 'gunicorn', 'waitress'])
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for mode in args.modes:
+            port = _free_port()
+            server = start_server(mode, port, args.workers, args.threads, tmp_dir)
+            try:
+                if not _wait_ready(port):
+                    raise RuntimeError(f"{mode} server did not start on port {port}")
+                run_load(port, args.clients, 2)  # warm-up (캐시/연결)
+                result = run_load(port, args.clients, args.duration)
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+            result['mode'] = mode if mode == 'dev' else f'{mode} {args.workers}x{args.threads}'
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"clients={args.clients} duration={args.duration}s cpus={os.cpu_count()}")
+    print(f"{'mode':<16}{'requests':>10}{'errors':>8}{'rps':>10}{'p50_ms':>10}{'p95_ms':>10}")
+    for r in results:
+        print(f"{r['mode']:<16}{r['requests']:>10}{r['errors']:>8}{r['rps']:>10}{r['p50_ms']:>10}{r['p95_ms']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Report Search Benchmark
+이전 방식(title/summary/organization/tags 4개 컬럼 ilike '%term%') vs FTS5 MATCH + bm25 비교
+
+합성 리포트 N개(기본 50,000개, 한/영 도메인 단어가 섞인 Zipf 분포 어휘)를 임시 DB에 넣고, 같은 /api/reports 엔드포인트를
+report.search.fts_enabled만 바꿔 호출하여 검색 요청(count + 페이지 + 하이라이트)의 지연 시간을 측정합니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.report_search
+    python -m benchmarks.report_search --reports 50000 --repeat 20 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flask import Flask  # noqa: E402
+
+WORDS_EN = (
+    "shipping freight container port congestion outlook market rate demand supply vessel capacity "
+    "bulk tanker carrier logistics trade route canal alliance charter index forecast fuel emission "
+    "decarbonization digital terminal inventory retail import export tariff recovery volatility"
+).split()
+WORDS_KO = (
+    "해운 운임 컨테이너 항만 물류 전망 시장 수요 공급 선박 선복량 벌크 유조선 무역 항로 "
+    "운하 용선 지수 연료 탄소 디지털 터미널 재고 수출 수입 관세 회복 변동성 공급망 부산항"
+).split()
+ORGS = ["KMI", "Drewry", "Clarksons", "McKinsey", "BIMCO", "UNCTAD", "KOTRA", "해양수산부", "IMF", "WTO"]
+VOCAB_SIZE = 5000  # 도메인 단어 + 일반 단어, Zipf 분포로 출현
+
+QUERIES = [
+    ("frequent en", "shipping"),
+    ("frequent ko prefix", "해운"),
+    ("two terms", "container congestion"),
+    ("rare ko+en", "부산항 decarbonization"),
+    ("organization", "Clarksons"),
+]
+
+
+def _vocabulary(rng: random.Random):
+    """도메인 단어를 순위 3, 3+k, 3+2k… 에 끼워 넣은 Zipf(s=1) 어휘"""
+    domain = WORDS_EN + WORDS_KO
+    rng.shuffle(domain)
+    words = [f"w{i}" for i in range(VOCAB_SIZE - len(domain))]
+    step = len(words) // len(domain)
+    for i, word in enumerate(domain):
+        words.insert(3 + i * step, word)
+    weights, total = [], 0.0
+    for rank in range(1, len(words) + 1):
+        total += 1.0 / rank
+        weights.append(total)
+    return words, weights
+
+
+def _text(rng: random.Random, vocab, count: int) -> str:
+    words, cum_weights = vocab
+    return " ".join(rng.choices(words, cum_weights=cum_weights, k=count))
+
+
+def seed(reports: int):
+    from report.models import ReportDB, engine
+
+    rng = random.Random(42)
+    vocab = _vocabulary(rng)
+    rows = []
+    for i in range(reports):
+        rows.append({
+            "id": f"RPT-{i:06d}",
+            "title": _text(rng, vocab, 6),
+            "category": rng.choice(["global_research", "government", "company"]),
+            "organization": rng.choice(ORGS),
+            "published_date": date(2020, 1, 1) + timedelta(days=i % 2000),
+            "summary": _text(rng, vocab, 40),
+            "tags": json.dumps(rng.sample(WORDS_EN + WORDS_KO, 2)),
+            "key_insights": json.dumps([_text(rng, vocab, 8), _text(rng, vocab, 8)]),
+            "is_featured": False,
+            "has_pdf": False,
+        })
+    with engine.begin() as conn:
+        for start in range(0, len(rows), 5000):
+            conn.execute(ReportDB.__table__.insert(), rows[start:start + 5000])
+
+
+def measure(client, term: str, repeat: int) -> dict:
+    latencies, total = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        data = client.get("/api/reports", query_string={"search": term, "page_size": 12}).get_json()
+        latencies.append(time.perf_counter() - started)
+        total = data["total"]
+    latencies.sort()
+    return {
+        "total": total,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LIKE vs FTS5 report search")
+    parser.add_argument("--reports", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'reports.db')}"
+        os.environ["REPORT_STORE_DIR"] = os.path.join(tmp_dir, "report_files")
+
+        from report import search
+        from report.api import report_bp
+
+        started = time.perf_counter()
+        seed(args.reports)
+        seed_seconds = time.perf_counter() - started
+
+        app = Flask("report_search")
+        app.register_blueprint(report_bp)
+        client = app.test_client()
+
+        for name, term in QUERIES:
+            for mode, enabled in (("like", False), ("fts5", True)):
+                search.fts_enabled = enabled
+                measure(client, term, 2)  # warm-up
+                result = measure(client, term, args.repeat)
+                result.update(query=name, term=term, mode=mode)
+                results.append(result)
+        search.fts_enabled = True
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print(f"reports={args.reports} repeat={args.repeat} seed={seed_seconds:.1f}s (incl. FTS triggers)")
+    print(f"{'query':<20}{'mode':<6}{'total':>8}{'p50_ms':>10}{'p95_ms':>10}")
+    for r in results:
+        print(f"{r['query']:<20}{r['mode']:<6}{r['total']:>8}{r['p50_ms']:>10}{r['p95_ms']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Report PDF Store Benchmark
+이전 방식(report_files.file_bytes BLOB + 목록에서 report.files lazy load) vs
+PDF 저장소(sha256 파일 + reports.has_pdf 컬럼 + send_file 스트리밍) 비교
+
+리포트 N개(기본 1,000개, 각각 PDF 포함)를 임시 DB에 넣고 Flask 테스트 클라이언트로
+목록(page_size 12 / 전체)과 다운로드(전체 / Range 64KB) 요청의 지연 시간과
+요청 처리 중 Python 힙 최대 사용량(tracemalloc peak)을 측정합니다.
+응답 본문은 청크 단위로 소비하므로 스트리밍 응답은 파일 전체를 메모리에 올리지 않습니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.report_store
+    python -m benchmarks.report_store --reports 1000 --pdf-kb 512 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from flask import Flask, Response, jsonify, request  # noqa: E402
+from sqlalchemy import (Boolean, Column, Date, ForeignKey, Integer, LargeBinary, String, Text,  # noqa: E402
+                        create_engine, desc)
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker  # noqa: E402
+
+LegacyBase = declarative_base()
+
+
+class LegacyReport(LegacyBase):
+    """이전 스키마: has_pdf 컬럼 없음"""
+    __tablename__ = "reports"
+
+    id = Column(String(50), primary_key=True)
+    title = Column(String(500), nullable=False)
+    category = Column(String(50), nullable=False)
+    organization = Column(String(200), nullable=False)
+    published_date = Column(Date, nullable=False)
+    summary = Column(Text)
+    tags = Column(Text)
+    is_featured = Column(Boolean, default=False)
+    files = relationship("LegacyReportFile", back_populates="report")
+
+
+class LegacyReportFile(LegacyBase):
+    """이전 스키마: PDF를 행에 BLOB으로 저장"""
+    __tablename__ = "report_files"
+
+    id = Column(String(50), primary_key=True)
+    report_id = Column(String(50), ForeignKey("reports.id"), nullable=False)
+    file_name = Column(String(500), nullable=False)
+    mime_type = Column(String(100), default="application/pdf")
+    file_size = Column(Integer, nullable=False)
+    sha256 = Column(String(64), unique=True, nullable=False)
+    file_bytes = Column(LargeBinary, nullable=False)
+    report = relationship("LegacyReport", back_populates="files")
+
+
+def _report_fields(i: int) -> dict:
+    return dict(
+        id=f"RPT-{i:05d}", title=f"Shipping outlook {i}", category="global_research",
+        organization=f"Org {i % 40}", published_date=date(2025, 1, 1) + timedelta(days=i % 365),
+        summary="Container freight and port congestion summary. " * 4, tags=json.dumps(["Shipping", "Freight"]),
+    )
+
+
+def build_legacy_app(db_path: str, reports: int, pdf_size: int) -> Flask:
+    import hashlib
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    LegacyBase.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    for i in range(reports):
+        data = os.urandom(pdf_size)
+        db.add(LegacyReport(**_report_fields(i)))
+        db.add(LegacyReportFile(id=f"FILE-{i:05d}", report_id=f"RPT-{i:05d}", file_name=f"report-{i}.pdf",
+                                file_size=pdf_size, sha256=hashlib.sha256(data).hexdigest(), file_bytes=data))
+        if i % 100 == 99:
+            db.commit()
+    db.commit()
+    db.close()
+
+    app = Flask("legacy")
+
+    @app.route("/api/reports")
+    def get_reports():
+        db = Session()
+        try:
+            page_size = request.args.get("page_size", 12, type=int)
+            rows = db.query(LegacyReport).order_by(desc(LegacyReport.published_date)).limit(page_size).all()
+            return jsonify({"reports": [{
+                "id": r.id, "title": r.title, "category": r.category, "organization": r.organization,
+                "published_date": r.published_date.isoformat(), "summary": r.summary,
+                "tags": json.loads(r.tags), "is_featured": r.is_featured,
+                "has_pdf": bool(r.files),
+            } for r in rows]})
+        finally:
+            db.close()
+
+    @app.route("/api/reports/<report_id>/download")
+    def download_report(report_id):
+        db = Session()
+        try:
+            file = db.query(LegacyReportFile).filter(LegacyReportFile.report_id == report_id).first()
+            return Response(file.file_bytes, mimetype=file.mime_type,
+                            headers={"Content-Disposition": f'attachment; filename="{file.file_name}"',
+                                     "Content-Length": str(file.file_size)})
+        finally:
+            db.close()
+
+    return app
+
+
+def build_store_app(reports: int, pdf_size: int) -> Flask:
+    """DATABASE_URL/REPORT_STORE_DIR 설정 후 호출 (report 패키지가 import 시 엔진을 만듦)"""
+    from report.api import report_bp
+    from report.models import ReportDB, SessionLocal
+    from report.storage import attach_pdf
+
+    db = SessionLocal()
+    for i in range(reports):
+        report = ReportDB(**_report_fields(i))
+        db.add(report)
+        attach_pdf(db, report, os.urandom(pdf_size), file_name=f"report-{i}.pdf")
+        if i % 100 == 99:
+            db.commit()
+    db.commit()
+    db.close()
+
+    app = Flask("store")
+    app.register_blueprint(report_bp)
+    return app
+
+
+def measure(app: Flask, path: str, headers: dict, repeat: int) -> dict:
+    client = app.test_client()
+    latencies, peaks, status, body = [], [], None, 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        response = client.get(path, headers=headers, buffered=False)
+        body = sum(len(chunk) for chunk in response.iter_encoded())
+        response.close()
+        latencies.append(time.perf_counter() - started)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        status = response.status_code
+    return {
+        "status": status,
+        "bytes": body,
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "peak_kb": round(max(peaks) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BLOB-in-row vs PDF store")
+    parser.add_argument("--reports", type=int, default=1000)
+    parser.add_argument("--pdf-kb", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    pdf_size = args.pdf_kb * 1024
+    cases = [
+        ("list page_size=12", "/api/reports?page_size=12", {}),
+        (f"list page_size={args.reports}", f"/api/reports?page_size={args.reports}", {}),
+        ("download full", "/api/reports/RPT-00007/download", {}),
+        ("download range 64KB", "/api/reports/RPT-00007/download", {"Range": "bytes=0-65535"}),
+    ]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'reports.db')}"
+        os.environ["REPORT_STORE_DIR"] = os.path.join(tmp_dir, "report_files")
+
+        apps = {
+            "legacy": build_legacy_app(os.path.join(tmp_dir, "legacy.db"), args.reports, pdf_size),
+            "store": build_store_app(args.reports, pdf_size),
+        }
+        for name, path, headers in cases:
+            for mode, app in apps.items():
+                measure(app, path, headers, 1)  # warm-up
+                result = measure(app, path, headers, args.repeat)
+                result.update(case=name, mode=mode)
+                results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"reports={args.reports} pdf={args.pdf_kb}KB repeat={args.repeat}")
+    print(f"{'case':<24}{'mode':<8}{'status':>7}{'bytes':>12}{'p50_ms':>10}{'peak_kb':>12}")
+    for r in results:
+        print(f"{r['case']:<24}{r['mode']:<8}{r['status']:>7}{r['bytes']:>12}{r['p50_ms']:>10}{r['peak_kb']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+SQLite Concurrency Benchmark
+기본 설정(rollback journal) vs 연결 프로파일(WAL + PRAGMA + 단일 writer 큐) 비교
+
+읽기 스레드는 집계 쿼리를, 쓰기 스레드는 건별 INSERT + COMMIT을 반복하며
+주어진 시간 동안의 처리량과 "database is locked" 오류 수를 측정합니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.sqlite_concurrency
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 4 --duration 10 --json
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlite_profile import WriteQueue, connect as profile_connect  # noqa: E402
+
+SEED_ROWS = 20000
+
+
+def _setup(db_path: str):
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE bids (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            bidding_id INTEGER NOT NULL,
+            forwarder_id INTEGER NOT NULL,
+            total_amount REAL NOT NULL,
+            submitted_at REAL NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX idx_bids_bidding ON bids (bidding_id)")
+    conn.executemany(
+        "INSERT INTO bids (bidding_id, forwarder_id, total_amount, submitted_at) VALUES (?, ?, ?, ?)",
+        [(i % 500, i % 50, 1000 + i % 997, time.time()) for i in range(SEED_ROWS)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def _run(db_path: str, readers: int, writers: int, duration: float, profiled: bool) -> dict:
+    connect = profile_connect if profiled else sqlite3.connect
+    write_queue = WriteQueue(name='bench-writer') if profiled else None
+    stop = threading.Event()
+    counts = {'reads': 0, 'writes': 0, 'locked_errors': 0}
+    counts_lock = threading.Lock()
+
+    def bump(key):
+        with counts_lock:
+            counts[key] += 1
+
+    def reader(worker_id):
+        conn = connect(db_path, check_same_thread=False)
+        i = worker_id
+        while not stop.is_set():
+            try:
+                conn.execute(
+                    "SELECT COUNT(*), MIN(total_amount), AVG(total_amount) FROM bids WHERE bidding_id = ?",
+                    (i % 500,)
+                ).fetchone()
+                bump('reads')
+            except sqlite3.OperationalError:
+                bump('locked_errors')
+            i += readers
+        conn.close()
+
+    def writer(worker_id):
+        conn = connect(db_path, check_same_thread=False)
+        i = worker_id
+
+        def insert(n):
+            conn.execute(
+                "INSERT INTO bids (bidding_id, forwarder_id, total_amount, submitted_at) VALUES (?, ?, ?, ?)",
+                (n % 500, n % 50, 1000 + n % 997, time.time())
+            )
+            conn.commit()
+
+        while not stop.is_set():
+            try:
+                if write_queue is not None:
+                    write_queue.run(insert, i)
+                else:
+                    insert(i)
+                bump('writes')
+            except sqlite3.OperationalError:
+                conn.rollback()
+                bump('locked_errors')
+            i += writers
+        conn.close()
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'mode': 'profile' if profiled else 'default',
+        'reads_per_sec': round(counts['reads'] / elapsed, 1),
+        'writes_per_sec': round(counts['writes'] / elapsed, 1),
+        'locked_errors': counts['locked_errors'],
+    }
+
+
+def run_benchmark(readers: int = 4, writers: int = 4, duration: float = 5.0) -> list:
+    """두 모드를 각각 새 DB 파일에서 실행하고 결과 목록을 반환합니다."""
+    results = []
+    for profiled in (False, True):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'bench.db')
+            _setup(db_path)
+            results.append(_run(db_path, readers, writers, duration, profiled))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite concurrent read/write benchmark')
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per mode')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.readers, args.writers, args.duration)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"readers={args.readers} writers={args.writers} duration={args.duration}s")
+    print(f"{'mode':<10}{'reads/s':>12}{'writes/s':>12}{'locked':>10}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['reads_per_sec']:>12}{r['writes_per_sec']:>12}{r['locked_errors']:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Startup Profile / Time-to-First-Response
+서버 시작 비용을 모듈별 import 시간과 /api/health 첫 응답 시간으로 측정합니다.
+
+- import: python -X importtime -c "import main"을 별도 프로세스로 실행해 모듈별 self/누적 시간을 집계
+  (최상위 패키지별 합계와 self 시간 상위 모듈). 무거운 의존성이 시작 경로에 다시 들어왔는지도 표시
+- ttfr: 서버 프로세스를 띄운 시점부터 GET /api/health가 200을 돌려줄 때까지의 시간 (여러 번 실행한 중앙값)
+  main.py의 __main__과 같은 app.run이지만 Quote Backend/스케줄러 워밍업은 켜지 않습니다
+  (워밍업은 포트가 열린 뒤 백그라운드에서 실행되므로 첫 응답 시간에 포함되지 않음)
+
+--max-ttfr-ms를 주면 중앙값이 이를 넘을 때 종료 코드 1 (회귀 확인용).
+리포트 DB는 임시 디렉토리에 만들고, KCCI/해운지수/인증/뉴스 DB는 server/의 파일을 그대로 씁니다
+(뉴스 DB는 news_intelligence.api import 때 없으면 생성됨).
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 5 --top 30 --max-ttfr-ms 3000 --json
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).parent.parent
+
+# 첫 사용까지 미루는 의존성 (startup.lazy_module / 함수 안 import)
+DEFERRED_MODULES = [
+    'pandas', 'numpy', 'google.genai', 'google.generativeai', 'bs4', 'feedparser', 'reportlab', 'requests',
+    'gemini_backend', 'news_intelligence.collectors', 'kcci.collector',
+]
+
+IMPORT_APP = "import main"
+# main.py의 __main__과 같은 설정 (Quote Backend/스케줄러 워밍업 제외)
+RUN_APP = "from config import DEBUG_MODE; from main import app; app.run(port={port}, debug=DEBUG_MODE, use_reloader=False)"
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def _env(tmp_dir: str) -> dict:
+    return dict(os.environ, ECOS_API_KEY=os.environ.get('ECOS_API_KEY', 'benchmark'),
+                DATABASE_URL=f"sqlite:///{os.path.join(tmp_dir, 'reports.db')}",
+                REPORT_STORE_DIR=os.path.join(tmp_dir, 'report_files'),
+                SCHEDULER_LEASE_PATH=os.path.join(tmp_dir, 'lease.db'),
+                CACHE_BACKEND_URL='memory://')
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def profile_imports(tmp_dir: str, top: int) -> dict:
+    """-X importtime 출력 → 모듈별 self/누적 ms, 최상위 패키지별 self 합계"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_APP],
+        cwd=str(SERVER_DIR), env=_env(tmp_dir), capture_output=True, text=True, timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+
+    packages = defaultdict(float)
+    for name, (self_ms, _) in modules.items():
+        packages[name.split('.')[0]] += self_ms
+
+    by_self = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        'total_ms': round(sum(self_ms for self_ms, _ in modules.values()), 1),
+        'module_count': len(modules),
+        'packages': [{'package': name, 'self_ms': round(ms, 1)}
+                     for name, ms in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]],
+        'modules': [{'module': name, 'self_ms': round(self_ms, 1), 'cumulative_ms': round(cumulative_ms, 1)}
+                    for name, (self_ms, cumulative_ms) in by_self],
+        'deferred': {name: name not in modules for name in DEFERRED_MODULES},
+    }
+
+
+def time_to_first_response(tmp_dir: str, timeout: float = 60) -> float:
+    """서버 프로세스 시작 → /api/health 200까지 ms"""
+    port = _free_port()
+    url = f'http://127.0.0.1:{port}/api/health'
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-c', RUN_APP.format(port=port)],
+        cwd=str(SERVER_DIR), env=_env(tmp_dir), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=2) as response:
+                    if response.status == 200:
+                        return round((time.perf_counter() - started) * 1000, 1)
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"no response from {url} within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="per-module import cost and /api/health time-to-first-response")
+    parser.add_argument("--runs", type=int, default=3, help="server starts for the TTFR median")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--max-ttfr-ms", type=float, default=None, help="exit 1 if median TTFR exceeds this")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        imports = profile_imports(tmp_dir, args.top)
+        runs = [time_to_first_response(tmp_dir) for _ in range(args.runs)]
+
+    ttfr = {'median_ms': round(statistics.median(runs), 1), 'runs_ms': runs}
+    regressed = args.max_ttfr_ms is not None and ttfr['median_ms'] > args.max_ttfr_ms
+
+    if args.json:
+        print(json.dumps({'imports': imports, 'ttfr': ttfr, 'max_ttfr_ms': args.max_ttfr_ms,
+                          'regressed': regressed}, indent=2))
+    else:
+        print(f"import main: {imports['total_ms']:.0f} ms across {imports['module_count']} modules")
+        print(f"\n{'package':<36}{'self_ms':>10}")
+        for row in imports['packages']:
+            print(f"{row['package']:<36}{row['self_ms']:>10}")
+        print(f"\n{'module':<48}{'self_ms':>10}{'cumul_ms':>10}")
+        for row in imports['modules']:
+            print(f"{row['module'][:47]:<48}{row['self_ms']:>10}{row['cumulative_ms']:>10}")
+        print("\ndeferred until first use:")
+        for name, deferred in imports['deferred'].items():
+            print(f"  [{'OK' if deferred else 'X '}] {name}")
+        print(f"\n/api/health time-to-first-response: median {ttfr['median_ms']:.0f} ms "
+              f"(runs: {', '.join(f'{ms:.0f}' for ms in runs)})")
+        if args.max_ttfr_ms is not None:
+            print(f"{'REGRESSION' if regressed else 'OK'}: limit {args.max_ttfr_ms:.0f} ms")
+
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
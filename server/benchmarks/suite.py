@@ -0,0 +1,211 @@
+"""
+Benchmark Suite (server)
+GDELT 파싱, 뉴스 분석, 지수 시계열 처리와 주요 API를 같은 합성 데이터로 측정하고 JSON 기준선과 비교합니다.
+
+데이터는 benchmarks.generators가 --seed로 만들며 규모는 --scale(small/medium/large)로 정합니다.
+리포트/뉴스/해운지수 DB와 GDELT 파일은 임시 디렉토리에 만들고 (KCCI는 API가 server/kcci.db를 직접 열어 제외),
+Gemini 키는 비워 뉴스 분석은 규칙 기반 경로만 측정합니다.
+(news_intelligence.api import 때 server/news_intelligence.db가 없으면 빈 스키마로 생성됨)
+
+    gdelt.*       export 파일 파싱, 롤링 윈도우 재구성/상위 알림 병합
+    news.*        규칙 기반 분류(analyze_batch), 워드클라우드 키워드, SimHash 중복 묶음
+    timeseries.*  LTTB 다운샘플링
+    api.*         Flask 테스트 클라이언트 요청 (SQL 문 수는 Server-Timing 헤더 기준)
+
+결과는 benchmarks/baselines/<scale>-<commit>.json에 저장되고, compare는 median이 --threshold 이상 느려지거나
+SQL 문 수가 늘어난 시나리오를 회귀로 표시하고 종료 코드 1을 돌려줍니다.
+
+Usage (server 디렉토리에서):
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run --scale small --repeat 20
+    python -m benchmarks.suite run --scale medium --only gdelt. --only api. --output /tmp/after.json
+    python -m benchmarks.suite compare benchmarks/baselines/small-abc1234.json /tmp/after.json --threshold 0.15
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks import generators
+from shared.benchmark_harness import main as harness_main, scenario
+
+BASELINE_DIR = Path(__file__).parent / 'baselines'
+
+SCALES = {
+    'small': {'gdelt_rows': 5000, 'gdelt_slices': 8, 'articles': 500, 'index_days': 800, 'reports': 1000},
+    'medium': {'gdelt_rows': 20000, 'gdelt_slices': 32, 'articles': 2000, 'index_days': 2500, 'reports': 5000},
+    'large': {'gdelt_rows': 60000, 'gdelt_slices': 96, 'articles': 8000, 'index_days': 7300, 'reports': 20000},
+}
+
+CRITICAL_SHARE = 0.2  # 실제 export처럼 대부분의 행은 임계값(-5) 위라 파서가 건너뜀
+DOWNSAMPLE_POINTS = 300
+
+
+@contextmanager
+def build_context(scale: dict, seed: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        os.environ['DATABASE_URL'] = f"sqlite:///{tmp / 'reports.db'}"
+        os.environ['REPORT_STORE_DIR'] = str(tmp / 'report_files')
+        os.environ['GDELT_BASE_PATH'] = str(tmp / 'gdelt')
+        os.environ['SCHEDULER_LEASE_PATH'] = str(tmp / 'lease.db')
+        os.environ['CACHE_BACKEND_URL'] = 'memory://'
+        os.environ['GEMINI_API_KEY'] = ''
+        os.environ['QUERY_BUDGET_ENFORCE'] = 'false'
+        os.environ.setdefault('ECOS_API_KEY', 'benchmark')
+
+        import news_intelligence.models as news_models
+        import shipping_indices.api as shipping_api
+        import shipping_indices.models as shipping_models
+
+        shipping_db = tmp / 'shipping_indices.db'
+        news_models._cached_db_url = f"sqlite:///{tmp / 'news.db'}"
+        shipping_models.get_shipping_indices_database_url = lambda: f"sqlite:///{shipping_db}"
+        shipping_api.get_db_path = lambda: str(shipping_db)
+
+        from benchmarks.report_search import seed as seed_reports
+        from main import app
+
+        seed_reports(scale['reports'])
+        generators.seed_news(scale['articles'], seed)
+        generators.seed_shipping_indices(scale['index_days'], seed)
+        gdelt_files = generators.write_gdelt_exports(tmp / 'gdelt', scale['gdelt_slices'], scale['gdelt_rows'],
+                                                     seed, CRITICAL_SHARE)
+
+        yield SimpleNamespace(
+            app=app,
+            client=app.test_client(),
+            gdelt_path=tmp / 'gdelt',
+            gdelt_files=gdelt_files,
+            articles=generators.news_articles(scale['articles'], seed),
+            series=generators.index_series(scale['index_days'], seed),
+        )
+
+
+# ============================================================
+# GDELT
+# ============================================================
+
+@scenario('gdelt.parse_export', 'parse one 15-minute export file (all rows scanned)')
+def gdelt_parse_export(ctx):
+    from gdelt_backend import parse_gdelt_events
+
+    file_path = ctx.gdelt_files[-1]
+    return lambda: parse_gdelt_events(file_path, -5.0, max_events=10 ** 7)
+
+
+@scenario('gdelt.window_rebuild', 'rebuild the 24h rolling alert window from disk')
+def gdelt_window_rebuild(ctx):
+    from gdelt_backend import RollingAlertWindow
+
+    return lambda: RollingAlertWindow().rebuild(ctx.gdelt_path)
+
+
+@scenario('gdelt.top_alerts', 'k-way merge of the top 1000 alerts across slices')
+def gdelt_top_alerts(ctx):
+    from gdelt_backend import RollingAlertWindow
+
+    window = RollingAlertWindow()
+    window.rebuild(ctx.gdelt_path)
+    return lambda: window.top_alerts(max_alerts=1000)
+
+
+# ============================================================
+# News analysis
+# ============================================================
+
+@scenario('news.analyze_batch', 'rule-based classification of every article')
+def news_analyze_batch(ctx):
+    from news_intelligence.analyzer import NewsAnalyzer
+
+    analyzer = NewsAnalyzer()
+    return lambda: analyzer.analyze_batch([dict(article) for article in ctx.articles])
+
+
+@scenario('news.wordcloud', 'n-gram keyword extraction for the word cloud')
+def news_wordcloud(ctx):
+    from news_intelligence.analyzer import NewsAnalyzer
+
+    analyzer = NewsAnalyzer()
+    return lambda: analyzer.extract_keywords_for_wordcloud(ctx.articles)
+
+
+@scenario('news.dedup', 'SimHash fingerprint + near-duplicate grouping')
+def news_dedup(ctx):
+    from news_intelligence.dedup import SimHashIndex, simhash
+
+    def run():
+        index = SimHashIndex()
+        return [index.assign(simhash(a['title'], a['content_summary'])) for a in ctx.articles]
+    return run
+
+
+# ============================================================
+# Time series
+# ============================================================
+
+@scenario('timeseries.downsample', f'LTTB downsampling to {DOWNSAMPLE_POINTS} points')
+def timeseries_downsample(ctx):
+    from timeseries import downsample_rows
+
+    return lambda: downsample_rows(ctx.series, 'index_date', 'current_index', DOWNSAMPLE_POINTS)
+
+
+# ============================================================
+# API
+# ============================================================
+
+def _get(ctx, url: str, before=None):
+    def run():
+        if before is not None:
+            before()
+        return ctx.client.get(url)
+    return run
+
+
+@scenario('api.news_articles', 'GET /api/news-intelligence/articles (100 per page)')
+def api_news_articles(ctx):
+    return _get(ctx, '/api/news-intelligence/articles?page_size=100')
+
+
+@scenario('api.news_articles_collapsed', 'GET /api/news-intelligence/articles?collapse=true')
+def api_news_articles_collapsed(ctx):
+    return _get(ctx, '/api/news-intelligence/articles?page_size=100&collapse=true')
+
+
+@scenario('api.global_alerts', 'GET /api/global-alerts (1000 alerts from the rolling window)')
+def api_global_alerts(ctx):
+    return _get(ctx, '/api/global-alerts?max_alerts=1000')
+
+
+@scenario('api.shipping_chart', 'GET /api/shipping-indices/scfi/chart-data (ALL, uncached)')
+def api_shipping_chart(ctx):
+    from shipping_indices.api import CHART_CACHE_NAMESPACE
+    from timeseries import chart_cache
+
+    return _get(ctx, f'/api/shipping-indices/scfi/chart-data?period=ALL&max_points={DOWNSAMPLE_POINTS}',
+                before=lambda: chart_cache.invalidate(CHART_CACHE_NAMESPACE))
+
+
+@scenario('api.shipping_all', 'GET /api/shipping-indices/all')
+def api_shipping_all(ctx):
+    return _get(ctx, '/api/shipping-indices/all')
+
+
+@scenario('api.reports_list', 'GET /api/reports (100 per page)')
+def api_reports_list(ctx):
+    return _get(ctx, '/api/reports?page_size=100')
+
+
+@scenario('api.reports_search', 'GET /api/reports?search=... (full-text search)')
+def api_reports_search(ctx):
+    return _get(ctx, '/api/reports?search=shipping&page_size=50')
+
+
+if __name__ == '__main__':
+    harness_main('server', SCALES, build_context, BASELINE_DIR)
@@ -17,16 +17,26 @@ Endpoints:
 import os
 import logging
 from flask import Blueprint, request, jsonify
-import requests
 
 import bok_backend
-from config import ECOS_API_KEY, ECOS_API_BASE_URL
+from config import ECOS_API_KEY, ECOS_API_BASE_URL, HTTP_CACHE_MAX_AGE_BOK
+from http_cache import public_max_age, register_cache_policy
+from startup import lazy_module
+from telemetry import external_call
+
+requests = lazy_module('requests')  # 외부 API 호출 때만 import
 
 logger = logging.getLogger(__name__)
 
 # Flask Blueprint
 bok_bp = Blueprint('bok', __name__)
 
+# HTTP 캐시: 외부 ECOS 응답이라 데이터 버전을 알 수 없음 → max-age + 본문 해시 ETag
+# (캐시 통계는 계속 바뀌므로 제외 → no-store)
+cache_policy = register_cache_policy(
+    bok_bp, public_max_age(HTTP_CACHE_MAX_AGE_BOK), exempt=('bok.get_bok_cache_stats',)
+)
+
 
 # ============================================================
 # BOK Statistics API
@@ -245,7 +255,8 @@ def get_exchange_rates():
     url = f"{ECOS_API_BASE_URL}/StatisticSearch/{ECOS_API_KEY}/json/kr/1/10/731Y001/D/{start_date}/{end_date}/{item_code}"
 
     try:
-        response = requests.get(url)
+        with external_call('ecos'):
+            response = requests.get(url)
         return jsonify(response.json())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1,4 +1,3 @@
-import requests
 import os
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
@@ -7,6 +6,12 @@ import threading
 import time
 from functools import wraps
 
+from cache_backend import get_shared_backend
+from startup import lazy_module
+from telemetry import external_call
+
+requests = lazy_module('requests')  # ECOS 호출 때만 import
+
 load_dotenv()
 
 # 로깅 설정
@@ -18,7 +23,7 @@ if not ECOS_API_KEY:
     logger.error("ECOS_API_KEY is not set in .env file. Please set it in .env file.")
     raise ValueError("ECOS_API_KEY is required. Please set it in .env file.")
 
-API_BASE_URL = "http://ecos.bok.or.kr/api"
+API_BASE_URL = os.getenv("ECOS_API_BASE_URL", "http://ecos.bok.or.kr/api")
 API_TIMEOUT = 30  # 30초 타임아웃
 
 # ============================================================
@@ -88,13 +93,23 @@ class CacheEntry:
         return time.time() - self.created_at > self.ttl
 
 class APICache:
-    """API 응답 캐시"""
-    def __init__(self):
+    """
+    API 응답 캐시
+    
+    backend(공유 캐시 백엔드)가 있으면 워커 프로세스끼리 같은 ECOS 응답을 공유하고,
+    없으면 프로세스 내 dict를 사용합니다.
+    """
+    NAMESPACE = 'ecos'
+    
+    def __init__(self, backend=None):
         self.cache = {}
         self.lock = threading.Lock()
+        self.backend = backend
     
     def get(self, key):
         """캐시에서 데이터 조회"""
+        if self.backend is not None:
+            return self.backend.get(self.NAMESPACE, key)
         with self.lock:
             if key in self.cache:
                 entry = self.cache[key]
@@ -109,12 +124,19 @@ class APICache:
     
     def set(self, key, data, ttl=CACHE_TTL_SECONDS):
         """캐시에 데이터 저장"""
+        if self.backend is not None:
+            self.backend.set(self.NAMESPACE, key, data, ttl)
+            return
         with self.lock:
             self.cache[key] = CacheEntry(data, ttl)
             logger.debug(f"Cache SET: {key[:50]}... (TTL: {ttl}s)")
     
     def clear(self):
         """캐시 전체 삭제"""
+        if self.backend is not None:
+            count = self.backend.invalidate(self.NAMESPACE)
+            logger.info(f"Cache cleared: {count} entries removed")
+            return
         with self.lock:
             count = len(self.cache)
             self.cache.clear()
@@ -131,13 +153,15 @@ class APICache:
     
     def get_stats(self):
         """캐시 통계 반환"""
+        if self.backend is not None:
+            return self.backend.stats(self.NAMESPACE)
         with self.lock:
             total = len(self.cache)
             expired = sum(1 for v in self.cache.values() if v.is_expired())
             return {"total": total, "active": total - expired, "expired": expired}
 
-# 전역 캐시 인스턴스
-_api_cache = APICache()
+# 전역 캐시 인스턴스 (CACHE_BACKEND_URL이 공유 백엔드면 워커 간 공유)
+_api_cache = APICache(backend=get_shared_backend())
 
 def get_cache_stats():
     """캐시 통계 조회 (외부 노출용)"""
@@ -668,7 +692,8 @@ def get_bok_statistics(stat_code, item_code, cycle, start_date, end_date, start_
         # Rate Limiting 적용
         _rate_limiter.wait_if_needed()
         
-        response = requests.get(url, timeout=API_TIMEOUT)
+        with external_call('ecos'):
+            response = requests.get(url, timeout=API_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -1610,7 +1635,8 @@ def search_statistical_codes(stat_code=None, stat_name=None, start_index=1, end_
         _rate_limiter.wait_if_needed()
         
         # http에서 302로 https로 가면 404가 나는 케이스가 있어 리다이렉트를 따라가지 않음
-        response = requests.get(url, timeout=API_TIMEOUT, allow_redirects=False)
+        with external_call('ecos'):
+            response = requests.get(url, timeout=API_TIMEOUT, allow_redirects=False)
         if response.status_code in (301, 302, 307, 308):
             logger.warning(f"Redirect blocked for StatisticTableList: {response.status_code} -> {response.headers.get('Location')}")
             return {"error": f"Redirect blocked: {response.status_code}", "status_code": response.status_code}
@@ -1726,7 +1752,8 @@ def get_statistic_item_list(stat_code, start_index=1, end_index=100, use_cache=T
         # Rate Limiting 적용
         _rate_limiter.wait_if_needed()
         
-        response = requests.get(url, timeout=API_TIMEOUT)
+        with external_call('ecos'):
+            response = requests.get(url, timeout=API_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
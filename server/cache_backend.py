@@ -0,0 +1,195 @@
+"""
+Cache Backend
+워커 프로세스끼리 공유해야 하는 캐시(ECOS 응답, GDELT 알림)의 저장소를 URL로 선택합니다.
+
+    backend = create_cache_backend("sqlite:///server/shared_cache.db")
+    backend.set('ecos', key, data, ttl=300)
+    backend.get('ecos', key)
+
+- memory://            프로세스별 dict (단일 프로세스 개발 서버, 기본값)
+- sqlite:///path.db    같은 서버의 워커끼리 파일 공유 (WAL, 값은 pickle)
+- redis://host:port/0  Redis (redis 패키지 필요, 여러 서버에서 공유)
+
+get_shared_backend()는 memory://일 때 None을 돌려주므로, 호출 측은 기존 프로세스 내 캐시를 그대로 씁니다.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from config import CACHE_BACKEND_URL
+from sqlite_profile import connect
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_PURGE_EVERY = 200  # set 200회마다 만료 항목 정리
+
+
+class MemoryCacheBackend:
+    """프로세스 내 (namespace, key) → (expires_at, value)"""
+
+    shared = False
+
+    def __init__(self):
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[(namespace, key)]
+                return None
+            return entry[1]
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float):
+        with self._lock:
+            self._entries[(namespace, key)] = (time.time() + ttl, value)
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        with self._lock:
+            keys = [k for k in self._entries if namespace is None or k[0] == namespace]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, int]:
+        now = time.time()
+        with self._lock:
+            entries = [v for k, v in self._entries.items() if namespace is None or k[0] == namespace]
+        expired = sum(1 for expires_at, _ in entries if expires_at < now)
+        return {"total": len(entries), "active": len(entries) - expired, "expired": expired}
+
+
+class SQLiteCacheBackend:
+    """SQLite 파일 캐시 (같은 호스트의 여러 프로세스가 공유)"""
+
+    shared = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._sets = 0
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            """)
+
+    def _connection(self):
+        # fork 이전(preload)에 연 연결을 자식 프로세스가 물려받지 않도록 pid 확인
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at >= ?",
+            (namespace, str(key), time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return None
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float):
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, str(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), time.time() + ttl)
+        )
+        self._sets += 1
+        if self._sets % _SQLITE_PURGE_EVERY == 0:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),))
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        conn = self._connection()
+        if namespace is None:
+            return conn.execute("DELETE FROM cache_entries").rowcount
+        return conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,)).rowcount
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, int]:
+        where, params = ("WHERE namespace = ?", (time.time(), namespace)) if namespace else ("", (time.time(),))
+        total, expired = self._connection().execute(
+            f"SELECT COUNT(*), COALESCE(SUM(expires_at < ?), 0) FROM cache_entries {where}", params
+        ).fetchone()
+        return {"total": total, "active": total - expired, "expired": expired}
+
+
+class RedisCacheBackend:
+    """Redis 캐시 (키: aal:{namespace}:{key}, TTL은 Redis가 관리)"""
+
+    shared = True
+
+    def __init__(self, url: str, prefix: str = 'aal'):
+        import redis  # 선택 의존성: CACHE_BACKEND_URL=redis://… 일 때만 필요
+
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: Hashable) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        raw = self._client.get(self._key(namespace, key))
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float):
+        self._client.set(self._key(namespace, key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                         px=max(int(ttl * 1000), 1))
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        pattern = f"{self.prefix}:{namespace}:*" if namespace else f"{self.prefix}:*"
+        keys = list(self._client.scan_iter(match=pattern, count=500))
+        return self._client.delete(*keys) if keys else 0
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, int]:
+        pattern = f"{self.prefix}:{namespace}:*" if namespace else f"{self.prefix}:*"
+        total = sum(1 for _ in self._client.scan_iter(match=pattern, count=500))
+        return {"total": total, "active": total, "expired": 0}
+
+
+def create_cache_backend(url: str):
+    if url.startswith('sqlite:///'):
+        return SQLiteCacheBackend(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisCacheBackend(url)
+    if url in ('', 'memory://'):
+        return MemoryCacheBackend()
+    raise ValueError(f"Unsupported CACHE_BACKEND_URL: {url}")
+
+
+_shared_backend = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_backend():
+    """
+    CACHE_BACKEND_URL의 공유 백엔드 (memory://면 None)
+
+    serve.py는 워커가 2개 이상이면 import 전에 CACHE_BACKEND_URL을 설정합니다.
+    """
+    global _shared_backend
+    url = os.getenv('CACHE_BACKEND_URL', CACHE_BACKEND_URL)
+    if url in ('', 'memory://'):
+        return None
+    with _shared_lock:
+        if _shared_backend is None:
+            _shared_backend = create_cache_backend(url)
+            logger.info(f"Shared cache backend: {url}")
+        return _shared_backend
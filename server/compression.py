@@ -0,0 +1,107 @@
+"""
+Response Compression
+JSON/텍스트 응답을 Accept-Encoding에 따라 brotli 또는 gzip으로 압축합니다.
+
+- COMPRESSION_MIN_SIZE 바이트 미만 응답은 그대로 (작은 응답은 압축 헤더/CPU 비용이 더 큼)
+- 압축 대상: JSON, text/* (SSE 제외), JavaScript, SVG, XML
+- 스트리밍/파일 응답(send_file, direct_passthrough)과 이미 Content-Encoding이 있는 응답
+  (frontend/dist의 .br/.gz 사본)은 건드리지 않음
+- brotli 패키지가 없으면 gzip만 사용
+- 압축 결과가 원본보다 작지 않으면 원본 유지
+"""
+
+import gzip
+import logging
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from config import COMPRESSION_BROTLI_QUALITY, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_SIZE
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+}
+
+
+def is_compressible(mimetype: str) -> bool:
+    """압축할 mimetype인지 (text/event-stream은 이벤트 단위로 흘려보내야 하므로 제외)"""
+    if not mimetype or mimetype == 'text/event-stream':
+        return False
+    return (mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES
+            or mimetype.endswith('+json'))
+
+
+def choose_encoding(accept_encodings):
+    """Accept-Encoding(werkzeug MIMEAccept)에서 사용할 인코딩 (br → gzip 순, 없으면 None)"""
+    if brotli is not None and accept_encodings['br'] > 0:
+        return 'br'
+    if accept_encodings['gzip'] > 0:
+        return 'gzip'
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response):
+    """after_request: 조건을 만족하는 응답 본문을 압축"""
+    if (request.method == 'HEAD'
+            or response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or 'no-transform' in response.headers.get('Cache-Control', '')
+            or not is_compressible(response.mimetype)):
+        return response
+
+    # 압축 여부와 상관없이 Accept-Encoding에 따라 본문이 달라질 수 있음을 캐시에 알림
+    response.vary.add('Accept-Encoding')
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE:
+        return response
+
+    compressed = compress(data, encoding)
+    if len(compressed) >= len(data):
+        return response
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+
+    # 강한 ETag는 인코딩마다 달라야 하므로 약한 ETag로 (약한 ETag는 의미상 같은 본문이면 공유 가능)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+    return response
+
+
+def init_compression(app):
+    """
+    앱 전체 after_request로 응답 압축을 등록합니다.
+
+    블루프린트 after_request(http_cache의 ETag/304 처리)가 먼저 실행된 뒤 압축합니다.
+
+    Args:
+        app: Flask application instance
+    """
+    if brotli is None:
+        logger.info("brotli not installed: compressing responses with gzip only")
+    app.after_request(compress_response)
+    return app
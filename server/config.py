@@ -22,6 +22,8 @@ FRONTEND_DIR = BASE_DIR / 'frontend'
 FRONTEND_CSS_DIR = FRONTEND_DIR / 'css'
 FRONTEND_JS_DIR = FRONTEND_DIR / 'js'
 FRONTEND_PAGES_DIR = FRONTEND_DIR / 'pages'
+# 해시 파일명 + 압축 사본 빌드 결과 (python frontend_assets.py, serve.py가 시작 시 빌드)
+FRONTEND_BUILD_DIR = Path(os.getenv("FRONTEND_BUILD_DIR", str(FRONTEND_DIR / 'dist')))
 
 # Quote backend paths
 QUOTE_BACKEND_DIR = BASE_DIR / 'quote_backend'
@@ -36,17 +38,36 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 # ============================================================
 # EXTERNAL API URLS
 # ============================================================
-ECOS_API_BASE_URL = "http://ecos.bok.or.kr/api"
+# 부하 테스트에서는 loadtest.stubs 주소로 바꿔 외부 API 없이 실행
+ECOS_API_BASE_URL = os.getenv("ECOS_API_BASE_URL", "http://ecos.bok.or.kr/api")
 
 # ============================================================
 # SERVER CONFIGURATION
 # ============================================================
-FLASK_PORT = 5000
+FLASK_PORT = int(os.getenv("FLASK_PORT", "5000"))
 QUOTE_BACKEND_PORT = 8001
 DEBUG_MODE = True
 
-# Disable caching for development
-SEND_FILE_MAX_AGE_DEFAULT = 0
+# 정적 파일: None = send_file이 Cache-Control: no-cache + ETag/Last-Modified로 응답 (변경 없으면 304)
+SEND_FILE_MAX_AGE_DEFAULT = None
+
+# ============================================================
+# HTTP CACHE (http_cache.py)
+# ============================================================
+# 스케줄러만 갱신하는 데이터는 max-age 동안 재요청 없이 사용하고, 이후에는 ETag로 재검증합니다.
+# 화면에서 수집/수정할 수 있는 데이터(KCCI, 리포트, 뉴스)는 no-cache (매번 재검증, 변경 없으면 304).
+HTTP_CACHE_MAX_AGE_SHIPPING = int(os.getenv("HTTP_CACHE_MAX_AGE_SHIPPING", "300"))
+HTTP_CACHE_MAX_AGE_GDELT = int(os.getenv("HTTP_CACHE_MAX_AGE_GDELT", "60"))
+HTTP_CACHE_MAX_AGE_BOK = int(os.getenv("HTTP_CACHE_MAX_AGE_BOK", "300"))
+
+# ============================================================
+# RESPONSE COMPRESSION (compression.py)
+# ============================================================
+# 이 크기(바이트) 이상인 JSON/텍스트 응답만 압축 (brotli 우선, 없으면 gzip)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+# 동적 응답용: 5 ≈ gzip 6과 비슷한 시간에 더 작음 (4 이하는 gzip보다 커지기도 함, 11은 정적 사본용)
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
 
 # ============================================================
 # SCHEDULER CONFIGURATION
@@ -62,6 +83,24 @@ KCCI_COLLECTION_DAY = 'mon'
 KCCI_COLLECTION_HOUR_UTC = 5
 KCCI_COLLECTION_MINUTE = 30
 
+# 스케줄러 lease: 여러 워커 중 lease를 잡은 프로세스만 작업 실행
+SCHEDULER_LEASE_PATH = os.getenv("SCHEDULER_LEASE_PATH", str(SERVER_DIR / 'scheduler_lease.db'))
+SCHEDULER_LEASE_TTL_SECONDS = int(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", "60"))
+
+# ============================================================
+# PRODUCTION SERVER (serve.py)
+# ============================================================
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", str(min((os.cpu_count() or 1) * 2 + 1, 8))))
+WEB_THREADS = int(os.getenv("WEB_THREADS", "4"))
+WEB_HOST = os.getenv("WEB_HOST", "0.0.0.0")
+
+# ============================================================
+# SHARED CACHE (ECOS / GDELT)
+# ============================================================
+# memory:// = 프로세스별 메모리, sqlite:///path = 같은 서버의 워커끼리 공유, redis://host:6379/0 = Redis
+CACHE_BACKEND_URL = os.getenv("CACHE_BACKEND_URL", "memory://")
+MULTI_WORKER_CACHE_URL = f"sqlite:///{SERVER_DIR / 'shared_cache.db'}"
+
 # ============================================================
 # LOGGING CONFIGURATION
 # ============================================================
@@ -6,6 +6,12 @@ Flask 확장 모듈들의 초기화를 관리합니다.
 from flask_cors import CORS
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from config import SEND_FILE_MAX_AGE_DEFAULT
+from compression import init_compression
+from http_cache import init_http_cache
+from json_provider import init_json_provider
+from telemetry import init_telemetry
+
 # ============================================================
 # CORS Extension
 # ============================================================
@@ -27,17 +33,18 @@ def init_extensions(app):
     # Initialize CORS
     cors.init_app(app)
     
-    # Disable caching for development
-    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+    # 정적 파일은 조건부 요청(ETag/Last-Modified)으로 재검증
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = SEND_FILE_MAX_AGE_DEFAULT
+    
+    # 블루프린트별 캐시 정책(http_cache.register_cache_policy)이 없는 응답은 no-store
+    init_http_cache(app)
+    
+    # jsonify/get_json은 orjson, 큰 JSON/텍스트 응답은 brotli/gzip 압축
+    init_json_provider(app)
+    init_compression(app)
     
-    # Add no-cache headers
-    @app.after_request
-    def add_no_cache_headers(response):
-        """Add no-cache headers to all responses for development"""
-        response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-        return response
+    # 라우트별 지연시간/SQL 문 수/외부 API 시간 → /metrics (Prometheus), query_budget 검사
+    init_telemetry(app)
     
     return app
 
@@ -0,0 +1,286 @@
+"""
+Frontend Asset Pipeline
+frontend/의 CSS/JS를 내용 해시가 붙은 파일명으로 빌드하고 HTML 페이지의 참조를 바꿉니다.
+
+    python frontend_assets.py            # frontend/dist 빌드
+    python frontend_assets.py --clean    # dist를 비우고 다시 빌드
+
+- css/**/*.css, js/**/*.js → 같은 경로의 name.<hash>.ext (JS의 import 경로도 해시 파일명으로 바꾼 뒤 해시)
+- 진입 페이지(ai_studio_code_F2.html, pages/*.html)는 이름 그대로 두고 참조만 바꿈
+- 모든 파일에 .gz (brotli 패키지가 있으면 .br도) 사본 생성
+- manifest.json을 마지막에 기록 (원본 경로 → 해시 경로, 빌드 시점의 원본 mtime)
+
+서빙(static_routes.py): 해시 파일은 Cache-Control: immutable (1년), 페이지는 no-cache(ETag 재검증).
+Accept-Encoding에 따라 .br/.gz 사본을 Content-Encoding과 함께 보냅니다.
+원본이 빌드 이후 수정되었으면(개발 중) 빌드를 쓰지 않고 원본을 그대로 서빙합니다.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from config import FRONTEND_BUILD_DIR, FRONTEND_DIR
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 10
+ASSET_DIRS = ("css", "js")
+ASSET_SUFFIXES = (".css", ".js")
+PAGE_GLOBS = ("*.html", "pages/*.html")
+
+# 해시 파일: 1년 + immutable (내용이 바뀌면 이름이 바뀜)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# 따옴표 안의 .css/.js 참조 (HTML 속성, 인라인 스크립트, JS import, CSS @import)
+_REFERENCE_RE = re.compile(r"""(["'`])([^"'`\s<>()]+?\.(?:css|js))(\?[^"'`\s]*)?\1""")
+# CSS url(...) (따옴표 없는 경우 포함)
+_CSS_URL_RE = re.compile(r"""url\(\s*(["']?)([^"')\s]+?\.(?:css|js))\1\s*\)""")
+
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_HASHED_RE = re.compile(r"\.[0-9a-f]{%d}\.(?:css|js)$" % HASH_LENGTH)
+
+
+def _resolve(ref: str, base_dir: str) -> Optional[str]:
+    """참조 URL → frontend 기준 경로 (외부 URL이면 None)"""
+    if ref.startswith(("http://", "https://", "//", "data:")):
+        return None
+    if ref.startswith("/"):
+        return posixpath.normpath(ref.lstrip("/"))
+    return posixpath.normpath(posixpath.join(base_dir, ref))
+
+
+def rewrite_references(text: str, rel_path: str, mapping: Dict[str, str]) -> str:
+    """
+    text 안의 로컬 CSS/JS 참조를 해시 파일명으로 바꿉니다.
+    해시 파일은 원본과 같은 디렉토리에 있으므로 참조의 마지막 경로 조각만 바꿉니다.
+    """
+    base_dir = posixpath.dirname(rel_path)
+
+    def replace(ref: str) -> str:
+        target = _resolve(ref, base_dir)
+        if target not in mapping:
+            return ref
+        return posixpath.join(posixpath.dirname(ref), posixpath.basename(mapping[target]))
+
+    def quoted(match):
+        quote, ref, query = match.group(1), match.group(2), match.group(3) or ""
+        return f"{quote}{replace(ref)}{query}{quote}"
+
+    def css_url(match):
+        quote, ref = match.group(1), match.group(2)
+        return f"url({quote}{replace(ref)}{quote})"
+
+    text = _REFERENCE_RE.sub(quoted, text)
+    if rel_path.endswith(".css"):
+        text = _CSS_URL_RE.sub(css_url, text)
+    return text
+
+
+def _dependencies(text: str, rel_path: str, assets: Iterable[str]) -> List[str]:
+    base_dir = posixpath.dirname(rel_path)
+    assets = set(assets)
+    found = []
+    for match in list(_REFERENCE_RE.finditer(text)) + list(_CSS_URL_RE.finditer(text)):
+        target = _resolve(match.group(2), base_dir)
+        if target in assets and target != rel_path and target not in found:
+            found.append(target)
+    return found
+
+
+def hashed_name(rel_path: str, content: bytes) -> str:
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    stem, suffix = posixpath.splitext(rel_path)
+    return f"{stem}.{digest}{suffix}"
+
+
+def _write(out_dir: Path, rel_path: str, content: bytes):
+    """파일 + 압축 사본(.gz, .br)을 기록 (tmp → replace)"""
+    target = out_dir / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    variants = [(target, content), (target.with_name(target.name + ".gz"), gzip.compress(content, 9, mtime=0))]
+    if brotli is not None:
+        variants.append((target.with_name(target.name + ".br"), brotli.compress(content)))
+    for path, data in variants:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+def source_mtime(src_dir: Path = FRONTEND_DIR) -> int:
+    """빌드 대상 원본 파일들의 가장 최근 mtime (ns)"""
+    latest = 0
+    for rel_path in _asset_paths(src_dir) + _page_paths(src_dir):
+        latest = max(latest, (src_dir / rel_path).stat().st_mtime_ns)
+    return latest
+
+
+def _asset_paths(src_dir: Path) -> List[str]:
+    paths = []
+    for name in ASSET_DIRS:
+        root = src_dir / name
+        if root.exists():
+            paths.extend(
+                path.relative_to(src_dir).as_posix()
+                for path in root.rglob("*") if path.is_file() and path.suffix in ASSET_SUFFIXES
+            )
+    return sorted(paths)
+
+
+def _page_paths(src_dir: Path) -> List[str]:
+    paths = []
+    for pattern in PAGE_GLOBS:
+        paths.extend(path.relative_to(src_dir).as_posix() for path in src_dir.glob(pattern))
+    return sorted(paths)
+
+
+def build_assets(src_dir: Path = FRONTEND_DIR, out_dir: Path = FRONTEND_BUILD_DIR, clean: bool = False) -> Dict:
+    """
+    해시 파일 + 압축 사본 + 참조를 바꾼 페이지를 out_dir에 만들고 manifest를 반환합니다.
+
+    이전 빌드의 해시 파일은 지우지 않습니다 (배포 중 예전 페이지를 받은 클라이언트용, clean=True면 삭제).
+    """
+    src_dir, out_dir = Path(src_dir), Path(out_dir)
+    if clean and out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    assets = _asset_paths(src_dir)
+    sources = {rel_path: (src_dir / rel_path).read_text(encoding="utf-8") for rel_path in assets}
+    deps = {rel_path: _dependencies(text, rel_path, assets) for rel_path, text in sources.items()}
+
+    # 의존하는 파일(import 대상)부터 해시 → 참조하는 파일의 해시에 반영
+    mapping: Dict[str, str] = {}
+    visiting = set()
+
+    def visit(rel_path: str):
+        if rel_path in mapping:
+            return
+        if rel_path in visiting:
+            logger.warning(f"Circular asset reference at {rel_path}; hashing without rewritten dependency")
+            return
+        visiting.add(rel_path)
+        for dep in deps[rel_path]:
+            visit(dep)
+        content = rewrite_references(sources[rel_path], rel_path, mapping).encode("utf-8")
+        mapping[rel_path] = hashed_name(rel_path, content)
+        _write(out_dir, mapping[rel_path], content)
+        visiting.discard(rel_path)
+
+    for rel_path in assets:
+        visit(rel_path)
+
+    pages = _page_paths(src_dir)
+    for rel_path in pages:
+        text = (src_dir / rel_path).read_text(encoding="utf-8")
+        _write(out_dir, rel_path, rewrite_references(text, rel_path, mapping).encode("utf-8"))
+
+    manifest = {"assets": mapping, "pages": pages, "source_mtime": source_mtime(src_dir)}
+    tmp = out_dir / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, out_dir / MANIFEST_NAME)
+
+    logger.info(f"Built {len(mapping)} assets and {len(pages)} pages into {out_dir}"
+                f"{'' if brotli else ' (brotli not installed: .gz only)'}")
+    return manifest
+
+
+class AssetBuild:
+    """빌드 결과 (manifest) - 요청 경로를 빌드 파일과 캐시 정책으로 매핑"""
+
+    def __init__(self, out_dir: Path, manifest: Dict):
+        self.out_dir = Path(out_dir)
+        self.assets = manifest.get("assets", {})
+        self.pages = set(manifest.get("pages", []))
+
+    def resolve(self, rel_path: str) -> Optional[Tuple[Path, bool]]:
+        """
+        빌드에서 서빙할 파일을 찾습니다. 이전 빌드의 해시 파일도 포함 (배포 직전 페이지를 받은 클라이언트).
+
+        Returns:
+            (파일 경로, immutable 여부) 또는 None (빌드에 없음 → 원본 서빙)
+        """
+        if rel_path in self.pages:
+            immutable = False
+        elif _HASHED_RE.search(rel_path):
+            immutable = True
+        else:
+            return None
+        path = safe_join(str(self.out_dir), rel_path)
+        if path is None or not os.path.isfile(path):
+            return None
+        return Path(path), immutable
+
+    @staticmethod
+    def variant(path: Path, accept_encodings) -> Tuple[Path, Optional[str]]:
+        """
+        Accept-Encoding에 맞는 압축 사본 (br → gzip 순)
+
+        Returns:
+            (파일 경로, Content-Encoding 또는 None)
+        """
+        for encoding, suffix in ENCODINGS:
+            if accept_encodings[encoding] > 0:
+                candidate = path.with_name(path.name + suffix)
+                if candidate.exists():
+                    return candidate, encoding
+        return path, None
+
+
+def load_build(out_dir: Path = FRONTEND_BUILD_DIR, src_dir: Path = FRONTEND_DIR) -> Optional[AssetBuild]:
+    """
+    manifest가 있고 원본이 빌드 이후 바뀌지 않았으면 AssetBuild, 아니면 None (원본 서빙)
+    """
+    manifest_path = Path(out_dir) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable asset manifest {manifest_path}: {e}")
+        return None
+    if source_mtime(Path(src_dir)) > manifest.get("source_mtime", 0):
+        logger.warning("Frontend sources changed since the last asset build; serving sources "
+                       "(run: python frontend_assets.py)")
+        return None
+    return AssetBuild(out_dir, manifest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build fingerprinted, precompressed frontend assets")
+    parser.add_argument("--src", default=str(FRONTEND_DIR))
+    parser.add_argument("--out", default=str(FRONTEND_BUILD_DIR))
+    parser.add_argument("--clean", action="store_true", help="remove previous build output first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    out_dir = Path(args.out)
+    manifest = build_assets(Path(args.src), out_dir, clean=args.clean)
+
+    files = [out_dir / rel_path for rel_path in list(manifest["assets"].values()) + manifest["pages"]]
+    raw = sum(path.stat().st_size for path in files)
+    sizes = {"gzip": sum(path.with_name(path.name + ".gz").stat().st_size for path in files)}
+    if brotli is not None:
+        sizes["br"] = sum(path.with_name(path.name + ".br").stat().st_size for path in files)
+    print(f"{len(manifest['assets'])} assets, {len(manifest['pages'])} pages → {out_dir}")
+    print(f"  raw {raw / 1024:.0f} KB, " + ", ".join(f"{name} {size / 1024:.0f} KB" for name, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
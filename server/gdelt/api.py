@@ -7,6 +7,7 @@ Endpoints:
 - /api/global-alerts/stats/by-country - 국가별 통계
 - /api/global-alerts/stats/by-category - 카테고리별 통계
 - /api/global-alerts/trends - 트렌드 분석
+- /api/global-alerts/grid - 지도용 geohash 그리드 집계
 - /api/global-alerts/cache/clear - 캐시 초기화
 """
 
@@ -14,12 +15,19 @@ import logging
 from flask import Blueprint, request, jsonify
 
 import gdelt_backend
+from config import HTTP_CACHE_MAX_AGE_GDELT
+from http_cache import public_max_age, register_cache_policy
 
 logger = logging.getLogger(__name__)
 
 # Flask Blueprint
 gdelt_bp = Blueprint('gdelt', __name__)
 
+# HTTP 캐시: 15분마다 새 export 파일이 오므로 짧은 max-age, 이후 최신 파일 기준으로 재검증
+cache_policy = register_cache_policy(
+    gdelt_bp, public_max_age(HTTP_CACHE_MAX_AGE_GDELT), validator=gdelt_backend.get_data_version
+)
+
 
 @gdelt_bp.route('/api/global-alerts', methods=['GET'])
 def get_global_alerts():
@@ -34,7 +42,8 @@ def get_global_alerts():
     - country: 국가 코드 필터 (예: US, KR)
     - category: 카테고리 필터 (예: Material Conflict)
     - min_articles: 최소 기사 수 필터
-    - sort_by: 정렬 기준 (importance, date, tone, scale)
+    - sort_by: 정렬 기준 (importance, date, tone, scale, severity)
+    - window_hours: 최근 N시간(1~24) 롤링 윈도우에서 조회 (기본 정렬: severity)
     """
     threshold = request.args.get('threshold', -5.0, type=float)
     max_alerts = request.args.get('max_alerts', 1000, type=int)
@@ -44,10 +53,22 @@ def get_global_alerts():
     category = request.args.get('category')
     min_articles = request.args.get('min_articles', type=int)
     sort_by = request.args.get('sort_by', 'date')
+    window_hours = request.args.get('window_hours', type=int)
     
     try:
+        # 롤링 윈도우 (최근 24시간 이내) 조회
+        if window_hours:
+            result = gdelt_backend.get_window_alerts(
+                goldstein_threshold=threshold,
+                max_alerts=max_alerts,
+                hours=window_hours,
+                country=country,
+                category=category,
+                min_articles=min_articles,
+                sort_by=request.args.get('sort_by', 'severity')
+            )
         # 날짜 범위가 지정된 경우
-        if start_date and end_date:
+        elif start_date and end_date:
             result = gdelt_backend.get_alerts_by_date_range(
                 start_date=start_date,
                 end_date=end_date,
@@ -148,6 +169,47 @@ def get_trends():
         return jsonify({'error': str(e), 'trends': {}}), 500
 
 
+@gdelt_bp.route('/api/global-alerts/grid', methods=['GET'])
+def get_alert_grid():
+    """
+    지도 표시용 geohash 그리드 집계를 반환합니다 (최근 24시간 롤링 윈도우 기준).
+    
+    Parameters:
+    - zoom: 지도 줌 레벨 (기본값: 2)
+    - threshold: GoldsteinScale 임계값 (기본값: -5.0)
+    - window_hours: 조회할 시간 범위 (1~24, 기본값: 24)
+    - bbox: 화면 영역 "min_lng,min_lat,max_lng,max_lat" (선택사항)
+    """
+    zoom = request.args.get('zoom', 2, type=int)
+    threshold = request.args.get('threshold', -5.0, type=float)
+    window_hours = request.args.get('window_hours', 24, type=int)
+    bbox_param = request.args.get('bbox')
+    
+    bbox = None
+    if bbox_param:
+        try:
+            bbox = tuple(float(v) for v in bbox_param.split(','))
+            if len(bbox) != 4:
+                raise ValueError
+        except ValueError:
+            return jsonify({
+                'error': 'bbox must be "min_lng,min_lat,max_lng,max_lat"',
+                'cells': []
+            }), 400
+    
+    try:
+        result = gdelt_backend.get_alert_grid(
+            zoom=zoom,
+            goldstein_threshold=threshold,
+            hours=window_hours,
+            bbox=bbox
+        )
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Error in get_alert_grid: {e}", exc_info=True)
+        return jsonify({'error': str(e), 'cells': []}), 500
+
+
 @gdelt_bp.route('/api/global-alerts/cache/clear', methods=['POST'])
 def clear_cache():
     """캐시를 초기화합니다."""
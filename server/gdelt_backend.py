@@ -11,13 +11,22 @@ import csv
 import json
 import io
 import zipfile
-import requests
 import shutil
+import heapq
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 import logging
 from dotenv import load_dotenv
+from cache_backend import get_shared_backend
+from http_cache import VALIDATOR_TTL
+from startup import lazy_module
+from telemetry import external_call
+
+requests = lazy_module('requests')  # 다운로드 때만 import
 
 # 환경 변수 로드
 load_dotenv()
@@ -131,7 +140,7 @@ def safe_str(value: str, default: str = '') -> str:
 
 
 # GDELT 다운로드 URL
-GDELT_BASE_URL = "http://data.gdeltproject.org/gdeltv2"
+GDELT_BASE_URL = os.getenv("GDELT_BASE_URL", "http://data.gdeltproject.org/gdeltv2")
 GDELT_LASTUPDATE_URL = f"{GDELT_BASE_URL}/lastupdate.txt"
 
 # 기본 GDELT 저장 경로 (프로젝트 내부 data/gdelt로 설정)
@@ -151,6 +160,23 @@ def get_gdelt_base_path() -> Path:
     return DEFAULT_GDELT_PATH
 
 
+def _latest_export_file(base_path: Path) -> Optional[Path]:
+    """default/events/YYYYMMDD/ 중 가장 최근 export 파일 (로그 없음)"""
+    events_path = base_path / "default" / "events"
+    if not events_path.exists():
+        return None
+    
+    # 날짜 디렉토리 중 가장 최근 것 찾기
+    date_dirs = sorted([d for d in events_path.iterdir() if d.is_dir()], reverse=True)
+    
+    for date_dir in date_dirs:
+        # CSV 파일 찾기 (압축 파일 포함)
+        csv_files = list(date_dir.glob("*.export.CSV")) + list(date_dir.glob("*.export.CSV.zip"))
+        if csv_files:
+            return sorted(csv_files, reverse=True)[0]
+    return None
+
+
 def find_latest_gdelt_file(base_path: Path = None) -> Optional[Path]:
     """
     가장 최근의 GDELT Events CSV 파일을 찾습니다.
@@ -168,26 +194,33 @@ def find_latest_gdelt_file(base_path: Path = None) -> Optional[Path]:
         logger.warning(f"GDELT base path does not exist: {base_path}")
         return None
     
-    # default/events/YYYYMMDD/ 디렉토리 구조에서 최신 파일 찾기
     events_path = base_path / "default" / "events"
     if not events_path.exists():
         logger.warning(f"GDELT events path does not exist: {events_path}")
         return None
     
-    # 날짜 디렉토리 중 가장 최근 것 찾기
-    date_dirs = sorted([d for d in events_path.iterdir() if d.is_dir()], reverse=True)
+    latest_file = _latest_export_file(base_path)
+    if latest_file is None:
+        logger.warning("No GDELT CSV files found")
+        return None
     
-    for date_dir in date_dirs:
-        # CSV 파일 찾기 (압축 파일 포함)
-        csv_files = list(date_dir.glob("*.export.CSV")) + list(date_dir.glob("*.export.CSV.zip"))
-        if csv_files:
-            # 가장 최근 파일 반환
-            latest_file = sorted(csv_files, reverse=True)[0]
-            logger.info(f"Found latest GDELT file: {latest_file}")
-            return latest_file
+    logger.info(f"Found latest GDELT file: {latest_file}")
+    return latest_file
+
+
+def get_data_version(base_path: Path = None) -> Optional[str]:
+    """
+    HTTP 캐시 검증자: 최신 export 파일 이름 + mtime
     
-    logger.warning("No GDELT CSV files found")
-    return None
+    알림/통계/롤링 윈도우는 모두 디스크의 export 파일에서 만들어지고, 윈도우 만료도
+    최신 슬라이스 기준이므로 새 파일이 오기 전까지 응답이 바뀌지 않습니다.
+    """
+    if base_path is None:
+        base_path = get_gdelt_base_path()
+    latest_file = _latest_export_file(base_path)
+    if latest_file is None:
+        return None
+    return f"{latest_file.name}:{latest_file.stat().st_mtime_ns}"
 
 
 def parse_gdelt_events(
@@ -620,7 +653,8 @@ def get_latest_gdelt_file_url() -> Optional[str]:
         최신 파일 URL 또는 None
     """
     try:
-        response = requests.get(GDELT_LASTUPDATE_URL, timeout=10)
+        with external_call('gdelt'):
+            response = requests.get(GDELT_LASTUPDATE_URL, timeout=10)
         if response.status_code == 200:
             # lastupdate.txt 형식: 
             # 78857 e097bd4fb117a0ca51716cf09f16bea2 http://data.gdeltproject.org/gdeltv2/20251230020000.export.CSV.zip
@@ -687,12 +721,13 @@ def download_gdelt_file(file_url: str = None, base_path: Path = None) -> Optiona
         
         # 파일 다운로드
         logger.info(f"Downloading GDELT file: {file_url}")
-        response = requests.get(file_url, timeout=60, stream=True)
-        response.raise_for_status()
-        
-        # 파일 저장
-        with open(save_path, 'wb') as f:
-            shutil.copyfileobj(response.raw, f)
+        with external_call('gdelt'):
+            response = requests.get(file_url, timeout=60, stream=True)
+            response.raise_for_status()
+            
+            # 파일 저장
+            with open(save_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f)
         
         logger.info(f"Downloaded GDELT file: {save_path}")
         return save_path
@@ -759,9 +794,530 @@ def cleanup_old_gdelt_data(base_path: Path = None, keep_days: int = 2) -> int:
     return deleted_count
 
 
+# ============================================================================
+# 롤링 24시간 알림 윈도우 (15분 슬라이스 96개)
+# ============================================================================
+
+WINDOW_SLICES = 96                   # 24시간 = 15분 × 96
+WINDOW_GOLDSTEIN_THRESHOLD = -4.0    # 윈도우에 보관할 최소 심각도 (이하 값만 보관)
+WINDOW_MAX_EVENTS_PER_SLICE = 100000
+
+
+def _severity_key(event: Dict):
+    """심각도 정렬 키: GoldsteinScale 오름차순, 같으면 기사 수 내림차순"""
+    return (event.get('goldstein_scale', 0), -(event.get('num_articles') or 0))
+
+
+def _slice_key_from_path(file_path: Path) -> Optional[str]:
+    """파일명(YYYYMMDDHHMMSS.export.CSV.zip)에서 슬라이스 키(YYYYMMDDHHMMSS)를 추출"""
+    key = file_path.name.split('.')[0]
+    if len(key) == 14 and key.isdigit():
+        return key
+    return None
+
+
+# ============================================================================
+# 지도용 그리드 집계 (geohash 셀)
+# ============================================================================
+
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GRID_PRECISIONS = (1, 2, 3, 4, 5, 6)
+
+
+def encode_geohash(lat: float, lng: float, precision: int) -> str:
+    """위도/경도를 geohash 문자열로 변환합니다."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_range[0] = mid
+            else:
+                bits <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    
+    return ''.join(chars)
+
+
+# (최대 줌 레벨, geohash 정밀도) - 셀 크기가 화면 타일 크기와 비슷하도록 선택
+_ZOOM_PRECISION_STEPS = ((1, 1), (2, 2), (4, 3), (7, 4), (10, 5))
+
+
+def zoom_to_geohash_precision(zoom: int) -> int:
+    """지도 줌 레벨(0~20)을 geohash 정밀도로 변환합니다."""
+    for max_zoom, precision in _ZOOM_PRECISION_STEPS:
+        if zoom <= max_zoom:
+            return precision
+    return GRID_PRECISIONS[-1]
+
+
+def _new_cell() -> Dict:
+    return {'count': 0, 'min_goldstein': None, 'lat_sum': 0.0, 'lng_sum': 0.0, 'categories': {}}
+
+
+def _add_event_to_cell(cell: Dict, event: Dict):
+    goldstein = event.get('goldstein_scale', 0)
+    cell['count'] += 1
+    if cell['min_goldstein'] is None or goldstein < cell['min_goldstein']:
+        cell['min_goldstein'] = goldstein
+    cell['lat_sum'] += event['lat']
+    cell['lng_sum'] += event['lng']
+    category = event.get('category', 'Unknown')
+    cell['categories'][category] = cell['categories'].get(category, 0) + 1
+
+
+def _merge_cell(target: Dict, source: Dict):
+    target['count'] += source['count']
+    if target['min_goldstein'] is None or source['min_goldstein'] < target['min_goldstein']:
+        target['min_goldstein'] = source['min_goldstein']
+    target['lat_sum'] += source['lat_sum']
+    target['lng_sum'] += source['lng_sum']
+    for category, count in source['categories'].items():
+        target['categories'][category] = target['categories'].get(category, 0) + count
+
+
+def build_grid_index(events: List[Dict], precisions=GRID_PRECISIONS) -> Dict[int, Dict[str, Dict]]:
+    """
+    이벤트 목록을 정밀도별 geohash 셀 집계로 변환합니다.
+    
+    Returns:
+        {precision: {geohash: cell_aggregate}}
+    """
+    max_precision = max(precisions)
+    grid = {precision: {} for precision in precisions}
+    
+    for event in events:
+        # 가장 긴 geohash 하나만 계산하고 접두사로 상위 셀을 얻음
+        full_hash = encode_geohash(event['lat'], event['lng'], max_precision)
+        for precision in precisions:
+            cells = grid[precision]
+            key = full_hash[:precision]
+            cell = cells.get(key)
+            if cell is None:
+                cell = cells[key] = _new_cell()
+            _add_event_to_cell(cell, event)
+    
+    return grid
+
+
+def _serialize_cells(cells: Dict[str, Dict], bbox: Optional[tuple] = None) -> List[Dict]:
+    """셀 집계를 응답용 compact 형식으로 변환 (bbox: min_lng, min_lat, max_lng, max_lat)"""
+    result = []
+    for key, cell in cells.items():
+        lat = round(cell['lat_sum'] / cell['count'], 4)
+        lng = round(cell['lng_sum'] / cell['count'], 4)
+        if bbox and not (bbox[0] <= lng <= bbox[2] and bbox[1] <= lat <= bbox[3]):
+            continue
+        result.append({
+            'cell': key,
+            'lat': lat,
+            'lng': lng,
+            'count': cell['count'],
+            'min_goldstein': cell['min_goldstein'],
+            'category': max(cell['categories'].items(), key=lambda x: x[1])[0],
+        })
+    result.sort(key=lambda c: c['count'], reverse=True)
+    return result
+
+
+class RollingAlertWindow:
+    """
+    최근 24시간 GDELT 알림을 15분 슬라이스 단위로 유지하는 링 버퍼.
+    
+    - 새 export 파일이 도착하면 해당 슬라이스만 파싱하여 추가
+    - 슬라이스 내부 이벤트는 심각도 순으로 미리 정렬
+    - 만료된 슬라이스는 자동으로 제거 (deque maxlen + 24시간 기준)
+    - 조회 시 슬라이스들을 k-way merge 하여 상위 N개만 꺼냄
+    - 슬라이스별 geohash 그리드 집계를 미리 계산 (지도 줌/이동은 집계만 병합)
+    """
+    
+    def __init__(self, max_slices: int = WINDOW_SLICES,
+                 goldstein_threshold: float = WINDOW_GOLDSTEIN_THRESHOLD):
+        self.max_slices = max_slices
+        self.goldstein_threshold = goldstein_threshold
+        self._slices = deque(maxlen=max_slices)  # (slice_key, events, grid) - 오래된 것부터
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._slices)
+    
+    def slice_keys(self) -> List[str]:
+        with self._lock:
+            return [key for key, *_ in self._slices]
+    
+    def add_file(self, file_path: Path) -> bool:
+        """
+        export 파일 하나를 새 슬라이스로 추가합니다.
+        
+        Returns:
+            추가되었으면 True (이미 있거나 오래된 파일이면 False)
+        """
+        slice_key = _slice_key_from_path(file_path)
+        if slice_key is None:
+            logger.warning(f"Skipping GDELT file with unexpected name: {file_path.name}")
+            return False
+        
+        with self._lock:
+            if any(key == slice_key for key, *_ in self._slices):
+                return False
+            if self._slices and slice_key < self._slices[0][0] and len(self._slices) == self.max_slices:
+                return False
+        
+        # 파싱은 락 밖에서 수행 (조회를 막지 않도록)
+        events = parse_gdelt_events(file_path, self.goldstein_threshold, WINDOW_MAX_EVENTS_PER_SLICE)
+        events.sort(key=_severity_key)
+        grid = build_grid_index(events)
+        
+        with self._lock:
+            slices = [s for s in self._slices if s[0] != slice_key]
+            slices.append((slice_key, events, grid))
+            slices.sort(key=lambda s: s[0])
+            self._slices = deque(self._expire(slices), maxlen=self.max_slices)
+        
+        logger.info(f"Alert window: added slice {slice_key} ({len(events)} events, {len(self._slices)} slices)")
+        return True
+    
+    def _expire(self, slices: List) -> List:
+        """최신 슬라이스 기준 24시간이 지난 슬라이스를 제거"""
+        if not slices:
+            return slices
+        newest = datetime.strptime(slices[-1][0], '%Y%m%d%H%M%S')
+        cutoff = (newest - timedelta(minutes=15 * self.max_slices)).strftime('%Y%m%d%H%M%S')
+        return [s for s in slices if s[0] > cutoff][-self.max_slices:]
+    
+    def rebuild(self, base_path: Path = None) -> int:
+        """
+        디스크에 남아 있는 export 파일로 윈도우를 다시 채웁니다 (서버 시작 시).
+        
+        Returns:
+            로드된 슬라이스 수
+        """
+        if base_path is None:
+            base_path = get_gdelt_base_path()
+        
+        events_path = base_path / "default" / "events"
+        if not events_path.exists():
+            return 0
+        
+        files = {}
+        for date_dir in events_path.iterdir():
+            if not date_dir.is_dir():
+                continue
+            for file_path in list(date_dir.glob("*.export.CSV")) + list(date_dir.glob("*.export.CSV.zip")):
+                slice_key = _slice_key_from_path(file_path)
+                if slice_key:
+                    files[slice_key] = file_path
+        
+        for slice_key in sorted(files)[-self.max_slices:]:
+            self.add_file(files[slice_key])
+        
+        return len(self._slices)
+    
+    def top_alerts(
+        self,
+        max_alerts: int = 1000,
+        goldstein_threshold: float = None,
+        hours: Optional[int] = None,
+        country: Optional[str] = None,
+        category: Optional[str] = None,
+        min_articles: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        윈도우 전체에서 심각도 순 상위 N개 알림을 반환합니다.
+        
+        각 슬라이스가 이미 정렬되어 있으므로 heapq.merge로 지연 병합하고,
+        N개를 채우거나 임계값을 넘으면 즉시 멈춥니다.
+        
+        Args:
+            max_alerts: 최대 알림 수
+            goldstein_threshold: GoldsteinScale 임계값 (윈도우 임계값보다 느슨하면 윈도우 값 사용)
+            hours: 최근 몇 시간만 볼지 (None이면 전체 24시간)
+            country, category, min_articles: filter_events와 동일한 필터
+        """
+        if goldstein_threshold is None or goldstein_threshold > self.goldstein_threshold:
+            goldstein_threshold = self.goldstein_threshold
+        
+        with self._lock:
+            slices = list(self._slices)
+        
+        if hours is not None and slices:
+            newest = datetime.strptime(slices[-1][0], '%Y%m%d%H%M%S')
+            cutoff = (newest - timedelta(hours=hours)).strftime('%Y%m%d%H%M%S')
+            slices = [s for s in slices if s[0] > cutoff]
+        
+        country_upper = country.upper() if country else None
+        results = []
+        
+        for event in heapq.merge(*(events for _, events, _ in slices), key=_severity_key):
+            if event.get('goldstein_scale', 0) > goldstein_threshold:
+                break
+            if country_upper and country_upper not in (
+                event.get('country_code', '').upper(),
+                event.get('actor1_country', '').upper(),
+                event.get('actor2_country', '').upper()
+            ):
+                continue
+            if category and event.get('category', '') != category:
+                continue
+            if min_articles is not None and event.get('num_articles', 0) < min_articles:
+                continue
+            
+            results.append(event)
+            if len(results) >= max_alerts:
+                break
+        
+        return results
+    
+    def grid(
+        self,
+        precision: int,
+        goldstein_threshold: float = None,
+        hours: Optional[int] = None,
+        bbox: Optional[tuple] = None
+    ) -> List[Dict]:
+        """
+        윈도우 전체의 geohash 셀 집계를 반환합니다.
+        
+        임계값이 윈도우 임계값과 같으면 슬라이스별 사전 집계만 병합하고,
+        더 엄격하면 정렬된 이벤트의 앞부분(임계값 이하)만 다시 집계합니다.
+        
+        Args:
+            precision: geohash 정밀도 (GRID_PRECISIONS 중 하나)
+            goldstein_threshold: GoldsteinScale 임계값
+            hours: 최근 몇 시간만 볼지 (None이면 전체 24시간)
+            bbox: (min_lng, min_lat, max_lng, max_lat) 화면 영역 필터
+        """
+        if precision not in GRID_PRECISIONS:
+            raise ValueError(f"precision must be one of {GRID_PRECISIONS}")
+        if goldstein_threshold is None or goldstein_threshold > self.goldstein_threshold:
+            goldstein_threshold = self.goldstein_threshold
+        
+        with self._lock:
+            slices = list(self._slices)
+        
+        if hours is not None and slices:
+            newest = datetime.strptime(slices[-1][0], '%Y%m%d%H%M%S')
+            cutoff = (newest - timedelta(hours=hours)).strftime('%Y%m%d%H%M%S')
+            slices = [s for s in slices if s[0] > cutoff]
+        
+        merged = {}
+        for _, events, grid in slices:
+            if goldstein_threshold < self.goldstein_threshold:
+                prefix = []
+                for event in events:
+                    if event.get('goldstein_scale', 0) > goldstein_threshold:
+                        break
+                    prefix.append(event)
+                cells = build_grid_index(prefix, precisions=(precision,))[precision]
+            else:
+                cells = grid[precision]
+            
+            for key, cell in cells.items():
+                target = merged.get(key)
+                if target is None:
+                    target = merged[key] = _new_cell()
+                _merge_cell(target, cell)
+        
+        return _serialize_cells(merged, bbox)
+    
+    def clear(self):
+        with self._lock:
+            self._slices.clear()
+
+
+_alert_window = RollingAlertWindow()
+_alert_window_loaded = False
+_alert_window_lock = threading.Lock()
+_alert_window_version: Optional[str] = None  # 윈도우가 반영한 디스크 데이터 버전 (get_data_version)
+_data_version_checked = (0.0, None, None)  # (만료 시각, base_path, 버전)
+
+
+def _recent_data_version(base_path: Path) -> Optional[str]:
+    """get_data_version을 VALIDATOR_TTL 동안 재사용 (요청마다 events 디렉토리를 훑지 않도록)"""
+    global _data_version_checked
+    
+    now = time.monotonic()
+    expires, checked_path, version = _data_version_checked
+    if now < expires and checked_path == base_path:
+        return version
+    version = get_data_version(base_path)
+    _data_version_checked = (now + VALIDATOR_TTL, base_path, version)
+    return version
+
+
+def get_alert_window(base_path: Path = None) -> RollingAlertWindow:
+    """롤링 알림 윈도우를 반환합니다 (최초 호출 시 디스크에서 채움)."""
+    global _alert_window_loaded, _alert_window_version
+    
+    if base_path is None:
+        base_path = get_gdelt_base_path()
+    
+    if not _alert_window_loaded:
+        with _alert_window_lock:
+            if not _alert_window_loaded:
+                _alert_window_version = get_data_version(base_path)
+                loaded = _alert_window.rebuild(base_path)
+                logger.info(f"Alert window rebuilt from disk: {loaded} slices")
+                _alert_window_loaded = True
+        return _alert_window
+    
+    # 다운로드는 스케줄러 lease를 가진 워커만 하므로, 다른 워커는 디스크의 새 파일을 따라잡음
+    # (HTTP ETag가 디스크의 최신 파일 기준이라 윈도우가 뒤처지면 옛 응답이 새 ETag로 캐시됨)
+    # 새 파일은 15분에 한 번이므로 확인은 VALIDATOR_TTL마다, 따라잡기는 잠금 안에서 한 요청만
+    version = _recent_data_version(base_path)
+    if version != _alert_window_version:
+        with _alert_window_lock:
+            if version != _alert_window_version:
+                latest_file = _latest_export_file(base_path)
+                slice_key = _slice_key_from_path(latest_file) if latest_file else None
+                keys = _alert_window.slice_keys()
+                if slice_key and (not keys or slice_key > keys[-1]):
+                    _alert_window.rebuild(base_path)
+                _alert_window_version = version
+    
+    return _alert_window
+
+
+def get_window_alerts(
+    goldstein_threshold: float = -5.0,
+    max_alerts: int = 1000,
+    hours: int = 24,
+    base_path: Path = None,
+    country: Optional[str] = None,
+    category: Optional[str] = None,
+    min_articles: Optional[int] = None,
+    sort_by: str = 'severity'
+) -> Dict:
+    """
+    최근 N시간(최대 24시간) 긴급 알림을 롤링 윈도우에서 가져옵니다.
+    
+    Args:
+        goldstein_threshold: GoldsteinScale 임계값
+        max_alerts: 최대 알림 수
+        hours: 조회할 시간 범위 (1~24)
+        sort_by: 'severity'(기본, 병합 순서 그대로) 또는 sort_events 기준
+        
+    Returns:
+        알림 데이터 딕셔너리
+    """
+    window = get_alert_window(base_path)
+    hours = max(1, min(hours, WINDOW_SLICES // 4))
+    
+    if len(window) == 0:
+        return {
+            'error': 'No GDELT data file found',
+            'alerts': [],
+            'count': 0,
+            'last_updated': None
+        }
+    
+    events = window.top_alerts(
+        max_alerts=max_alerts,
+        goldstein_threshold=goldstein_threshold,
+        hours=hours,
+        country=country,
+        category=category,
+        min_articles=min_articles
+    )
+    
+    if sort_by != 'severity':
+        events = sort_events(events, sort_by=sort_by)
+    
+    slice_keys = window.slice_keys()
+    
+    return {
+        'alerts': events,
+        'count': len(events),
+        'last_updated': datetime.now().isoformat(),
+        'window': {
+            'hours': hours,
+            'slices': len(slice_keys),
+            'oldest_slice': slice_keys[0] if slice_keys else None,
+            'newest_slice': slice_keys[-1] if slice_keys else None,
+        },
+        'threshold': min(goldstein_threshold, window.goldstein_threshold),
+        'filters': {
+            'country': country,
+            'category': category,
+            'min_articles': min_articles,
+            'sort_by': sort_by
+        }
+    }
+
+
+def get_alert_grid(
+    zoom: int = 2,
+    goldstein_threshold: float = -5.0,
+    hours: int = 24,
+    bbox: Optional[tuple] = None,
+    base_path: Path = None
+) -> Dict:
+    """
+    지도 표시용 geohash 그리드 집계를 반환합니다.
+    
+    이벤트 원본 대신 셀별 개수, 최소 GoldsteinScale, 대표 카테고리만 반환하므로
+    응답 크기가 이벤트 목록보다 크게 줄어듭니다.
+    
+    Args:
+        zoom: 지도 줌 레벨 (0~20)
+        goldstein_threshold: GoldsteinScale 임계값
+        hours: 조회할 시간 범위 (1~24)
+        bbox: (min_lng, min_lat, max_lng, max_lat) 화면 영역 필터
+        
+    Returns:
+        그리드 집계 딕셔너리
+    """
+    window = get_alert_window(base_path)
+    hours = max(1, min(hours, WINDOW_SLICES // 4))
+    precision = zoom_to_geohash_precision(zoom)
+    
+    if len(window) == 0:
+        return {
+            'error': 'No GDELT data file found',
+            'cells': [],
+            'count': 0,
+            'last_updated': None
+        }
+    
+    cells = window.grid(precision, goldstein_threshold=goldstein_threshold, hours=hours, bbox=bbox)
+    
+    return {
+        'cells': cells,
+        'count': len(cells),
+        'total_events': sum(c['count'] for c in cells),
+        'zoom': zoom,
+        'precision': precision,
+        'hours': hours,
+        'threshold': min(goldstein_threshold, window.goldstein_threshold),
+        'last_updated': datetime.now().isoformat()
+    }
+
+
 def update_gdelt_data() -> Dict:
     """
-    GDELT 데이터를 업데이트합니다 (다운로드 + 정리).
+    GDELT 데이터를 업데이트합니다 (다운로드 + 롤링 윈도우 갱신 + 정리).
     
     Returns:
         업데이트 결과 딕셔너리
@@ -779,6 +1335,9 @@ def update_gdelt_data() -> Dict:
         if downloaded_file:
             result['downloaded'] = True
             result['file_path'] = str(downloaded_file)
+            
+            # 새 슬라이스만 윈도우에 반영 (만료 슬라이스는 자동 제거)
+            result['window_updated'] = get_alert_window().add_file(downloaded_file)
         
         # 오래된 데이터 정리
         deleted_count = cleanup_old_gdelt_data()
@@ -1019,6 +1578,10 @@ def get_trends(
 _cache = {}
 _cache_timestamps = {}
 CACHE_TTL = 300  # 5분
+CACHE_NAMESPACE = 'gdelt'
+
+# 워커 간 공유 캐시 (CACHE_BACKEND_URL 미설정 시 None → 위의 프로세스 내 dict 사용)
+_shared_cache = get_shared_backend()
 
 
 def _get_cache_key(func_name: str, **kwargs) -> str:
@@ -1045,6 +1608,8 @@ def clear_cache():
     global _cache, _cache_timestamps
     _cache.clear()
     _cache_timestamps.clear()
+    if _shared_cache is not None:
+        _shared_cache.invalidate(CACHE_NAMESPACE)
 
 
 def get_cached_alerts(
@@ -1069,7 +1634,12 @@ def get_cached_alerts(
         sort_by=sort_by
     )
     
-    if _is_cache_valid(cache_key):
+    if _shared_cache is not None:
+        cached = _shared_cache.get(CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            logger.debug(f"Shared cache hit: {cache_key}")
+            return cached
+    elif _is_cache_valid(cache_key):
         logger.debug(f"Cache hit: {cache_key}")
         return _cache[cache_key]
     
@@ -1084,8 +1654,11 @@ def get_cached_alerts(
         sort_by=sort_by
     )
     
-    _cache[cache_key] = result
-    _cache_timestamps[cache_key] = datetime.now().timestamp()
+    if _shared_cache is not None:
+        _shared_cache.set(CACHE_NAMESPACE, cache_key, result, CACHE_TTL)
+    else:
+        _cache[cache_key] = result
+        _cache_timestamps[cache_key] = datetime.now().timestamp()
     
     return result
 
@@ -11,6 +11,8 @@ from typing import Optional, Dict, List, Any
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
+from telemetry import external_call
+
 load_dotenv()
 
 # 로깅 설정
@@ -19,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 # Gemini API Key
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_API_BASE_URL = os.getenv("GEMINI_API_BASE_URL")  # 부하 테스트용 로컬 스텁 (loadtest.stubs)
 
 # Gemini SDK 및 Tool 모듈 로드
 genai = None
@@ -28,7 +31,11 @@ try:
     import google.generativeai as genai
     from google.generativeai.types import FunctionDeclaration, Tool
     if GEMINI_API_KEY:
-        genai.configure(api_key=GEMINI_API_KEY)
+        if GEMINI_API_BASE_URL:
+            genai.configure(api_key=GEMINI_API_KEY, transport="rest",
+                            client_options={"api_endpoint": GEMINI_API_BASE_URL})
+        else:
+            genai.configure(api_key=GEMINI_API_KEY)
         GEMINI_AVAILABLE = True
         logger.info("Gemini API configured successfully")
     else:
@@ -1136,7 +1143,8 @@ def chat_with_gemini(session_id: str, user_message: str) -> Dict[str, Any]:
         
         # 첫 번째 메시지 전송
         logger.info(f"[DEBUG] Sending message to Gemini: {user_message[:100]}...")
-        response = chat.send_message(user_message)
+        with external_call('gemini'):
+            response = chat.send_message(user_message)
         
         # 응답 디버그 로그
         logger.info(f"[DEBUG] Gemini response received")
@@ -1190,11 +1198,12 @@ def chat_with_gemini(session_id: str, user_message: str) -> Dict[str, Any]:
                     })
                 
                 # function_response 형식으로 전달
-                final_response = chat.send_message(
-                    content_types.to_content({
-                        "parts": [{"function_response": fr} for fr in function_responses]
-                    })
-                )
+                with external_call('gemini'):
+                    final_response = chat.send_message(
+                        content_types.to_content({
+                            "parts": [{"function_response": fr} for fr in function_responses]
+                        })
+                    )
                 ai_message = safe_get_response_text(final_response)
                 
                 # 텍스트가 비어있으면 Tool 결과 직접 사용
@@ -1204,7 +1213,8 @@ def chat_with_gemini(session_id: str, user_message: str) -> Dict[str, Any]:
             except Exception as e:
                 logger.warning(f"Function response failed, using fallback: {e}")
                 # 폴백: 직접 컨텍스트로 전달
-                final_response = chat.send_message(follow_up)
+                with external_call('gemini'):
+                    final_response = chat.send_message(follow_up)
                 ai_message = safe_get_response_text(final_response)
                 
                 if not ai_message.strip():
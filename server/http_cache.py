@@ -0,0 +1,187 @@
+"""
+HTTP Cache Policies
+블루프린트별 Cache-Control 정책과 ETag / 304 조건부 응답
+
+    register_cache_policy(kcci_bp, NO_CACHE, validator=lambda: sqlite_table_version(db_path, ['kcci_index']))
+
+- validator: 데이터가 바뀔 때만 달라지는 짧은 문자열(MAX(collected_at) + COUNT, 파일 mtime 등)을 돌려주는 함수.
+  ETag = hash(블루프린트, validator 값, 오늘 날짜, 경로+쿼리) 이므로 If-None-Match가 맞으면
+  뷰(DB 쿼리, 직렬화)를 실행하지 않고 before_request에서 바로 304를 돌려줍니다.
+  오늘 날짜를 넣는 이유: 기간 필터(1M, 3M…)가 date.today() 기준이라 날짜가 바뀌면 결과도 바뀜
+- validator가 없거나 실패하면 응답 본문 해시로 ETag를 만들어 본문 전송만 절약합니다 (make_conditional).
+- 정책이 없는 엔드포인트, 오류 응답, GET/HEAD가 아닌 요청은 Cache-Control: no-store.
+  쓰기 요청이 끝나면 그 블루프린트의 validator 재사용 값을 버립니다.
+- 뷰가 직접 ETag/Cache-Control을 붙인 응답(send_file 등)은 그대로 둡니다.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from datetime import date
+from typing import Callable, Iterable, Optional
+
+from flask import current_app, g, request
+
+logger = logging.getLogger(__name__)
+
+NO_STORE = "no-store"
+NO_CACHE = "no-cache"  # 저장은 하되 매번 재검증 (변경 없으면 304)
+
+# validator 결과를 프로세스 안에서 재사용하는 시간 (요청마다 DB를 보지 않도록)
+VALIDATOR_TTL = 2.0
+
+_CACHEABLE_METHODS = ("GET", "HEAD")
+_ETAG_KEY = "http_cache_etag"
+
+
+def public_max_age(seconds: int) -> str:
+    """max-age 동안은 재검증 없이 사용, 이후에는 ETag로 재검증"""
+    return f"public, max-age={int(seconds)}"
+
+
+class CachePolicy:
+    """블루프린트 하나의 Cache-Control + ETag 정책"""
+
+    def __init__(self, name: str, cache_control: str,
+                 validator: Optional[Callable[[], Optional[str]]] = None,
+                 exempt: Iterable[str] = (), validator_ttl: float = VALIDATOR_TTL):
+        self.name = name
+        self.cache_control = cache_control
+        self.validator = validator
+        self.exempt = set(exempt)
+        self.validator_ttl = validator_ttl
+        self._version = None
+        self._version_expires = 0.0
+
+    def version(self) -> Optional[str]:
+        """validator 값 (validator_ttl 동안 재사용, 실패 시 None)"""
+        if self.validator is None:
+            return None
+        now = time.monotonic()
+        if now >= self._version_expires:
+            try:
+                self._version = self.validator()
+            except Exception as e:
+                logger.debug(f"Cache validator failed for {self.name}: {e}")
+                self._version = None
+            self._version_expires = now + self.validator_ttl
+        return self._version
+
+    def invalidate(self):
+        """다음 요청에서 validator를 다시 실행합니다 (같은 프로세스에서 데이터를 바꾼 직후)."""
+        self._version_expires = 0.0
+
+    def etag_for(self, version: str) -> str:
+        key = "\0".join((self.name, version, date.today().isoformat(), request.full_path))
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:24]
+
+    def _cacheable(self) -> bool:
+        return (request.method in _CACHEABLE_METHODS
+                and self.cache_control != NO_STORE
+                and request.endpoint not in self.exempt)
+
+    def before_request(self):
+        if not self._cacheable():
+            return None
+        version = self.version()
+        if version is None:
+            return None
+
+        etag = self.etag_for(version)
+        g.setdefault(_ETAG_KEY, etag)
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = self.cache_control
+            return response
+        return None
+
+    def after_request(self, response):
+        if request.endpoint in self.exempt or response.status_code == 304:
+            return response
+        if request.method not in _CACHEABLE_METHODS:
+            # 같은 블루프린트의 쓰기 요청(수집, 임포트, 리포트 수정) 직후 GET이 예전 ETag로 304 받지 않도록
+            self.invalidate()
+            response.headers.setdefault("Cache-Control", NO_STORE)
+            return response
+        if response.status_code != 200:
+            response.headers.setdefault("Cache-Control", NO_STORE)
+            return response
+
+        response.headers.setdefault("Cache-Control", self.cache_control)
+        if self.cache_control == NO_STORE or response.headers.get("ETag"):
+            return response
+
+        etag = g.get(_ETAG_KEY)
+        if etag:
+            response.set_etag(etag, weak=True)
+        elif not response.is_streamed:
+            response.add_etag(weak=True)
+            response.make_conditional(request)
+        return response
+
+
+def register_cache_policy(blueprint, cache_control: str,
+                          validator: Optional[Callable[[], Optional[str]]] = None,
+                          exempt: Iterable[str] = ()) -> CachePolicy:
+    """
+    블루프린트에 캐시 정책을 등록합니다.
+
+    Args:
+        blueprint: Flask Blueprint
+        cache_control: Cache-Control 값 (NO_STORE, NO_CACHE, public_max_age(n))
+        validator: 데이터 버전 문자열을 돌려주는 함수 (없으면 본문 해시 ETag)
+        exempt: 정책을 적용하지 않을 엔드포인트 이름 (예: 'reports.download_report')
+    """
+    policy = CachePolicy(blueprint.name, cache_control, validator, exempt)
+    blueprint.before_request(policy.before_request)
+    blueprint.after_request(policy.after_request)
+    return policy
+
+
+def init_http_cache(app):
+    """정책이 없는 응답(다른 블루프린트, 404 등)의 기본값: no-store"""
+
+    @app.after_request
+    def default_cache_control(response):
+        response.headers.setdefault("Cache-Control", NO_STORE)
+        return response
+
+    return app
+
+
+# ============================================================
+# Validators
+# ============================================================
+
+def sqlite_table_version(db_path: str, tables: Iterable[str], column: str = "collected_at") -> Optional[str]:
+    """테이블별 MAX(column) + COUNT(*) (DB 파일이 없으면 None)"""
+    if not os.path.exists(db_path):
+        return None
+    # 읽기 전용 연결 (검증자 때문에 빈 DB 파일이 생기거나 PRAGMA가 쓰기를 시도하지 않도록)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        parts = [
+            conn.execute(f"SELECT MAX({column}), COUNT(*) FROM {table}").fetchone()
+            for table in tables
+        ]
+    finally:
+        conn.close()
+    return repr(parts)
+
+
+def file_version(*paths: str) -> Optional[str]:
+    """파일들의 (mtime_ns, size) - SQLite는 db와 -wal을 함께 넘깁니다 (첫 파일이 없으면 None)"""
+    parts = []
+    for i, path in enumerate(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if i == 0:
+                return None
+            parts.append("-")
+            continue
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return ",".join(parts)
@@ -5,7 +5,6 @@ KCCI (Korea Container Freight Index) Module
 """
 
 from .models import KCCIIndex, KCCIRouteIndex, KCCICollectionLog, init_kcci_database, get_kcci_session
-from .collector import KCCICollector
 from .api import kcci_bp
 
 __all__ = [
@@ -18,3 +17,10 @@ __all__ = [
     'get_kcci_session',
 ]
 
+
+def __getattr__(name):
+    # 수집기(requests, BeautifulSoup)는 수집할 때 import
+    if name == 'KCCICollector':
+        from .collector import KCCICollector
+        return KCCICollector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
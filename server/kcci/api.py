@@ -8,15 +8,29 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime, date, timedelta
 from typing import Optional
 import logging
+import os
 
 from .models import KCCIIndex, KCCIRouteIndex, KCCICollectionLog, get_kcci_session, init_kcci_database
-from .collector import KCCICollector, collect_kcci_and_save
+from timeseries import MIN_POINTS, chart_cache, downsample_rows
+from sqlite_profile import connect as sqlite_connect
+from http_cache import NO_CACHE, register_cache_policy, sqlite_table_version
+
+# 차트 캐시 네임스페이스 (수집 시 무효화)
+CHART_CACHE_NAMESPACE = 'kcci'
 
 logger = logging.getLogger(__name__)
 
 # Flask Blueprint
 kcci_bp = Blueprint('kcci', __name__, url_prefix='/api/kcci')
 
+KCCI_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'kcci.db')
+
+# HTTP 캐시: 수동 수집 버튼이 있으므로 매번 재검증 (수집 시각/행 수가 그대로면 쿼리 없이 304)
+cache_policy = register_cache_policy(
+    kcci_bp, NO_CACHE,
+    validator=lambda: sqlite_table_version(KCCI_DB_PATH, ('kcci_index', 'kcci_route_index')),
+)
+
 
 @kcci_bp.route('/comprehensive', methods=['GET'])
 def get_comprehensive_index():
@@ -40,7 +54,7 @@ def get_comprehensive_index():
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         db_path = os.path.join(base_dir, 'kcci.db')
         
-        conn = sqlite3.connect(db_path)
+        conn = sqlite_connect(db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -213,7 +227,7 @@ def get_latest_route_indices():
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         db_path = os.path.join(base_dir, 'kcci.db')
         
-        conn = sqlite3.connect(db_path)
+        conn = sqlite_connect(db_path)
         conn.row_factory = sqlite3.Row  # 컬럼 이름으로 접근 가능하게
         cursor = conn.cursor()
         
@@ -287,6 +301,8 @@ def trigger_collection():
     - data: 수집된 데이터 요약
     """
     try:
+        from .collector import collect_kcci_and_save  # requests/BeautifulSoup: 수집 때만 import
+        
         result = collect_kcci_and_save()
         
         return jsonify({
@@ -423,6 +439,8 @@ def get_chart_data():
     - period: 기간 (3M, 6M, 1Y, ALL, 기본값: 6M)
     - route_codes: 항로 코드 리스트 (콤마 구분, 선택)
     - include_routes: 항로별 데이터 포함 여부 (기본값: false)
+    - max_points: 시계열별 최대 점 개수 (LTTB 다운샘플링, 선택)
+    - compact: true이면 중복 배열(comprehensive.data) 제외 (기본값: false)
     
     Returns:
     - comprehensive: 종합지수 시계열 데이터
@@ -435,17 +453,26 @@ def get_chart_data():
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         db_path = os.path.join(base_dir, 'kcci.db')
         
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         # 파라미터 파싱
         period = request.args.get('period', '6M')
         route_codes = request.args.get('route_codes', '')
         include_routes = request.args.get('include_routes', 'false').lower() == 'true'
+        compact = request.args.get('compact', 'false').lower() == 'true'
+        max_points = request.args.get('max_points', type=int)
+        max_points = max(max_points, MIN_POINTS) if max_points and max_points > 0 else None
         
         # 기간 계산
         end_date = date.today()
+        
+        cache_key = ('chart-data', period, route_codes, include_routes, max_points, compact, end_date.isoformat())
+        cached = chart_cache.get(CHART_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return jsonify(cached)
+        
+        conn = sqlite_connect(db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
         if period == '3M':
             start_date = end_date - timedelta(days=90)
         elif period == '6M':
@@ -477,6 +504,9 @@ def get_chart_data():
                 'weekly_change_rate': row['weekly_change_rate']
             })
         
+        total_points = len(comprehensive_data)
+        comprehensive_data = downsample_rows(comprehensive_data, 'week_date', 'current_index', max_points)
+        
         response = {
             'success': True,
             'period': period,
@@ -487,11 +517,13 @@ def get_chart_data():
             'comprehensive': {
                 'labels': [d['week_date'] for d in comprehensive_data],
                 'values': [d['current_index'] for d in comprehensive_data],
-                'data': comprehensive_data
+                'total_points': total_points
             },
             'source': '한국해양진흥공사(KOBC)',
             'index_name': 'KCCI (Korea Container Freight Index)'
         }
+        if not compact:
+            response['comprehensive']['data'] = comprehensive_data
         
         # 항로별 데이터 포함
         if include_routes:
@@ -516,6 +548,7 @@ def get_chart_data():
             
             # 항로별로 그룹화
             routes_grouped = {}
+            route_points = {}
             for row in route_rows:
                 code = row['route_code']
                 if code not in routes_grouped:
@@ -526,13 +559,20 @@ def get_chart_data():
                         'labels': [],
                         'values': []
                     }
-                routes_grouped[code]['labels'].append(row['week_date'])
-                routes_grouped[code]['values'].append(row['current_index'])
+                    route_points[code] = []
+                route_points[code].append({'week_date': row['week_date'], 'current_index': row['current_index']})
+            
+            for code, points in route_points.items():
+                points = downsample_rows(points, 'week_date', 'current_index', max_points)
+                routes_grouped[code]['labels'] = [p['week_date'] for p in points]
+                routes_grouped[code]['values'] = [p['current_index'] for p in points]
             
             response['routes'] = list(routes_grouped.values())
         
         conn.close()
         
+        chart_cache.set(CHART_CACHE_NAMESPACE, cache_key, response)
+        
         return jsonify(response)
         
     except Exception as e:
@@ -316,15 +316,23 @@ def collect_kcci_and_save():
     
     스케줄러에서 호출하는 메인 함수
     """
-    from .models import KCCIIndex, KCCIRouteIndex, KCCICollectionLog, get_kcci_session, init_kcci_database
+    from .models import init_kcci_database, run_kcci_write
     
     # 데이터베이스 초기화
     init_kcci_database()
     
-    # 수집 실행
+    # 수집 실행 (네트워크 작업은 writer 스레드 밖에서)
     collector = KCCICollector()
     result = collector.collect()
     
+    # 저장은 KCCI DB 단일 writer 스레드에서
+    return run_kcci_write(_save_kcci_result, collector, result)
+
+
+def _save_kcci_result(collector: KCCICollector, result: Dict) -> Dict:
+    """수집 결과를 DB에 저장 (종합지수/항로별 지수는 주차 기준 덮어쓰기)"""
+    from .models import KCCIIndex, KCCIRouteIndex, KCCICollectionLog, get_kcci_session
+    
     session = get_kcci_session()
     
     try:
@@ -405,6 +413,13 @@ def collect_kcci_and_save():
         logger.info(f"KCCI data saved: week_date={result.get('week_date')}, "
                    f"routes={len(result.get('routes', []))}")
         
+        # 차트 캐시 무효화
+        try:
+            from timeseries import chart_cache
+            chart_cache.invalidate('kcci')
+        except ImportError:
+            pass
+        
         return result
         
     except Exception as e:
@@ -7,12 +7,14 @@ KCCI 종합지수 및 항로별 지수 저장 모델
 from datetime import datetime, timezone
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, Float, 
-    Index, create_engine, Date
+    Index, Date
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+from sqlite_profile import get_engine, get_write_queue
+
 Base = declarative_base()
 
 
@@ -176,14 +178,19 @@ def get_kcci_database_url():
 
 def init_kcci_database():
     """데이터베이스 초기화 및 테이블 생성"""
-    engine = create_engine(get_kcci_database_url(), echo=False)
+    engine = get_engine(get_kcci_database_url(), echo=False)
     Base.metadata.create_all(engine)
     return engine
 
 
 def get_kcci_session():
-    """새 데이터베이스 세션 반환"""
-    engine = create_engine(get_kcci_database_url(), echo=False)
+    """새 데이터베이스 세션 반환 (엔진은 URL별로 공유)"""
+    engine = get_engine(get_kcci_database_url(), echo=False)
     Session = sessionmaker(bind=engine)
     return Session()
 
+
+def run_kcci_write(fn, *args, **kwargs):
+    """KCCI DB 단일 writer 스레드에서 쓰기 작업 실행"""
+    return get_write_queue(get_kcci_database_url()).run(fn, *args, **kwargs)
+
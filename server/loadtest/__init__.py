@@ -0,0 +1,7 @@
+"""
+Offline Load Test
+외부 서비스(ECOS/GDELT/Gemini/SMTP) 스텁과 Flask + Quote Backend 혼합 트래픽 부하 드라이버.
+
+    loadtest.stubs   외부 API/SMTP 스텁 서버 (기록된 fixture 재생, 지연/실패율 설정)
+    loadtest.driver  프로파일(profiles/*.json)대로 요청을 보내고 엔드포인트별 p50/p95/p99, 오류 수 보고
+"""
@@ -0,0 +1,331 @@
+"""
+Load Driver
+프로파일(profiles/*.json)의 가중치대로 Flask(5000)와 Quote Backend(8001)에 요청을 보내고
+엔드포인트별 처리량, p50/p95/p99 지연시간, 오류 수를 보고합니다.
+
+- 동시 사용자 --concurrency명이 각자 연결을 재사용하며(requests.Session) 응답을 받는 즉시 다음 요청 (closed loop)
+- --warmup 초 동안의 결과는 버리고 --duration 초 동안 측정
+- 프로파일 경로/본문의 {forwarder_id}, {customer_email}, {bidding_no}, {today}, {month_ago}, {worker}는
+  시작 전에 Quote Backend에 부하 테스트용 포워더/화주/비딩을 만들어 채움
+- flow "award": 견적 요청 → 비딩 조회 → 입찰 → 화주 낙찰 (낙찰 메일이 outbox → SMTP로 나감)
+  각 단계는 quote.award_flow:<단계>로, 전체는 quote.award_flow로 기록
+- 4xx/5xx 응답과 연결 오류를 오류로 집계. --max-error-rate를 넘으면 종료 코드 1
+- --stubs를 주면 실행 전후 스텁의 서비스별 요청/주입 실패 수 차이를 함께 보고
+
+Usage (server 디렉토리에서, 스텁과 앱을 먼저 실행):
+    python -m loadtest.stubs                                   # 터미널 1: 출력된 export 줄을 터미널 2에 적용
+    python serve.py --workers 2                                 # 터미널 2
+    python -m loadtest.driver --concurrency 16 --duration 60    # 터미널 3
+    python -m loadtest.driver --profile loadtest/profiles/mixed.json --stubs http://127.0.0.1:9100 \\
+        --concurrency 32 --duration 120 --warmup 10 --output /tmp/load.json --max-error-rate 0.01
+"""
+
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))  # 저장소 루트의 shared 패키지
+
+PROFILES_DIR = Path(__file__).parent / 'profiles'
+DEFAULT_PROFILE = PROFILES_DIR / 'mixed.json'
+
+LOADTEST_SHIPPER_EMAIL = 'loadtest-shipper@example.com'
+LOADTEST_FORWARDER_EMAIL = 'loadtest-forwarder@example.com'
+LOADTEST_PASSWORD = 'loadtest-password'
+
+REQUEST_TIMEOUT = 60
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _fill(value, context: Dict):
+    """문자열/리스트/dict 안의 {placeholder}를 context 값으로 채움"""
+    if isinstance(value, str):
+        return value.format(**context)
+    if isinstance(value, list):
+        return [_fill(item, context) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill(item, context) for key, item in value.items()}
+    return value
+
+
+class Recorder:
+    """(이름, 시작 시각, ms, 상태) 기록. 워커마다 하나씩 써서 잠금 없이 모은 뒤 합침"""
+
+    def __init__(self):
+        self.samples: List[Tuple[str, float, float, str]] = []
+
+    def record(self, name: str, started: float, elapsed_ms: float, status: str):
+        self.samples.append((name, started, elapsed_ms, status))
+
+
+class DriverError(Exception):
+    """준비 단계(부하 테스트용 데이터 생성) 실패"""
+
+
+class LoadDriver:
+    def __init__(self, profile: Dict, flask_url: str, quote_url: str):
+        self.profile = profile
+        self.base_urls = {'flask': flask_url.rstrip('/'), 'quote': quote_url.rstrip('/')}
+        self.entries = profile['requests']
+        self.weights = [entry.get('weight', 1) for entry in self.entries]
+        self.context: Dict = {}
+        self._quote_sequence = 0
+        self._sequence_lock = threading.Lock()
+
+    # ---------------- 요청 ----------------
+
+    def _request(self, session, recorder: Recorder, name: str, app: str, method: str, path: str,
+                 body=None) -> Optional[Dict]:
+        """요청 하나를 보내고 기록. 성공이면 JSON 본문(없으면 {}), 실패면 None"""
+        started = time.time()
+        t0 = time.perf_counter()
+        try:
+            response = session.request(method, self.base_urls[app] + path, json=body, timeout=REQUEST_TIMEOUT)
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+        except Exception as e:
+            recorder.record(name, started, (time.perf_counter() - t0) * 1000, type(e).__name__)
+            return None
+        status = str(response.status_code)
+        recorder.record(name, started, elapsed_ms, status)
+        if response.status_code >= 400:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return {}
+
+    def _quote_payload(self) -> Dict:
+        with self._sequence_lock:
+            self._quote_sequence += 1
+            sequence = self._quote_sequence
+        etd = date.today() + timedelta(days=30)
+        return {
+            'trade_mode': 'export', 'shipping_type': 'ocean', 'load_type': 'FCL', 'incoterms': 'FOB',
+            'pol': 'KRPUS', 'pod': 'USLAX', 'etd': etd.isoformat(), 'eta': (etd + timedelta(days=14)).isoformat(),
+            'invoice_value': 50000, 'remark': f'loadtest #{sequence}',
+            'cargo': [{'row_index': 0, 'container_type': '40HC', 'qty': 2, 'gross_weight': 18000, 'cbm': 60}],
+            'customer': {'company': '부하테스트화주', 'name': 'loadtest', 'email': LOADTEST_SHIPPER_EMAIL,
+                         'phone': '010-0000-0000'},
+        }
+
+    def award_flow(self, session, recorder: Recorder, worker: int):
+        """견적 요청 → 비딩 조회 → 입찰 → 낙찰 (낙찰 메일 발송까지)"""
+        name = 'quote.award_flow'
+        t0 = time.perf_counter()
+        started = time.time()
+
+        quote = self._request(session, recorder, f'{name}:quote_request', 'quote', 'POST', '/api/quote/request',
+                              self._quote_payload())
+        bidding_no = quote and quote.get('bidding_no')
+        detail = bidding_no and self._request(session, recorder, f'{name}:bidding_detail', 'quote', 'GET',
+                                              f'/api/bidding/{bidding_no}/detail')
+        bid = detail and self._request(
+            session, recorder, f'{name}:bid_submit', 'quote', 'POST',
+            f"/api/bid/submit?forwarder_id={self.context['forwarder_id']}",
+            {'bidding_id': detail['id'], 'total_amount': 2200 + worker, 'transit_time': '14 days'})
+        bid_id = bid and (bid.get('bid') or {}).get('id')
+        awarded = bid_id and self._request(
+            session, recorder, f'{name}:award', 'quote', 'POST',
+            f"/api/shipper/bidding/{bidding_no}/award/{bid_id}?customer_email={self.context['customer_email']}")
+
+        recorder.record(name, started, (time.perf_counter() - t0) * 1000, '200' if awarded else 'failed')
+
+    FLOWS: Dict[str, Callable] = {'award': award_flow}
+
+    def run_entry(self, session, recorder: Recorder, entry: Dict, worker: int):
+        if 'flow' in entry:
+            self.FLOWS[entry['flow']](self, session, recorder, worker)
+            return
+        context = dict(self.context, worker=worker)
+        body = _fill(entry['json'], context) if 'json' in entry else None
+        self._request(session, recorder, entry['name'], entry['app'], entry.get('method', 'GET'),
+                      _fill(entry['path'], context), body)
+
+    # ---------------- 준비 ----------------
+
+    def prepare(self):
+        """부하 테스트용 포워더/화주/비딩을 만들고 placeholder 값을 채움"""
+        import requests
+
+        today = date.today()
+        self.context = {'today': today.strftime('%Y%m%d'),
+                        'month_ago': (today - timedelta(days=30)).strftime('%Y%m%d')}
+        if not any(entry.get('app') == 'quote' or 'flow' in entry for entry in self.entries):
+            return
+
+        session = requests.Session()
+        recorder = Recorder()
+        forwarder = {'company': '부하테스트포워더', 'name': 'loadtest', 'email': LOADTEST_FORWARDER_EMAIL,
+                     'phone': '02-000-0000', 'password': LOADTEST_PASSWORD}
+        account = (self._request(session, recorder, 'prepare', 'quote', 'POST', '/api/forwarder/register', forwarder)
+                   or self._request(session, recorder, 'prepare', 'quote', 'POST', '/api/forwarder/login',
+                                    {'email': LOADTEST_FORWARDER_EMAIL, 'password': LOADTEST_PASSWORD}))
+        quote = self._request(session, recorder, 'prepare', 'quote', 'POST', '/api/quote/request',
+                              self._quote_payload())
+        if not account or not account.get('forwarder') or not quote:
+            statuses = [sample[3] for sample in recorder.samples]
+            raise DriverError(f"could not create load test data on {self.base_urls['quote']} (responses: {statuses})")
+
+        # 화주는 견적 요청의 이메일로 식별 (customer_email을 받는 API만 사용)
+        self.context.update(forwarder_id=account['forwarder']['id'], customer_email=LOADTEST_SHIPPER_EMAIL,
+                            bidding_no=quote['bidding_no'])
+
+    # ---------------- 실행 ----------------
+
+    def run(self, concurrency: int, duration: float, warmup: float = 0.0, think_ms: float = 0.0,
+            seed: int = 1) -> List[Tuple[str, float, float, str]]:
+        """warmup 이후 시작한 요청만 돌려줌"""
+        import requests
+
+        measure_from = time.time() + warmup
+        deadline = measure_from + duration
+        recorders = [Recorder() for _ in range(concurrency)]
+
+        def worker(index: int):
+            rng = random.Random(seed * 1000 + index)
+            session = requests.Session()
+            while time.time() < deadline:
+                entry = rng.choices(self.entries, weights=self.weights)[0]
+                self.run_entry(session, recorders[index], entry, index)
+                if think_ms:
+                    time.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+
+        threads = [threading.Thread(target=worker, args=(i,), name=f'load-{i}', daemon=True)
+                   for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [sample for recorder in recorders for sample in recorder.samples if sample[1] >= measure_from]
+
+
+def summarize(samples: List[Tuple[str, float, float, str]], duration: float) -> Dict:
+    """엔드포인트별/전체 count, errors, rps, p50/p95/p99/max ms, 상태 코드 분포"""
+    grouped: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+    for name, _, elapsed_ms, status in samples:
+        grouped[name].append((elapsed_ms, status))
+
+    def stats(items: List[Tuple[float, str]]) -> Dict:
+        latencies = sorted(elapsed for elapsed, _ in items)
+        statuses = Counter(status for _, status in items)
+        errors = sum(count for status, count in statuses.items() if not (status.isdigit() and int(status) < 400))
+        return {
+            'count': len(items),
+            'errors': errors,
+            'error_rate': round(errors / len(items), 4) if items else 0.0,
+            'rps': round(len(items) / duration, 2) if duration else 0.0,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'max_ms': round(latencies[-1], 2) if latencies else 0.0,
+            'statuses': dict(sorted(statuses.items())),
+        }
+
+    # 흐름의 단계(name:step)는 전체 흐름에 이미 포함되므로 합계에서 제외
+    top_level = [item for name, items in grouped.items() if ':' not in name for item in items]
+    return {
+        'endpoints': {name: stats(items) for name, items in sorted(grouped.items())},
+        'total': stats(top_level),
+    }
+
+
+def print_report(report: Dict):
+    params = report['params']
+    print(f"\nconcurrency={params['concurrency']} duration={params['duration']}s warmup={params['warmup']}s "
+          f"profile={params['profile']}\n")
+    print(f"{'endpoint':<38}{'count':>8}{'errors':>8}{'rps':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    rows = list(report['summary']['endpoints'].items()) + [('TOTAL', report['summary']['total'])]
+    for name, row in rows:
+        if name == 'TOTAL':
+            print('-' * 103)
+        print(f"{name:<38}{row['count']:>8}{row['errors']:>8}{row['rps']:>9.1f}{row['p50_ms']:>10.1f}"
+              f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+    for name, row in report['summary']['endpoints'].items():
+        failed = {status: count for status, count in row['statuses'].items()
+                  if not (status.isdigit() and int(status) < 400)}
+        if failed:
+            print(f"  {name}: {failed}")
+    if report.get('stubs'):
+        print("\nexternal calls (stub side):")
+        for service, counts in sorted(report['stubs'].items()):
+            print(f"  {service:<8}{counts['requests']:>8} requests{counts['failures']:>8} injected failures")
+
+
+def _stub_stats(url: Optional[str]) -> Dict[str, Dict[str, int]]:
+    if not url:
+        return {}
+    import requests
+
+    return requests.get(f"{url.rstrip('/')}/_stub/stats", timeout=10).json()['services']
+
+
+def main(argv=None):
+    import argparse
+
+    from shared.benchmark_harness import environment
+
+    parser = argparse.ArgumentParser(prog='python -m loadtest.driver', description=__doc__.split('\n')[1])
+    parser.add_argument('--profile', type=Path, default=DEFAULT_PROFILE)
+    parser.add_argument('--flask', default='http://127.0.0.1:5000', help="Flask server URL")
+    parser.add_argument('--quote', default='http://127.0.0.1:8001', help="Quote Backend URL")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30.0, help="measured seconds")
+    parser.add_argument('--warmup', type=float, default=5.0, help="seconds discarded before measuring")
+    parser.add_argument('--think-ms', type=float, default=0.0, help="mean pause between a user's requests")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--stubs', default=None, help="stub server URL for external call counts")
+    parser.add_argument('--output', type=Path, default=None, help="write the JSON report here")
+    parser.add_argument('--max-error-rate', type=float, default=None, help="exit 1 above this total error rate")
+    args = parser.parse_args(argv)
+
+    profile = json.loads(args.profile.read_text(encoding='utf-8'))
+    driver = LoadDriver(profile, args.flask, args.quote)
+    try:
+        driver.prepare()
+    except DriverError as e:
+        parser.exit(2, f"error: {e}\n")
+
+    print(f"load: {len(driver.entries)} request types, {args.concurrency} users, "
+          f"{args.warmup:.0f}s warmup + {args.duration:.0f}s")
+    stubs_before = _stub_stats(args.stubs)
+    samples = driver.run(args.concurrency, args.duration, args.warmup, args.think_ms, args.seed)
+    stubs_after = _stub_stats(args.stubs)
+
+    report = {
+        'params': {'profile': str(args.profile), 'flask': args.flask, 'quote': args.quote,
+                   'concurrency': args.concurrency, 'duration': args.duration, 'warmup': args.warmup,
+                   'think_ms': args.think_ms, 'seed': args.seed},
+        'environment': environment(),
+        'summary': summarize(samples, args.duration),
+        'stubs': {service: {key: counts[key] - stubs_before.get(service, {}).get(key, 0) for key in counts}
+                  for service, counts in stubs_after.items()},
+    }
+    print_report(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"\nsaved {args.output}")
+
+    error_rate = report['summary']['total']['error_rate']
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"error rate {error_rate:.2%} exceeds {args.max_error_rate:.2%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
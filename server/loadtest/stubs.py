@@ -0,0 +1,563 @@
+"""
+External Service Stubs
+ECOS(한국은행), GDELT 파일 서버, Gemini API, SMTP를 로컬에서 흉내 내는 스텁 서버.
+
+- HTTP 스텁 하나가 경로 접두사로 세 서비스를 나눠 응답 (/ecos/api, /gdelt/gdeltv2, /gemini)
+- SMTP 스텁은 EHLO/AUTH/MAIL/RCPT/DATA/NOOP/RSET/QUIT만 지원 (STARTTLS 없음 → SMTP_STARTTLS=false)
+- 응답은 fixtures/의 기록된 응답을 재생:
+    ecos/StatisticSearch.json   값 목록을 요청한 기간/주기의 날짜에 순서대로 다시 배치
+    ecos/StatisticTableList.json, ecos/StatisticItemList.json   그대로 (요청 범위만큼 자름)
+    gdelt/export.CSV            15분 슬라이스마다 날짜 컬럼만 바꿔 zip으로 제공 (lastupdate.txt는 현재 슬라이스)
+    gemini/responses.json       프롬프트 종류(배치/단건 분석, 위기 요약, 채팅)에 맞는 응답
+- 서비스마다 지연시간(latency_ms ± jitter_ms)과 실패율(error_rate, HTTP 503 / SMTP 451)을 설정
+- GET /_stub/stats: 서비스별 요청/주입 실패 수, POST /_stub/config: 실행 중 지연/실패율 변경
+  ({"gemini": {"latency_ms": 3000, "error_rate": 0.2}})
+
+Usage (server 디렉토리에서):
+    python -m loadtest.stubs                                  # 기본 포트 9100(HTTP), 9025(SMTP)
+    python -m loadtest.stubs --latency gemini=2000 --error-rate ecos=0.05 --seed 1
+    python -m loadtest.stubs --fixtures /path/to/recorded --mail-dir /tmp/mails
+
+시작하면 앱이 스텁을 쓰도록 할 환경 변수를 출력합니다 (같은 셸에서 python serve.py 실행 전에 설정).
+"""
+
+import hashlib
+import io
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+DEFAULT_HTTP_PORT = 9100
+DEFAULT_SMTP_PORT = 9025
+
+
+class Behavior:
+    """서비스 하나의 응답 지연/실패 설정"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+
+    def delay(self, rng: random.Random) -> float:
+        return max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+    def to_dict(self) -> Dict:
+        return {'latency_ms': self.latency_ms, 'jitter_ms': self.jitter_ms, 'error_rate': self.error_rate}
+
+
+# 실제 서비스에서 관찰되는 수준의 기본 지연 (실패 주입은 기본 꺼짐)
+DEFAULT_BEHAVIORS = {
+    'ecos': {'latency_ms': 150, 'jitter_ms': 80},
+    'gdelt': {'latency_ms': 300, 'jitter_ms': 150},
+    'gemini': {'latency_ms': 1200, 'jitter_ms': 600},
+    'smtp': {'latency_ms': 80, 'jitter_ms': 40},
+}
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+def _periods(cycle: str, start: str, end: str) -> List[str]:
+    """ECOS 주기별 시점 목록 (D: YYYYMMDD 영업일, M: YYYYMM, Q: YYYYQn, A: YYYY)"""
+    labels = []
+    if cycle == 'D':
+        day, last = datetime.strptime(start, '%Y%m%d').date(), datetime.strptime(end, '%Y%m%d').date()
+        while day <= last:
+            if day.weekday() < 5:
+                labels.append(day.strftime('%Y%m%d'))
+            day += timedelta(days=1)
+    elif cycle == 'M':
+        year, month = int(start[:4]), int(start[4:6])
+        while (year, month) <= (int(end[:4]), int(end[4:6])):
+            labels.append(f'{year}{month:02d}')
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    elif cycle == 'Q':
+        year, quarter = int(start[:4]), int(start[-1])
+        while (year, quarter) <= (int(end[:4]), int(end[-1])):
+            labels.append(f'{year}Q{quarter}')
+            year, quarter = (year + 1, 1) if quarter == 4 else (year, quarter + 1)
+    elif cycle in ('A', 'Y'):
+        labels = [str(year) for year in range(int(start[:4]), int(end[:4]) + 1)]
+    return labels
+
+
+class Fixtures:
+    """기록된 응답을 요청에 맞춰 재생"""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR):
+        fixtures_dir = Path(fixtures_dir)
+        self.ecos = {name: self._load_json(fixtures_dir / 'ecos' / f'{name}.json')
+                     for name in ('StatisticSearch', 'StatisticTableList', 'StatisticItemList')}
+        self.gdelt_rows = (fixtures_dir / 'gdelt' / 'export.CSV').read_text(encoding='utf-8').splitlines()
+        self.gemini = self._load_json(fixtures_dir / 'gemini' / 'responses.json')
+        self._zips: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load_json(path: Path) -> Dict:
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    # ---------------- ECOS ----------------
+
+    def ecos_response(self, service: str, args: List[str]) -> Dict:
+        """
+        /{service}/{KEY}/json/kr/{start}/{end}/... 요청의 응답
+
+        StatisticSearch: args[5:] = 통계표코드/주기/시작/종료/항목코드
+        """
+        try:
+            start_index, end_index = int(args[3]), int(args[4])
+        except (IndexError, ValueError):
+            return {'RESULT': {'CODE': 'ERROR-100', 'MESSAGE': '필수 값이 누락되어 있습니다.'}}
+
+        recorded = self.ecos.get(service)
+        if recorded is None:
+            return {'RESULT': {'CODE': 'ERROR-101', 'MESSAGE': '서비스명이 올바르지 않습니다.'}}
+        rows = recorded[service]['row']
+
+        if service == 'StatisticSearch':
+            try:
+                stat_code, cycle, start, end = args[5], args[6], args[7], args[8]
+                labels = _periods(cycle, start, end)
+            except (IndexError, ValueError):
+                return {'RESULT': {'CODE': 'ERROR-100', 'MESSAGE': '필수 값이 누락되어 있습니다.'}}
+            item_code = args[9] if len(args) > 9 else rows[0].get('ITEM_CODE1')
+            rows = [dict(rows[i % len(rows)], STAT_CODE=stat_code, ITEM_CODE1=item_code, TIME=label)
+                    for i, label in enumerate(labels)]
+
+        rows = rows[start_index - 1:end_index]
+        if not rows:
+            return {'RESULT': {'CODE': 'INFO-200', 'MESSAGE': '해당하는 데이터가 없습니다.'}}
+        return {service: {'list_total_count': len(rows), 'row': rows}}
+
+    # ---------------- GDELT ----------------
+
+    @staticmethod
+    def current_slice(now: Optional[datetime] = None) -> str:
+        now = now or datetime.now(timezone.utc)
+        now = now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0)
+        return now.strftime('%Y%m%d%H%M%S')
+
+    def gdelt_export_zip(self, key: str) -> bytes:
+        """슬라이스 key(YYYYMMDDHHMMSS)의 export zip (fixture 행의 날짜 컬럼만 바꿈)"""
+        with self._lock:
+            if key not in self._zips:
+                lines = []
+                for line in self.gdelt_rows:
+                    columns = line.split('\t')
+                    if len(columns) > 1:
+                        columns[1] = key[:8]
+                    lines.append('\t'.join(columns))
+                buffer = io.BytesIO()
+                with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+                    zf.writestr(f'{key}.export.CSV', '\n'.join(lines) + '\n')
+                if len(self._zips) >= 16:
+                    self._zips.pop(next(iter(self._zips)))
+                self._zips[key] = buffer.getvalue()
+            return self._zips[key]
+
+    def gdelt_lastupdate(self, base_url: str, now: Optional[datetime] = None) -> str:
+        key = self.current_slice(now)
+        data = self.gdelt_export_zip(key)
+        return (f"{len(data)} {hashlib.md5(data).hexdigest()} {base_url}/{key}.export.CSV.zip\n"
+                f"0 d41d8cd98f00b204e9800998ecf8427e {base_url}/{key}.mentions.CSV.zip\n"
+                f"0 d41d8cd98f00b204e9800998ecf8427e {base_url}/{key}.gkg.csv.zip\n")
+
+    # ---------------- Gemini ----------------
+
+    def gemini_text(self, prompt: str, rng: random.Random) -> str:
+        analysis = self.gemini['analysis']
+        batch_ids = [int(i) for i in re.findall(r'^\[(\d+)\] Title:', prompt, re.MULTILINE)]
+        if batch_ids:
+            return json.dumps([dict(rng.choice(analysis), id=i) for i in batch_ids], ensure_ascii=False)
+        if 'Respond ONLY with valid JSON' in prompt:
+            return json.dumps(rng.choice(analysis), ensure_ascii=False)
+        if 'crisis alerts' in prompt:
+            return self.gemini['summary']
+        return rng.choice(self.gemini['chat'])
+
+
+def gemini_response(text: str, model: str, prompt: str) -> Dict:
+    """generateContent 응답 형식 (토큰 수는 4글자 = 1토큰으로 근사)"""
+    prompt_tokens, output_tokens = len(prompt) // 4 + 1, len(text) // 4 + 1
+    return {
+        'candidates': [{'content': {'parts': [{'text': text}], 'role': 'model'}, 'finishReason': 'STOP', 'index': 0}],
+        'usageMetadata': {'promptTokenCount': prompt_tokens, 'candidatesTokenCount': output_tokens,
+                          'totalTokenCount': prompt_tokens + output_tokens},
+        'modelVersion': model,
+    }
+
+
+# ============================================================
+# Stats
+# ============================================================
+
+class StubStats:
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, service: str, failed: bool):
+        with self._lock:
+            counts = self._counts.setdefault(service, {'requests': 0, 'failures': 0})
+            counts['requests'] += 1
+            counts['failures'] += int(failed)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {service: dict(counts) for service, counts in self._counts.items()}
+
+
+# ============================================================
+# HTTP stub (ECOS / GDELT / Gemini)
+# ============================================================
+
+_GEMINI_PATH = re.compile(r'^/gemini/(v1beta|v1|v1alpha)/models/([^/:]+):generateContent$')
+_GDELT_EXPORT = re.compile(r'^/gdelt/gdeltv2/(\d{14})\.export\.CSV\.zip$')
+
+
+class _HTTPStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # requests.Session keep-alive
+    server_version = 'loadtest-stub'
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr 로그를 남기지 않음
+
+    @property
+    def stubs(self) -> 'StubServers':
+        return self.server.stubs
+
+    def _send(self, status: int, body, content_type: str = 'application/json; charset=utf-8'):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body, ensure_ascii=False)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _simulate(self, service: str) -> bool:
+        """지연 후 실패 주입 여부를 돌려줌 (실패면 503 응답까지 보냄)"""
+        behavior = self.stubs.behaviors[service]
+        time.sleep(behavior.delay(self.stubs.rng))
+        failed = behavior.fails(self.stubs.rng)
+        self.stubs.stats.record(service, failed)
+        if failed:
+            if service == 'gemini':
+                self._send(503, {'error': {'code': 503, 'status': 'UNAVAILABLE',
+                                           'message': 'The model is overloaded. Please try again later. (stub)'}})
+            else:
+                self._send(503, 'Service Unavailable (stub)', 'text/plain; charset=utf-8')
+        return not failed
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+
+        if path == '/_stub/stats':
+            self._send(200, {'services': self.stubs.stats.snapshot(), 'behaviors': self.stubs.behavior_dict()})
+            return
+
+        if path.startswith('/ecos/api/'):
+            if self._simulate('ecos'):
+                parts = path[len('/ecos/api/'):].split('/')
+                self._send(200, self.stubs.fixtures.ecos_response(parts[0], parts[1:]))
+            return
+
+        if path.startswith('/gdelt/gdeltv2/'):
+            if not self._simulate('gdelt'):
+                return
+            if path == '/gdelt/gdeltv2/lastupdate.txt':
+                base_url = f"http://{self.headers.get('Host')}/gdelt/gdeltv2"
+                self._send(200, self.stubs.fixtures.gdelt_lastupdate(base_url), 'text/plain; charset=utf-8')
+                return
+            match = _GDELT_EXPORT.match(path)
+            if match:
+                self._send(200, self.stubs.fixtures.gdelt_export_zip(match.group(1)), 'application/zip')
+                return
+
+        self._send(404, {'error': f'no stub for GET {path}'})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        body = self._read_body()
+
+        if path == '/_stub/config':
+            try:
+                self.stubs.configure(json.loads(body or b'{}'))
+            except (ValueError, TypeError, KeyError) as e:
+                self._send(400, {'error': str(e)})
+                return
+            self._send(200, {'behaviors': self.stubs.behavior_dict()})
+            return
+
+        match = _GEMINI_PATH.match(path)
+        if match:
+            if self._simulate('gemini'):
+                try:
+                    request = json.loads(body or b'{}')
+                except ValueError:
+                    self._send(400, {'error': {'code': 400, 'status': 'INVALID_ARGUMENT', 'message': 'bad JSON'}})
+                    return
+                # 대화형 요청이면 마지막 user 턴이 이번 질문
+                contents = request.get('contents') or [{}]
+                prompt = '\n'.join(part.get('text', '') for part in contents[-1].get('parts', []))
+                text = self.stubs.fixtures.gemini_text(prompt, self.stubs.rng)
+                self._send(200, gemini_response(text, match.group(2), prompt))
+            return
+
+        self._send(404, {'error': f'no stub for POST {path}'})
+
+
+class _HTTPStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, stubs: 'StubServers'):
+        self.stubs = stubs
+        super().__init__(address, _HTTPStubHandler)
+
+
+# ============================================================
+# SMTP stub
+# ============================================================
+
+class _SMTPStubHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str):
+        self.wfile.write(f'{line}\r\n'.encode('ascii'))
+
+    def _read_data(self) -> bytes:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b'.\r\n', b'.\n'):
+                return b''.join(lines)
+            lines.append(line[1:] if line.startswith(b'..') else line)
+
+    def handle(self):
+        stubs: StubServers = self.server.stubs
+        sender, recipients = None, []
+        self._reply('220 loadtest-stub ESMTP')
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            command = line.split(' ', 1)[0].upper()
+
+            if command == 'EHLO':
+                self.wfile.write(b'250-loadtest-stub\r\n250-AUTH PLAIN LOGIN\r\n250-8BITMIME\r\n250 SIZE 10485760\r\n')
+            elif command == 'HELO':
+                self._reply('250 loadtest-stub')
+            elif command == 'AUTH':
+                if line.upper().startswith('AUTH LOGIN'):
+                    for prompt in ('VXNlcm5hbWU6', 'UGFzc3dvcmQ6'):  # "Username:", "Password:"
+                        self._reply(f'334 {prompt}')
+                        self.rfile.readline()
+                self._reply('235 2.7.0 Authentication successful')
+            elif command == 'MAIL':
+                sender, recipients = line[10:].strip('<> '), []
+                self._reply('250 2.1.0 Ok')
+            elif command == 'RCPT':
+                recipients.append(line[8:].strip('<> '))
+                self._reply('250 2.1.5 Ok')
+            elif command == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                message = self._read_data()
+                behavior = stubs.behaviors['smtp']
+                time.sleep(behavior.delay(stubs.rng))
+                failed = behavior.fails(stubs.rng)
+                stubs.stats.record('smtp', failed)
+                if failed:
+                    self._reply('451 4.3.0 Temporary local problem (stub)')
+                else:
+                    stubs.store_mail(sender, recipients, message)
+                    self._reply('250 2.0.0 Ok: queued')
+                sender, recipients = None, []
+            elif command in ('RSET', 'NOOP'):
+                if command == 'RSET':
+                    sender, recipients = None, []
+                self._reply('250 2.0.0 Ok')
+            elif command == 'STARTTLS':
+                self._reply('454 4.7.0 TLS not available (stub, set SMTP_STARTTLS=false)')
+            elif command == 'QUIT':
+                self._reply('221 2.0.0 Bye')
+                return
+            else:
+                self._reply('502 5.5.2 Command not recognized')
+
+
+class _SMTPStubServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, stubs: 'StubServers'):
+        self.stubs = stubs
+        super().__init__(address, _SMTPStubHandler)
+
+
+# ============================================================
+# Servers
+# ============================================================
+
+class StubServers:
+    """
+    HTTP + SMTP 스텁 실행기 (port=0이면 빈 포트 자동 선택)
+
+        with StubServers(http_port=0, smtp_port=0) as stubs:
+            os.environ.update(stubs.env())
+    """
+
+    def __init__(self, host: str = '127.0.0.1', http_port: int = DEFAULT_HTTP_PORT,
+                 smtp_port: int = DEFAULT_SMTP_PORT, behaviors: Optional[Dict[str, Dict]] = None,
+                 fixtures_dir: Path = FIXTURES_DIR, seed: Optional[int] = None, mail_dir: Optional[Path] = None):
+        self.host = host
+        self.behaviors = {name: Behavior(**config) for name, config in DEFAULT_BEHAVIORS.items()}
+        self.configure(behaviors or {})
+        self.fixtures = Fixtures(fixtures_dir)
+        self.rng = random.Random(seed)
+        self.stats = StubStats()
+        self.mail_dir = Path(mail_dir) if mail_dir else None
+        self.mails = 0
+        self._mail_lock = threading.Lock()
+        self._http = _HTTPStubServer((host, http_port), self)
+        self._smtp = _SMTPStubServer((host, smtp_port), self)
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def http_port(self) -> int:
+        return self._http.server_address[1]
+
+    @property
+    def smtp_port(self) -> int:
+        return self._smtp.server_address[1]
+
+    def configure(self, behaviors: Dict[str, Dict]):
+        """{"gemini": {"latency_ms": 2000}} 형식으로 일부 값만 바꿈"""
+        for name, config in behaviors.items():
+            if name not in self.behaviors:
+                raise KeyError(f"unknown service: {name}")
+            for key, value in config.items():
+                if key not in ('latency_ms', 'jitter_ms', 'error_rate'):
+                    raise KeyError(f"unknown setting: {key}")
+                setattr(self.behaviors[name], key, float(value))
+
+    def behavior_dict(self) -> Dict[str, Dict]:
+        return {name: behavior.to_dict() for name, behavior in self.behaviors.items()}
+
+    def store_mail(self, sender: str, recipients: List[str], message: bytes):
+        with self._mail_lock:
+            self.mails += 1
+            number = self.mails
+        if self.mail_dir is not None:
+            self.mail_dir.mkdir(parents=True, exist_ok=True)
+            (self.mail_dir / f'{number:06d}.eml').write_bytes(message)
+
+    def env(self) -> Dict[str, str]:
+        """앱이 스텁을 쓰도록 하는 환경 변수"""
+        http = f'http://{self.host}:{self.http_port}'
+        return {
+            'ECOS_API_BASE_URL': f'{http}/ecos/api',
+            'ECOS_API_KEY': 'loadtest',
+            'GDELT_BASE_URL': f'{http}/gdelt/gdeltv2',
+            'GEMINI_API_BASE_URL': f'{http}/gemini',
+            'GEMINI_API_KEY': 'loadtest',
+            'SMTP_HOST': self.host,
+            'SMTP_PORT': str(self.smtp_port),
+            'SMTP_STARTTLS': 'false',
+            'EMAIL_DEV_MODE': 'false',
+        }
+
+    def start(self) -> 'StubServers':
+        for server, name in ((self._http, 'stub-http'), (self._smtp, 'stub-smtp')):
+            thread = threading.Thread(target=server.serve_forever, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self._http, self._smtp):
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    def __enter__(self) -> 'StubServers':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _service_values(values: List[str], option: str) -> Dict[str, float]:
+    parsed = {}
+    for value in values:
+        name, _, number = value.partition('=')
+        if name not in DEFAULT_BEHAVIORS or not number:
+            raise SystemExit(f"{option}: expected SERVICE=VALUE with SERVICE in {sorted(DEFAULT_BEHAVIORS)}")
+        parsed[name] = float(number)
+    return parsed
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m loadtest.stubs', description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--http-port', type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument('--smtp-port', type=int, default=DEFAULT_SMTP_PORT)
+    parser.add_argument('--latency', action='append', default=[], metavar='SERVICE=MS')
+    parser.add_argument('--jitter', action='append', default=[], metavar='SERVICE=MS')
+    parser.add_argument('--error-rate', action='append', default=[], metavar='SERVICE=RATE')
+    parser.add_argument('--fixtures', type=Path, default=FIXTURES_DIR, help="recorded responses directory")
+    parser.add_argument('--mail-dir', type=Path, default=None, help="write received mails as .eml files")
+    parser.add_argument('--seed', type=int, default=None, help="latency/failure/response choice seed")
+    args = parser.parse_args(argv)
+
+    behaviors: Dict[str, Dict] = {}
+    for option, key in (('latency', 'latency_ms'), ('jitter', 'jitter_ms'), ('error_rate', 'error_rate')):
+        for name, value in _service_values(getattr(args, option), f"--{option.replace('_', '-')}").items():
+            behaviors.setdefault(name, {})[key] = value
+
+    stubs = StubServers(args.host, args.http_port, args.smtp_port, behaviors, args.fixtures, args.seed,
+                        args.mail_dir).start()
+    print(f"stubs listening: http://{args.host}:{stubs.http_port}  smtp://{args.host}:{stubs.smtp_port}")
+    for name, behavior in stubs.behavior_dict().items():
+        print(f"  {name:<8}{behavior['latency_ms']:>7.0f} ms ±{behavior['jitter_ms']:.0f}  "
+              f"error_rate {behavior['error_rate']:.1%}")
+    print("\n# 앱을 시작할 셸에서:")
+    for key, value in stubs.env().items():
+        print(f"export {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stubs.stop()
+        print(json.dumps(stubs.stats.snapshot(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
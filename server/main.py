@@ -14,6 +14,10 @@ from dotenv import load_dotenv
 # Load environment variables FIRST before importing modules that need them
 load_dotenv()
 
+# 프로세스 시작 시각 기록 (uptime / 워밍업 완료 시각 기준)
+from startup import mark_started, run_after_listening
+mark_started()
+
 # Import configuration
 from config import BASE_DIR, FLASK_PORT, QUOTE_BACKEND_PORT, DEBUG_MODE
 
@@ -21,12 +25,7 @@ from config import BASE_DIR, FLASK_PORT, QUOTE_BACKEND_PORT, DEBUG_MODE
 from extensions import init_extensions
 
 # Import scheduler
-from scheduler import (
-    init_scheduler,
-    run_initial_jobs,
-    start_news_collection_after_server_ready,
-    shutdown_scheduler
-)
+from scheduler import start_scheduler_election, shutdown_scheduler
 
 # Import quote backend manager
 from quote_manager import (
@@ -129,14 +128,14 @@ if __name__ == '__main__':
     print("=" * 60)
     print()
     
-    # Initialize seed data if needed
-    run_quote_seed_if_needed()
-    
-    # Start Quote Backend (FastAPI on port 8001)
-    start_quote_backend()
-    
-    # Initialize and start scheduler
-    init_scheduler()
+    # Quote Backend seed/subprocess (FastAPI on port 8001) and scheduler start once the port is bound,
+    # so the first request is not blocked by warm-up (status: /api/health)
+    run_after_listening(
+        FLASK_PORT,
+        ('quote seed', run_quote_seed_if_needed),
+        ('quote backend', start_quote_backend),
+        ('scheduler', lambda: start_scheduler_election(FLASK_PORT)),
+    )
     
     print()
     print(f"  [Main Server]     http://localhost:{FLASK_PORT}  (Flask)")
@@ -159,11 +158,6 @@ if __name__ == '__main__':
         print("  [X] No shipping_indices routes found!")
     print()
     
-    # Run initial jobs (GDELT update)
-    run_initial_jobs()
-    
-    # Start news collection after server is ready
-    start_news_collection_after_server_ready(FLASK_PORT)
-    
     # Start Flask server (use_reloader=False to prevent double subprocess)
+    # Production: python serve.py (multi-worker, see serve.py)
     app.run(port=FLASK_PORT, debug=DEBUG_MODE, use_reloader=False)
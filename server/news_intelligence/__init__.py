@@ -2,7 +2,6 @@
 # This module provides logistics news collection, analysis, and API services
 
 from .models import NewsArticle, CollectionLog, Base
-from .collectors import NewsCollectorManager
 from .analyzer import NewsAnalyzer
 from .api import news_bp
 
@@ -15,3 +14,10 @@ __all__ = [
     'news_bp'
 ]
 
+
+def __getattr__(name):
+    # 수집기(feedparser, requests, 스크래퍼)는 수집 작업이 처음 실행될 때 import
+    if name == 'NewsCollectorManager':
+        from .collectors import NewsCollectorManager
+        return NewsCollectorManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
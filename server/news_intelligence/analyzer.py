@@ -15,6 +15,7 @@ import os
 import json
 import logging
 import re
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -24,23 +25,47 @@ from collections import Counter
 from dotenv import load_dotenv
 load_dotenv()
 
+from telemetry import external_call
+
 logger = logging.getLogger(__name__)
 
-# Try to import Google Gemini (new google-genai package)
+# Google Gemini (google-genai package) - 첫 분석 때 import (서버 시작 시 ~0.4s)
 GEMINI_AVAILABLE = False
 genai_client = None
+_genai_loaded = False
+_genai_lock = threading.Lock()
+
 
-try:
-    from google import genai
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    if GEMINI_API_KEY:
-        genai_client = genai.Client(api_key=GEMINI_API_KEY)
-        GEMINI_AVAILABLE = True
-        logger.info("Gemini API (google-genai) configured successfully for news analysis")
-    else:
-        logger.warning("GEMINI_API_KEY not found. AI analysis will use fallback methods.")
-except ImportError:
-    logger.warning("google-genai package not installed. AI analysis will use fallback methods.")
+def get_genai_client():
+    """
+    google-genai 클라이언트를 처음 호출될 때 만듭니다 (API 키가 없으면 import하지 않음).
+    
+    Returns:
+        genai.Client 또는 None (키 없음/패키지 미설치 → 규칙 기반 분석)
+    """
+    global GEMINI_AVAILABLE, genai_client, _genai_loaded
+    
+    if _genai_loaded:
+        return genai_client
+    with _genai_lock:
+        if _genai_loaded:
+            return genai_client
+        GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+        if not GEMINI_API_KEY:
+            logger.warning("GEMINI_API_KEY not found. AI analysis will use fallback methods.")
+        else:
+            try:
+                from google import genai
+                # GEMINI_API_BASE_URL: 부하 테스트용 로컬 스텁 (loadtest.stubs)
+                base_url = os.getenv("GEMINI_API_BASE_URL")
+                genai_client = genai.Client(api_key=GEMINI_API_KEY,
+                                            http_options={"base_url": base_url} if base_url else None)
+                GEMINI_AVAILABLE = True
+                logger.info("Gemini API (google-genai) configured successfully for news analysis")
+            except ImportError:
+                logger.warning("google-genai package not installed. AI analysis will use fallback methods.")
+        _genai_loaded = True
+    return genai_client
 
 
 # ===== 일반 키워드 필터링 강화 (v2.3) =====
@@ -214,9 +239,9 @@ class NewsAnalyzer:
             model: Gemini model to use (default: gemini-2.0-flash)
         """
         self.model_name = model
-        self.client = genai_client  # Use global client
+        self.client = get_genai_client()  # Use global client
         
-        if GEMINI_AVAILABLE and self.client:
+        if self.client:
             logger.info(f"Gemini analyzer ready with model: {self.model_name}")
         else:
             logger.warning("Gemini not available, using rule-based analysis only")
@@ -519,14 +544,15 @@ Respond ONLY with a valid JSON array (no markdown, no explanation):
 [{{"id": 0, "category": "...", "countries": ["XX"], "keywords": ["..."], "is_crisis": false}}, ...]"""
 
         # Use new google-genai API
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "temperature": 0.3,
-                "max_output_tokens": 1000,
-            }
-        )
+        with external_call('gemini'):
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config={
+                    "temperature": 0.3,
+                    "max_output_tokens": 1000,
+                }
+            )
         result_text = response.text.strip()
         
         # Parse JSON response (remove markdown code blocks if present)
@@ -581,14 +607,15 @@ Respond ONLY with valid JSON (no markdown, no explanation):
 {{"category": "...", "countries": ["XX", "YY"], "keywords": ["word1", "word2"], "is_crisis": true/false}}"""
         
         # Use new google-genai API
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "temperature": 0.3,
-                "max_output_tokens": 200,
-            }
-        )
+        with external_call('gemini'):
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config={
+                    "temperature": 0.3,
+                    "max_output_tokens": 200,
+                }
+            )
         result_text = response.text.strip()
         
         # Parse JSON response (remove markdown code blocks if present)
@@ -654,14 +681,15 @@ Articles:
 Provide a brief, actionable summary for logistics professionals. Be concise and actionable."""
 
         # Use new google-genai API
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config={
-                "temperature": 0.5,
-                "max_output_tokens": 300,
-            }
-        )
+        with external_call('gemini'):
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config={
+                    "temperature": 0.5,
+                    "max_output_tokens": 300,
+                }
+            )
         return response.text.strip()
     
     def get_stats(self) -> Dict[str, Any]:
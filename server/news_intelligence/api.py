@@ -14,9 +14,13 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import func, or_, and_, desc, not_
 import logging
+import time
 
-from .models import NewsArticle, CollectionLog, get_session, init_database
+from .models import NewsArticle, CollectionLog, get_database_url, get_session, init_database, run_write
 from .analyzer import NewsAnalyzer
+from .dedup import collapse_by_group
+from http_cache import NO_CACHE, file_version, register_cache_policy
+from telemetry import query_budget
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,28 @@ news_bp = Blueprint('news_intelligence', __name__, url_prefix='/api/news-intelli
 # Initialize database on import
 init_database()
 
+# 24시간 창이 현재 시각 기준이라 DB가 그대로여도 기사가 창 밖으로 빠짐 → 5분 단위로 ETag 갱신
+WINDOW_BUCKET_SECONDS = 300
+
+
+def _data_version():
+    """
+    HTTP 캐시 검증자: SQLite 파일(+WAL)의 mtime/크기 + 5분 버킷
+    분석/중복 묶기가 타임스탬프 없이 행을 갱신하므로 테이블 값 대신 파일 단위로 비교합니다.
+    (SQLite가 아니면 None → 본문 해시 ETag)
+    """
+    url = get_database_url()
+    if not url.startswith('sqlite:///'):
+        return None
+    path = url[len('sqlite:///'):]
+    version = file_version(path, path + '-wal')
+    if version is None:
+        return None
+    return f"{version}|{int(time.time() // WINDOW_BUCKET_SECONDS)}"
+
+
+cache_policy = register_cache_policy(news_bp, NO_CACHE, validator=_data_version)
+
 
 def is_gdelt_title_scraped_failed(title: str, source_name: str) -> bool:
     """
@@ -49,6 +75,7 @@ def is_gdelt_title_scraped_failed(title: str, source_name: str) -> bool:
 
 
 @news_bp.route('/articles', methods=['GET'])
+@query_budget(2)
 def get_articles():
     """
     Get news articles with filtering and pagination.
@@ -59,9 +86,10 @@ def get_articles():
     - page: Page number (default: 1)
     - page_size: Items per page (default: 20, max: 100)
     - is_crisis: Filter crisis articles only (optional, boolean)
+    - collapse: Return one representative per near-duplicate cluster (default: false)
     
     Returns:
-    - articles: List of article objects
+    - articles: List of article objects (with cluster_size when collapsed)
     - total: Total count matching filters
     - page: Current page
     - page_size: Items per page
@@ -73,6 +101,7 @@ def get_articles():
     page = request.args.get('page', 1, type=int)
     page_size = min(request.args.get('page_size', 20, type=int), 100)
     is_crisis = request.args.get('is_crisis')
+    collapse = request.args.get('collapse', 'false').lower() == 'true'
     
     session = get_session()
     
@@ -125,19 +154,33 @@ def get_articles():
             if not is_gdelt_title_scraped_failed(a.title, a.source_name)
         ]
         
+        # Keep the most recent article of each near-duplicate cluster
+        if collapse:
+            clusters = collapse_by_group(filtered_articles)
+        else:
+            clusters = [(a, 1) for a in filtered_articles]
+        
         # Get total count after filtering
-        total = len(filtered_articles)
+        total = len(clusters)
         
         # Paginate
         offset = (page - 1) * page_size
-        articles = filtered_articles[offset:offset + page_size]
+        page_clusters = clusters[offset:offset + page_size]
+        
+        article_dicts = []
+        for article, cluster_size in page_clusters:
+            article_dict = article.to_dict()
+            if collapse:
+                article_dict['cluster_size'] = cluster_size
+            article_dicts.append(article_dict)
         
         return jsonify({
-            'articles': [a.to_dict() for a in articles],
+            'articles': article_dicts,
             'total': total,
             'page': page,
             'page_size': page_size,
             'total_pages': (total + page_size - 1) // page_size,
+            'collapsed': collapse,
         })
         
     except Exception as e:
@@ -244,10 +287,15 @@ def get_map_data():
     
     Returns country-level crisis scores for heatmap display.
     
+    Query Parameters:
+    - collapse: Count each near-duplicate cluster once (default: false)
+    
     Returns:
     - countries: Dictionary of country_code -> crisis_count
     - total_crisis: Total crisis articles
     """
+    collapse = request.args.get('collapse', 'false').lower() == 'true'
+    
     session = get_session()
     
     try:
@@ -270,6 +318,9 @@ def get_map_data():
             )
         ).all()
         
+        if collapse:
+            crisis_articles = [a for a, _ in collapse_by_group(crisis_articles)]
+        
         # Count by country
         country_scores = {}
         for article in crisis_articles:
@@ -370,6 +421,9 @@ def get_wordcloud_data():
     - 조사/관사 필터링
     - 키워드 100개로 확장
     
+    Query Parameters:
+    - collapse: Count each near-duplicate cluster once (default: false)
+    
     Returns:
     - keywords: List of {text, count, size}
     - total_articles: Number of articles analyzed
@@ -436,6 +490,8 @@ def get_wordcloud_data():
     # 가격 패턴
     PRICE_PATTERN = re.compile(r'(\d+만\d*원?|△\w+|\d{2,}만|\d+원)')
     
+    collapse = request.args.get('collapse', 'false').lower() == 'true'
+    
     session = get_session()
     
     try:
@@ -456,6 +512,9 @@ def get_wordcloud_data():
             )
         ).all()
         
+        if collapse:
+            articles = [a for a, _ in collapse_by_group(articles)]
+        
         keyword_counts = Counter()
         
         for article in articles:
@@ -739,7 +798,7 @@ def _analyze_unprocessed_articles():
             except Exception as e:
                 logger.warning(f"Error analyzing article {article.id}: {e}")
         
-        session.commit()
+        run_write(session.commit)
         
     except Exception as e:
         session.rollback()
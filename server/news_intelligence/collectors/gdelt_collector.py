@@ -8,18 +8,40 @@ Uses existing GDELT data infrastructure from gdelt_backend.
 import os
 import sys
 import re
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 from pathlib import Path
 from .base import BaseCollector
+from .title_scraper import TitleCache, HostSessionPool
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Simple cache for fetched titles (to avoid re-fetching)
-_title_cache: Dict[str, str] = {}
+# Title fetch budget for one collection run; unfinished fetches keep the fallback title
+TITLE_FETCH_TIMEOUT = 30
+
+# Shared across collector instances (a new manager is created per scheduled run)
+_title_cache: Optional[TitleCache] = None
+_session_pool: Optional[HostSessionPool] = None
+_shared_lock = threading.Lock()
+
+
+def _get_title_cache() -> TitleCache:
+    global _title_cache
+    with _shared_lock:
+        if _title_cache is None:
+            _title_cache = TitleCache()
+        return _title_cache
+
+
+def _get_session_pool() -> HostSessionPool:
+    global _session_pool
+    with _shared_lock:
+        if _session_pool is None:
+            _session_pool = HostSessionPool()
+        return _session_pool
 
 # Add parent directory for gdelt_backend import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -118,34 +140,42 @@ class GDELTCollector(BaseCollector):
         """
         Fetch the title from a URL by scraping the HTML.
         
+        Results (including failures) are stored in the persistent title cache.
+        
         Args:
             url: The URL to fetch
             
         Returns:
             The title or None if failed
         """
-        global _title_cache
-        
-        # Check cache first
-        if url in _title_cache:
-            return _title_cache[url]
-        
         # Skip non-http URLs
         if not url or not url.startswith('http'):
             return None
         
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=5, allow_redirects=True)
-            response.raise_for_status()
+        cache = _get_title_cache()
+        
+        # Check cache first (a hit may be a cached failure)
+        hit, cached_title = cache.get(url)
+        if hit:
+            return cached_title
+        
+        title = self._scrape_title(url)
+        cache.set(url, title)
+        return title
+    
+    def _scrape_title(self, url: str) -> Optional[str]:
+        """
+        Download the page head through the pooled per-host session and parse its title.
+        
+        Args:
+            url: The URL to fetch
             
-            # Try to find title in HTML
-            html = response.text[:10000]  # Only check first 10KB
+        Returns:
+            The title or None if failed
+        """
+        try:
+            # Only the head of the page is read (streaming stops at </title>)
+            html = _get_session_pool().fetch_head(url)
             
             # Try <title> tag first
             title_match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
@@ -155,7 +185,6 @@ class GDELTCollector(BaseCollector):
                 title = re.sub(r'\s*[\|\-–—]\s*[^|\-–—]+$', '', title)
                 title = title.strip()
                 if title and len(title) > 5:
-                    _title_cache[url] = title
                     return title
             
             # Try og:title meta tag
@@ -163,7 +192,6 @@ class GDELTCollector(BaseCollector):
             if og_title_match:
                 title = og_title_match.group(1).strip()
                 if title and len(title) > 5:
-                    _title_cache[url] = title
                     return title
             
             return None
@@ -172,13 +200,19 @@ class GDELTCollector(BaseCollector):
             self.logger.debug(f"Failed to fetch title from {url}: {e}")
             return None
     
-    def _fetch_titles_parallel(self, articles: List[Dict[str, Any]], max_workers: int = 10):
+    def _fetch_titles_parallel(self, articles: List[Dict[str, Any]], max_workers: int = 10,
+                               timeout: float = TITLE_FETCH_TIMEOUT):
         """
         Fetch titles for articles in parallel.
         
+        Cached titles are resolved with one bulk lookup first. Fetches still
+        running after the timeout are abandoned and their articles keep the
+        fallback title, so a slow host never drops the whole batch.
+        
         Args:
             articles: List of article dictionaries
             max_workers: Maximum number of parallel workers
+            timeout: Seconds to wait for all fetches
         """
         # All GDELT articles need title fetching
         needs_fetch = [
@@ -189,33 +223,65 @@ class GDELTCollector(BaseCollector):
         if not needs_fetch:
             return
         
-        self.logger.info(f"Fetching titles for {len(needs_fetch)} GDELT articles...")
+        cache = _get_title_cache()
+        cached = cache.get_many(a['url'] for _, a in needs_fetch)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit fetch tasks
-            future_to_idx = {
-                executor.submit(self._fetch_title_from_url, a['url']): i
-                for i, a in needs_fetch
-            }
-            
-            # Process completed futures
-            fetched_count = 0
-            for future in as_completed(future_to_idx, timeout=30):
-                idx = future_to_idx[future]
-                try:
-                    title = future.result()
-                    if title:
-                        articles[idx]['title'] = title
-                        articles[idx]['title_scraped'] = True  # Mark as successfully scraped
+        cache_hits = 0
+        to_fetch = []
+        for i, a in needs_fetch:
+            if a['url'] in cached:
+                self._apply_title(articles[i], cached[a['url']][1])
+                cache_hits += 1
+            else:
+                to_fetch.append((i, a))
+        
+        self.logger.info(f"Fetching titles for {len(to_fetch)} GDELT articles ({cache_hits} cached)...")
+        
+        fetched_count = 0
+        if to_fetch:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                # Submit fetch tasks
+                future_to_idx = {
+                    executor.submit(self._fetch_title_from_url, a['url']): i
+                    for i, a in to_fetch
+                }
+                
+                done, not_done = wait(future_to_idx, timeout=timeout)
+                
+                # Process completed futures
+                for future in done:
+                    idx = future_to_idx[future]
+                    try:
+                        title = future.result()
+                    except Exception as e:
+                        self.logger.debug(f"Error fetching title: {e}")
+                        title = None
+                    if self._apply_title(articles[idx], title):
                         fetched_count += 1
-                    else:
-                        articles[idx]['title_scraped'] = False  # Mark as failed
-                except Exception as e:
-                    self.logger.debug(f"Error fetching title: {e}")
-                    articles[idx]['title_scraped'] = False  # Mark as failed
+                
+                # Timed out: keep fallback titles for the rest
+                for future in not_done:
+                    articles[future_to_idx[future]]['title_scraped'] = False
+                if not_done:
+                    self.logger.warning(
+                        f"Title fetch timed out after {timeout}s; {len(not_done)} articles keep fallback titles"
+                    )
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
         
+        cache.prune()
         self.logger.info(f"Fetched {fetched_count} titles from URLs")
     
+    def _apply_title(self, article: Dict[str, Any], title: Optional[str]) -> bool:
+        """Set a scraped title on an article; returns True if one was applied"""
+        if title:
+            article['title'] = title
+            article['title_scraped'] = True  # Mark as successfully scraped
+            return True
+        article['title_scraped'] = False  # Mark as failed
+        return False
+    
     def _convert_alert_to_article(self, alert: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Convert GDELT alert to news article format.
@@ -14,7 +14,8 @@ from .gdelt_collector import GDELTCollector
 from .google_news_collector import GoogleNewsCollector
 from .naver_news_collector import NaverNewsCollector
 from .base import article_filter
-from ..models import NewsArticle, CollectionLog, get_session, init_database
+from ..models import NewsArticle, CollectionLog, get_session, init_database, run_write
+from ..dedup import get_dedup_index, simhash
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class NewsCollectorManager:
     Features:
     - Runs all collectors in sequence
     - Handles deduplication based on URL
+    - Clusters near-duplicate (syndicated) articles via group_id
     - Logs collection statistics
     - Manages database storage
     """
@@ -72,6 +74,7 @@ class NewsCollectorManager:
             'total_collected': 0,
             'new_articles': 0,
             'duplicates': 0,
+            'near_duplicates': 0,
             'filtered_out': 0,
             'kr_count': 0,
             'global_count': 0,
@@ -101,11 +104,12 @@ class NewsCollectorManager:
         all_articles = article_filter.filter_articles(all_articles)
         result['filtered_out'] = article_filter.get_filtered_count()
         
-        # Store articles (with deduplication)
+        # Store articles (with deduplication) on the single writer thread
         try:
-            stored_count, duplicate_count = self._store_articles(all_articles)
+            stored_count, duplicate_count, near_duplicate_count = run_write(self._store_articles, all_articles)
             result['new_articles'] = stored_count
             result['duplicates'] = duplicate_count
+            result['near_duplicates'] = near_duplicate_count
             
             # Count by type
             session = get_session()
@@ -127,7 +131,7 @@ class NewsCollectorManager:
         
         # Archive old articles
         try:
-            archived_count = self._archive_old_articles()
+            archived_count = run_write(self._archive_old_articles)
             result['archived'] = archived_count
         except Exception as e:
             self.logger.error(f"Error archiving old articles: {e}")
@@ -137,7 +141,7 @@ class NewsCollectorManager:
         
         # Log collection result
         try:
-            self._log_collection(result)
+            run_write(self._log_collection, result)
         except Exception as e:
             self.logger.error(f"Error logging collection: {e}")
         
@@ -147,17 +151,26 @@ class NewsCollectorManager:
         """
         Store articles in database with deduplication.
         
+        Exact duplicates (same URL) are skipped. Near-duplicates are stored
+        but share the group_id of their cluster and inherit its AI analysis,
+        so they never enter the analysis backlog. Articles with no title or
+        summary text are stored without a group_id.
+        
         Args:
             articles: List of article dictionaries
             
         Returns:
-            Tuple of (stored_count, duplicate_count)
+            Tuple of (stored_count, duplicate_count, near_duplicate_count)
         """
         session = get_session()
         stored_count = 0
         duplicate_count = 0
+        near_duplicate_count = 0
         
         try:
+            dedup_index = get_dedup_index(session)
+            dedup_index.prune()
+            
             for article_data in articles:
                 url = article_data.get('url')
                 if not url:
@@ -187,6 +200,13 @@ class NewsCollectorManager:
                     status='ACTIVE',
                 )
                 
+                fingerprint = simhash(article.title, article.content_summary)
+                if fingerprint is not None:  # no title/summary text: leave unclustered
+                    article.group_id, is_near_duplicate = dedup_index.assign(fingerprint)
+                    if is_near_duplicate:
+                        near_duplicate_count += 1
+                        self._copy_group_analysis(session, article)
+                
                 session.add(article)
                 stored_count += 1
             
@@ -198,7 +218,27 @@ class NewsCollectorManager:
         finally:
             session.close()
         
-        return stored_count, duplicate_count
+        return stored_count, duplicate_count, near_duplicate_count
+    
+    def _copy_group_analysis(self, session, article: NewsArticle):
+        """
+        Copy AI analysis from an already analyzed member of the article's cluster.
+        
+        Args:
+            session: Active database session
+            article: New (unsaved) article with group_id set
+        """
+        with session.no_autoflush:
+            analyzed = session.query(NewsArticle).filter(
+                NewsArticle.group_id == article.group_id,
+                NewsArticle.category.isnot(None)
+            ).first()
+        
+        if analyzed:
+            article.category = analyzed.category
+            article.country_tags = analyzed.country_tags
+            article.keywords = analyzed.keywords
+            article.is_crisis = analyzed.is_crisis
     
     def _archive_old_articles(self) -> int:
         """
@@ -0,0 +1,277 @@
+"""
+Title Scraping Support for GDELT Collector
+
+GDELT events only carry a source URL, so article titles are scraped from the
+page itself. This module keeps that cheap:
+- TitleCache: SQLite-backed URL -> title cache with expiry and negative caching
+- HostSessionPool: pooled requests.Session per host with a concurrency cap,
+  bounded to the most recently used hosts
+- fetch_html_head(): streams a page and stops once </title> has been read
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+import logging
+
+from sqlite_profile import connect as sqlite_connect
+
+logger = logging.getLogger(__name__)
+
+# Successful titles rarely change; failed URLs are retried sooner
+TITLE_TTL_SECONDS = 7 * 24 * 3600
+NEGATIVE_TTL_SECONDS = 6 * 3600
+MAX_CACHE_ENTRIES = 50000
+
+# Concurrent requests allowed against a single host
+MAX_CONNECTIONS_PER_HOST = 2
+# Idle host sessions kept alive (GDELT reports thousands of publisher hosts over time)
+MAX_HOST_SESSIONS = 256
+
+# Stop reading a page after this many bytes even if </title> was not seen
+MAX_HEAD_BYTES = 10000
+CHUNK_SIZE = 2048
+
+REQUEST_TIMEOUT = 5
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+_TITLE_END = re.compile(rb'</title\s*>', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+def get_default_cache_path() -> str:
+    """Cache database lives next to news_intelligence.db in the server directory"""
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, 'gdelt_title_cache.db')
+
+
+class TitleCache:
+    """
+    Persistent URL -> title cache.
+
+    A NULL title records a failed fetch (negative cache) so dead or
+    title-less URLs are not re-requested on every collection run.
+    """
+
+    def __init__(self, db_path: str = None, ttl_seconds: float = TITLE_TTL_SECONDS,
+                 negative_ttl_seconds: float = NEGATIVE_TTL_SECONDS,
+                 max_entries: int = MAX_CACHE_ENTRIES):
+        self.db_path = db_path or get_default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite_connect(self.db_path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS title_cache (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_title_cache_expires ON title_cache (expires_at)')
+        self._conn.commit()
+
+    def get(self, url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a URL.
+
+        Returns:
+            Tuple of (hit, title); title is None for a negative hit
+        """
+        return self.get_many([url]).get(url, (False, None))
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Look up many URLs with one query per 500 URLs.
+
+        Returns:
+            Dictionary of url -> (True, title) for unexpired entries only
+        """
+        urls = list(urls)
+        now = time.time()
+        results = {}
+
+        with self._lock:
+            for start in range(0, len(urls), 500):
+                batch = urls[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f'SELECT url, title FROM title_cache WHERE expires_at > ? AND url IN ({placeholders})',
+                    [now, *batch]
+                ).fetchall()
+                for url, title in rows:
+                    results[url] = (True, title)
+
+        return results
+
+    def set(self, url: str, title: Optional[str]):
+        """Store a title, or None to negatively cache a failed URL"""
+        now = time.time()
+        ttl = self.ttl_seconds if title else self.negative_ttl_seconds
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO title_cache (url, title, fetched_at, expires_at) VALUES (?, ?, ?, ?)',
+                (url, title, now, now + ttl)
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """
+        Drop expired entries and trim the oldest ones beyond max_entries.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                'DELETE FROM title_cache WHERE expires_at <= ?', (time.time(),)
+            ).rowcount
+
+            count = self._conn.execute('SELECT COUNT(*) FROM title_cache').fetchone()[0]
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    'DELETE FROM title_cache WHERE url IN '
+                    '(SELECT url FROM title_cache ORDER BY fetched_at ASC LIMIT ?)',
+                    (count - self.max_entries,)
+                ).rowcount
+
+            self._conn.commit()
+
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _HostEntry:
+    __slots__ = ('session', 'semaphore', 'active')
+
+    def __init__(self, session: requests.Session, semaphore: threading.BoundedSemaphore):
+        self.session = session
+        self.semaphore = semaphore
+        self.active = 0
+
+
+class HostSessionPool:
+    """
+    One pooled requests.Session per host, with a per-host concurrency cap.
+
+    Reusing the session keeps TCP/TLS connections alive across the many
+    URLs GDELT reports for the same publisher. Only the max_hosts most
+    recently used hosts are kept; idle sessions beyond that are closed.
+    """
+
+    def __init__(self, max_per_host: int = MAX_CONNECTIONS_PER_HOST, max_hosts: int = MAX_HOST_SESSIONS):
+        self.max_per_host = max_per_host
+        self.max_hosts = max_hosts
+        self._entries: 'OrderedDict[str, _HostEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _acquire(self, host: str) -> _HostEntry:
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_per_host)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                entry = self._entries[host] = _HostEntry(session, threading.BoundedSemaphore(self.max_per_host))
+            else:
+                self._entries.move_to_end(host)
+            entry.active += 1
+            self._evict()
+            return entry
+
+    def _release(self, entry: _HostEntry):
+        with self._lock:
+            entry.active -= 1
+            self._evict()
+
+    def _evict(self):
+        """Close least recently used idle sessions over max_hosts (caller holds the lock)"""
+        excess = len(self._entries) - self.max_hosts
+        if excess <= 0:
+            return
+        for host in [host for host, entry in self._entries.items() if entry.active == 0][:excess]:
+            self._entries.pop(host).session.close()
+
+    def fetch_head(self, url: str, timeout: float = REQUEST_TIMEOUT) -> str:
+        """
+        Fetch the beginning of an HTML page through the host's session.
+
+        Raises:
+            requests.RequestException on network or HTTP errors
+        """
+        host = urlsplit(url).netloc.lower()
+        entry = self._acquire(host)
+        try:
+            with entry.semaphore:
+                return fetch_html_head(entry.session, url, timeout=timeout)
+        finally:
+            self._release(entry)
+
+    def close(self):
+        with self._lock:
+            for entry in self._entries.values():
+                entry.session.close()
+            self._entries.clear()
+
+
+def fetch_html_head(session: requests.Session, url: str, timeout: float = REQUEST_TIMEOUT,
+                    max_bytes: int = MAX_HEAD_BYTES) -> str:
+    """
+    Stream a page and return its decoded prefix.
+
+    Reading stops as soon as </title> has arrived or max_bytes were read,
+    and the connection is released without downloading the rest.
+    """
+    with session.get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+        response.raise_for_status()
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not chunk:
+                continue
+            buffer.extend(chunk)
+            # Only the tail can contain a tag split across chunks
+            if _TITLE_END.search(buffer, max(0, len(buffer) - len(chunk) - 16)):
+                break
+            if len(buffer) >= max_bytes:
+                break
+
+        return _decode_html(bytes(buffer[:max_bytes]), response)
+
+
+def _decode_html(raw: bytes, response: requests.Response) -> str:
+    content_type = response.headers.get('Content-Type', '')
+    encoding = response.encoding if 'charset' in content_type.lower() else None
+
+    if not encoding:
+        charset_match = _META_CHARSET.search(raw)
+        encoding = charset_match.group(1).decode('ascii') if charset_match else 'utf-8'
+
+    try:
+        return raw.decode(encoding, errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
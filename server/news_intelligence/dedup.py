@@ -0,0 +1,300 @@
+"""
+Near-Duplicate Detection for News Articles
+
+Syndicated copies of one story arrive from several feeds with different URLs.
+This module fingerprints title + summary with a 64-bit SimHash and keeps an
+LSH band index so each new article is matched against existing clusters
+without scanning every stored row.
+
+- simhash(): 64-bit fingerprint over word shingles (None for articles without text)
+- SimHashIndex: banded LSH index that maps a fingerprint to a group_id
+- get_dedup_index(): process-wide index, warmed from ACTIVE articles
+- collapse_by_group(): keep one representative per group_id
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+# 4 bands x 16 bits: by pigeonhole, two fingerprints within Hamming distance 3
+# always agree on at least one band, so band lookups never miss a true match.
+NUM_BANDS = 4
+MAX_HAMMING_DISTANCE = 3
+
+# Entries older than this are evicted (articles are archived after 24 hours)
+INDEX_RETENTION_SECONDS = 48 * 3600
+
+_TOKEN_PATTERN = re.compile(r'[\w가-힣]+')
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _feature_hash(feature: str) -> int:
+    digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def simhash(title: str, summary: str = '') -> Optional[int]:
+    """
+    Compute a 64-bit SimHash fingerprint for an article.
+
+    Features are word bigrams (single words for one-word texts), so reordered
+    or lightly edited copies of the same story land within a few bits.
+
+    Args:
+        title: Article title
+        summary: Article summary (optional)
+
+    Returns:
+        Unsigned 64-bit fingerprint, or None when title and summary have no
+        words (such articles have nothing to match on and stay unclustered)
+    """
+    tokens = _tokenize(f"{title or ''} {summary or ''}")
+    if not tokens:
+        return None
+
+    if len(tokens) == 1:
+        features = tokens
+    else:
+        features = [f"{tokens[i]} {tokens[i + 1]}" for i in range(len(tokens) - 1)]
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        h = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            if h & (1 << bit):
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints"""
+    return bin(a ^ b).count('1')
+
+
+def make_group_id(fingerprint: int) -> str:
+    """Group id derived from the fingerprint of the first article in a cluster"""
+    return f"sh-{fingerprint:016x}"
+
+
+class SimHashIndex:
+    """
+    Banded LSH index over SimHash fingerprints.
+
+    Each fingerprint is split into NUM_BANDS bands; every band value is a
+    bucket key. A lookup only compares against fingerprints that share a
+    bucket, which keeps matching sub-linear in the number of stored articles.
+    """
+
+    def __init__(self, num_bands: int = NUM_BANDS, max_distance: int = MAX_HAMMING_DISTANCE,
+                 retention_seconds: float = INDEX_RETENTION_SECONDS):
+        if FINGERPRINT_BITS % num_bands != 0:
+            raise ValueError(f"num_bands must divide {FINGERPRINT_BITS}")
+        if max_distance >= num_bands:
+            raise ValueError("max_distance must be smaller than num_bands")
+
+        self.num_bands = num_bands
+        self.band_bits = FINGERPRINT_BITS // num_bands
+        self.max_distance = max_distance
+        self.retention_seconds = retention_seconds
+
+        self._band_mask = (1 << self.band_bits) - 1
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(num_bands)]
+        self._entries: Dict[int, Tuple[str, float]] = {}  # fingerprint -> (group_id, added_at)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bands(self, fingerprint: int) -> Iterable[Tuple[int, int]]:
+        for i in range(self.num_bands):
+            yield i, (fingerprint >> (i * self.band_bits)) & self._band_mask
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """
+        Find the group_id of the closest indexed fingerprint.
+
+        Returns:
+            group_id if a fingerprint within max_distance exists, else None
+        """
+        with self._lock:
+            return self._find_locked(fingerprint)
+
+    def _find_locked(self, fingerprint: int) -> Optional[str]:
+        best_group = None
+        best_distance = self.max_distance + 1
+
+        for band_index, band_value in self._bands(fingerprint):
+            for candidate in self._buckets[band_index].get(band_value, ()):
+                distance = hamming_distance(fingerprint, candidate)
+                if distance < best_distance:
+                    best_distance = distance
+                    best_group = self._entries[candidate][0]
+                    if distance == 0:
+                        return best_group
+        return best_group
+
+    def add(self, fingerprint: int, group_id: str, added_at: Optional[float] = None):
+        """Add a fingerprint to the index under the given group"""
+        with self._lock:
+            self._add_locked(fingerprint, group_id, added_at)
+
+    def _add_locked(self, fingerprint: int, group_id: str, added_at: Optional[float] = None):
+        if fingerprint in self._entries:
+            return
+        self._entries[fingerprint] = (group_id, added_at if added_at is not None else time.time())
+        for band_index, band_value in self._bands(fingerprint):
+            self._buckets[band_index].setdefault(band_value, []).append(fingerprint)
+
+    def assign(self, fingerprint: int) -> Tuple[str, bool]:
+        """
+        Find or create the group for a fingerprint and index it.
+
+        Returns:
+            Tuple of (group_id, is_duplicate)
+        """
+        with self._lock:
+            group_id = self._find_locked(fingerprint)
+            is_duplicate = group_id is not None
+            if group_id is None:
+                group_id = make_group_id(fingerprint)
+            self._add_locked(fingerprint, group_id)
+            return group_id, is_duplicate
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Evict entries older than the retention window.
+
+        Returns:
+            Number of evicted fingerprints
+        """
+        cutoff = (now if now is not None else time.time()) - self.retention_seconds
+
+        with self._lock:
+            expired = [fp for fp, (_, added_at) in self._entries.items() if added_at < cutoff]
+            for fingerprint in expired:
+                del self._entries[fingerprint]
+                for band_index, band_value in self._bands(fingerprint):
+                    bucket = self._buckets[band_index].get(band_value)
+                    if bucket is None:
+                        continue
+                    bucket.remove(fingerprint)
+                    if not bucket:
+                        del self._buckets[band_index][band_value]
+
+        return len(expired)
+
+
+# Process-wide index shared by collection runs
+_dedup_index: Optional[SimHashIndex] = None
+_dedup_index_lock = threading.Lock()
+
+
+def get_dedup_index(session=None) -> SimHashIndex:
+    """
+    Get the shared dedup index, warming it from the database on first use.
+
+    Warming fingerprints every ACTIVE article and backfills group_id on rows
+    stored before clustering existed. Articles without text are left out of
+    the index and any group_id they were given is cleared.
+
+    Args:
+        session: Optional SQLAlchemy session used for the initial warm-up
+    """
+    global _dedup_index
+
+    if _dedup_index is not None:
+        return _dedup_index
+
+    with _dedup_index_lock:
+        if _dedup_index is None:
+            index = SimHashIndex()
+            if session is not None:
+                _warm_index(index, session)
+            _dedup_index = index
+
+    return _dedup_index
+
+
+def reset_dedup_index():
+    """Drop the shared index (used by tests and after bulk deletes)"""
+    global _dedup_index
+    with _dedup_index_lock:
+        _dedup_index = None
+
+
+def _warm_index(index: SimHashIndex, session):
+    from .models import NewsArticle
+
+    articles = session.query(NewsArticle).filter(
+        NewsArticle.status == 'ACTIVE'
+    ).order_by(NewsArticle.id.asc()).all()
+
+    backfilled = 0
+    for article in articles:
+        fingerprint = simhash(article.title, article.content_summary)
+        if fingerprint is None:
+            if article.group_id:
+                article.group_id = None
+                backfilled += 1
+            continue
+        if article.group_id:
+            index.add(fingerprint, article.group_id)
+        else:
+            article.group_id, _ = index.assign(fingerprint)
+            backfilled += 1
+
+    if backfilled:
+        session.commit()
+
+    logger.info(f"Dedup index warmed with {len(index)} fingerprints ({backfilled} group_id backfilled)")
+
+
+def collapse_by_group(items: List[Any], key: Callable[[Any], Optional[str]] = None) -> List[Tuple[Any, int]]:
+    """
+    Keep the first item of each group, preserving input order.
+
+    Items without a group are kept as their own cluster.
+
+    Args:
+        items: Items ordered by preference (first one becomes representative)
+        key: Function returning the group_id of an item (default: .group_id)
+
+    Returns:
+        List of (representative, cluster_size) tuples
+    """
+    if key is None:
+        key = lambda item: item.group_id
+
+    representatives: List[List[Any]] = []
+    positions: Dict[str, int] = {}
+
+    for item in items:
+        group_id = key(item)
+        if group_id is None:
+            representatives.append([item, 1])
+            continue
+        position = positions.get(group_id)
+        if position is None:
+            positions[group_id] = len(representatives)
+            representatives.append([item, 1])
+        else:
+            representatives[position][1] += 1
+
+    return [(item, size) for item, size in representatives]
@@ -7,13 +7,15 @@ Database Models for News Intelligence Service
 from datetime import datetime, timezone
 from sqlalchemy import (
     Column, Integer, String, Text, DateTime, Boolean, 
-    Float, JSON, Enum, Index, create_engine
+    Float, JSON, Enum, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import enum
 import os
 
+from sqlite_profile import get_engine, get_write_queue
+
 Base = declarative_base()
 
 
@@ -91,6 +93,7 @@ class NewsArticle(Base):
         Index('idx_news_type_category', 'news_type', 'category'),
         Index('idx_news_is_crisis', 'is_crisis'),
         Index('idx_news_url', 'url'),
+        Index('idx_news_group_id', 'group_id'),
     )
     
     def to_dict(self):
@@ -114,6 +117,7 @@ class NewsArticle(Base):
             'num_articles': self.num_articles,
             'keywords': self.keywords or [],
             'status': self.status,
+            'group_id': self.group_id,
         }
 
 
@@ -187,14 +191,24 @@ def get_database_url():
 
 def init_database():
     """Initialize database and create tables"""
-    engine = create_engine(get_database_url(), echo=False)
+    engine = get_engine(get_database_url(), echo=False)
     Base.metadata.create_all(engine)
     return engine
 
 
 def get_session():
-    """Get a new database session"""
-    engine = create_engine(get_database_url(), echo=False)
+    """Get a new database session (engine is shared per database URL)"""
+    engine = get_engine(get_database_url(), echo=False)
     Session = sessionmaker(bind=engine)
     return Session()
 
+
+def run_write(fn, *args, **kwargs):
+    """
+    Run a write job on the single writer thread for this database.
+    
+    Collection, archiving and analysis jobs write through here so they never
+    hold competing write transactions; readers are not blocked (WAL).
+    """
+    return get_write_queue(get_database_url()).run(fn, *args, **kwargs)
+
@@ -20,8 +20,13 @@ from config import BASE_DIR, QUOTE_BACKEND_DIR, QUOTE_BACKEND_PORT
 
 logger = logging.getLogger(__name__)
 
+QUOTE_BACKEND_START_TIMEOUT = 10.0  # 초
+QUOTE_BACKEND_POLL_INTERVAL = 0.1
+
 # Global variable to store quote_backend process
 _quote_backend_process = None
+# 서브프로세스를 시작한 프로세스 (serve.py 워커는 fork로 핸들을 물려받지만 종료하면 안 됨)
+_quote_backend_owner_pid = None
 
 
 def is_port_in_use(port: int, host: str = 'localhost') -> bool:
@@ -41,7 +46,7 @@ def start_quote_backend() -> subprocess.Popen:
     Returns:
         subprocess.Popen: 시작된 프로세스 객체 또는 None
     """
-    global _quote_backend_process
+    global _quote_backend_process, _quote_backend_owner_pid
     
     quote_backend_main = QUOTE_BACKEND_DIR / 'main.py'
     
@@ -85,13 +90,19 @@ def start_quote_backend() -> subprocess.Popen:
                 preexec_fn=os.setsid
             )
         
+        _quote_backend_owner_pid = os.getpid()
+        
         # Wait for the server to start (uvicorn needs a moment)
-        max_wait = 10
-        for i in range(max_wait):
-            time.sleep(1)
+        # 짧은 간격으로 확인해 포트가 열리는 즉시 반환 (최대 QUOTE_BACKEND_START_TIMEOUT초)
+        deadline = time.monotonic() + QUOTE_BACKEND_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if _quote_backend_process.poll() is not None:
+                logger.warning(f"Quote Backend exited with code {_quote_backend_process.returncode}. Check {log_file}")
+                return _quote_backend_process
             if is_port_in_use(QUOTE_BACKEND_PORT):
                 logger.info(f"Quote Backend started successfully (PID: {_quote_backend_process.pid})")
                 return _quote_backend_process
+            time.sleep(QUOTE_BACKEND_POLL_INTERVAL)
         
         # If we get here, server didn't start
         logger.warning(f"Quote Backend may not have started properly. Check {log_file}")
@@ -106,6 +117,9 @@ def stop_quote_backend():
     """Quote Backend 서브프로세스를 종료합니다."""
     global _quote_backend_process
     
+    if _quote_backend_process and _quote_backend_owner_pid != os.getpid():
+        return
+    
     if _quote_backend_process:
         try:
             logger.info("Stopping Quote Backend...")
@@ -1,17 +1,23 @@
 """
 Report & Insight Module
-MVP Version: No Auth, PDF stored in DB
+MVP Version: No Auth, PDF stored on disk by sha256, metadata in DB
 """
 
-from .models import ReportDB, ReportFileDB, init_db, get_db, SessionLocal
+from .models import ReportDB, ReportFileDB, ReportTagDB, ReportTagCountDB, init_db, get_db, SessionLocal
+from .storage import PDFStore, pdf_store, attach_pdf
 from .api import report_bp
 
 __all__ = [
     'ReportDB',
     'ReportFileDB', 
+    'ReportTagDB',
+    'ReportTagCountDB',
     'init_db',
     'get_db',
     'SessionLocal',
+    'PDFStore',
+    'pdf_store',
+    'attach_pdf',
     'report_bp'
 ]
 
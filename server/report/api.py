@@ -1,15 +1,25 @@
 """
 Report & Insight - Backend API (Flask version)
 Flask Blueprint for report management
-MVP Version: No Auth/Bookmarks, PDF download from DB
+MVP Version: No Auth/Bookmarks, PDF download from the sha256 PDF store
 """
 
-from flask import Blueprint, request, jsonify, Response
-from sqlalchemy import func, or_, desc, asc
+from flask import Blueprint, request, jsonify, send_file
+from sqlalchemy import func, desc, asc
 from datetime import date
+import logging
 import uuid
 
 from .models import ReportDB, ReportFileDB, init_db, SessionLocal
+from .search import apply_search, get_highlights
+from .storage import pdf_store
+from .tags import normalize_tags, related_reports, tag_facets, tag_filter
+from http_cache import NO_CACHE, register_cache_policy
+
+logger = logging.getLogger(__name__)
+
+# PDF 내용은 sha256으로 고정되므로 ETag 재검증만으로 충분
+PDF_MAX_AGE = 3600
 
 # Create Flask Blueprint
 report_bp = Blueprint('reports', __name__, url_prefix='/api/reports')
@@ -46,7 +56,7 @@ def report_to_response(report: ReportDB, include_file: bool = True) -> dict:
         response["has_pdf"] = True
     else:
         response["file"] = None
-        response["has_pdf"] = bool(report.files) if hasattr(report, 'files') else False
+        response["has_pdf"] = bool(report.has_pdf)
     
     return response
 
@@ -62,7 +72,7 @@ def report_to_list_item(report: ReportDB) -> dict:
         "summary": report.summary,
         "tags": report.get_tags(),
         "is_featured": report.is_featured,
-        "has_pdf": bool(report.files) if hasattr(report, 'files') else False
+        "has_pdf": bool(report.has_pdf)
     }
 
 
@@ -71,6 +81,22 @@ def get_session():
     return SessionLocal()
 
 
+def _data_version():
+    """HTTP 캐시 검증자: reports의 MAX(updated_at) + 행 수 (수정/추가/삭제 시 바뀜)"""
+    db = get_session()
+    try:
+        return repr(tuple(db.query(func.max(ReportDB.updated_at), func.count(ReportDB.id)).one()))
+    finally:
+        db.close()
+
+
+# 관리 화면에서 바로 수정하므로 매번 재검증 (변경 없으면 쿼리 없이 304)
+# PDF 다운로드는 send_file의 sha256 ETag / max-age를 그대로 사용
+cache_policy = register_cache_policy(
+    report_bp, NO_CACHE, validator=_data_version, exempt=('reports.download_report',)
+)
+
+
 # ============================================
 # Report Endpoints
 # ============================================
@@ -88,7 +114,7 @@ def get_reports():
         search = request.args.get('search') or request.args.get('q')  # Support both
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
-        sort = request.args.get('sort', 'newest')
+        sort = request.args.get('sort') or ('relevance' if search else 'newest')
         
         # Base query
         query = db.query(ReportDB)
@@ -100,21 +126,15 @@ def get_reports():
         if organization:
             query = query.filter(ReportDB.organization == organization)
         
-        if tags:
-            tag_list = [t.strip() for t in tags.split(",")]
-            for tag in tag_list:
-                query = query.filter(ReportDB.tags.contains(tag))
+        tag_list = normalize_tags(tags.split(",")) if tags else []
+        if tag_list:
+            # Reports having every tag (exact match via report_tags)
+            query = query.filter(ReportDB.id.in_(tag_filter(tag_list)))
         
+        rank, match = None, None
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    ReportDB.title.ilike(search_term),
-                    ReportDB.summary.ilike(search_term),
-                    ReportDB.organization.ilike(search_term),
-                    ReportDB.tags.ilike(search_term)
-                )
-            )
+            # FTS5 MATCH (bm25 rank) or LIKE fallback - see report/search.py
+            query, rank, match = apply_search(query, ReportDB, search)
         
         if date_from:
             query = query.filter(ReportDB.published_date >= date.fromisoformat(date_from))
@@ -123,7 +143,9 @@ def get_reports():
             query = query.filter(ReportDB.published_date <= date.fromisoformat(date_to))
         
         # Apply sorting
-        if sort == 'newest':
+        if sort == 'relevance' and rank is not None:
+            query = query.order_by(rank, desc(ReportDB.published_date))
+        elif sort in ('newest', 'relevance'):
             query = query.order_by(desc(ReportDB.published_date))
         elif sort == 'oldest':
             query = query.order_by(asc(ReportDB.published_date))
@@ -143,6 +165,13 @@ def get_reports():
         # Convert to response
         report_responses = [report_to_list_item(r) for r in reports]
         
+        # Highlighted title/summary (HTML-escaped, matches wrapped in <mark>)
+        if match:
+            highlights = get_highlights(db, [r.id for r in reports], match)
+            for item in report_responses:
+                if item["id"] in highlights:
+                    item["highlight"] = highlights[item["id"]]
+        
         return jsonify({
             "reports": report_responses,
             "total": total,
@@ -218,11 +247,6 @@ def get_filters():
     try:
         category = request.args.get('category')
         
-        # Base query for filtering
-        base_query = db.query(ReportDB)
-        if category and category != 'all':
-            base_query = base_query.filter(ReportDB.category == category)
-        
         # Organizations with counts
         org_counts = db.query(
             ReportDB.organization,
@@ -237,16 +261,8 @@ def get_filters():
             for org, count in sorted(org_counts, key=lambda x: -x[1])
         ]
         
-        # Tags with counts
-        all_tags = {}
-        for report in base_query.all():
-            for tag in report.get_tags():
-                all_tags[tag] = all_tags.get(tag, 0) + 1
-        
-        tags = [
-            {"name": tag, "count": count}
-            for tag, count in sorted(all_tags.items(), key=lambda x: -x[1])
-        ]
+        # Tags with counts (precomputed facet table)
+        tags = tag_facets(db, category if category and category != 'all' else None)
         
         return jsonify({
             "organizations": organizations,
@@ -273,12 +289,14 @@ def get_report(report_id):
 
 @report_bp.route('/<report_id>/download', methods=['GET'])
 def download_report(report_id):
-    """Download PDF file for a report"""
-    from urllib.parse import quote
+    """
+    Download PDF file for a report
     
+    파일을 청크 단위로 스트리밍하며 Range(206), ETag(sha256)/If-None-Match(304)를 지원합니다.
+    """
     db = get_session()
     try:
-        # Get the report file
+        # Get the report file metadata (content is in the PDF store)
         file = db.query(ReportFileDB)\
             .filter(ReportFileDB.report_id == report_id)\
             .first()
@@ -286,20 +304,23 @@ def download_report(report_id):
         if not file:
             return jsonify({"error": "PDF file not found for this report"}), 404
         
-        # Encode filename for Content-Disposition (RFC 5987)
-        # Use both filename (ASCII fallback) and filename* (UTF-8)
-        ascii_filename = file.file_name.encode('ascii', 'ignore').decode('ascii') or 'report.pdf'
-        encoded_filename = quote(file.file_name)
-        
-        # Return the PDF as binary response
-        return Response(
-            file.file_bytes,
-            mimetype=file.mime_type,
-            headers={
-                "Content-Disposition": f"attachment; filename=\"{ascii_filename}\"; filename*=UTF-8''{encoded_filename}",
-                "Content-Length": str(file.file_size)
-            }
+        path = pdf_store.path_for(file.sha256)
+        if not path.is_file():
+            logger.error(f"PDF missing from store: report={report_id} sha256={file.sha256}")
+            return jsonify({"error": "PDF file not found for this report"}), 404
+        
+        # Content-Disposition filename/filename* (RFC 5987) is built by send_file
+        response = send_file(
+            path,
+            mimetype=file.mime_type or "application/pdf",
+            as_attachment=True,
+            download_name=file.file_name,
+            etag=file.sha256,
+            conditional=True,
+            max_age=PDF_MAX_AGE,
         )
+        response.headers["Accept-Ranges"] = "bytes"
+        return response
     finally:
         db.close()
 
@@ -307,13 +328,12 @@ def download_report(report_id):
 @report_bp.route('/<report_id>/related', methods=['GET'])
 def get_related_reports(report_id):
     """
-    Get related reports based on MVP logic:
-    1. Same category_key
-    2. Same source/organization (if category allows)
-    3. Tag overlap
-    4. published_at DESC
-    5. Max 6
-    6. Exclude self
+    Get related reports ranked in one query (see report/tags.py):
+    1. Tag overlap (4 points per shared tag)
+    2. Same source/organization (2 points)
+    3. Same category_key (1 point)
+    4. published_at DESC on ties
+    5. Max 6, exclude self
     """
     db = get_session()
     try:
@@ -325,59 +345,7 @@ def get_related_reports(report_id):
         if not report:
             return jsonify({"error": "Report not found"}), 404
         
-        related_ids = set()
-        related_reports = []
-        
-        # Priority 1: Same category, different ID, newest first
-        same_category = db.query(ReportDB)\
-            .filter(ReportDB.category == report.category)\
-            .filter(ReportDB.id != report_id)\
-            .order_by(desc(ReportDB.published_date))\
-            .limit(limit)\
-            .all()
-        
-        for r in same_category:
-            if r.id not in related_ids and len(related_reports) < limit:
-                related_ids.add(r.id)
-                related_reports.append(r)
-        
-        # Priority 2: Same organization if not enough
-        if len(related_reports) < limit:
-            same_org = db.query(ReportDB)\
-                .filter(ReportDB.organization == report.organization)\
-                .filter(ReportDB.id != report_id)\
-                .filter(~ReportDB.id.in_(related_ids))\
-                .order_by(desc(ReportDB.published_date))\
-                .limit(limit - len(related_reports))\
-                .all()
-            
-            for r in same_org:
-                if r.id not in related_ids and len(related_reports) < limit:
-                    related_ids.add(r.id)
-                    related_reports.append(r)
-        
-        # Priority 3: Tag overlap if still not enough
-        if len(related_reports) < limit:
-            report_tags = report.get_tags()
-            if report_tags:
-                # Find reports with any matching tag
-                for tag in report_tags:
-                    if len(related_reports) >= limit:
-                        break
-                    tag_matches = db.query(ReportDB)\
-                        .filter(ReportDB.tags.contains(tag))\
-                        .filter(ReportDB.id != report_id)\
-                        .filter(~ReportDB.id.in_(related_ids))\
-                        .order_by(desc(ReportDB.published_date))\
-                        .limit(limit - len(related_reports))\
-                        .all()
-                    
-                    for r in tag_matches:
-                        if r.id not in related_ids and len(related_reports) < limit:
-                            related_ids.add(r.id)
-                            related_reports.append(r)
-        
-        return jsonify([report_to_list_item(r) for r in related_reports])
+        return jsonify([report_to_list_item(r) for r in related_reports(db, report, limit)])
     finally:
         db.close()
 
@@ -468,10 +436,14 @@ def delete_report(report_id):
         if not db_report:
             return jsonify({"error": "Report not found"}), 404
         
-        # Files are deleted automatically via cascade
+        # Files are deleted automatically via cascade (sha256는 유니크라 다른 리포트와 공유되지 않음)
+        file_hashes = [f.sha256 for f in db_report.files]
         db.delete(db_report)
         db.commit()
         
+        for sha256 in file_hashes:
+            pdf_store.delete(sha256)
+        
         return jsonify({"message": "Report deleted successfully"})
     except Exception as e:
         db.rollback()
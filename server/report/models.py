@@ -1,19 +1,21 @@
 """
 Report & Insight - Data Models
 SQLAlchemy models and Pydantic schemas for report management
-MVP Version: No Auth, PDF stored in PostgreSQL bytea
+MVP Version: No Auth, PDF stored on disk by sha256 (report/storage.py), metadata in DB
 """
 
 from datetime import date, datetime
 from typing import List, Optional
 from pathlib import Path
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, String, Text, Date, Boolean, DateTime, Integer, LargeBinary, ForeignKey, create_engine
+from sqlalchemy import Column, String, Text, Date, Boolean, DateTime, Integer, ForeignKey, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 import json
 import os
 
+from sqlite_profile import configure_engine
+
 Base = declarative_base()
 
 
@@ -35,12 +37,16 @@ class ReportDB(Base):
     key_insights = Column(Text, nullable=True)  # JSON array stored as text
     canonical_url = Column(String(500), nullable=True)
     is_featured = Column(Boolean, default=False)
+    has_pdf = Column(Boolean, default=False, nullable=False)  # report_files 존재 여부 (목록에서 조인 없이 사용)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationship to files
     files = relationship("ReportFileDB", back_populates="report", cascade="all, delete-orphan")
     
+    # Normalized tags (kept in sync with the tags JSON by report/tags.py)
+    tag_rows = relationship("ReportTagDB", cascade="all, delete-orphan")
+    
     def get_tags(self) -> List[str]:
         """Parse tags from JSON string"""
         if self.tags:
@@ -69,7 +75,7 @@ class ReportDB(Base):
 
 
 class ReportFileDB(Base):
-    """SQLAlchemy model for report files table - stores PDF binary"""
+    """SQLAlchemy model for report files table - PDF metadata (content lives in the PDF store)"""
     __tablename__ = "report_files"
     
     id = Column(String(50), primary_key=True)
@@ -77,14 +83,34 @@ class ReportFileDB(Base):
     file_name = Column(String(500), nullable=False)
     mime_type = Column(String(100), default="application/pdf")
     file_size = Column(Integer, nullable=False)
-    sha256 = Column(String(64), unique=True, nullable=False)
-    file_bytes = Column(LargeBinary, nullable=False)  # bytea for PDF storage
+    sha256 = Column(String(64), unique=True, nullable=False)  # PDF store key
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationship to report
     report = relationship("ReportDB", back_populates="files")
 
 
+class ReportTagDB(Base):
+    """SQLAlchemy model for report_tags table - one row per (report, tag)"""
+    __tablename__ = "report_tags"
+    
+    report_id = Column(String(50), ForeignKey("reports.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+    
+    __table_args__ = (
+        Index("ix_report_tags_tag_report", "tag", "report_id"),
+    )
+
+
+class ReportTagCountDB(Base):
+    """SQLAlchemy model for report_tag_counts table - facet counts per (category, tag)"""
+    __tablename__ = "report_tag_counts"
+    
+    category = Column(String(50), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
 # ============================================
 # Pydantic Schemas for API
 # ============================================
@@ -214,10 +240,10 @@ DATABASE_URL = get_database_url()
 
 # Engine configuration based on database type
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
+    engine = configure_engine(create_engine(
         DATABASE_URL, 
         connect_args={"check_same_thread": False}
-    )
+    ))
 else:
     # PostgreSQL connection
     engine = create_engine(DATABASE_URL)
@@ -227,7 +253,14 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     """Initialize database tables"""
+    from .search import ensure_fts
+    from .storage import migrate_legacy_blobs
+    from .tags import ensure_tag_index
+    
     Base.metadata.create_all(bind=engine)
+    migrate_legacy_blobs(engine)
+    ensure_fts(engine)
+    ensure_tag_index(engine)
 
 
 def get_db():
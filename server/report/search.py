@@ -0,0 +1,191 @@
+"""
+Report & Insight - Full-text Search
+SQLite FTS5 인덱스(reports_fts)로 리포트 검색, bm25 순위, 하이라이트 스니펫
+
+- reports 테이블의 INSERT/UPDATE/DELETE 트리거로 인덱스 자동 동기화 (ORM, seed, 직접 SQL 모두)
+- tags/key_insights(JSON 텍스트)는 json_each로 값만 꺼내 색인 (한글 \\uXXXX 이스케이프 제거)
+- 검색어는 토큰마다 접두어 검색("해운"* → 해운시장, 해운업…) 후 AND
+- FTS5를 쓸 수 없는 DB(PostgreSQL 등)에서는 기존 ilike 검색으로 대체
+"""
+
+import html
+import logging
+import re
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import column, func, literal_column, or_, table, text
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 컬럼 순서 = bm25 가중치 순서 (rowid = reports_fts_ids.id)
+FTS_COLUMNS = ("title", "summary", "organization", "tags", "key_insights")
+BM25_WEIGHTS = (10.0, 4.0, 6.0, 6.0, 2.0)
+SNIPPET_TOKENS = 24
+
+# 하이라이트 경계 표시 (HTML 이스케이프 후 <mark>로 치환)
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+fts_enabled = False
+
+# reports.id(문자열) ↔ FTS rowid 매핑
+# reports의 암묵적 rowid는 VACUUM 시 바뀔 수 있으므로 INTEGER PRIMARY KEY 테이블로 고정하고,
+# UNINDEXED 컬럼 대신 rowid로 조인해 매칭 건수가 많을 때도 FTS 내용 테이블을 읽지 않습니다.
+reports_fts_ids = table("reports_fts_ids", column("id"), column("report_id"))
+reports_fts = table("reports_fts", column("rowid"), *(column(name) for name in FTS_COLUMNS))
+_fts_ref = literal_column("reports_fts")
+
+
+def _json_text(expr: str) -> str:
+    """JSON 배열 텍스트 → 공백으로 이은 값 (JSON이 아니면 원문)"""
+    return (f"CASE WHEN json_valid({expr}) THEN "
+            f"(SELECT group_concat(value, ' ') FROM json_each({expr})) ELSE {expr} END")
+
+
+def _index_sql(prefix: str) -> str:
+    """{prefix} 행(reports)을 색인하는 INSERT … SELECT"""
+    return (
+        f"INSERT INTO reports_fts (rowid, {', '.join(FTS_COLUMNS)}) "
+        f"SELECT m.id, {prefix}.title, {prefix}.summary, {prefix}.organization, "
+        f"{_json_text(f'{prefix}.tags')}, {_json_text(f'{prefix}.key_insights')} "
+        f"FROM reports_fts_ids m"
+    )
+
+
+_DDL = [
+    """CREATE TABLE IF NOT EXISTS reports_fts_ids (
+        id INTEGER PRIMARY KEY,
+        report_id VARCHAR(50) NOT NULL UNIQUE
+    )""",
+    """CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+        title, summary, organization, tags, key_insights,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS reports_fts_ai AFTER INSERT ON reports BEGIN
+        INSERT INTO reports_fts_ids (report_id) VALUES (new.id);
+        {_index_sql('new')} WHERE m.report_id = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_ad AFTER DELETE ON reports BEGIN
+        DELETE FROM reports_fts WHERE rowid = (SELECT id FROM reports_fts_ids WHERE report_id = old.id);
+        DELETE FROM reports_fts_ids WHERE report_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS reports_fts_au
+        AFTER UPDATE OF id, title, summary, organization, tags, key_insights ON reports BEGIN
+        DELETE FROM reports_fts WHERE rowid = (SELECT id FROM reports_fts_ids WHERE report_id = old.id);
+        UPDATE reports_fts_ids SET report_id = new.id WHERE report_id = old.id;
+        {_index_sql('new')} WHERE m.report_id = new.id;
+    END""",
+]
+
+
+def _populate(conn):
+    conn.execute(text("DELETE FROM reports_fts"))
+    conn.execute(text("DELETE FROM reports_fts_ids"))
+    conn.execute(text("INSERT INTO reports_fts_ids (report_id) SELECT id FROM reports"))
+    conn.execute(text(f"{_index_sql('reports')} JOIN reports ON reports.id = m.report_id"))
+
+
+def ensure_fts(engine) -> bool:
+    """
+    FTS5 테이블/트리거를 만들고, 새로 만들었으면 기존 리포트로 채웁니다.
+    SQLite + FTS5에서만 활성화되며 결과를 fts_enabled에 기록합니다.
+    """
+    global fts_enabled
+    if engine.dialect.name != "sqlite":
+        fts_enabled = False
+        return False
+
+    try:
+        with engine.begin() as conn:
+            existed = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reports_fts'"
+            )).first() is not None
+            for ddl in _DDL:
+                conn.execute(text(ddl))
+            if not existed:
+                _populate(conn)
+        fts_enabled = True
+    except Exception as e:
+        logger.warning(f"FTS5 unavailable, report search falls back to LIKE: {e}")
+        fts_enabled = False
+    return fts_enabled
+
+
+def rebuild_fts(engine):
+    """인덱스를 reports 테이블 기준으로 다시 만듭니다."""
+    with engine.begin() as conn:
+        _populate(conn)
+
+
+def build_match_query(search: str) -> Optional[str]:
+    """
+    사용자 입력 → FTS5 MATCH 식
+
+    FTS 문법 문자는 버리고 단어마다 접두어 검색으로 바꿉니다.
+    예: '해운 outlook 2025' → '"해운"* "outlook"* "2025"*'
+    """
+    tokens = _TOKEN_RE.findall(search or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def apply_search(query, model, search: str):
+    """
+    검색 조건을 적용합니다. (query, rank 식 또는 None, MATCH 식 또는 None)을 반환합니다.
+    rank가 있으면 호출 측에서 relevance 정렬에 사용합니다.
+    """
+    if fts_enabled:
+        match = build_match_query(search)
+        if match is None:
+            return query, None, None
+        query = query.join(reports_fts_ids, reports_fts_ids.c.report_id == model.id)\
+            .join(reports_fts, reports_fts.c.rowid == reports_fts_ids.c.id)\
+            .filter(_fts_ref.op("MATCH")(match))
+        return query, func.bm25(_fts_ref, *BM25_WEIGHTS), match
+
+    search_term = f"%{search}%"
+    query = query.filter(
+        or_(
+            model.title.ilike(search_term),
+            model.summary.ilike(search_term),
+            model.organization.ilike(search_term),
+            model.tags.ilike(search_term)
+        )
+    )
+    return query, None, None
+
+
+def _marked_html(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return html.escape(value).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def get_highlights(db, report_ids: Iterable[str], match: str) -> Dict[str, dict]:
+    """
+    현재 페이지 리포트들의 하이라이트 (HTML 이스케이프 + <mark>)
+
+    Returns:
+        {report_id: {"title": ..., "summary": ...}}
+    """
+    ids = list(report_ids)
+    if not ids or not match:
+        return {}
+
+    params = {f"id{i}": report_id for i, report_id in enumerate(ids)}
+    placeholders = ", ".join(f":{name}" for name in params)
+    rows = db.execute(text(f"""
+        SELECT m.report_id,
+               highlight(reports_fts, 0, :open, :close),
+               snippet(reports_fts, 1, :open, :close, '…', :tokens)
+        FROM reports_fts
+        JOIN reports_fts_ids m ON m.id = reports_fts.rowid
+        WHERE reports_fts MATCH :match AND m.report_id IN ({placeholders})
+    """), dict(params, open=_MARK_OPEN, close=_MARK_CLOSE, tokens=SNIPPET_TOKENS, match=match)).all()
+
+    return {
+        report_id: {"title": _marked_html(title), "summary": _marked_html(summary)}
+        for report_id, title, summary in rows
+    }
@@ -1,7 +1,7 @@
 """
 Report & Insight - Seed Data
 Seed reports from JSON file + PDF files into PostgreSQL/SQLite database
-MVP Version: No Auth, PDF stored in database as bytea
+MVP Version: No Auth, PDF stored in the sha256 PDF store (report/storage.py)
 """
 
 import os
@@ -11,7 +11,8 @@ import uuid
 import hashlib
 from datetime import date
 from pathlib import Path
-from .models import ReportDB, ReportFileDB, init_db, SessionLocal
+from .models import ReportDB, ReportFileDB, ReportTagCountDB, ReportTagDB, init_db, SessionLocal
+from .storage import attach_pdf, pdf_store
 
 # Seed data directory (same as this file's directory)
 SEED_DIR = Path(__file__).parent
@@ -28,21 +29,6 @@ def calculate_sha256(file_path: str) -> str:
     return sha256_hash.hexdigest()
 
 
-def read_pdf_file(file_path: str) -> tuple:
-    """Read PDF file and return (bytes, size, sha256)"""
-    path = Path(file_path)
-    if not path.exists():
-        return None, 0, None
-    
-    with open(path, "rb") as f:
-        file_bytes = f.read()
-    
-    file_size = len(file_bytes)
-    sha256 = hashlib.sha256(file_bytes).hexdigest()
-    
-    return file_bytes, file_size, sha256
-
-
 def seed_from_json(json_path: str = None, pdf_base_dir: str = None):
     """
     Seed reports from JSON file and PDF files
@@ -120,7 +106,7 @@ def seed_from_json(json_path: str = None, pdf_base_dir: str = None):
                 if pdf_path:
                     full_pdf_path = pdf_base_dir / pdf_path
                     if full_pdf_path.exists():
-                        file_bytes, file_size, sha256 = read_pdf_file(full_pdf_path)
+                        sha256 = calculate_sha256(full_pdf_path)
                         
                         # Check for duplicate by SHA256
                         existing_file = db.query(ReportFileDB).filter(
@@ -131,19 +117,9 @@ def seed_from_json(json_path: str = None, pdf_base_dir: str = None):
                             print(f"  [WARN] Duplicate PDF (sha256): {pdf_path} -> reusing existing")
                             # Link to existing file's data is not needed, skip file creation
                         else:
-                            # Create file record
-                            file_id = f"FILE-{uuid.uuid4().hex[:8].upper()}"
-                            db_file = ReportFileDB(
-                                id=file_id,
-                                report_id=report_id,
-                                file_name=full_pdf_path.name,
-                                mime_type="application/pdf",
-                                file_size=file_size,
-                                sha256=sha256,
-                                file_bytes=file_bytes
-                            )
-                            db.add(db_file)
-                            print(f"  [PDF] Stored: {full_pdf_path.name} ({file_size} bytes)")
+                            # Copy into the PDF store and create the metadata record
+                            db_file = attach_pdf(db, db_report, full_pdf_path)
+                            print(f"  [PDF] Stored: {db_file.file_name} ({db_file.file_size} bytes)")
                     else:
                         print(f"  [WARN] PDF not found: {pdf_path}")
                 
@@ -476,9 +452,12 @@ def clear_reports():
     try:
         # Delete files first (if cascade doesn't work)
         db.query(ReportFileDB).delete()
+        db.query(ReportTagDB).delete()
+        db.query(ReportTagCountDB).delete()
         db.query(ReportDB).delete()
         db.commit()
-        print("All reports and files cleared!")
+        removed = pdf_store.collect_garbage([])
+        print(f"All reports and files cleared! ({removed} PDFs removed from store)")
     except Exception as e:
         db.rollback()
         print(f"Error clearing database: {e}")
@@ -0,0 +1,220 @@
+"""
+Report & Insight - PDF Store
+PDF 원본을 DB 행 밖(디스크)에 sha256 주소로 저장합니다.
+
+    {REPORT_STORE_DIR}/ab/cd/abcd…(64자).pdf
+
+- 같은 내용은 한 번만 저장
+- 쓰기는 임시 파일 → os.replace로 원자적으로 교체
+- attach_pdf는 임시 파일까지만 쓰고 세션 commit 후 제자리로 옮김 (롤백되면 임시 파일 삭제)
+- report_files 테이블에는 메타데이터(file_name, file_size, sha256)만 남습니다.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SERVER_DIR = Path(__file__).parent.parent
+REPORT_STORE_DIR = Path(os.environ.get("REPORT_STORE_DIR", SERVER_DIR / "report_files"))
+
+_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class PDFStore:
+    """sha256 주소 기반 파일 저장소"""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path_for(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256[2:4] / f"{sha256}.pdf"
+
+    def exists(self, sha256: str) -> bool:
+        return self.path_for(sha256).is_file()
+
+    def stage(self, chunks: Iterable[bytes]) -> Tuple[Path, str, int]:
+        """청크를 임시 파일에 쓰면서 해시 계산 → (임시 파일, sha256, size). promote 전에는 보이지 않음"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+        return Path(tmp_path), digest.hexdigest(), size
+
+    def promote(self, tmp_path: Union[str, Path], sha256: str):
+        """stage한 임시 파일을 주소 위치로 이동 (이미 같은 내용이 있으면 임시 파일만 삭제)"""
+        target = self.path_for(sha256)
+        if target.exists():
+            self.discard(tmp_path)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, target)
+
+    @staticmethod
+    def discard(tmp_path: Union[str, Path]):
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    def _write(self, chunks: Iterable[bytes]) -> Tuple[str, int]:
+        tmp_path, sha256, size = self.stage(chunks)
+        try:
+            self.promote(tmp_path, sha256)
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+        return sha256, size
+
+    def put_bytes(self, data: bytes) -> Tuple[str, int]:
+        """bytes 저장 → (sha256, size)"""
+        return self._write([data])
+
+    def put_file(self, file_path: Union[str, Path]) -> Tuple[str, int]:
+        """파일을 청크 단위로 복사 저장 → (sha256, size)"""
+        with open(file_path, "rb") as f:
+            return self._write(_read_chunks(f))
+
+    def delete(self, sha256: str) -> bool:
+        try:
+            self.path_for(sha256).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def collect_garbage(self, referenced: Iterable[str]) -> int:
+        """참조되지 않는 파일 삭제, 삭제한 개수 반환"""
+        keep = set(referenced)
+        removed = 0
+        if not self.root.exists():
+            return 0
+        for path in self.root.glob("*/*/*.pdf"):
+            if path.stem not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def _read_chunks(f) -> Iterable[bytes]:
+    return iter(lambda: f.read(_CHUNK_SIZE), b"")
+
+
+pdf_store = PDFStore(REPORT_STORE_DIR)
+
+_STAGED_KEY = "report_pdf_staged"
+
+
+def _promote_staged(session):
+    for store, tmp_path, sha256 in session.info.pop(_STAGED_KEY, ()):
+        try:
+            store.promote(tmp_path, sha256)
+        except OSError as e:
+            logger.error(f"Failed to store report PDF {sha256}: {e}")
+
+
+def _discard_staged(session, transaction):
+    # commit되지 않고 끝난 최상위 트랜잭션(롤백/close)의 임시 파일 정리
+    if transaction.parent is None:
+        for store, tmp_path, _ in session.info.pop(_STAGED_KEY, ()):
+            store.discard(tmp_path)
+
+
+def _stage_for_commit(db, chunks: Iterable[bytes]) -> Tuple[str, int]:
+    """임시 파일로 저장하고 이 세션이 commit될 때 주소 위치로 옮기도록 등록"""
+    from sqlalchemy import event
+
+    tmp_path, sha256, size = pdf_store.stage(chunks)
+    staged = db.info.setdefault(_STAGED_KEY, [])
+    if not event.contains(db, "after_commit", _promote_staged):
+        event.listen(db, "after_commit", _promote_staged)
+        event.listen(db, "after_transaction_end", _discard_staged)
+    staged.append((pdf_store, tmp_path, sha256))
+    return sha256, size
+
+
+def attach_pdf(db, report, source: Union[str, Path, bytes], file_name: Optional[str] = None,
+               mime_type: str = "application/pdf"):
+    """
+    리포트에 PDF를 저장하고 메타데이터 행을 추가합니다 (commit은 호출 측).
+    파일은 세션이 commit된 뒤에 저장소에 나타나고, 롤백되면 남지 않습니다.
+
+    Args:
+        db: SQLAlchemy session
+        report: ReportDB
+        source: 파일 경로 또는 bytes
+        file_name: 다운로드 파일명 (경로면 기본값은 파일 이름)
+    """
+    from .models import ReportFileDB
+
+    if isinstance(source, (bytes, bytearray)):
+        sha256, size = _stage_for_commit(db, [bytes(source)])
+    else:
+        with open(source, "rb") as f:
+            sha256, size = _stage_for_commit(db, _read_chunks(f))
+        file_name = file_name or Path(source).name
+
+    db_file = ReportFileDB(
+        id=f"FILE-{uuid.uuid4().hex[:8].upper()}",
+        report_id=report.id,
+        file_name=file_name or "report.pdf",
+        mime_type=mime_type,
+        file_size=size,
+        sha256=sha256,
+    )
+    db.add(db_file)
+    report.has_pdf = True
+    return db_file
+
+
+def migrate_legacy_blobs(engine) -> int:
+    """
+    report_files.file_bytes(이전 스키마)의 PDF를 저장소로 옮기고 컬럼을 제거합니다.
+    reports.has_pdf 컬럼이 없으면 추가 후 채웁니다. 옮긴 파일 수를 반환합니다.
+    """
+    from sqlalchemy import inspect, text
+
+    inspector = inspect(engine)
+    tables = inspector.get_table_names()
+    if "reports" not in tables or "report_files" not in tables:
+        return 0
+
+    report_columns = {c["name"] for c in inspector.get_columns("reports")}
+    file_columns = {c["name"] for c in inspector.get_columns("report_files")}
+    moved = 0
+
+    with engine.begin() as conn:
+        if "has_pdf" not in report_columns:
+            conn.execute(text("ALTER TABLE reports ADD COLUMN has_pdf BOOLEAN NOT NULL DEFAULT FALSE"))
+            conn.execute(text(
+                "UPDATE reports SET has_pdf = EXISTS "
+                "(SELECT 1 FROM report_files f WHERE f.report_id = reports.id)"
+            ))
+
+        if "file_bytes" in file_columns:
+            ids = [row[0] for row in conn.execute(text("SELECT id FROM report_files"))]
+            for file_id in ids:
+                row = conn.execute(
+                    text("SELECT sha256, file_bytes FROM report_files WHERE id = :id"), {"id": file_id}
+                ).first()
+                sha256, _ = pdf_store.put_bytes(row[1])
+                if sha256 != row[0]:
+                    logger.warning(f"report_files {file_id}: stored sha256 mismatch, using content hash")
+                    conn.execute(text("UPDATE report_files SET sha256 = :sha WHERE id = :id"),
+                                 {"sha": sha256, "id": file_id})
+                moved += 1
+            conn.execute(text("ALTER TABLE report_files DROP COLUMN file_bytes"))
+            logger.info(f"Moved {moved} report PDFs to {pdf_store.root}")
+
+    return moved
@@ -0,0 +1,197 @@
+"""
+Report & Insight - Tag Index
+reports.tags(JSON 텍스트)를 report_tags 조인 테이블과 report_tag_counts 패싯 테이블로 정규화합니다.
+
+- 동기화: 리포트 DB 세션(report.models.SessionLocal)의 before_flush에서 ReportDB 추가/수정/삭제 시
+  report_tags 행을 맞추고, after_flush에서 영향받은 태그의 (category, tag) 개수를 다시 집계 (같은 트랜잭션).
+  다른 DB(뉴스, KCCI, 인증 등)의 세션 flush에는 걸리지 않습니다.
+- 태그 필터: 정확히 일치하는 태그만 (기존 contains는 부분 문자열도 매칭)
+- 필터 개수 / 관련 리포트: 인덱스를 타는 단일 쿼리
+"""
+
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import case, delete, desc, event, func, insert, literal, or_, select
+
+from .models import ReportDB, ReportTagCountDB, ReportTagDB, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+MAX_TAG_LENGTH = 100
+
+# 관련 리포트 점수: 겹치는 태그 1개당 4점, 같은 기관 2점, 같은 카테고리 1점
+RELATED_TAG_WEIGHT = 4
+RELATED_ORG_WEIGHT = 2
+RELATED_CATEGORY_WEIGHT = 1
+
+_AFFECTED_KEY = "report_tags_affected"
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """공백 정리, 빈 값/중복 제거 (순서 유지)"""
+    result, seen = [], set()
+    for tag in tags or []:
+        if not isinstance(tag, str):
+            continue
+        tag = " ".join(tag.split())[:MAX_TAG_LENGTH]
+        if tag and tag not in seen:
+            seen.add(tag)
+            result.append(tag)
+    return result
+
+
+def _tags_changed(report: ReportDB) -> bool:
+    from sqlalchemy import inspect
+
+    attrs = inspect(report).attrs
+    return attrs.tags.history.has_changes() or attrs.category.history.has_changes()
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _sync_report_tags(session, flush_context, instances):
+    affected: Set[str] = session.info.setdefault(_AFFECTED_KEY, set())
+
+    for obj in session.new:
+        if isinstance(obj, ReportDB):
+            tags = normalize_tags(obj.get_tags())
+            obj.tag_rows = [ReportTagDB(tag=tag) for tag in tags]
+            affected.update(tags)
+
+    for obj in session.dirty:
+        if isinstance(obj, ReportDB) and _tags_changed(obj):
+            current = {row.tag: row for row in obj.tag_rows}
+            tags = normalize_tags(obj.get_tags())
+            for tag, row in current.items():
+                if tag not in tags:
+                    obj.tag_rows.remove(row)
+            for tag in tags:
+                if tag not in current:
+                    obj.tag_rows.append(ReportTagDB(tag=tag))
+            # 카테고리가 바뀌면 남아 있는 태그의 카테고리별 개수도 달라짐
+            affected.update(current)
+            affected.update(tags)
+
+    for obj in session.deleted:
+        if isinstance(obj, ReportDB):
+            affected.update(row.tag for row in obj.tag_rows)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _recount_after_flush(session, flush_context):
+    affected = session.info.pop(_AFFECTED_KEY, None)
+    if affected:
+        recount_tags(session.connection(), affected)
+
+
+def recount_tags(conn, tags: Optional[Iterable[str]] = None):
+    """(category, tag) 개수를 report_tags 기준으로 다시 집계 (tags=None이면 전체)"""
+    counts = select(ReportDB.category, ReportTagDB.tag, func.count())\
+        .join(ReportDB, ReportDB.id == ReportTagDB.report_id)\
+        .group_by(ReportDB.category, ReportTagDB.tag)
+    clear = delete(ReportTagCountDB)
+
+    if tags is not None:
+        tags = list(tags)
+        counts = counts.where(ReportTagDB.tag.in_(tags))
+        clear = clear.where(ReportTagCountDB.tag.in_(tags))
+
+    conn.execute(clear)
+    conn.execute(insert(ReportTagCountDB).from_select(
+        [ReportTagCountDB.category, ReportTagCountDB.tag, ReportTagCountDB.count], counts
+    ))
+
+
+def rebuild_tag_index(db):
+    """reports.tags에서 report_tags와 개수를 모두 다시 만듭니다 (commit은 호출 측)."""
+    db.execute(delete(ReportTagDB))
+    rows = []
+    for report_id, raw in db.execute(select(ReportDB.id, ReportDB.tags)):
+        try:
+            tags = json.loads(raw) if raw else []
+        except (TypeError, ValueError):
+            tags = []
+        rows.extend({"report_id": report_id, "tag": tag} for tag in normalize_tags(tags))
+    if rows:
+        db.execute(insert(ReportTagDB), rows)
+    recount_tags(db.connection())
+    return len(rows)
+
+
+def ensure_tag_index(engine):
+    """기존 DB에 report_tags가 비어 있으면 reports.tags로 채웁니다."""
+    db = SessionLocal(bind=engine)
+    try:
+        has_rows = db.execute(select(ReportTagDB.report_id).limit(1)).first() is not None
+        has_tags = db.execute(
+            select(ReportDB.id).where(ReportDB.tags.isnot(None), ReportDB.tags.notin_(["", "[]"])).limit(1)
+        ).first() is not None
+        if has_tags and not has_rows:
+            count = rebuild_tag_index(db)
+            db.commit()
+            logger.info(f"Indexed {count} report tags")
+    finally:
+        db.close()
+
+
+# ============================================
+# Queries
+# ============================================
+
+def tag_filter(tags: List[str]):
+    """모든 태그를 가진 리포트 id (AND) - ReportDB.id.in_(...)에 사용"""
+    tags = normalize_tags(tags)
+    return select(ReportTagDB.report_id)\
+        .where(ReportTagDB.tag.in_(tags))\
+        .group_by(ReportTagDB.report_id)\
+        .having(func.count() == len(tags))
+
+
+def tag_facets(db, category: Optional[str] = None) -> List[Dict]:
+    """패싯 테이블에서 태그별 리포트 수 (개수 내림차순)"""
+    if category:
+        rows = db.execute(
+            select(ReportTagCountDB.tag, ReportTagCountDB.count)
+            .where(ReportTagCountDB.category == category, ReportTagCountDB.count > 0)
+            .order_by(desc(ReportTagCountDB.count), ReportTagCountDB.tag)
+        ).all()
+    else:
+        total = func.sum(ReportTagCountDB.count)
+        rows = db.execute(
+            select(ReportTagCountDB.tag, total)
+            .group_by(ReportTagCountDB.tag)
+            .having(total > 0)
+            .order_by(desc(total), ReportTagCountDB.tag)
+        ).all()
+    return [{"name": tag, "count": count} for tag, count in rows]
+
+
+def related_reports(db, report: ReportDB, limit: int) -> List[ReportDB]:
+    """
+    관련 리포트를 점수 순으로 조회 (단일 쿼리)
+
+    점수 = 겹치는 태그 수 * 4 + 같은 기관 2 + 같은 카테고리 1, 동점이면 최신순.
+    태그가 겹치거나 기관/카테고리가 같은 리포트만 후보입니다.
+    """
+    source_tags = select(ReportTagDB.tag).where(ReportTagDB.report_id == report.id)
+    overlap = select(ReportTagDB.report_id, func.count().label("overlap"))\
+        .where(ReportTagDB.tag.in_(source_tags), ReportTagDB.report_id != report.id)\
+        .group_by(ReportTagDB.report_id)\
+        .subquery()
+
+    same_org = case((ReportDB.organization == report.organization, literal(RELATED_ORG_WEIGHT)), else_=literal(0))
+    same_category = case((ReportDB.category == report.category, literal(RELATED_CATEGORY_WEIGHT)), else_=literal(0))
+    score = func.coalesce(overlap.c.overlap, 0) * RELATED_TAG_WEIGHT + same_org + same_category
+
+    return db.query(ReportDB)\
+        .outerjoin(overlap, overlap.c.report_id == ReportDB.id)\
+        .filter(ReportDB.id != report.id)\
+        .filter(or_(
+            overlap.c.overlap.isnot(None),
+            ReportDB.organization == report.organization,
+            ReportDB.category == report.category,
+        ))\
+        .order_by(desc(score), desc(ReportDB.published_date))\
+        .limit(limit)\
+        .all()
@@ -6,6 +6,9 @@ Jobs:
 - GDELT 데이터 업데이트 (15분마다)
 - News Intelligence 수집 (1시간마다)
 - KCCI 수집 (매주 월요일 14:30 KST)
+
+여러 워커로 실행할 때는 start_scheduler_election()이 scheduler_leases lease를 잡은
+프로세스 하나에서만 작업을 등록/실행합니다.
 """
 
 import logging
@@ -17,12 +20,17 @@ from apscheduler.triggers.cron import CronTrigger
 
 from extensions import scheduler
 from config import (
+    FLASK_PORT,
     GDELT_UPDATE_INTERVAL_MINUTES,
     NEWS_INTELLIGENCE_INTERVAL_HOURS,
     KCCI_COLLECTION_DAY,
     KCCI_COLLECTION_HOUR_UTC,
-    KCCI_COLLECTION_MINUTE
+    KCCI_COLLECTION_MINUTE,
+    SCHEDULER_LEASE_PATH,
+    SCHEDULER_LEASE_TTL_SECONDS
 )
+from scheduler_lease import LeaderElection, SchedulerLease
+from startup import run_after_listening
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +99,7 @@ def _background_analysis_job():
     """
     try:
         from news_intelligence.analyzer import NewsAnalyzer
-        from news_intelligence.models import NewsArticle, get_session
+        from news_intelligence.models import NewsArticle, get_session, run_write
         
         logger.info("Background analysis job started")
         start_time = time.time()
@@ -135,7 +143,7 @@ def _background_analysis_job():
                     article.keywords = article_data.get('keywords', [])
                     article.is_crisis = article_data.get('is_crisis', False)
             
-            session.commit()
+            run_write(session.commit)
             
             # Log statistics
             elapsed = time.time() - start_time
@@ -220,60 +228,68 @@ def init_scheduler():
     logger.info("Scheduler initialized with jobs: GDELT (15min), News (1hr), KCCI (Mon 14:30 KST)")
 
 
-def run_initial_jobs():
-    """서버 시작 시 초기 작업을 실행합니다."""
-    
-    # 서버 시작 시 즉시 GDELT 데이터 업데이트 시도
-    try:
-        update_gdelt_data_job()
-    except Exception as e:
-        logger.warning(f"Initial GDELT update failed: {e}")
+def run_initial_jobs(port: int = FLASK_PORT):
+    """
+    서버가 포트에서 요청을 받기 시작한 뒤 초기 GDELT 업데이트와 뉴스 수집을 백그라운드에서 실행합니다.
+    (첫 요청이 수집 작업을 기다리지 않도록 startup.run_after_listening 사용)
+    """
+    run_after_listening(
+        port,
+        ('initial GDELT update', update_gdelt_data_job),
+        ('initial news collection', update_news_intelligence_job),
+    )
 
 
-def start_news_collection_after_server_ready(port: int = 5000):
-    """서버가 준비된 후 뉴스 수집을 시작합니다."""
-    import socket
-    
-    def _wait_and_collect():
-        # 서버가 포트에서 리스닝할 때까지 대기
-        logger.info(f"Waiting for server to be ready on localhost:{port}...")
-        max_wait = 30  # 최대 30초 대기
-        wait_time = 0
-        server_ready = False
-        
-        while wait_time < max_wait:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', port))
-                sock.close()
-                if result == 0:
-                    server_ready = True
-                    logger.info(f"[OK] Server is ready on localhost:{port}")
-                    break
-            except Exception:
-                pass
-            time.sleep(0.5)
-            wait_time += 0.5
-        
-        if server_ready:
-            # 서버가 완전히 초기화될 때까지 약간의 추가 대기
-            time.sleep(1)
-            try:
-                logger.info("Starting News Intelligence collection after server startup...")
-                update_news_intelligence_job()
-            except Exception as e:
-                logger.warning(f"Initial News Intelligence collection failed: {e}")
-        else:
-            logger.warning("[WARN] Server may not be ready, skipping initial news collection")
+# ============================================================
+# Leader Election (multi-worker)
+# ============================================================
+
+_election = None
+
+
+def _on_elected(port: int):
+    """
+    lease 획득: 처음이면 작업 등록 후 초기 작업을 백그라운드에서 실행 (워커 부팅을 막지 않음).
+    강등됐다가 다시 선출되면 일시 정지한 작업만 재개합니다 (초기 수집을 반복하지 않음).
+    """
+    if scheduler.running:
+        scheduler.resume()
+        logger.info("Scheduler resumed (lease re-acquired)")
+        return
+    init_scheduler()
+    run_initial_jobs(port)
+
+
+def _on_demoted():
+    """lease 상실: 다른 프로세스가 작업을 넘겨받았으므로 일시 정지"""
+    if scheduler.running:
+        scheduler.pause()
+        logger.info("Scheduler paused (lease held by another process)")
+
+
+def start_scheduler_election(port: int = FLASK_PORT) -> LeaderElection:
+    """
+    스케줄러 lease 선출을 시작합니다.
     
-    # 서버 시작 후 뉴스 수집을 시작하는 스레드 시작
-    news_thread = threading.Thread(target=_wait_and_collect, daemon=True)
-    news_thread.start()
+    lease를 잡은 프로세스만 init_scheduler() + 초기 작업을 실행하고,
+    나머지는 주기적으로 lease를 확인하다가 리더가 사라지면 넘겨받습니다.
+    """
+    global _election
+    if _election is None:
+        lease = SchedulerLease(SCHEDULER_LEASE_PATH, ttl_seconds=SCHEDULER_LEASE_TTL_SECONDS)
+        _election = LeaderElection(lease, on_elected=lambda: _on_elected(port), on_demoted=_on_demoted)
+        _election.start()
+        if not _election.is_leader:
+            logger.info(f"Scheduler standby (lease held by {lease.holder()})")
+    return _election
 
 
 def shutdown_scheduler():
     """스케줄러를 종료합니다."""
+    global _election
+    if _election is not None:
+        _election.stop()
+        _election = None
     if scheduler.running:
         scheduler.shutdown()
         logger.info("Scheduler shutdown complete")
@@ -0,0 +1,145 @@
+"""
+Scheduler Lease
+여러 웹 워커 프로세스 중 한 곳에서만 스케줄러 작업을 실행하도록 SQLite 파일 lease로 리더를 정합니다.
+
+    lease = SchedulerLease(path, ttl_seconds=60)
+    election = LeaderElection(lease, on_elected=start_jobs, on_demoted=pause_jobs)
+    election.start()
+
+- 리더는 ttl/3 간격으로 lease를 갱신하고, 나머지 워커는 같은 간격으로 획득을 시도합니다.
+- 리더 프로세스가 죽으면 ttl이 지난 뒤 다른 워커가 lease를 넘겨받습니다.
+- 갱신에 실패한 리더(예: 오래 멈춰 있다가 깨어난 경우)는 on_demoted로 작업을 멈춥니다.
+
+같은 파일 시스템의 프로세스끼리만 조율됩니다 (여러 서버에 배포할 때는 공유 DB lease 필요).
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+from sqlite_profile import connect
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS scheduler_leases (
+        name TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+"""
+
+# 비어 있거나, 만료됐거나, 이미 내 lease면 (재)획득
+_ACQUIRE = """
+    INSERT INTO scheduler_leases (name, owner, expires_at) VALUES (?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+    WHERE scheduler_leases.owner = excluded.owner OR scheduler_leases.expires_at < ?
+"""
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SchedulerLease:
+    """이름별 lease 한 행 (owner, expires_at)"""
+
+    def __init__(self, path: str, name: str = 'scheduler', ttl_seconds: float = 60, owner: Optional[str] = None):
+        self.path = path
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or default_owner()
+        with self._connect() as conn:
+            conn.execute(_CREATE_TABLE)
+
+    def _connect(self):
+        return connect(self.path, timeout=5, isolation_level=None)
+
+    def try_acquire(self) -> bool:
+        """lease를 획득/갱신하면 True"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(_ACQUIRE, (self.name, self.owner, now + self.ttl_seconds, now))
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def release(self):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM scheduler_leases WHERE name = ? AND owner = ?", (self.name, self.owner))
+        finally:
+            conn.close()
+
+    def holder(self) -> Optional[str]:
+        """현재 유효한 lease 소유자 (없으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT owner FROM scheduler_leases WHERE name = ? AND expires_at >= ?", (self.name, time.time())
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+
+class LeaderElection:
+    """lease를 주기적으로 갱신/획득하며 리더 전환 시 콜백 호출 (daemon 스레드)"""
+
+    def __init__(self, lease: SchedulerLease, on_elected: Callable[[], None], on_demoted: Callable[[], None],
+                 interval: Optional[float] = None):
+        self.lease = lease
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.interval = interval if interval is not None else max(lease.ttl_seconds / 3, 1)
+        self.is_leader = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self):
+        """한 번 획득/갱신을 시도하고 상태 변화에 맞춰 콜백 호출"""
+        try:
+            acquired = self.lease.try_acquire()
+        except Exception as e:
+            logger.warning(f"Scheduler lease check failed: {e}")
+            acquired = False
+
+        if acquired and not self.is_leader:
+            self.is_leader = True
+            logger.info(f"Scheduler leader elected: {self.lease.owner}")
+            self.on_elected()
+        elif not acquired and self.is_leader:
+            self.is_leader = False
+            logger.warning(f"Scheduler lease lost: {self.lease.owner}")
+            self.on_demoted()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.check()
+        self._thread = threading.Thread(target=self._run, name='SchedulerLeaderElection', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        """선출 중지 + 리더였다면 lease 반납 (다른 워커가 ttl을 기다리지 않고 넘겨받음)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self.is_leader:
+            self.is_leader = False
+            self.on_demoted()
+            try:
+                self.lease.release()
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler lease: {e}")
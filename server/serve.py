@@ -0,0 +1,151 @@
+"""
+AAL Production Server
+운영용 엔트리포인트 - Werkzeug 개발 서버(main.py) 대신 여러 워커로 실행합니다.
+
+- Linux/macOS: gunicorn (gthread 워커 N개, preload_app)
+- Windows: waitress (단일 프로세스, 스레드 풀)
+
+공통 동작:
+- Quote Backend 시드/서브프로세스는 마스터 프로세스에서 한 번만, 포트를 바인딩한 뒤 백그라운드로 시작
+  (첫 요청이 워밍업을 기다리지 않음, startup.run_after_listening)
+- 스케줄러는 워커마다 lease 선출을 시작하고 lease를 잡은 워커 하나만 작업 실행 (scheduler_lease.py)
+- 워커가 2개 이상이면 ECOS/GDELT 캐시를 CACHE_BACKEND_URL(기본: server/shared_cache.db)로 공유
+- 시작 전에 프론트엔드 자산을 빌드 (해시 파일명 + .gz/.br, frontend_assets.py)
+
+Usage:
+    python serve.py                          # WEB_WORKERS x WEB_THREADS, 포트 5000
+    python serve.py --workers 4 --threads 8 --port 5000
+    python serve.py --server waitress        # Windows
+    python serve.py --no-quote-backend       # Quote Backend를 별도로 운영할 때
+    python serve.py --no-scheduler           # 스케줄러를 별도 프로세스에서 운영할 때
+    python serve.py --no-build-assets        # 배포 단계에서 이미 python frontend_assets.py를 실행한 경우
+"""
+
+import argparse
+import os
+import sys
+
+from config import FLASK_PORT, MULTI_WORKER_CACHE_URL, WEB_HOST, WEB_THREADS, WEB_WORKERS
+
+
+def prepare_environment(workers: int):
+    """앱 import 전에 호출: 멀티 워커면 공유 캐시 백엔드 사용 (명시한 CACHE_BACKEND_URL이 우선)"""
+    if workers > 1:
+        os.environ.setdefault('CACHE_BACKEND_URL', MULTI_WORKER_CACHE_URL)
+
+
+def build_frontend_assets():
+    """워커 시작 전에 한 번 빌드 (실패해도 원본 파일로 서빙)"""
+    from frontend_assets import build_assets
+
+    try:
+        manifest = build_assets()
+        print(f"  [Assets] {len(manifest['assets'])} fingerprinted assets, {len(manifest['pages'])} pages")
+    except Exception as e:
+        print(f"  [Assets] build failed, serving frontend sources: {e}")
+
+
+def start_quote_services(host: str, port: int):
+    """마스터 프로세스에서 포트가 열린 뒤 Quote Backend 시드 + 서브프로세스 시작"""
+    from quote_manager import run_quote_seed_if_needed, start_quote_backend
+    from startup import run_after_listening
+
+    run_after_listening(port, ('quote seed', run_quote_seed_if_needed),
+                        ('quote backend', start_quote_backend), host=host)
+
+
+def run_gunicorn(host: str, port: int, workers: int, threads: int, timeout: int,
+                 with_scheduler: bool = True, with_quote_backend: bool = True):
+    from gunicorn.app.base import BaseApplication
+
+    from main import app
+    from scheduler import shutdown_scheduler, start_scheduler_election
+
+    def when_ready(server):
+        # 마스터가 소켓을 바인딩한 뒤 (워커 fork와 무관하게 마스터에서 한 번)
+        if with_quote_backend:
+            start_quote_services(host, port)
+
+    def post_fork(server, worker):
+        # APScheduler 스레드는 fork를 넘지 못하므로 워커 안에서 선출 시작
+        if with_scheduler:
+            start_scheduler_election(port)
+
+    def worker_exit(server, worker):
+        shutdown_scheduler()
+
+    options = {
+        'bind': f'{host}:{port}',
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread',
+        'preload_app': True,
+        'timeout': timeout,
+        'graceful_timeout': 30,
+        'keepalive': 5,
+        'when_ready': when_ready,
+        'post_fork': post_fork,
+        'worker_exit': worker_exit,
+    }
+
+    class AALApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    AALApplication().run()
+
+
+def run_waitress(host: str, port: int, threads: int, with_scheduler: bool = True, with_quote_backend: bool = True):
+    from waitress import serve
+
+    from main import app
+    from scheduler import start_scheduler_election
+
+    if with_quote_backend:
+        start_quote_services(host, port)
+    if with_scheduler:
+        start_scheduler_election(port)  # 초기 수집은 포트가 열린 뒤 실행
+    serve(app, host=host, port=port, threads=threads)
+
+
+def main():
+    from startup import mark_started
+
+    mark_started()  # uptime / 워밍업 완료 시각 기준 (워커는 fork 시 물려받음)
+
+    parser = argparse.ArgumentParser(description="AAL production server")
+    parser.add_argument('--server', choices=['gunicorn', 'waitress'],
+                        default='waitress' if sys.platform == 'win32' else 'gunicorn')
+    parser.add_argument('--host', default=WEB_HOST)
+    parser.add_argument('--port', type=int, default=FLASK_PORT)
+    parser.add_argument('--workers', type=int, default=WEB_WORKERS)
+    parser.add_argument('--threads', type=int, default=WEB_THREADS)
+    parser.add_argument('--timeout', type=int, default=120, help="worker timeout (seconds)")
+    parser.add_argument('--no-quote-backend', action='store_true', help="do not start quote_backend subprocess")
+    parser.add_argument('--no-scheduler', action='store_true', help="do not run background jobs in this server")
+    parser.add_argument('--no-build-assets', action='store_true', help="skip the frontend asset build at startup")
+    args = parser.parse_args()
+
+    workers = args.workers if args.server == 'gunicorn' else 1
+    prepare_environment(workers)
+
+    if not args.no_build_assets:
+        build_frontend_assets()
+
+    print(f"  [Main Server] http://{args.host}:{args.port}  ({args.server}, "
+          f"{workers} worker(s) x {args.threads} thread(s))")
+
+    if args.server == 'gunicorn':
+        run_gunicorn(args.host, args.port, workers, args.threads, args.timeout,
+                     not args.no_scheduler, not args.no_quote_backend)
+    else:
+        run_waitress(args.host, args.port, args.threads * max(args.workers, 1),
+                     not args.no_scheduler, not args.no_quote_backend)
+
+
+if __name__ == '__main__':
+    main()
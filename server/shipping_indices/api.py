@@ -5,14 +5,20 @@ Flask Blueprint for shipping indices data endpoints
 """
 
 from flask import Blueprint, request, jsonify
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 import logging
 import sqlite3
 import os
 
+from timeseries import MIN_POINTS, chart_cache, downsample_rows, period_start_date
+from sqlite_profile import connect as sqlite_connect
+from http_cache import public_max_age, register_cache_policy, sqlite_table_version
+from config import HTTP_CACHE_MAX_AGE_SHIPPING
+from telemetry import query_budget
 from .models import (
     SCFIIndex, CCFIIndex, BDIIndex,
-    init_shipping_indices_database, get_shipping_indices_session
+    init_shipping_indices_database, get_shipping_indices_session,
+    run_shipping_indices_write
 )
 
 logger = logging.getLogger(__name__)
@@ -26,6 +32,99 @@ def get_db_path():
     return os.path.join(base_dir, 'shipping_indices.db')
 
 
+# HTTP 캐시: 임포트/스케줄러만 갱신하므로 max-age 동안 재요청 없음, 이후 collected_at/행 수로 재검증
+cache_policy = register_cache_policy(
+    shipping_bp, public_max_age(HTTP_CACHE_MAX_AGE_SHIPPING),
+    validator=lambda: sqlite_table_version(get_db_path(), ('scfi_index', 'ccfi_index', 'bdi_index')),
+)
+
+
+# 차트 캐시 네임스페이스 (임포트 시 무효화)
+CHART_CACHE_NAMESPACE = 'shipping_indices'
+
+
+def _parse_max_points():
+    """max_points 파라미터 (없거나 0이면 다운샘플링하지 않음)"""
+    max_points = request.args.get('max_points', type=int)
+    if not max_points or max_points <= 0:
+        return None
+    return max(max_points, MIN_POINTS)
+
+
+def _get_chart_data(table: str, period: str, max_points, compact: bool) -> dict:
+    """
+    지수 테이블의 기간별 차트 데이터를 조회합니다 (캐시 사용).
+    
+    통계(high/low/average 등)는 다운샘플링 전 전체 데이터로 계산합니다.
+    """
+    end_date = date.today()
+    cache_key = ('chart-data', table, period, max_points, compact, end_date.isoformat())
+    cached = chart_cache.get(CHART_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dict(cached)
+    
+    start_date = period_start_date(period, end_date)
+    
+    conn = sqlite_connect(get_db_path())
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT index_date, current_index, previous_index, change, change_rate
+        FROM {table} 
+        WHERE index_date >= ? AND index_date <= ?
+        ORDER BY index_date ASC
+    """, (start_date.isoformat(), end_date.isoformat()))
+    rows = cursor.fetchall()
+    conn.close()
+    
+    data = []
+    for row in rows:
+        data.append({
+            'index_date': row['index_date'],
+            'current_index': row['current_index'],
+            'previous_index': row['previous_index'],
+            'change': row['change'],
+            'change_rate': row['change_rate']
+        })
+    
+    # 통계 계산
+    if data:
+        values = [d['current_index'] for d in data]
+        stats = {
+            'high': max(values),
+            'low': min(values),
+            'average': round(sum(values) / len(values), 2),
+            'start_value': values[0],
+            'end_value': values[-1],
+            'change': round(values[-1] - values[0], 2),
+            'change_rate': round((values[-1] - values[0]) / values[0] * 100, 2) if values[0] else 0
+        }
+    else:
+        stats = {}
+    
+    total_points = len(data)
+    data = downsample_rows(data, 'index_date', 'current_index', max_points)
+    
+    response = {
+        'success': True,
+        'period': period,
+        'date_range': {
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat()
+        },
+        'labels': [d['index_date'] for d in data],
+        'values': [d['current_index'] for d in data],
+        'stats': stats,
+        'total_points': total_points,
+        'downsampled': len(data) < total_points
+    }
+    if not compact:
+        response['data'] = data
+    
+    chart_cache.set(CHART_CACHE_NAMESPACE, cache_key, response)
+    return dict(response)
+
+
 # =============================================================================
 # SCFI API Endpoints
 # =============================================================================
@@ -41,7 +140,7 @@ def get_scfi_index():
     - limit: 반환할 최대 개수 (기본값: 500)
     """
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -114,7 +213,7 @@ def get_scfi_index():
 def get_scfi_stats():
     """SCFI 통계 정보"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -170,82 +269,29 @@ def get_scfi_stats():
 
 @shipping_bp.route('/scfi/chart-data', methods=['GET'])
 def get_scfi_chart_data():
-    """SCFI 차트 데이터"""
+    """
+    SCFI 차트 데이터
+    
+    Parameters:
+    - period: 기간 (1W, 1M, 3M, 6M, 1Y, ALL, 기본값: 6M)
+    - max_points: 최대 점 개수 (LTTB 다운샘플링, 선택)
+    - compact: true이면 중복 배열(data) 제외 (기본값: false)
+    """
     try:
-        conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         period = request.args.get('period', '6M')
+        max_points = _parse_max_points()
+        compact = request.args.get('compact', 'false').lower() == 'true'
         
-        end_date = date.today()
-        if period == '1W':
-            start_date = end_date - timedelta(days=7)
-        elif period == '1M':
-            start_date = end_date - timedelta(days=30)
-        elif period == '3M':
-            start_date = end_date - timedelta(days=90)
-        elif period == '6M':
-            start_date = end_date - timedelta(days=180)
-        elif period == '1Y':
-            start_date = end_date - timedelta(days=365)
-        elif period == 'ALL' or period == 'MAX':
-            start_date = date(2000, 1, 1)
-        else:
-            start_date = end_date - timedelta(days=180)
-        
-        cursor.execute("""
-            SELECT index_date, current_index, previous_index, change, change_rate
-            FROM scfi_index 
-            WHERE index_date >= ? AND index_date <= ?
-            ORDER BY index_date ASC
-        """, (start_date.isoformat(), end_date.isoformat()))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        data = []
-        for row in rows:
-            data.append({
-                'index_date': row['index_date'],
-                'current_index': row['current_index'],
-                'previous_index': row['previous_index'],
-                'change': row['change'],
-                'change_rate': row['change_rate']
-            })
-        
-        # 통계 계산
-        if data:
-            values = [d['current_index'] for d in data]
-            stats = {
-                'high': max(values),
-                'low': min(values),
-                'average': round(sum(values) / len(values), 2),
-                'start_value': values[0],
-                'end_value': values[-1],
-                'change': round(values[-1] - values[0], 2),
-                'change_rate': round((values[-1] - values[0]) / values[0] * 100, 2) if values[0] else 0
-            }
-        else:
-            stats = {}
-        
-        return jsonify({
-            'success': True,
-            'period': period,
-            'date_range': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'labels': [d['index_date'] for d in data],
-            'values': [d['current_index'] for d in data],
-            'data': data,
-            'stats': stats,
+        response = _get_chart_data('scfi_index', period, max_points, compact)
+        response.update({
             'source': 'Shanghai Shipping Exchange (SSE)',
             'unit': 'pt',
             'index_name': 'SCFI (Shanghai Containerized Freight Index)',
             'description': 'The Shanghai Containerized Freight Index (SCFI) has been published by the Shanghai Shipping Exchange (SSE) since December 7, 2005. It reflects spot freight rates for container shipping from Shanghai to 15 major destinations. Originally based on time charter rates, since October 16, 2009, it is calculated based on container freight rates in USD per TEU (20-foot equivalent unit). The index covers CY-CY shipping conditions for General Dry Cargo Containers. The freight rate for each route is the arithmetic average of all rates on that route, including surcharges related to maritime transport. Freight information is provided by panelists including liner carriers and forwarders from CCFI.'
         })
         
+        return jsonify(response)
+        
     except Exception as e:
         logger.error(f"Error fetching SCFI chart data: {e}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -259,7 +305,7 @@ def get_scfi_chart_data():
 def get_ccfi_index():
     """CCFI 지수 조회"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -327,7 +373,7 @@ def get_ccfi_index():
 def get_ccfi_stats():
     """CCFI 통계 정보"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -379,81 +425,29 @@ def get_ccfi_stats():
 
 @shipping_bp.route('/ccfi/chart-data', methods=['GET'])
 def get_ccfi_chart_data():
-    """CCFI 차트 데이터"""
+    """
+    CCFI 차트 데이터
+    
+    Parameters:
+    - period: 기간 (1W, 1M, 3M, 6M, 1Y, ALL, 기본값: 6M)
+    - max_points: 최대 점 개수 (LTTB 다운샘플링, 선택)
+    - compact: true이면 중복 배열(data) 제외 (기본값: false)
+    """
     try:
-        conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         period = request.args.get('period', '6M')
+        max_points = _parse_max_points()
+        compact = request.args.get('compact', 'false').lower() == 'true'
         
-        end_date = date.today()
-        if period == '1W':
-            start_date = end_date - timedelta(days=7)
-        elif period == '1M':
-            start_date = end_date - timedelta(days=30)
-        elif period == '3M':
-            start_date = end_date - timedelta(days=90)
-        elif period == '6M':
-            start_date = end_date - timedelta(days=180)
-        elif period == '1Y':
-            start_date = end_date - timedelta(days=365)
-        elif period == 'ALL' or period == 'MAX':
-            start_date = date(2000, 1, 1)
-        else:
-            start_date = end_date - timedelta(days=180)
-        
-        cursor.execute("""
-            SELECT index_date, current_index, previous_index, change, change_rate
-            FROM ccfi_index 
-            WHERE index_date >= ? AND index_date <= ?
-            ORDER BY index_date ASC
-        """, (start_date.isoformat(), end_date.isoformat()))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        data = []
-        for row in rows:
-            data.append({
-                'index_date': row['index_date'],
-                'current_index': row['current_index'],
-                'previous_index': row['previous_index'],
-                'change': row['change'],
-                'change_rate': row['change_rate']
-            })
-        
-        if data:
-            values = [d['current_index'] for d in data]
-            stats = {
-                'high': max(values),
-                'low': min(values),
-                'average': round(sum(values) / len(values), 2),
-                'start_value': values[0],
-                'end_value': values[-1],
-                'change': round(values[-1] - values[0], 2),
-                'change_rate': round((values[-1] - values[0]) / values[0] * 100, 2) if values[0] else 0
-            }
-        else:
-            stats = {}
-        
-        return jsonify({
-            'success': True,
-            'period': period,
-            'date_range': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'labels': [d['index_date'] for d in data],
-            'values': [d['current_index'] for d in data],
-            'data': data,
-            'stats': stats,
+        response = _get_chart_data('ccfi_index', period, max_points, compact)
+        response.update({
             'source': 'Shanghai Shipping Exchange (SSE)',
             'unit': 'pt',
             'index_name': 'CCFI (China Containerized Freight Index)',
             'description': 'The China Containerized Freight Index (CCFI) is compiled by the Shanghai Shipping Exchange under the supervision of China\'s Ministry of Transport. First published on April 13, 1998, it objectively reflects global container market conditions and serves as a key indicator of Chinese shipping market trends. The index uses January 1, 1998 as the base (1000). It covers 11 major routes from Chinese ports, with freight information from 16 shipping companies, published every Friday.'
         })
         
+        return jsonify(response)
+        
     except Exception as e:
         logger.error(f"Error fetching CCFI chart data: {e}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -467,7 +461,7 @@ def get_ccfi_chart_data():
 def get_bdi_index():
     """BDI 지수 조회"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -535,7 +529,7 @@ def get_bdi_index():
 def get_bdi_stats():
     """BDI 통계 정보"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -587,81 +581,29 @@ def get_bdi_stats():
 
 @shipping_bp.route('/bdi/chart-data', methods=['GET'])
 def get_bdi_chart_data():
-    """BDI 차트 데이터"""
+    """
+    BDI 차트 데이터
+    
+    Parameters:
+    - period: 기간 (1W, 1M, 3M, 6M, 1Y, ALL, 기본값: 6M)
+    - max_points: 최대 점 개수 (LTTB 다운샘플링, 선택)
+    - compact: true이면 중복 배열(data) 제외 (기본값: false)
+    """
     try:
-        conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         period = request.args.get('period', '6M')
+        max_points = _parse_max_points()
+        compact = request.args.get('compact', 'false').lower() == 'true'
         
-        end_date = date.today()
-        if period == '1W':
-            start_date = end_date - timedelta(days=7)
-        elif period == '1M':
-            start_date = end_date - timedelta(days=30)
-        elif period == '3M':
-            start_date = end_date - timedelta(days=90)
-        elif period == '6M':
-            start_date = end_date - timedelta(days=180)
-        elif period == '1Y':
-            start_date = end_date - timedelta(days=365)
-        elif period == 'ALL' or period == 'MAX':
-            start_date = date(2000, 1, 1)
-        else:
-            start_date = end_date - timedelta(days=180)
-        
-        cursor.execute("""
-            SELECT index_date, current_index, previous_index, change, change_rate
-            FROM bdi_index 
-            WHERE index_date >= ? AND index_date <= ?
-            ORDER BY index_date ASC
-        """, (start_date.isoformat(), end_date.isoformat()))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        data = []
-        for row in rows:
-            data.append({
-                'index_date': row['index_date'],
-                'current_index': row['current_index'],
-                'previous_index': row['previous_index'],
-                'change': row['change'],
-                'change_rate': row['change_rate']
-            })
-        
-        if data:
-            values = [d['current_index'] for d in data]
-            stats = {
-                'high': max(values),
-                'low': min(values),
-                'average': round(sum(values) / len(values), 2),
-                'start_value': values[0],
-                'end_value': values[-1],
-                'change': round(values[-1] - values[0], 2),
-                'change_rate': round((values[-1] - values[0]) / values[0] * 100, 2) if values[0] else 0
-            }
-        else:
-            stats = {}
-        
-        return jsonify({
-            'success': True,
-            'period': period,
-            'date_range': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'labels': [d['index_date'] for d in data],
-            'values': [d['current_index'] for d in data],
-            'data': data,
-            'stats': stats,
+        response = _get_chart_data('bdi_index', period, max_points, compact)
+        response.update({
             'source': 'Baltic Exchange',
             'unit': 'pt',
             'index_name': 'BDI (Baltic Dry Index)',
             'description': 'The Baltic Dry Index (BDI) has been used by the Baltic Exchange since November 1, 1999, replacing the BFI (Baltic Freight Index) which tracked dry cargo freight rates since 1985. Using January 4, 1985 as the base (1000), it is a composite index of time charter rates by vessel type: Baltic Capesize Index (BCI), Baltic Panamax Index (BPI), Baltic Supramax Index (BSI), and Baltic Handysize Index (BHSI). The BDI is calculated by averaging these four indices with equal weights and multiplying by the BDI factor.'
         })
         
+        return jsonify(response)
+        
     except Exception as e:
         logger.error(f"Error fetching BDI chart data: {e}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -672,10 +614,11 @@ def get_bdi_chart_data():
 # =============================================================================
 
 @shipping_bp.route('/all', methods=['GET'])
+@query_budget(4)
 def get_all_indices():
     """모든 지수의 최신 데이터 조회"""
     try:
-        conn = sqlite3.connect(get_db_path())
+        conn = sqlite_connect(get_db_path())
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -740,30 +683,32 @@ def get_all_indices():
 
 @shipping_bp.route('/compare', methods=['GET'])
 def compare_indices():
-    """여러 지수 비교 (차트용)"""
+    """
+    여러 지수 비교 (차트용)
+    
+    Parameters:
+    - indices: 비교할 지수 (콤마 구분, 기본값: scfi,ccfi,bdi)
+    - period: 기간 (1W, 1M, 3M, 6M, 1Y, ALL, 기본값: 6M)
+    - max_points: 지수별 최대 점 개수 (LTTB 다운샘플링, 선택)
+    - compact: true이면 중복 배열(data) 제외 (기본값: false)
+    """
     try:
-        conn = sqlite3.connect(get_db_path())
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         indices = request.args.get('indices', 'scfi,ccfi,bdi').lower().split(',')
         period = request.args.get('period', '6M')
+        max_points = _parse_max_points()
+        compact = request.args.get('compact', 'false').lower() == 'true'
         
         end_date = date.today()
-        if period == '1W':
-            start_date = end_date - timedelta(days=7)
-        elif period == '1M':
-            start_date = end_date - timedelta(days=30)
-        elif period == '3M':
-            start_date = end_date - timedelta(days=90)
-        elif period == '6M':
-            start_date = end_date - timedelta(days=180)
-        elif period == '1Y':
-            start_date = end_date - timedelta(days=365)
-        elif period == 'ALL' or period == 'MAX':
-            start_date = date(2000, 1, 1)
-        else:
-            start_date = end_date - timedelta(days=180)
+        start_date = period_start_date(period, end_date)
+        
+        cache_key = ('compare', tuple(indices), period, max_points, compact, end_date.isoformat())
+        cached = chart_cache.get(CHART_CACHE_NAMESPACE, cache_key)
+        if cached is not None:
+            return jsonify(cached)
+        
+        conn = sqlite_connect(get_db_path())
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
         
         result = {}
         
@@ -796,18 +741,23 @@ def compare_indices():
                             'pct_change': round(pct_change, 2)
                         })
                     
+                    total_points = len(data)
+                    data = downsample_rows(data, 'index_date', 'current_index', max_points)
+                    
                     result[idx] = {
                         'name': info['name'],
                         'color': info['color'],
                         'labels': [d['index_date'] for d in data],
                         'values': [d['current_index'] for d in data],
                         'pct_changes': [d['pct_change'] for d in data],
-                        'data': data
+                        'total_points': total_points
                     }
+                    if not compact:
+                        result[idx]['data'] = data
         
         conn.close()
         
-        return jsonify({
+        response = {
             'success': True,
             'period': period,
             'date_range': {
@@ -815,7 +765,10 @@ def compare_indices():
                 'end': end_date.isoformat()
             },
             'indices': result
-        })
+        }
+        chart_cache.set(CHART_CACHE_NAMESPACE, cache_key, response)
+        
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"Error comparing indices: {e}", exc_info=True)
@@ -828,7 +781,8 @@ def import_data():
     try:
         from .import_excel import import_all
         
-        results = import_all()
+        results = run_shipping_indices_write(import_all)
+        chart_cache.invalidate(CHART_CACHE_NAMESPACE)
         
         return jsonify({
             'success': True,
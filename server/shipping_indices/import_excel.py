@@ -123,6 +123,7 @@ def import_scfi_excel(excel_path: str, clear_existing: bool = True):
                 existing.previous_index = prev_val
                 existing.change = change
                 existing.change_rate = round(change_rate, 2) if change_rate else None
+                existing.collected_at = datetime.now()
             else:
                 scfi = SCFIIndex(
                     index_date=index_date,
@@ -208,6 +209,7 @@ def import_ccfi_excel(excel_path: str, clear_existing: bool = True):
                 existing.previous_index = prev_val
                 existing.change = change
                 existing.change_rate = round(change_rate, 2) if change_rate else None
+                existing.collected_at = datetime.now()
             else:
                 ccfi = CCFIIndex(
                     index_date=index_date,
@@ -292,6 +294,7 @@ def import_bdi_excel(excel_path: str, clear_existing: bool = True):
                 existing.previous_index = prev_val
                 existing.change = change
                 existing.change_rate = round(change_rate, 2) if change_rate else None
+                existing.collected_at = datetime.now()
             else:
                 bdi = BDIIndex(
                     index_date=index_date,
@@ -0,0 +1,18 @@
+"""
+SQLite Connection Profile
+SQLite 연결 공통 설정 및 단일 writer 큐
+
+구현은 quote_backend와 같은 공용 모듈(shared/sqlite_profile.py)에 있고, 여기는 server 모듈들이
+`from sqlite_profile import ...`로 쓰도록 다시 내보냅니다.
+"""
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)  # 저장소 루트의 shared 패키지
+
+from shared.sqlite_profile import (  # noqa: E402,F401
+    SQLITE_PRAGMAS, WriteQueue, apply_pragmas, configure_engine, connect, get_engine, get_write_queue,
+)
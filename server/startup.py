@@ -0,0 +1,153 @@
+"""
+Startup - 서버 시작 비용 줄이기
+무거운 의존성은 기능을 처음 쓸 때 import하고, 워밍업 작업은 포트가 열린 뒤 백그라운드에서 실행합니다.
+
+    gemini_backend = lazy_module('gemini_backend')      # 첫 속성 접근 때 import
+    run_after_listening(FLASK_PORT, ('quote backend', start_quote_backend), ...)
+
+- lazy_module: google-genai, BeautifulSoup, feedparser, numpy 등을 import하는 모듈을 첫 사용까지 미룸.
+  실제 import에 걸린 시간은 lazy_import_timings()와 /api/health에서 확인
+- run_after_listening: 서버가 포트에서 요청을 받을 수 있게 된 뒤 Quote Backend 시드/서브프로세스,
+  스케줄러, 초기 수집을 순서대로 실행 (첫 응답이 워밍업을 기다리지 않음)
+
+import 비용 프로파일과 /api/health 첫 응답 시간: python -m benchmarks.startup
+"""
+
+import importlib
+import logging
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 시작 기준 시각 (uptime, 워밍업 완료 시각 계산용). 엔트리포인트가 mark_started()로 기록
+STARTED_AT: Optional[float] = None
+
+WAIT_FOR_PORT_TIMEOUT = 30.0
+WAIT_FOR_PORT_INTERVAL = 0.05
+
+_lazy_timings: Dict[str, float] = {}
+_warmup_state: Dict[str, Dict] = {}
+_state_lock = threading.Lock()
+
+
+class LazyModule:
+    """
+    첫 속성 접근 때 모듈을 import하는 대리 객체.
+
+    import는 importlib의 모듈 단위 잠금을 따르므로 여러 요청 스레드가 동시에 접근해도 한 번만 실행됩니다.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            already_loaded = self._name in sys.modules
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            if not already_loaded and self._name not in _lazy_timings:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                _lazy_timings[self._name] = round(elapsed_ms, 1)
+                logger.info(f"Lazy import {self._name}: {elapsed_ms:.0f} ms (first use)")
+            self._module = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def lazy_import_timings() -> Dict[str, float]:
+    """지금까지 첫 사용 시점에 import된 모듈과 걸린 시간 (ms)"""
+    return dict(_lazy_timings)
+
+
+def mark_started() -> float:
+    """
+    프로세스 시작 시각을 기록합니다 (첫 호출만 반영).
+
+    엔트리포인트(main.py, serve.py)가 가능한 한 일찍 호출합니다. 기록 전에 uptime을 물으면 그 시각으로 기록합니다.
+    """
+    global STARTED_AT
+    if STARTED_AT is None:
+        STARTED_AT = time.time()
+    return STARTED_AT
+
+
+def wait_for_port(port: int, host: str = '127.0.0.1', timeout: float = WAIT_FOR_PORT_TIMEOUT) -> bool:
+    """포트가 연결을 받을 때까지 대기 (timeout 초 안에 열리면 True)"""
+    if host in ('', '0.0.0.0', '::'):
+        host = '127.0.0.1'  # 모든 인터페이스에 바인딩한 경우
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(WAIT_FOR_PORT_INTERVAL)
+    return False
+
+
+def _set_state(name: str, **values):
+    with _state_lock:
+        _warmup_state.setdefault(name, {'status': 'pending'}).update(values)
+
+
+def run_after_listening(port: int, *tasks: Tuple[str, Callable[[], object]], host: str = '127.0.0.1',
+                        timeout: float = WAIT_FOR_PORT_TIMEOUT) -> threading.Thread:
+    """
+    포트가 열린 뒤 tasks를 순서대로 실행하는 데몬 스레드를 시작합니다.
+
+    작업 하나가 실패해도 나머지는 계속 실행합니다. 포트가 timeout 안에 열리지 않아도
+    (다른 인터페이스에 바인딩 등) 경고 후 실행합니다.
+
+    Args:
+        port: 서버 포트
+        host: 서버가 바인딩한 주소 (0.0.0.0이면 127.0.0.1로 확인)
+        tasks: (이름, 인자 없는 함수) 목록
+    """
+    for name, _ in tasks:
+        _set_state(name)
+
+    def _run():
+        if not wait_for_port(port, host, timeout):
+            logger.warning(f"Port {port} not reachable after {timeout:.0f}s; running warm-up anyway")
+        for name, task in tasks:
+            _set_state(name, status='running')
+            started = time.perf_counter()
+            try:
+                task()
+                status = 'done'
+            except Exception as e:
+                logger.warning(f"Warm-up task '{name}' failed: {e}")
+                status = 'failed'
+            _set_state(name, status=status, ms=round((time.perf_counter() - started) * 1000, 1),
+                       finished_after_s=uptime_seconds())
+        logger.info(f"Warm-up finished {uptime_seconds():.1f}s after start")
+
+    thread = threading.Thread(target=_run, name="WarmupThread", daemon=True)
+    thread.start()
+    return thread
+
+
+def warmup_status() -> Dict[str, Dict]:
+    """워밍업 작업별 상태 (pending/running/done/failed, 소요 ms)"""
+    with _state_lock:
+        return {name: dict(state) for name, state in _warmup_state.items()}
+
+
+def uptime_seconds() -> float:
+    return round(time.time() - mark_started(), 2)
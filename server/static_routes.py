@@ -8,20 +8,86 @@ Endpoints:
 - /js/<path> - JavaScript 파일
 - /pages/<path> - HTML 페이지
 - /api/config/google-maps-key - Google Maps API 키
+- /api/health - 헬스 체크 (uptime, 워밍업 상태, 지연 import 시간)
 - /api/news - 뉴스 Mock 데이터
 - /api/logistics - 물류 지수 Mock 데이터
+
+frontend/dist에 빌드(frontend_assets.py)가 있으면 해시 파일명 CSS/JS는 immutable로,
+HTML 페이지는 참조를 바꾼 빌드본을 재검증(no-cache)으로 서빙합니다. 둘 다 .br/.gz 사본 우선.
 """
 
 import logging
-from flask import Blueprint, send_from_directory, send_file, jsonify
+import mimetypes
+import time
+from flask import Blueprint, request, send_from_directory, send_file, jsonify
 
+import frontend_assets
 from config import BASE_DIR, FRONTEND_DIR, GOOGLE_MAPS_API_KEY
+from http_cache import NO_CACHE, register_cache_policy
+from startup import lazy_import_timings, uptime_seconds, warmup_status
 
 logger = logging.getLogger(__name__)
 
 # Flask Blueprint
 static_bp = Blueprint('static', __name__)
 
+# 프론트엔드 파일: 매번 재검증 (send_file의 ETag/Last-Modified로 304), JSON 라우트는 본문 해시 ETag
+# 해시 파일명 자산은 _serve_frontend가 immutable Cache-Control을 직접 붙임
+# 헬스 체크는 항상 현재 상태 (no-store)
+register_cache_policy(static_bp, NO_CACHE, exempt=('static.health',))
+
+# 원본 수정/재빌드 확인 주기: python main.py 개발 중 frontend/ 수정이 이 시간 안에 반영됨
+ASSET_BUILD_RECHECK_SECONDS = 2.0
+
+_asset_build = None
+_asset_build_state = None  # (manifest mtime, 원본 최신 mtime) - 바뀔 때만 manifest를 다시 읽음
+_asset_build_expires = 0.0
+
+
+def _asset_build_state_now():
+    manifest_path = frontend_assets.FRONTEND_BUILD_DIR / frontend_assets.MANIFEST_NAME
+    try:
+        manifest_mtime = manifest_path.stat().st_mtime_ns
+    except OSError:
+        manifest_mtime = None
+    return manifest_mtime, frontend_assets.source_mtime(frontend_assets.FRONTEND_DIR)
+
+
+def get_asset_build():
+    """frontend/dist 빌드 (없거나 원본보다 오래되었으면 None, ASSET_BUILD_RECHECK_SECONDS마다 다시 확인)"""
+    global _asset_build, _asset_build_state, _asset_build_expires
+    now = time.monotonic()
+    if now >= _asset_build_expires:
+        state = _asset_build_state_now()
+        if state != _asset_build_state:
+            _asset_build = frontend_assets.load_build(frontend_assets.FRONTEND_BUILD_DIR,
+                                                      frontend_assets.FRONTEND_DIR)
+            _asset_build_state = state
+        _asset_build_expires = now + ASSET_BUILD_RECHECK_SECONDS
+    return _asset_build
+
+
+def _serve_frontend(rel_path: str, directory, filename: str):
+    """빌드에 있으면 압축 사본 + 캐시 정책으로, 없으면 원본 디렉토리에서 서빙"""
+    build = get_asset_build()
+    resolved = build.resolve(rel_path) if build else None
+    if resolved is None:
+        return send_from_directory(str(directory), filename)
+    
+    path, immutable = resolved
+    file_path, encoding = build.variant(path, request.accept_encodings)
+    response = send_file(
+        str(file_path),
+        mimetype=mimetypes.guess_type(path.name)[0],
+        max_age=frontend_assets.IMMUTABLE_MAX_AGE if immutable else None,
+    )
+    if immutable:
+        response.cache_control.immutable = True
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
 
 # ============================================================
 # Static File Routes
@@ -32,7 +98,7 @@ def serve_index():
     """frontend/ai_studio_code_F2.html을 메인 페이지로 서빙"""
     f2_file = FRONTEND_DIR / 'ai_studio_code_F2.html'
     if f2_file.exists():
-        return send_file(str(f2_file))
+        return _serve_frontend(f2_file.name, FRONTEND_DIR, f2_file.name)
     else:
         return "File not found: frontend/ai_studio_code_F2.html", 404
 
@@ -40,19 +106,19 @@ def serve_index():
 @static_bp.route('/css/<path:filename>')
 def serve_css(filename):
     """CSS 파일 서빙"""
-    return send_from_directory(str(FRONTEND_DIR / 'css'), filename)
+    return _serve_frontend(f'css/{filename}', FRONTEND_DIR / 'css', filename)
 
 
 @static_bp.route('/js/<path:filename>')
 def serve_js(filename):
     """JavaScript 파일 서빙"""
-    return send_from_directory(str(FRONTEND_DIR / 'js'), filename)
+    return _serve_frontend(f'js/{filename}', FRONTEND_DIR / 'js', filename)
 
 
 @static_bp.route('/pages/<path:filename>')
 def serve_pages(filename):
     """Pages 폴더 파일 서빙 (quotation.html 등)"""
-    return send_from_directory(str(FRONTEND_DIR / 'pages'), filename)
+    return _serve_frontend(f'pages/{filename}', FRONTEND_DIR / 'pages', filename)
 
 
 # ============================================================
@@ -70,6 +136,20 @@ def get_google_maps_key():
     return jsonify({"apiKey": GOOGLE_MAPS_API_KEY})
 
 
+@static_bp.route('/api/health', methods=['GET'])
+def health():
+    """
+    헬스 체크 - 워밍업(Quote Backend, 스케줄러, 초기 수집)을 기다리지 않고 바로 응답합니다.
+    첫 응답 시간은 python -m benchmarks.startup으로 측정합니다.
+    """
+    return jsonify({
+        "status": "ok",
+        "uptime_s": uptime_seconds(),
+        "warmup": warmup_status(),
+        "lazy_imports_ms": lazy_import_timings(),
+    })
+
+
 # ============================================================
 # Mock Data API Routes (News, Logistics)
 # ============================================================
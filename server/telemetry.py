@@ -0,0 +1,78 @@
+"""
+Request Telemetry
+요청별 지연시간, SQL 문 수/시간, 외부 API(ECOS/GDELT/Gemini) 호출 시간을 기록하고
+Prometheus 텍스트 형식으로 /metrics에 노출합니다.
+
+    @kcci_bp.route('/routes')
+    @query_budget(3)                 # 이 라우트의 SQL 문 상한
+    def get_routes(): ...
+
+    with external_call('ecos'):      # 외부 API 호출 시간
+        response = requests.get(url, timeout=API_TIMEOUT)
+
+집계/렌더링은 quote_backend와 같은 공용 코어(shared/telemetry.py)를 쓰고, 여기는 Flask 연동만 둡니다.
+- SQL: SQLAlchemy 이벤트 + sqlite_profile.connect 연결의 trace callback(trace_statement)
+- 라우트 라벨은 URL 규칙(/api/kcci/routes/<route_code>)이므로 값별로 시계열이 늘어나지 않음
+- 응답에 Server-Timing 헤더(app/db/외부 호출)를 붙여 브라우저 개발자 도구에서 확인 가능
+
+집계는 프로세스별입니다 (gunicorn 워커마다 /metrics가 다름).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)  # 저장소 루트의 shared 패키지
+
+from shared.telemetry import (  # noqa: E402
+    METRICS_CONTENT_TYPE, NO_ROUTE, REQUEST_DURATION, REQUEST_STATEMENTS, REQUESTS_TOTAL, QueryBudgetExceeded,
+    RequestStats, _current, check_query_budget, count_queries, external_call, instrument_sqlalchemy,
+    normalize_statement, query_budget, record_statement, render_metrics, server_timing, slowest_statements,
+    trace_statement,
+)
+
+
+# ============================================================
+# Flask integration
+# ============================================================
+
+def init_telemetry(app):
+    """요청 전후 훅 + /metrics 등록"""
+    from flask import Response, g, request
+
+    instrument_sqlalchemy()
+
+    @app.before_request
+    def _start_request_stats():
+        rule = request.url_rule.rule if request.url_rule is not None else NO_ROUTE
+        g.telemetry_started = time.perf_counter()
+        g.telemetry_token = _current.set(RequestStats(rule))
+
+    @app.after_request
+    def _record_request_stats(response):
+        stats = _current.get()
+        started = g.get('telemetry_started')
+        if stats is None or started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        labels = (request.method, stats.route)
+        REQUEST_DURATION.observe(labels, elapsed)
+        REQUEST_STATEMENTS.observe(labels, stats.statements)
+        REQUESTS_TOTAL.inc((request.method, stats.route, str(response.status_code)))
+        response.headers['Server-Timing'] = server_timing(stats, elapsed)
+        check_query_budget(app.view_functions.get(request.endpoint), stats, request.method)
+        return response
+
+    @app.teardown_request
+    def _reset_request_stats(exc=None):
+        token = g.pop('telemetry_token', None)
+        if token is not None:
+            _current.reset(token)
+
+    def metrics():
+        return Response(render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
+    app.add_url_rule('/metrics', 'metrics', metrics)
+    return app
@@ -0,0 +1,70 @@
+"""
+Unit Tests for the Benchmark Harness
+Tests for seeded data generators and baseline comparison
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add server directory (and the repository root for shared/) to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+
+def _result(**scenarios):
+    return {'params': {'scale': 'small'}, 'scenarios': {
+        name: {'median_ms': ms, 'statements': sql} for name, (ms, sql) in scenarios.items()
+    }}
+
+
+class TestGenerators:
+    """Tests for benchmarks.generators determinism"""
+
+    def test_same_seed_same_data(self):
+        """Test the same seed produces identical articles and series"""
+        from benchmarks.generators import index_series, news_articles
+
+        assert news_articles(50, seed=1) == news_articles(50, seed=1)
+        assert news_articles(50, seed=1) != news_articles(50, seed=2)
+        assert index_series(100, seed=3) == index_series(100, seed=3)
+
+    def test_gdelt_exports(self, tmp_path):
+        """Test export files are written in 15-minute slices and parse"""
+        from benchmarks.generators import write_gdelt_exports
+        from gdelt_backend import parse_gdelt_events
+
+        files = write_gdelt_exports(tmp_path, slices=3, rows=20, seed=7)
+
+        assert [f.name for f in files] == ['20250101000000.export.CSV', '20250101001500.export.CSV',
+                                           '20250101003000.export.CSV']
+        assert len(parse_gdelt_events(files[0], -5.0, max_events=100)) == 20
+        assert files[0].read_text() == write_gdelt_exports(tmp_path / 'again', 1, 20, seed=7)[0].read_text()
+
+
+class TestCompare:
+    """Tests for harness.compare statuses"""
+
+    def test_statuses(self):
+        """Test regressed/improved/same/added/removed classification"""
+        from shared.benchmark_harness import compare
+
+        base = _result(slow=(10.0, 3), fast=(10.0, 3), noise=(1.0, 3), sql=(10.0, 3), gone=(5.0, 1))
+        new = _result(slow=(13.0, 3), fast=(7.0, 3), noise=(1.4, 3), sql=(10.0, 4), new=(5.0, 1))
+        status = {row['scenario']: row['status'] for row in compare(base, new, threshold=0.2)}
+
+        assert status == {'slow': 'regressed', 'fast': 'improved', 'noise': 'same', 'sql': 'regressed',
+                          'gone': 'removed', 'new': 'added'}
+
+    def test_cli_exit_code(self, tmp_path):
+        """Test compare exits 1 only when a scenario regressed"""
+        from shared.benchmark_harness import main, save
+
+        save(_result(a=(10.0, 1)), tmp_path / 'base.json')
+        save(_result(a=(10.5, 1)), tmp_path / 'same.json')
+        save(_result(a=(20.0, 1)), tmp_path / 'slow.json')
+
+        main('server', {}, None, tmp_path, ['compare', str(tmp_path / 'base.json'), str(tmp_path / 'same.json')])
+        with pytest.raises(SystemExit) as excinfo:
+            main('server', {}, None, tmp_path, ['compare', str(tmp_path / 'base.json'),
+                                                str(tmp_path / 'slow.json')])
+        assert excinfo.value.code == 1
@@ -0,0 +1,93 @@
+"""
+Unit Tests for the Shared Cache Backend
+Tests for memory/SQLite backends, cross-process sharing and APICache delegation
+"""
+import pytest
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from cache_backend import MemoryCacheBackend, SQLiteCacheBackend, create_cache_backend
+
+
+def _write_from_child(path):
+    backend = SQLiteCacheBackend(path)
+    backend.set('ecos', 'child', {'pid': os.getpid()}, ttl=60)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryCacheBackend()
+    return SQLiteCacheBackend(str(tmp_path / 'cache.db'))
+
+
+class TestBackends:
+    """Tests shared by every backend"""
+
+    def test_set_get_and_expiry(self, backend):
+        """Test values round-trip and expire after ttl"""
+        backend.set('ecos', 'rate', {'USD': 1400.5}, ttl=60)
+        backend.set('ecos', 'short', [1, 2], ttl=0.1)
+
+        assert backend.get('ecos', 'rate') == {'USD': 1400.5}
+        assert backend.get('gdelt', 'rate') is None
+        time.sleep(0.15)
+        assert backend.get('ecos', 'short') is None
+        assert backend.stats('ecos')['active'] == 1
+
+    def test_invalidate_namespace(self, backend):
+        """Test invalidation is scoped to one namespace"""
+        backend.set('ecos', 'a', 1, ttl=60)
+        backend.set('gdelt', 'b', 2, ttl=60)
+
+        assert backend.invalidate('ecos') == 1
+        assert backend.get('ecos', 'a') is None
+        assert backend.get('gdelt', 'b') == 2
+
+
+class TestSharing:
+    """Tests for multi-process sharing"""
+
+    def test_sqlite_backend_shared_across_processes(self, tmp_path):
+        """Test a value written by another process is visible here"""
+        path = str(tmp_path / 'cache.db')
+        backend = SQLiteCacheBackend(path)
+
+        proc = multiprocessing.get_context('spawn').Process(target=_write_from_child, args=(path,))
+        proc.start()
+        proc.join(timeout=60)
+
+        value = backend.get('ecos', 'child')
+        assert value is not None and value['pid'] != os.getpid()
+
+    def test_create_from_url(self, tmp_path):
+        """Test URL schemes map to backends"""
+        assert isinstance(create_cache_backend('memory://'), MemoryCacheBackend)
+        assert isinstance(create_cache_backend(f"sqlite:///{tmp_path / 'c.db'}"), SQLiteCacheBackend)
+        with pytest.raises(ValueError):
+            create_cache_backend('memcached://localhost')
+
+
+class TestAPICacheDelegation:
+    """Tests for bok_backend.APICache with a shared backend"""
+
+    def test_api_cache_uses_backend(self, tmp_path):
+        """Test APICache stores ECOS responses in the shared backend"""
+        from bok_backend import APICache
+
+        shared = SQLiteCacheBackend(str(tmp_path / 'cache.db'))
+        cache = APICache(backend=shared)
+        cache.set('StatisticSearch:731Y001', {'rows': [1]}, ttl=60)
+
+        assert len(cache.cache) == 0
+        assert APICache(backend=shared).get('StatisticSearch:731Y001') == {'rows': [1]}
+        assert cache.get_stats()['active'] == 1
+
+        cache.clear()
+        assert shared.get('ecos', 'StatisticSearch:731Y001') is None
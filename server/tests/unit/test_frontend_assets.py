@@ -0,0 +1,150 @@
+"""
+Unit Tests for the Frontend Asset Pipeline
+Tests for content hashing, reference rewriting, precompressed variants and immutable serving
+"""
+import gzip
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask
+
+
+@pytest.fixture
+def frontend(tmp_path):
+    """Small frontend tree: a page, a module importing a config module, and a stylesheet"""
+    src = tmp_path / 'frontend'
+    (src / 'css').mkdir(parents=True)
+    (src / 'js' / 'config').mkdir(parents=True)
+    (src / 'js' / 'features').mkdir(parents=True)
+    (src / 'pages').mkdir()
+
+    (src / 'css' / 'base.css').write_text('body { color: #111; }\n')
+    (src / 'js' / 'config' / 'api.js').write_text("export const API = '/api';\n")
+    (src / 'js' / 'features' / 'app.js').write_text(
+        "import { API } from '../config/api.js';\nconsole.log(API);\n"
+    )
+    (src / 'pages' / 'market.html').write_text(
+        '<link rel="stylesheet" href="../css/base.css">\n'
+        '<link href="https://cdn.example.com/lib.min.css" rel="stylesheet">\n'
+        '<script type="module" src="../js/features/app.js"></script>\n'
+        "<script type=\"module\">import '../js/features/app.js';</script>\n"
+        '<script src="../js/missing.js"></script>\n'
+    )
+    return src, tmp_path / 'dist'
+
+
+class TestBuildAssets:
+    """Tests for build_assets"""
+
+    def test_hashes_and_rewrites(self, frontend):
+        """Test assets get content hashes and pages/imports point at them"""
+        from frontend_assets import build_assets
+
+        src, out = frontend
+        manifest = build_assets(src, out)
+        assets = manifest['assets']
+
+        app_js = (out / assets['js/features/app.js']).read_text()
+        api_name = Path(assets['js/config/api.js']).name
+        assert assets['css/base.css'].startswith('css/base.') and assets['css/base.css'].endswith('.css')
+        assert f"from '../config/{api_name}'" in app_js
+
+        page = (out / 'pages' / 'market.html').read_text()
+        app_name = Path(assets['js/features/app.js']).name
+        assert page.count(f'../js/features/{app_name}') == 2
+        assert 'https://cdn.example.com/lib.min.css' in page
+        assert '../js/missing.js' in page
+        assert gzip.decompress((out / 'pages' / 'market.html.gz').read_bytes()).decode() == page
+
+    def test_dependency_change_rehashes_importer(self, frontend):
+        """Test changing an imported module changes the importing module's hash too"""
+        from frontend_assets import build_assets
+
+        src, out = frontend
+        before = build_assets(src, out)['assets']
+        (src / 'js' / 'config' / 'api.js').write_text("export const API = '/api/v2';\n")
+        after = build_assets(src, out)['assets']
+
+        assert after['js/config/api.js'] != before['js/config/api.js']
+        assert after['js/features/app.js'] != before['js/features/app.js']
+        assert after['css/base.css'] == before['css/base.css']
+        assert (out / before['js/features/app.js']).exists()  # 이전 빌드 파일 유지
+
+    def test_stale_build_is_ignored(self, frontend):
+        """Test load_build falls back to sources once a source file is newer than the build"""
+        from frontend_assets import build_assets, load_build
+
+        src, out = frontend
+        build_assets(src, out)
+        assert load_build(out, src) is not None
+
+        css = src / 'css' / 'base.css'
+        future = css.stat().st_mtime + 10
+        os.utime(css, (future, future))
+        assert load_build(out, src) is None
+
+
+class TestServeBuild:
+    """Tests for static_routes serving the build"""
+
+    @pytest.fixture
+    def client(self, frontend, monkeypatch):
+        import frontend_assets
+        import static_routes
+
+        src, out = frontend
+        manifest = frontend_assets.build_assets(src, out)
+        monkeypatch.setattr(frontend_assets, 'FRONTEND_DIR', src)
+        monkeypatch.setattr(frontend_assets, 'FRONTEND_BUILD_DIR', out)
+        monkeypatch.setattr(static_routes, '_asset_build', None)
+        monkeypatch.setattr(static_routes, '_asset_build_state', None)
+        monkeypatch.setattr(static_routes, '_asset_build_expires', 0.0)
+
+        app = Flask(__name__)
+        app.register_blueprint(static_routes.static_bp)
+        return app.test_client(), manifest
+
+    def test_hashed_asset_is_immutable_and_precompressed(self, client):
+        """Test hashed files are immutable and the gzip sibling is chosen by Accept-Encoding"""
+        client, manifest = client
+        url = '/' + manifest['assets']['js/features/app.js']
+
+        plain = client.get(url)
+        encoded = client.get(url, headers={'Accept-Encoding': 'gzip'})
+
+        assert 'immutable' in plain.headers['Cache-Control']
+        assert 'max-age=31536000' in plain.headers['Cache-Control']
+        assert plain.headers.get('Content-Encoding') is None
+        assert encoded.headers['Content-Encoding'] == 'gzip'
+        assert encoded.headers['Vary'] == 'Accept-Encoding'
+        assert encoded.mimetype.endswith('javascript')
+        assert gzip.decompress(encoded.data) == plain.data
+
+    def test_page_is_revalidated(self, client):
+        """Test rewritten pages are no-cache with a conditional 304"""
+        client, manifest = client
+        page = client.get('/pages/market.html')
+
+        assert page.headers['Cache-Control'] == 'no-cache'
+        assert Path(manifest['assets']['css/base.css']).name in page.get_data(as_text=True)
+        assert client.get('/pages/market.html', headers={'If-None-Match': page.headers['ETag']}).status_code == 304
+
+    def test_source_edit_disables_build(self, client, frontend, monkeypatch):
+        """Test editing a source file switches back to serving sources after the recheck interval"""
+        import static_routes
+
+        src, _ = frontend
+        assert static_routes.get_asset_build() is not None
+
+        css = src / 'css' / 'base.css'
+        future = css.stat().st_mtime + 10
+        os.utime(css, (future, future))
+        assert static_routes.get_asset_build() is not None  # 확인 주기 안에서는 그대로
+
+        monkeypatch.setattr(static_routes, '_asset_build_expires', 0.0)
+        assert static_routes.get_asset_build() is None
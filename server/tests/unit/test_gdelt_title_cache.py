@@ -0,0 +1,154 @@
+"""
+Unit Tests for GDELT Title Scraping
+Tests for TitleCache, streaming head fetch and partial title fetch results
+"""
+import time
+import threading
+from unittest.mock import patch, MagicMock
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestTitleCache:
+    """Tests for TitleCache class"""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test stored titles are returned as hits"""
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        cache = TitleCache(db_path=str(tmp_path / 'titles.db'))
+        cache.set('http://a.com/1', 'Port strike halts terminals')
+        
+        assert cache.get('http://a.com/1') == (True, 'Port strike halts terminals')
+        assert cache.get('http://a.com/2') == (False, None)
+    
+    def test_negative_cache(self, tmp_path):
+        """Test failed URLs are cached as negative hits"""
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        cache = TitleCache(db_path=str(tmp_path / 'titles.db'))
+        cache.set('http://dead.com/1', None)
+        
+        assert cache.get('http://dead.com/1') == (True, None)
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test cache survives reopening the database"""
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        db_path = str(tmp_path / 'titles.db')
+        TitleCache(db_path=db_path).set('http://a.com/1', 'Persisted title')
+        
+        assert TitleCache(db_path=db_path).get('http://a.com/1') == (True, 'Persisted title')
+    
+    def test_expired_entries_miss_and_prune(self, tmp_path):
+        """Test expired entries are not returned and are pruned"""
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        cache = TitleCache(db_path=str(tmp_path / 'titles.db'), ttl_seconds=-1)
+        cache.set('http://a.com/1', 'Old title')
+        
+        assert cache.get('http://a.com/1') == (False, None)
+        assert cache.prune() == 1
+    
+    def test_prune_bounds_size(self, tmp_path):
+        """Test prune trims oldest entries beyond max_entries"""
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        cache = TitleCache(db_path=str(tmp_path / 'titles.db'), max_entries=2)
+        for i in range(4):
+            cache.set(f'http://a.com/{i}', f'Title number {i}')
+            time.sleep(0.01)
+        
+        assert cache.prune() == 2
+        hits = cache.get_many([f'http://a.com/{i}' for i in range(4)])
+        assert sorted(hits) == ['http://a.com/2', 'http://a.com/3']
+
+
+class TestFetchHtmlHead:
+    """Tests for streaming head fetch"""
+    
+    def test_stops_reading_after_title(self):
+        """Test streaming stops once </title> is received"""
+        from news_intelligence.collectors.title_scraper import fetch_html_head
+        
+        consumed = []
+        
+        def chunks(chunk_size):
+            for chunk in [b'<html><head><title>Port', b' strike</title>', b'<body>' + b'x' * 5000]:
+                consumed.append(chunk)
+                yield chunk
+        
+        response = MagicMock()
+        response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        response.encoding = 'utf-8'
+        response.iter_content.side_effect = chunks
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.get.return_value = response
+        
+        html = fetch_html_head(session, 'http://a.com/1')
+        
+        assert '<title>Port strike</title>' in html
+        assert len(consumed) == 2
+
+
+class TestHostSessionPool:
+    """Tests for HostSessionPool LRU bound"""
+    
+    def test_evicts_least_recently_used_idle_session(self):
+        """Test sessions beyond max_hosts are closed, least recently used first"""
+        from news_intelligence.collectors import title_scraper
+        
+        pool = title_scraper.HostSessionPool(max_hosts=2)
+        sessions = {}
+        
+        def fake_fetch(session, url, timeout):
+            sessions.setdefault(url.split('/')[2], session)
+            return '<title>t</title>'
+        
+        with patch.object(title_scraper, 'fetch_html_head', side_effect=fake_fetch):
+            for url in ('http://a.com/1', 'http://b.com/1', 'http://a.com/2', 'http://c.com/1'):
+                pool.fetch_head(url)
+        
+        assert len(pool) == 2
+        with patch.object(sessions['b.com'], 'close') as closed_b, \
+             patch.object(sessions['a.com'], 'close') as closed_a:
+            pool.close()
+        closed_a.assert_called_once()
+        closed_b.assert_not_called()
+
+
+class TestFetchTitlesParallel:
+    """Tests for GDELTCollector._fetch_titles_parallel"""
+    
+    def test_timeout_returns_partial_result(self, tmp_path):
+        """Test slow fetches keep fallback titles instead of failing the batch"""
+        from news_intelligence.collectors import gdelt_collector
+        from news_intelligence.collectors.title_scraper import TitleCache
+        
+        release = threading.Event()
+        
+        def fake_fetch(url):
+            if 'slow' in url:
+                release.wait(5)
+                return None
+            return 'Fetched headline title'
+        
+        articles = [
+            {'title': '[GDELT] A: Material Conflict', 'url': 'http://fast.com/1'},
+            {'title': '[GDELT] B: Material Conflict', 'url': 'http://slow.com/1'},
+        ]
+        
+        collector = gdelt_collector.GDELTCollector()
+        with patch.object(gdelt_collector, '_title_cache', TitleCache(db_path=str(tmp_path / 't.db'))), \
+             patch.object(collector, '_fetch_title_from_url', side_effect=fake_fetch):
+            collector._fetch_titles_parallel(articles, max_workers=2, timeout=0.5)
+        release.set()
+        
+        assert articles[0]['title'] == 'Fetched headline title'
+        assert articles[0]['title_scraped'] is True
+        assert articles[1]['title'] == '[GDELT] B: Material Conflict'
+        assert articles[1]['title_scraped'] is False
@@ -0,0 +1,205 @@
+"""
+Unit Tests for GDELT Rolling Alert Window
+Tests for RollingAlertWindow slice management and top-N merge
+"""
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def _make_row(goldstein, country='US', num_articles=1, category_quad=4):
+    """Build one 61-column GDELT export row"""
+    row = [''] * 61
+    row[1] = '20250101'
+    row[6] = 'ACTOR1'
+    row[7] = country
+    row[26] = '190'
+    row[29] = str(category_quad)
+    row[30] = str(goldstein)
+    row[31] = '1'
+    row[32] = '1'
+    row[33] = str(num_articles)
+    row[34] = '-3.0'
+    row[52] = 'Somewhere'
+    row[53] = country
+    row[56] = '10.0'
+    row[57] = '20.0'
+    row[60] = 'http://example.com/news'
+    return '\t'.join(row)
+
+
+def _write_slice(base_path, slice_key, rows):
+    date_dir = base_path / 'default' / 'events' / slice_key[:8]
+    date_dir.mkdir(parents=True, exist_ok=True)
+    file_path = date_dir / f'{slice_key}.export.CSV'
+    file_path.write_text('\n'.join(rows) + '\n', encoding='utf-8')
+    return file_path
+
+
+class TestRollingAlertWindow:
+    """Tests for RollingAlertWindow class"""
+    
+    def test_add_file_prefilters_and_sorts(self, tmp_path):
+        """Test slices keep only events at or below the window threshold, sorted by severity"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow(goldstein_threshold=-4.0)
+        path = _write_slice(tmp_path, '20250101000000', [
+            _make_row(-5.0), _make_row(2.0), _make_row(-9.0), _make_row(-4.0)
+        ])
+        
+        assert window.add_file(path) is True
+        assert window.add_file(path) is False
+        alerts = window.top_alerts(max_alerts=10)
+        assert [a['goldstein_scale'] for a in alerts] == [-9.0, -5.0, -4.0]
+    
+    def test_merge_across_slices_top_n(self, tmp_path):
+        """Test k-way merge returns global top-N across slices"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow()
+        window.add_file(_write_slice(tmp_path, '20250101000000', [_make_row(-5.0), _make_row(-8.0)]))
+        window.add_file(_write_slice(tmp_path, '20250101001500', [_make_row(-10.0), _make_row(-6.0)]))
+        
+        alerts = window.top_alerts(max_alerts=3)
+        assert [a['goldstein_scale'] for a in alerts] == [-10.0, -8.0, -6.0]
+        
+        strict = window.top_alerts(max_alerts=10, goldstein_threshold=-7.0)
+        assert [a['goldstein_scale'] for a in strict] == [-10.0, -8.0]
+    
+    def test_filters_and_hours(self, tmp_path):
+        """Test country filter and hours restriction"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow()
+        window.add_file(_write_slice(tmp_path, '20250101000000', [_make_row(-9.0, country='KR')]))
+        window.add_file(_write_slice(tmp_path, '20250101020000', [_make_row(-5.0, country='US')]))
+        
+        assert [a['country_code'] for a in window.top_alerts(country='kr')] == ['KR']
+        assert [a['goldstein_scale'] for a in window.top_alerts(hours=1)] == [-5.0]
+    
+    def test_expired_slices_dropped(self, tmp_path):
+        """Test slices older than 24 hours from the newest are evicted"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow()
+        window.add_file(_write_slice(tmp_path, '20250101000000', [_make_row(-9.0)]))
+        window.add_file(_write_slice(tmp_path, '20250101003000', [_make_row(-8.0)]))
+        window.add_file(_write_slice(tmp_path, '20250102001500', [_make_row(-5.0)]))
+        
+        assert window.slice_keys() == ['20250101003000', '20250102001500']
+    
+    def test_ring_buffer_capacity(self, tmp_path):
+        """Test the window never holds more than max_slices"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow(max_slices=3)
+        for minute in ('00', '15', '30', '45'):
+            window.add_file(_write_slice(tmp_path, f'2025010100{minute}00', [_make_row(-5.0)]))
+        
+        assert len(window) == 3
+        assert window.slice_keys()[0] == '20250101001500'
+    
+    def test_rebuild_from_disk(self, tmp_path):
+        """Test rebuild loads existing export files"""
+        from gdelt_backend import RollingAlertWindow
+        
+        _write_slice(tmp_path, '20250101000000', [_make_row(-6.0)])
+        _write_slice(tmp_path, '20250101001500', [_make_row(-7.0)])
+        
+        window = RollingAlertWindow()
+        assert window.rebuild(tmp_path) == 2
+        assert [a['goldstein_scale'] for a in window.top_alerts()] == [-7.0, -6.0]
+
+    def test_loaded_window_catches_up_with_disk(self, tmp_path, monkeypatch):
+        """Test a worker that did not download the file still picks up new slices (and the data version moves)"""
+        import gdelt_backend
+
+        monkeypatch.setattr(gdelt_backend, '_alert_window', gdelt_backend.RollingAlertWindow())
+        monkeypatch.setattr(gdelt_backend, '_alert_window_loaded', False)
+        monkeypatch.setattr(gdelt_backend, '_alert_window_version', None)
+        monkeypatch.setattr(gdelt_backend, '_data_version_checked', (0.0, None, None))
+
+        assert gdelt_backend.get_data_version(tmp_path) is None
+        _write_slice(tmp_path, '20250101000000', [_make_row(-6.0)])
+        assert gdelt_backend.get_alert_window(tmp_path).slice_keys() == ['20250101000000']
+        assert gdelt_backend.get_alert_window(tmp_path).slice_keys() == ['20250101000000']
+        version = gdelt_backend.get_data_version(tmp_path)
+
+        _write_slice(tmp_path, '20250101001500', [_make_row(-7.0)])
+        _write_slice(tmp_path, '20250101003000', [_make_row(-8.0)])
+        assert gdelt_backend.get_data_version(tmp_path) != version
+        # 디스크 확인은 VALIDATOR_TTL 동안 재사용되므로 만료 전에는 그대로
+        assert gdelt_backend.get_alert_window(tmp_path).slice_keys() == ['20250101000000']
+
+        monkeypatch.setattr(gdelt_backend, '_data_version_checked', (0.0, None, None))
+        assert gdelt_backend.get_alert_window(tmp_path).slice_keys() == [
+            '20250101000000', '20250101001500', '20250101003000'
+        ]
+
+
+def _make_geo_row(goldstein, lat, lng, quad_class=4):
+    row = _make_row(goldstein, category_quad=quad_class).split('\t')
+    row[56] = str(lat)
+    row[57] = str(lng)
+    return '\t'.join(row)
+
+
+class TestAlertGrid:
+    """Tests for geohash grid aggregation"""
+    
+    def test_encode_geohash_known_value(self):
+        """Test geohash encoding against a known reference point"""
+        from gdelt_backend import encode_geohash
+        
+        assert encode_geohash(57.64911, 10.40744, 6) == 'u4pruy'
+    
+    def test_zoom_to_precision_is_monotonic(self):
+        """Test higher zoom never yields a coarser precision"""
+        from gdelt_backend import zoom_to_geohash_precision
+        
+        precisions = [zoom_to_geohash_precision(z) for z in range(0, 21)]
+        assert precisions == sorted(precisions)
+        assert precisions[0] == 1 and precisions[-1] == 6
+    
+    def test_grid_merges_slices(self, tmp_path):
+        """Test cell counts, min goldstein and dominant category across slices"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow()
+        window.add_file(_write_slice(tmp_path, '20250101000000', [
+            _make_geo_row(-5.0, 37.5, 127.0, quad_class=4),
+            _make_geo_row(-9.0, 37.6, 127.1, quad_class=3),
+        ]))
+        window.add_file(_write_slice(tmp_path, '20250101001500', [
+            _make_geo_row(-6.0, 37.55, 127.05, quad_class=4),
+            _make_geo_row(-7.0, -33.9, 151.2, quad_class=4),
+        ]))
+        
+        cells = window.grid(precision=2)
+        seoul = next(c for c in cells if c['cell'] == 'wy')
+        
+        assert len(cells) == 2
+        assert seoul['count'] == 3
+        assert seoul['min_goldstein'] == -9.0
+        assert seoul['category'] == 'Material Conflict'
+    
+    def test_grid_stricter_threshold_and_bbox(self, tmp_path):
+        """Test stricter thresholds and bbox filter the cells"""
+        from gdelt_backend import RollingAlertWindow
+        
+        window = RollingAlertWindow()
+        window.add_file(_write_slice(tmp_path, '20250101000000', [
+            _make_geo_row(-5.0, 37.5, 127.0),
+            _make_geo_row(-9.0, -33.9, 151.2),
+        ]))
+        
+        strict = window.grid(precision=3, goldstein_threshold=-8.0)
+        assert [c['count'] for c in strict] == [1]
+        assert strict[0]['min_goldstein'] == -9.0
+        
+        korea = window.grid(precision=3, bbox=(120.0, 30.0, 135.0, 45.0))
+        assert len(korea) == 1
+        assert korea[0]['lat'] == 37.5
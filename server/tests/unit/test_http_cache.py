@@ -0,0 +1,169 @@
+"""
+Unit Tests for HTTP Cache Policies
+Tests for validator ETags, 304 short-circuit, body-hash fallback and no-store defaults
+"""
+import pytest
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Blueprint, Flask, jsonify, send_file
+
+
+@pytest.fixture
+def cached_app(tmp_path):
+    """App with a validator-backed blueprint, a body-hash blueprint and an unregistered blueprint"""
+    from http_cache import NO_CACHE, init_http_cache, public_max_age, register_cache_policy
+
+    state = {'version': 'v1', 'calls': 0}
+
+    data_bp = Blueprint('data', __name__)
+    data_policy = register_cache_policy(data_bp, NO_CACHE, validator=lambda: state['version'],
+                                        exempt=('data.download',))
+
+    @data_bp.route('/data')
+    def get_data():
+        state['calls'] += 1
+        return jsonify({'version': state['version']})
+
+    @data_bp.route('/data', methods=['POST'])
+    def post_data():
+        state['version'] = 'v2'
+        return jsonify({'ok': True})
+
+    @data_bp.route('/data/missing')
+    def missing():
+        return jsonify({'error': 'not found'}), 404
+
+    pdf = tmp_path / 'file.pdf'
+    pdf.write_bytes(b'%PDF-1.4')
+
+    @data_bp.route('/data/download')
+    def download():
+        return send_file(str(pdf), etag='sha-abc', max_age=3600)
+
+    ext_bp = Blueprint('ext', __name__)
+    register_cache_policy(ext_bp, public_max_age(300))
+
+    @ext_bp.route('/ext')
+    def get_ext():
+        return jsonify({'value': 42})
+
+    other_bp = Blueprint('other', __name__)
+
+    @other_bp.route('/other')
+    def get_other():
+        return jsonify({'value': 1})
+
+    app = Flask(__name__)
+    init_http_cache(app)
+    for bp in (data_bp, ext_bp, other_bp):
+        app.register_blueprint(bp)
+    return app.test_client(), state, data_policy
+
+
+class TestValidatorPolicy:
+    """Tests for blueprints with a data-version validator"""
+
+    def test_matching_etag_skips_view(self, cached_app):
+        """Test If-None-Match with the current ETag returns 304 without running the view"""
+        client, state, _ = cached_app
+        first = client.get('/data')
+        etag = first.headers['ETag']
+
+        assert first.status_code == 200
+        assert first.headers['Cache-Control'] == 'no-cache'
+        assert etag.startswith('W/"')
+
+        repeat = client.get('/data', headers={'If-None-Match': etag})
+        assert repeat.status_code == 304
+        assert repeat.data == b''
+        assert repeat.headers['ETag'] == etag
+        assert state['calls'] == 1
+
+    def test_etag_varies_by_query(self, cached_app):
+        """Test different query strings get different ETags"""
+        client, _, _ = cached_app
+        assert client.get('/data?period=1M').headers['ETag'] != client.get('/data?period=1Y').headers['ETag']
+
+    def test_write_invalidates_version(self, cached_app):
+        """Test a POST on the blueprint refreshes the memoized validator"""
+        client, state, _ = cached_app
+        etag = client.get('/data').headers['ETag']
+
+        assert client.post('/data').headers['Cache-Control'] == 'no-store'
+        response = client.get('/data', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.get_json() == {'version': 'v2'}
+        assert response.headers['ETag'] != etag
+
+    def test_errors_and_exempt_endpoints(self, cached_app):
+        """Test error responses are no-store and view-set validators are kept"""
+        client, _, _ = cached_app
+        assert client.get('/data/missing').headers['Cache-Control'] == 'no-store'
+
+        download = client.get('/data/download')
+        assert download.headers['ETag'] == '"sha-abc"'
+        assert 'max-age=3600' in download.headers['Cache-Control']
+        assert client.get('/data/download', headers={'If-None-Match': '"sha-abc"'}).status_code == 304
+
+
+class TestBodyHashPolicy:
+    """Tests for blueprints without a validator"""
+
+    def test_body_hash_etag(self, cached_app):
+        """Test body-hash ETag, max-age and conditional 304"""
+        client, _, _ = cached_app
+        first = client.get('/ext')
+
+        assert first.headers['Cache-Control'] == 'public, max-age=300'
+        repeat = client.get('/ext', headers={'If-None-Match': first.headers['ETag']})
+        assert repeat.status_code == 304
+
+    def test_unregistered_blueprint_is_no_store(self, cached_app):
+        """Test the app default for endpoints without a policy"""
+        client, _, _ = cached_app
+        response = client.get('/other')
+
+        assert response.headers['Cache-Control'] == 'no-store'
+        assert 'ETag' not in response.headers
+
+
+class TestValidators:
+    """Tests for sqlite_table_version and file_version"""
+
+    def test_sqlite_table_version(self, tmp_path):
+        """Test the version changes on insert and update of collected_at"""
+        from http_cache import sqlite_table_version
+
+        db_path = str(tmp_path / 'index.db')
+        assert sqlite_table_version(db_path, ['idx']) is None
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE idx (id INTEGER PRIMARY KEY, collected_at TEXT)")
+        conn.execute("INSERT INTO idx (collected_at) VALUES ('2025-01-01')")
+        conn.commit()
+        before = sqlite_table_version(db_path, ['idx'])
+
+        conn.execute("UPDATE idx SET collected_at = '2025-01-02'")
+        conn.commit()
+        conn.close()
+        assert sqlite_table_version(db_path, ['idx']) != before
+
+    def test_file_version(self, tmp_path):
+        """Test missing main file returns None and a missing WAL is tolerated"""
+        from http_cache import file_version
+
+        db_path = tmp_path / 'news.db'
+        assert file_version(str(db_path)) is None
+
+        db_path.write_bytes(b'x')
+        version = file_version(str(db_path), str(db_path) + '-wal')
+        assert version.endswith(',-')
+
+        db_path.write_bytes(b'xy')
+        assert file_version(str(db_path), str(db_path) + '-wal') != version
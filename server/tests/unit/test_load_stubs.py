@@ -0,0 +1,99 @@
+"""
+Unit Tests for the Offline Load Test
+Tests for external API stubs and driver statistics
+"""
+import json
+import smtplib
+import sys
+from pathlib import Path
+
+import requests
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestFixtures:
+    """Tests for loadtest.stubs fixture replay"""
+
+    def test_periods(self):
+        """Test ECOS period labels per cycle"""
+        from loadtest.stubs import _periods
+
+        assert _periods('D', '20250103', '20250107') == ['20250103', '20250106', '20250107']
+        assert _periods('M', '202411', '202502') == ['202411', '202412', '202501', '202502']
+        assert _periods('Q', '2024Q3', '2025Q1') == ['2024Q3', '2024Q4', '2025Q1']
+        assert _periods('A', '2023', '2025') == ['2023', '2024', '2025']
+
+    def test_ecos_statistic_search(self):
+        """Test StatisticSearch rows follow the requested code, item and range"""
+        from loadtest.stubs import Fixtures
+
+        fixtures = Fixtures()
+        args = ['KEY', 'json', 'kr', '1', '2', '731Y001', 'D', '20250101', '20250110', '0000003']
+        response = fixtures.ecos_response('StatisticSearch', args)
+
+        rows = response['StatisticSearch']['row']
+        assert [row['TIME'] for row in rows] == ['20250101', '20250102']
+        assert {row['ITEM_CODE1'] for row in rows} == {'0000003'}
+
+    def test_gemini_batch_ids(self):
+        """Test batch analysis prompts get one result per article id"""
+        import random
+
+        from loadtest.stubs import Fixtures
+
+        prompt = "[3] Title: a\nDescription: x\n\n[7] Title: b\nDescription: y"
+        results = json.loads(Fixtures().gemini_text(prompt, random.Random(1)))
+
+        assert [item['id'] for item in results] == [3, 7]
+
+
+class TestStubServers:
+    """Tests for the HTTP/SMTP stub servers"""
+
+    def test_http_and_smtp(self, tmp_path):
+        """Test ECOS over HTTP, failure injection and mail capture"""
+        from loadtest.stubs import StubServers
+
+        behaviors = {name: {'latency_ms': 0, 'jitter_ms': 0} for name in ('ecos', 'gdelt', 'gemini', 'smtp')}
+        with StubServers(http_port=0, smtp_port=0, behaviors=behaviors, seed=1, mail_dir=tmp_path) as stubs:
+            env = stubs.env()
+            url = f"{env['ECOS_API_BASE_URL']}/StatisticTableList/KEY/json/kr/1/5"
+            assert 'StatisticTableList' in requests.get(url, timeout=5).json()
+
+            stubs.configure({'ecos': {'error_rate': 1}})
+            assert requests.get(url, timeout=5).status_code == 503
+
+            with smtplib.SMTP(env['SMTP_HOST'], int(env['SMTP_PORT']), timeout=5) as smtp:
+                smtp.sendmail('a@example.com', ['b@example.com'], 'Subject: hi\r\n\r\nbody')
+
+            assert stubs.stats.snapshot()['ecos'] == {'requests': 2, 'failures': 1}
+            assert stubs.mails == 1
+            assert b'body' in (tmp_path / '000001.eml').read_bytes()
+
+
+class TestDriverStats:
+    """Tests for loadtest.driver statistics"""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        from loadtest.driver import percentile
+
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 95) == 0.0
+
+    def test_summarize_excludes_flow_steps(self):
+        """Test flow steps are reported but not counted in the total"""
+        from loadtest.driver import summarize
+
+        samples = [('a', 0, 10.0, '200'), ('a', 0, 30.0, '500'), ('flow', 0, 50.0, '200'),
+                   ('flow:step', 0, 20.0, '200')]
+        report = summarize(samples, duration=2.0)
+
+        assert report['endpoints']['a']['errors'] == 1
+        assert report['endpoints']['flow:step']['count'] == 1
+        assert report['total']['count'] == 3
+        assert report['total']['max_ms'] == 50.0
@@ -0,0 +1,129 @@
+"""
+Unit Tests for News Intelligence Near-Duplicate Clustering
+Tests for simhash, SimHashIndex and collapse_by_group
+"""
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestSimHash:
+    """Tests for simhash fingerprinting"""
+    
+    def test_identical_text_same_fingerprint(self):
+        """Test identical title/summary produce identical fingerprints"""
+        from news_intelligence.dedup import simhash
+        
+        a = simhash("Port strike halts Rotterdam terminals", "Dock workers walked out on Monday")
+        b = simhash("Port strike halts Rotterdam terminals", "Dock workers walked out on Monday")
+        assert a == b
+    
+    def test_text_without_words_has_no_fingerprint(self):
+        """Test articles with no words get no fingerprint instead of a shared zero"""
+        from news_intelligence.dedup import simhash
+        
+        assert simhash("", "") is None
+        assert simhash(None, None) is None
+        assert simhash(" - ", "...") is None
+    
+    def test_syndicated_copy_is_close(self):
+        """Test a lightly edited copy stays within the match distance"""
+        from news_intelligence.dedup import simhash, hamming_distance, MAX_HAMMING_DISTANCE
+        
+        summary = ("Dock workers at the port of Rotterdam walked out on Monday over pay, "
+                   "halting container operations at the largest terminals in Europe")
+        original = simhash("Port strike halts Rotterdam container terminals", summary)
+        copy = simhash("Port strike halts Rotterdam container terminals", summary + " - Reuters")
+        assert hamming_distance(original, copy) <= MAX_HAMMING_DISTANCE
+    
+    def test_different_stories_are_far(self):
+        """Test unrelated stories do not match"""
+        from news_intelligence.dedup import simhash, hamming_distance, MAX_HAMMING_DISTANCE
+        
+        a = simhash("Port strike halts Rotterdam terminals", "Dock workers walked out on Monday over pay")
+        b = simhash("Air cargo demand rises in Asia", "Freight forwarders report higher volumes ahead of holidays")
+        assert hamming_distance(a, b) > MAX_HAMMING_DISTANCE
+
+
+class TestSimHashIndex:
+    """Tests for SimHashIndex class"""
+    
+    def test_assign_new_and_duplicate(self):
+        """Test first fingerprint opens a group, a near copy joins it"""
+        from news_intelligence.dedup import SimHashIndex
+        
+        index = SimHashIndex()
+        group_a, dup_a = index.assign(0xF0F0F0F0F0F0F0F0)
+        group_b, dup_b = index.assign(0xF0F0F0F0F0F0F0F0 ^ 0b101)
+        
+        assert dup_a is False
+        assert dup_b is True
+        assert group_a == group_b
+        assert len(index) == 2
+    
+    def test_distance_beyond_threshold_not_matched(self):
+        """Test fingerprints differing in many bits get separate groups"""
+        from news_intelligence.dedup import SimHashIndex
+        
+        index = SimHashIndex()
+        group_a, _ = index.assign(0)
+        group_b, dup_b = index.assign(0xFFFF)
+        
+        assert dup_b is False
+        assert group_a != group_b
+    
+    def test_match_when_differences_spread_across_bands(self):
+        """Test a match is found when every band but one differs"""
+        from news_intelligence.dedup import SimHashIndex
+        
+        index = SimHashIndex()
+        base = 0x123456789ABCDEF0
+        group, _ = index.assign(base)
+        
+        # Flip one bit in each of the first three 16-bit bands
+        variant = base ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+        assert index.find(variant) == group
+    
+    def test_invalid_band_configuration(self):
+        """Test configurations that could miss matches are rejected"""
+        from news_intelligence.dedup import SimHashIndex
+        
+        with pytest.raises(ValueError):
+            SimHashIndex(num_bands=4, max_distance=4)
+        with pytest.raises(ValueError):
+            SimHashIndex(num_bands=5)
+    
+    def test_prune_evicts_old_entries(self):
+        """Test prune removes entries older than retention"""
+        from news_intelligence.dedup import SimHashIndex
+        
+        index = SimHashIndex(retention_seconds=10)
+        index.add(0xAAAA, 'sh-old', added_at=100.0)
+        index.add(0xBBBB0000, 'sh-new', added_at=200.0)
+        
+        assert index.prune(now=150.0) == 1
+        assert len(index) == 1
+        assert index.find(0xAAAA) is None
+
+
+class TestCollapseByGroup:
+    """Tests for collapse_by_group helper"""
+    
+    def test_keeps_first_of_each_group(self):
+        """Test the first item represents its cluster and sizes are counted"""
+        from news_intelligence.dedup import collapse_by_group
+        
+        items = [
+            SimpleNamespace(id=1, group_id='g1'),
+            SimpleNamespace(id=2, group_id='g2'),
+            SimpleNamespace(id=3, group_id='g1'),
+            SimpleNamespace(id=4, group_id=None),
+            SimpleNamespace(id=5, group_id='g1'),
+        ]
+        result = collapse_by_group(items)
+        
+        assert [(item.id, size) for item, size in result] == [(1, 3), (2, 1), (4, 1)]
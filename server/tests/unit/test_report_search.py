@@ -0,0 +1,112 @@
+"""
+Unit Tests for Report Full-text Search
+Tests for FTS5 sync triggers, prefix matching, bm25 ranking and highlights
+"""
+import pytest
+import sys
+from datetime import date
+from functools import partial
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask
+from sqlalchemy import create_engine
+
+
+@pytest.fixture
+def search_db(tmp_path, monkeypatch):
+    """Temp report database with the FTS index, bound to report_bp"""
+    from report import api
+    from report.models import Base, ReportDB, SessionLocal
+    from report.search import ensure_fts
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    Session = partial(SessionLocal, bind=engine)
+
+    db = Session()
+    rows = [
+        ('R1', '해운시장 2025 전망', 'KMI', '컨테이너 운임과 항만 적체 분석', ['해운', '운임'], date(2024, 1, 1)),
+        ('R2', 'Port congestion report', 'Drewry', '해운 업황 요약: 선복량 증가', ['Port'], date(2025, 6, 1)),
+        ('R3', 'Air cargo <script> outlook', 'IATA', 'Air freight demand recovers', ['Air'], date(2025, 3, 1)),
+    ]
+    for report_id, title, org, summary, tags, published in rows:
+        report = ReportDB(id=report_id, title=title, category='global_research', organization=org,
+                          summary=summary, published_date=published)
+        report.set_tags(tags)
+        db.add(report)
+    db.commit()
+    db.close()
+
+    assert ensure_fts(engine)  # 기존 행으로 인덱스 채움
+    monkeypatch.setattr(api, 'SessionLocal', Session)
+    app = Flask(__name__)
+    app.register_blueprint(api.report_bp)
+    return app, Session
+
+
+def _search(app, term, **params):
+    query = dict(params, search=term, page_size=20)
+    return app.test_client().get('/api/reports', query_string=query).get_json()
+
+
+class TestMatchQuery:
+    """Tests for build_match_query"""
+
+    def test_tokens_become_prefix_terms(self):
+        """Test FTS syntax is stripped and each token is a prefix term"""
+        from report.search import build_match_query
+
+        assert build_match_query('해운 outlook') == '"해운"* "outlook"*'
+        assert build_match_query('port" OR (air') == '"port"* "OR"* "air"*'
+        assert build_match_query('  "* ') is None
+
+
+class TestReportSearch:
+    """Tests for /api/reports?search="""
+
+    def test_korean_prefix_and_ranking(self, search_db):
+        """Test Korean prefix matches and title hits rank above summary hits"""
+        app, _ = search_db
+        data = _search(app, '해운')
+
+        assert [r['id'] for r in data['reports']] == ['R1', 'R2']
+        assert data['total'] == 2
+        assert data['reports'][0]['highlight']['title'] == '<mark>해운시장</mark> 2025 전망'
+
+    def test_explicit_sort_overrides_relevance(self, search_db):
+        """Test sort=newest still orders search results by date"""
+        app, _ = search_db
+        assert [r['id'] for r in _search(app, '해운', sort='newest')['reports']] == ['R2', 'R1']
+
+    def test_tags_are_indexed_as_text(self, search_db):
+        """Test JSON-escaped Korean tags are searchable"""
+        app, _ = search_db
+        assert [r['id'] for r in _search(app, '운임')['reports']] == ['R1']
+
+    def test_highlight_is_html_escaped(self, search_db):
+        """Test highlighted fields escape stored HTML"""
+        app, _ = search_db
+        item = _search(app, 'air')['reports'][0]
+
+        assert item['highlight']['title'] == '<mark>Air</mark> cargo &lt;script&gt; outlook'
+        assert '<mark>Air</mark>' in item['highlight']['summary']
+
+    def test_index_follows_update_and_delete(self, search_db):
+        """Test triggers keep the index in sync with the reports table"""
+        from report.models import ReportDB
+
+        app, Session = search_db
+        db = Session()
+        db.get(ReportDB, 'R3').title = 'Bulk carrier outlook'
+        db.add(ReportDB(id='R4', title='Bulk shipping digest', category='company',
+                        organization='Clarksons', published_date=date(2025, 7, 1)))
+        db.delete(db.get(ReportDB, 'R1'))
+        db.commit()
+        db.close()
+
+        assert sorted(r['id'] for r in _search(app, 'bulk')['reports']) == ['R3', 'R4']
+        assert _search(app, 'cargo')['total'] == 0
+        assert [r['id'] for r in _search(app, '해운')['reports']] == ['R2']
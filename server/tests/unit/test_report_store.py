@@ -0,0 +1,200 @@
+"""
+Unit Tests for the Report PDF Store
+Tests for content-addressed storage, legacy blob migration and streaming downloads
+"""
+import pytest
+import hashlib
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256)) * 64 + b"\n%%EOF\n"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the module-level PDF store at a temp directory"""
+    from report import storage
+
+    store = storage.PDFStore(tmp_path / 'files')
+    monkeypatch.setattr(storage, 'pdf_store', store)
+    return store
+
+
+@pytest.fixture
+def report_app(tmp_path, store, monkeypatch):
+    """Flask app with report_bp bound to a temp database"""
+    from report import api
+    from report.models import Base, ReportDB
+    from report.storage import attach_pdf
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(api, 'SessionLocal', Session)
+    monkeypatch.setattr(api, 'pdf_store', store)
+
+    db = Session()
+    for report_id, with_pdf in (('RPT-PDF', True), ('RPT-NOPDF', False)):
+        report = ReportDB(id=report_id, title=report_id, category='government',
+                          organization='KMI', published_date=date(2025, 1, 1))
+        db.add(report)
+        if with_pdf:
+            attach_pdf(db, report, PDF_BYTES, file_name='해운 전망.pdf')
+    db.commit()
+    db.close()
+
+    app = Flask(__name__)
+    app.register_blueprint(api.report_bp)
+    return app
+
+
+class TestPDFStore:
+    """Tests for PDFStore"""
+
+    def test_put_is_content_addressed(self, store, tmp_path):
+        """Test files are stored once under their sha256"""
+        source = tmp_path / 'a.pdf'
+        source.write_bytes(PDF_BYTES)
+
+        sha256, size = store.put_file(source)
+        assert sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+        assert size == len(PDF_BYTES)
+        assert store.path_for(sha256).read_bytes() == PDF_BYTES
+        assert store.path_for(sha256).relative_to(store.root).parts[:2] == (sha256[:2], sha256[2:4])
+
+        assert store.put_bytes(PDF_BYTES) == (sha256, size)
+        assert len(list(store.root.rglob('*.pdf'))) == 1
+        assert not list(store.root.glob('*.tmp'))
+
+    def test_collect_garbage(self, store):
+        """Test unreferenced files are removed"""
+        keep, _ = store.put_bytes(b'keep')
+        drop, _ = store.put_bytes(b'drop')
+
+        assert store.collect_garbage([keep]) == 1
+        assert store.exists(keep) and not store.exists(drop)
+
+
+class TestAttachPDF:
+    """Tests for attach_pdf commit/rollback handling"""
+
+    def test_file_appears_only_after_commit(self, tmp_path, store):
+        """Test a rolled back attach leaves no file and a committed one does"""
+        from report.models import Base, ReportDB
+        from report.storage import attach_pdf
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'attach.db'}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        sha256 = hashlib.sha256(PDF_BYTES).hexdigest()
+
+        db = Session()
+        report = ReportDB(id='RPT-1', title='a', category='government', organization='KMI',
+                          published_date=date(2025, 1, 1))
+        db.add(report)
+        attach_pdf(db, report, PDF_BYTES)
+        assert not store.exists(sha256)
+        db.rollback()
+        db.close()
+
+        assert not list(store.root.rglob('*.pdf')) and not list(store.root.glob('*.tmp'))
+
+        db = Session()
+        report = ReportDB(id='RPT-1', title='a', category='government', organization='KMI',
+                          published_date=date(2025, 1, 1))
+        db.add(report)
+        attach_pdf(db, report, PDF_BYTES)
+        db.commit()
+        db.close()
+
+        assert store.path_for(sha256).read_bytes() == PDF_BYTES
+        assert not list(store.root.glob('*.tmp'))
+
+
+class TestLegacyMigration:
+    """Tests for migrate_legacy_blobs"""
+
+    def test_moves_blobs_and_adds_has_pdf(self, tmp_path, store):
+        """Test an old schema with file_bytes is migrated to the store"""
+        from report.storage import migrate_legacy_blobs
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        sha256 = hashlib.sha256(PDF_BYTES).hexdigest()
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE reports (id VARCHAR(50) PRIMARY KEY, title VARCHAR(500))"))
+            conn.execute(text(
+                "CREATE TABLE report_files (id VARCHAR(50) PRIMARY KEY, report_id VARCHAR(50), "
+                "file_name VARCHAR(500), mime_type VARCHAR(100), file_size INTEGER, "
+                "sha256 VARCHAR(64) UNIQUE, file_bytes BLOB NOT NULL, created_at DATETIME)"
+            ))
+            conn.execute(text("INSERT INTO reports VALUES ('R1', 'a'), ('R2', 'b')"))
+            conn.execute(text("INSERT INTO report_files (id, report_id, file_name, file_size, sha256, file_bytes) "
+                              "VALUES ('F1', 'R1', 'a.pdf', :size, :sha, :data)"),
+                         {"size": len(PDF_BYTES), "sha": sha256, "data": PDF_BYTES})
+
+        assert migrate_legacy_blobs(engine) == 1
+        assert store.path_for(sha256).read_bytes() == PDF_BYTES
+        assert 'file_bytes' not in {c['name'] for c in inspect(engine).get_columns('report_files')}
+        with engine.connect() as conn:
+            flags = dict(conn.execute(text("SELECT id, has_pdf FROM reports")).all())
+        assert flags == {'R1': 1, 'R2': 0}
+
+        assert migrate_legacy_blobs(engine) == 0  # 재실행 시 변경 없음
+
+
+class TestDownload:
+    """Tests for /api/reports/<id>/download and list has_pdf"""
+
+    def test_full_download_and_etag(self, report_app):
+        """Test full download carries ETag and attachment filename"""
+        client = report_app.test_client()
+        response = client.get('/api/reports/RPT-PDF/download')
+
+        assert response.status_code == 200
+        assert response.data == PDF_BYTES
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert response.headers['ETag'] == f'"{hashlib.sha256(PDF_BYTES).hexdigest()}"'
+        assert "filename*=UTF-8''" in response.headers['Content-Disposition']
+
+        cached = client.get('/api/reports/RPT-PDF/download',
+                            headers={'If-None-Match': response.headers['ETag']})
+        assert cached.status_code == 304
+        assert cached.data == b''
+
+    def test_range_request(self, report_app):
+        """Test byte ranges return 206 with the requested slice"""
+        client = report_app.test_client()
+        response = client.get('/api/reports/RPT-PDF/download', headers={'Range': 'bytes=100-199'})
+
+        assert response.status_code == 206
+        assert response.data == PDF_BYTES[100:200]
+        assert response.headers['Content-Range'] == f'bytes 100-199/{len(PDF_BYTES)}'
+
+    def test_missing_pdf(self, report_app, store):
+        """Test reports without a PDF (or with a lost file) return 404"""
+        client = report_app.test_client()
+        assert client.get('/api/reports/RPT-NOPDF/download').status_code == 404
+
+        store.delete(hashlib.sha256(PDF_BYTES).hexdigest())
+        assert client.get('/api/reports/RPT-PDF/download').status_code == 404
+
+    def test_list_uses_has_pdf_column(self, report_app):
+        """Test list items report has_pdf without loading files"""
+        items = report_app.test_client().get('/api/reports?page_size=10').get_json()['reports']
+        assert {item['id']: item['has_pdf'] for item in items} == {'RPT-PDF': True, 'RPT-NOPDF': False}
+
+    def test_delete_removes_file(self, report_app, store):
+        """Test deleting a report removes its PDF from the store"""
+        sha256 = hashlib.sha256(PDF_BYTES).hexdigest()
+        assert store.exists(sha256)
+
+        assert report_app.test_client().delete('/api/reports/RPT-PDF').status_code == 200
+        assert not store.exists(sha256)
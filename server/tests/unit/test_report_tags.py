@@ -0,0 +1,127 @@
+"""
+Unit Tests for the Report Tag Index
+Tests for report_tags sync, facet counts, exact tag filters and related-report ranking
+"""
+import pytest
+import sys
+from functools import partial
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+REPORTS = [
+    {'id': 'R1', 'title': 'Port outlook', 'category': 'global_research', 'organization': 'Drewry',
+     'published_date': '2025-01-10', 'tags': ['Port', 'Container']},
+    {'id': 'R2', 'title': 'Congestion watch', 'category': 'global_research', 'organization': 'KMI',
+     'published_date': '2025-02-10', 'tags': ['Port Congestion', 'Container']},
+    {'id': 'R3', 'title': 'Box market', 'category': 'company', 'organization': 'Drewry',
+     'published_date': '2025-03-10', 'tags': ['Container', 'Port', 'Freight']},
+    {'id': 'R4', 'title': 'Air cargo', 'category': 'government', 'organization': 'IATA',
+     'published_date': '2025-04-10', 'tags': ['Air']},
+]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """report_bp on a temp database, seeded through the create endpoint"""
+    from report import api
+    from report.models import Base, SessionLocal
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(api, 'SessionLocal', partial(SessionLocal, bind=engine))
+
+    app = Flask(__name__)
+    app.register_blueprint(api.report_bp)
+    client = app.test_client()
+    for report in REPORTS:
+        assert client.post('/api/reports', json=report).status_code == 201
+    client.engine = engine
+    return client
+
+
+def _facets(client, category=None):
+    query = {'category': category} if category else {}
+    return {t['name']: t['count'] for t in client.get('/api/reports/filters', query_string=query).get_json()['tags']}
+
+
+def _ids(client, **query):
+    return sorted(r['id'] for r in client.get('/api/reports', query_string=query).get_json()['reports'])
+
+
+class TestTagFilter:
+    """Tests for ?tags= filtering"""
+
+    def test_exact_match_and_all_tags(self, client):
+        """Test tags match exactly (no substrings) and multiple tags AND"""
+        assert _ids(client, tags='Port') == ['R1', 'R3']
+        assert _ids(client, tags='Port,Container') == ['R1', 'R3']
+        assert _ids(client, tags='Container, Freight') == ['R3']
+        assert _ids(client, tags=',') == ['R1', 'R2', 'R3', 'R4']
+
+
+class TestFacetCounts:
+    """Tests for report_tag_counts maintenance"""
+
+    def test_counts_follow_writes(self, client):
+        """Test counts update on create, tag edit, category change and delete"""
+        assert _facets(client) == {'Container': 3, 'Port': 2, 'Port Congestion': 1, 'Freight': 1, 'Air': 1}
+        assert _facets(client, 'company') == {'Container': 1, 'Port': 1, 'Freight': 1}
+
+        client.put('/api/reports/R3', json={'tags': ['Container', 'Rail']})
+        client.put('/api/reports/R1', json={'category': 'company'})
+        client.delete('/api/reports/R4')
+
+        assert _facets(client) == {'Container': 3, 'Port': 1, 'Port Congestion': 1, 'Rail': 1}
+        assert _facets(client, 'company') == {'Container': 2, 'Port': 1, 'Rail': 1}
+        assert _facets(client, 'global_research') == {'Container': 1, 'Port Congestion': 1}
+
+    def test_backfill_existing_database(self, client):
+        """Test ensure_tag_index rebuilds an empty index from reports.tags"""
+        from report.models import ReportTagCountDB, ReportTagDB
+        from report.tags import ensure_tag_index
+
+        with client.engine.begin() as conn:
+            conn.execute(ReportTagDB.__table__.delete())
+            conn.execute(ReportTagCountDB.__table__.delete())
+        assert _facets(client) == {}
+
+        ensure_tag_index(client.engine)
+        assert _facets(client)['Container'] == 3
+        assert _ids(client, tags='Port') == ['R1', 'R3']
+
+    def test_other_sessions_not_synced(self, client):
+        """Test flushes outside report.models.SessionLocal leave the tag tables alone"""
+        from datetime import date
+
+        from report.models import ReportDB, ReportTagDB
+
+        db = sessionmaker(bind=client.engine)()
+        report = ReportDB(id='R9', title='Other', category='company', organization='AAL',
+                          published_date=date(2025, 5, 10))
+        report.set_tags(['Container'])
+        db.add(report)
+        db.commit()
+        assert db.query(ReportTagDB).filter_by(report_id='R9').count() == 0
+        db.close()
+
+
+class TestRelatedReports:
+    """Tests for /api/reports/<id>/related"""
+
+    def test_ranked_by_tag_overlap(self, client):
+        """Test shared tags outrank same category/organization"""
+        related = client.get('/api/reports/R1/related').get_json()
+
+        # R3: 2 tags + same org = 10, R2: 1 tag + same category = 5, R4: nothing shared
+        assert [r['id'] for r in related] == ['R3', 'R2']
+
+    def test_limit_and_missing(self, client):
+        """Test limit applies and unknown reports return 404"""
+        assert len(client.get('/api/reports/R1/related?limit=1').get_json()) == 1
+        assert client.get('/api/reports/NOPE/related').status_code == 404
@@ -0,0 +1,132 @@
+"""
+Unit Tests for Response Encoding
+Tests for the orjson JSON provider and brotli/gzip response compression
+"""
+import gzip
+import pytest
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import DefaultJSONProvider
+
+orjson = pytest.importorskip('orjson')
+
+
+@dataclass
+class Point:
+    lat: float
+    lng: float
+
+
+SAMPLE = {
+    'b': [1, 2.5, None, True],
+    'a': {'항구': '부산', 'when': datetime(2025, 1, 2, 3, 4, 5)},
+    'price': Decimal('12.50'),
+    'point': Point(35.1, 129.0),
+}
+
+
+@pytest.fixture
+def app(tmp_path):
+    """App with JSON provider + compression and a few response shapes"""
+    from compression import init_compression
+    from json_provider import init_json_provider
+
+    app = Flask(__name__)
+    init_json_provider(app)
+    init_compression(app)
+
+    pdf = tmp_path / 'file.pdf'
+    pdf.write_bytes(b'%PDF-1.4' + b'0' * 4096)
+
+    @app.route('/big')
+    def big():
+        return jsonify({'rows': [{'route': 'Busan-LA', 'index': i} for i in range(200)]})
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify(request.get_json())
+
+    @app.route('/stream')
+    def stream():
+        return Response((f'data: {i}\n\n' * 100 for i in range(3)), mimetype='text/event-stream')
+
+    @app.route('/file')
+    def file():
+        return send_file(str(pdf))
+
+    return app
+
+
+class TestORJSONProvider:
+    """Tests for ORJSONProvider"""
+
+    def test_matches_default_provider(self, app):
+        """Test output decodes to the same value as Flask's default provider (sorted keys, HTTP dates)"""
+        default = DefaultJSONProvider(app)
+
+        with app.app_context():
+            fast = app.json.dumps(SAMPLE)
+        assert orjson.loads(fast) == orjson.loads(default.dumps(SAMPLE))
+        assert fast.index('"a"') < fast.index('"b"')
+        assert '"Thu, 02 Jan 2025 03:04:05 GMT"' in fast
+        assert '부산' in fast  # ensure_ascii 없이 UTF-8
+
+    def test_big_int_falls_back(self, app):
+        """Test values orjson rejects go through the stdlib encoder"""
+        assert app.json.dumps({'n': 2 ** 70}) == '{"n":1180591620717411303424}'
+        with pytest.raises(TypeError):
+            app.json.dumps({'x': object()})
+
+    def test_debug_indent_and_roundtrip(self, app):
+        """Test debug mode indents and request.get_json uses the provider"""
+        app.debug = True
+        client = app.test_client()
+        response = client.post('/echo', json={'z': 1, 'a': [1, 2]})
+
+        assert response.get_json() == {'a': [1, 2], 'z': 1}
+        assert response.data.startswith(b'{\n  "a"')
+
+
+class TestCompression:
+    """Tests for compress_response"""
+
+    def test_large_json_gzip(self, app):
+        """Test large JSON is gzip-compressed and decodes to the original body"""
+        client = app.test_client()
+        plain = client.get('/big')
+        encoded = client.get('/big', headers={'Accept-Encoding': 'gzip'})
+
+        assert plain.headers.get('Content-Encoding') is None
+        assert encoded.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in encoded.headers['Vary']
+        assert int(encoded.headers['Content-Length']) < len(plain.data)
+        assert gzip.decompress(encoded.data) == plain.data
+
+    def test_brotli_preferred(self, app):
+        """Test br is chosen when both are accepted and brotli is installed"""
+        brotli = pytest.importorskip('brotli')
+        response = app.test_client().get('/big', headers={'Accept-Encoding': 'gzip, br'})
+
+        assert response.headers['Content-Encoding'] == 'br'
+        assert orjson.loads(brotli.decompress(response.data))['rows'][199]['index'] == 199
+
+    def test_skipped_responses(self, app):
+        """Test small bodies, SSE streams and file responses are left alone"""
+        client = app.test_client()
+        headers = {'Accept-Encoding': 'gzip, br'}
+
+        assert client.get('/small', headers=headers).headers.get('Content-Encoding') is None
+        assert client.get('/stream', headers=headers).headers.get('Content-Encoding') is None
+        assert client.get('/file', headers=headers).headers.get('Content-Encoding') is None
@@ -0,0 +1,141 @@
+"""
+Unit Tests for the Scheduler Lease
+Tests for single-owner leases, expiry takeover and leader election across processes
+"""
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scheduler_lease import LeaderElection, SchedulerLease
+
+
+def _compete(path, ready, results):
+    """다른 프로세스에서 lease 획득 시도"""
+    lease = SchedulerLease(path, ttl_seconds=30)
+    ready.wait()
+    results.put(lease.try_acquire())
+
+
+class TestSchedulerLease:
+    """Tests for SchedulerLease"""
+
+    def test_single_owner_until_expiry(self, tmp_path):
+        """Test only one owner holds the lease and renewal keeps it"""
+        path = str(tmp_path / 'lease.db')
+        first = SchedulerLease(path, ttl_seconds=0.3, owner='a')
+        second = SchedulerLease(path, ttl_seconds=0.3, owner='b')
+
+        assert first.try_acquire()
+        assert not second.try_acquire()
+        assert first.try_acquire()  # 갱신
+        assert first.holder() == 'a'
+
+        time.sleep(0.4)
+        assert second.try_acquire()
+        assert not first.try_acquire()
+        assert second.holder() == 'b'
+
+    def test_release_hands_over_immediately(self, tmp_path):
+        """Test a released lease is available without waiting for ttl"""
+        path = str(tmp_path / 'lease.db')
+        first = SchedulerLease(path, ttl_seconds=60, owner='a')
+        second = SchedulerLease(path, ttl_seconds=60, owner='b')
+
+        assert first.try_acquire()
+        first.release()
+        assert first.holder() is None
+        assert second.try_acquire()
+
+    def test_exactly_one_process_wins(self, tmp_path):
+        """Test concurrent processes racing for the lease elect one leader"""
+        path = str(tmp_path / 'lease.db')
+        SchedulerLease(path)  # 테이블 생성
+        ctx = multiprocessing.get_context('spawn')
+        ready, results = ctx.Event(), ctx.Queue()
+        procs = [ctx.Process(target=_compete, args=(path, ready, results)) for _ in range(4)]
+        for p in procs:
+            p.start()
+        ready.set()
+        for p in procs:
+            p.join(timeout=60)
+
+        outcomes = [results.get(timeout=5) for _ in procs]
+        assert outcomes.count(True) == 1
+
+
+class TestLeaderElection:
+    """Tests for LeaderElection callbacks"""
+
+    def test_elect_demote_and_takeover(self, tmp_path):
+        """Test callbacks fire on election, loss and takeover"""
+        path = str(tmp_path / 'lease.db')
+        events = []
+        leader = LeaderElection(SchedulerLease(path, ttl_seconds=0.3, owner='a'),
+                                on_elected=lambda: events.append('a+'), on_demoted=lambda: events.append('a-'))
+        standby = LeaderElection(SchedulerLease(path, ttl_seconds=0.3, owner='b'),
+                                 on_elected=lambda: events.append('b+'), on_demoted=lambda: events.append('b-'))
+
+        leader.check()
+        standby.check()
+        assert (leader.is_leader, standby.is_leader) == (True, False)
+
+        time.sleep(0.4)  # 리더가 갱신하지 못한 채 만료
+        standby.check()
+        leader.check()
+        assert (leader.is_leader, standby.is_leader) == (False, True)
+
+        standby.stop()
+        assert events == ['a+', 'b+', 'a-', 'b-']
+        assert SchedulerLease(path, owner='c').holder() is None
+
+    def test_background_thread_renews(self, tmp_path):
+        """Test the election thread keeps the lease alive past its ttl"""
+        path = str(tmp_path / 'lease.db')
+        election = LeaderElection(SchedulerLease(path, ttl_seconds=0.3, owner='a'),
+                                  on_elected=lambda: None, on_demoted=lambda: None, interval=0.05)
+        election.start()
+        try:
+            time.sleep(0.6)
+            assert election.is_leader
+            assert not SchedulerLease(path, ttl_seconds=0.3, owner='b').try_acquire()
+        finally:
+            election.stop()
+
+
+class TestSchedulerElection:
+    """Tests for scheduler._on_elected"""
+
+    def test_initial_jobs_only_on_first_election(self, monkeypatch):
+        """Test re-election after a demotion resumes jobs without repeating the initial collection"""
+        import scheduler
+
+        calls = []
+
+        class FakeScheduler:
+            running = False
+
+            def pause(self):
+                calls.append('pause')
+
+            def resume(self):
+                calls.append('resume')
+
+        fake = FakeScheduler()
+
+        def fake_init():
+            fake.running = True
+            calls.append('init')
+
+        monkeypatch.setattr(scheduler, 'scheduler', fake)
+        monkeypatch.setattr(scheduler, 'init_scheduler', fake_init)
+        monkeypatch.setattr(scheduler, 'run_initial_jobs', lambda port: calls.append('initial'))
+
+        scheduler._on_elected(5000)
+        scheduler._on_demoted()
+        scheduler._on_elected(5000)
+
+        assert calls == ['init', 'initial', 'pause', 'resume']
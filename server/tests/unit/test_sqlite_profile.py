@@ -0,0 +1,82 @@
+"""
+Unit Tests for SQLite Connection Profile
+Tests for pragma application, shared engines and the single-writer queue
+"""
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestPragmas:
+    """Tests for connect / get_engine pragma setup"""
+
+    def test_connect_enables_wal(self, tmp_path):
+        """Test raw connections use WAL and the configured pragmas"""
+        from sqlite_profile import connect
+
+        conn = connect(str(tmp_path / 'test.db'))
+        try:
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+            assert conn.execute('PRAGMA busy_timeout').fetchone()[0] > 0
+            assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2  # MEMORY
+        finally:
+            conn.close()
+
+    def test_get_engine_is_shared_and_profiled(self, tmp_path):
+        """Test one engine per URL with pragmas applied on connect"""
+        from sqlalchemy import text
+        from sqlite_profile import get_engine
+
+        url = f"sqlite:///{tmp_path / 'engine.db'}"
+        engine = get_engine(url)
+
+        assert get_engine(url) is engine
+        with engine.connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+
+
+class TestWriteQueue:
+    """Tests for WriteQueue"""
+
+    def test_runs_on_single_thread_in_order(self):
+        """Test jobs from many threads execute sequentially on one writer thread"""
+        from sqlite_profile import WriteQueue
+
+        write_queue = WriteQueue()
+        executed = []
+        thread_names = set()
+
+        def job(n):
+            thread_names.add(threading.current_thread().name)
+            executed.append(n)
+            return n * 2
+
+        futures = [write_queue.submit(job, n) for n in range(20)]
+        assert [f.result(timeout=5) for f in futures] == [n * 2 for n in range(20)]
+        assert executed == list(range(20))
+        assert thread_names == {write_queue.name}
+
+    def test_exception_propagates(self):
+        """Test job exceptions are raised in the caller"""
+        from sqlite_profile import WriteQueue
+
+        write_queue = WriteQueue()
+
+        def fail():
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            write_queue.run(fail)
+        assert write_queue.run(lambda: 'ok') == 'ok'
+
+    def test_nested_run_does_not_deadlock(self):
+        """Test a job may submit further writes from the writer thread"""
+        from sqlite_profile import WriteQueue
+
+        write_queue = WriteQueue()
+        assert write_queue.run(lambda: write_queue.run(lambda: 42)) == 42
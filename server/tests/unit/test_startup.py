@@ -0,0 +1,129 @@
+"""
+Unit Tests for Startup
+Tests for lazy module imports, after-listen warm-up and the import footprint of main
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import startup
+from startup import LazyModule, run_after_listening, wait_for_port, warmup_status
+
+SERVER_DIR = Path(__file__).parent.parent.parent
+
+
+class TestLazyModule:
+    """lazy_module: 첫 속성 접근 때 import"""
+
+    def test_defers_import_until_attribute_access(self, tmp_path, monkeypatch):
+        (tmp_path / 'lazy_sample_mod.py').write_text("VALUE = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        sys.modules.pop('lazy_sample_mod', None)
+
+        module = LazyModule('lazy_sample_mod')
+        assert 'lazy_sample_mod' not in sys.modules
+        assert 'not loaded' in repr(module)
+
+        assert module.VALUE == 42
+        assert 'lazy_sample_mod' in sys.modules
+        assert 'lazy_sample_mod' in startup.lazy_import_timings()
+
+    def test_already_imported_module_not_timed(self):
+        module = LazyModule('json')
+        assert module.dumps([1]) == '[1]'
+        assert 'json' not in startup.lazy_import_timings()
+
+
+class TestMarkStarted:
+    """mark_started: 엔트리포인트가 명시적으로 시작 시각 기록"""
+
+    def test_first_call_wins(self, monkeypatch):
+        monkeypatch.setattr(startup, 'STARTED_AT', None)
+
+        first = startup.mark_started()
+        time.sleep(0.01)
+        assert startup.mark_started() == first
+        assert startup.uptime_seconds() >= 0.01
+
+    def test_import_does_not_record(self):
+        code = "import startup; print(startup.STARTED_AT)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=str(SERVER_DIR), capture_output=True, text=True,
+                                timeout=30)
+        assert result.stdout.strip() == 'None'
+
+
+class TestRunAfterListening:
+    """run_after_listening: 포트가 열린 뒤 워밍업 작업 실행"""
+
+    def test_waits_for_port_then_runs_in_order(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        calls = []
+
+        def failing():
+            raise RuntimeError('boom')
+
+        thread = run_after_listening(port, ('test first', lambda: calls.append('first')),
+                                     ('test failing', failing),
+                                     ('test last', lambda: calls.append('last')), timeout=5)
+        time.sleep(0.2)
+        assert calls == []
+        assert warmup_status()['test first']['status'] == 'pending'
+
+        sock.listen()
+        thread.join(5)
+        sock.close()
+
+        status = warmup_status()
+        assert calls == ['first', 'last']
+        assert status['test first']['status'] == 'done'
+        assert status['test failing']['status'] == 'failed'
+        assert 'ms' in status['test last']
+
+    def test_wait_for_port_timeout(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        assert wait_for_port(port, timeout=0.2) is False
+
+
+class TestAppStartup:
+    """import main 경로에 무거운 의존성이 없고 /api/health가 바로 응답"""
+
+    def test_import_main_defers_heavy_modules(self, tmp_path):
+        code = ("import json, sys, main; "
+                "print(json.dumps([m for m in ('pandas', 'numpy', 'google.genai', 'bs4', 'feedparser', "
+                "'reportlab', 'requests', 'gemini_backend') if m in sys.modules]))")
+        env = dict(os.environ, ECOS_API_KEY='test',
+                   DATABASE_URL=f"sqlite:///{tmp_path / 'reports.db'}",
+                   REPORT_STORE_DIR=str(tmp_path / 'report_files'))
+        result = subprocess.run([sys.executable, '-c', code], cwd=str(SERVER_DIR), env=env,
+                                capture_output=True, text=True, timeout=120)
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+    def test_health_endpoint(self):
+        from flask import Flask
+
+        from http_cache import init_http_cache
+        from static_routes import static_bp
+
+        app = Flask(__name__)
+        init_http_cache(app)
+        app.register_blueprint(static_bp)
+        response = app.test_client().get('/api/health')
+
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'no-store'
+        body = response.get_json()
+        assert body['status'] == 'ok'
+        assert {'uptime_s', 'warmup', 'lazy_imports_ms'} <= set(body)
@@ -0,0 +1,119 @@
+"""
+Unit Tests for Request Telemetry
+Tests for SQL statement counting, query budgets, external call timing and the /metrics endpoint
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import telemetry  # noqa: F401  (저장소 루트를 sys.path에 추가)
+from shared import telemetry as telemetry_core
+from telemetry import (
+    METRICS_CONTENT_TYPE, QueryBudgetExceeded, count_queries, external_call, init_telemetry,
+    normalize_statement, query_budget, render_metrics, trace_statement,
+)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    from flask import Flask, jsonify
+
+    monkeypatch.setattr(telemetry_core, 'QUERY_BUDGET_ENFORCE', True)
+    engine = create_engine('sqlite://')
+
+    app = Flask(__name__)
+    init_telemetry(app)
+
+    @app.route('/items/<int:item_id>')
+    @query_budget(2)
+    def get_item(item_id):
+        with engine.connect() as conn:
+            for _ in range(item_id):
+                conn.execute(text('SELECT 1'))
+        return jsonify({'id': item_id})
+
+    return app
+
+
+class TestStatementCounting:
+    """SQLAlchemy 이벤트와 sqlite3 trace callback으로 SQL 문 수 집계"""
+
+    def test_counts_sqlalchemy_statements(self):
+        engine = create_engine('sqlite://')
+        with count_queries() as stats:
+            with engine.connect() as conn:
+                conn.execute(text('SELECT 1'))
+                conn.execute(text('SELECT 2'))
+        assert stats.statements == 2
+        assert stats.sql_seconds > 0
+
+    def test_counts_raw_sqlite_statements(self):
+        conn = sqlite3.connect(':memory:')
+        conn.set_trace_callback(trace_statement)
+        with count_queries() as stats:
+            conn.execute('CREATE TABLE t (id INTEGER)')
+            conn.execute('SELECT * FROM t')
+        conn.close()
+        assert stats.statements == 2
+
+    def test_normalize_collapses_in_lists(self):
+        statement = 'SELECT *\n  FROM ports WHERE code IN (?, ?, ?)'
+        assert normalize_statement(statement) == 'SELECT * FROM ports WHERE code IN (?...)'
+
+
+class TestRequestTelemetry:
+    """요청 훅: Server-Timing, 라우트 라벨, query_budget"""
+
+    def test_server_timing_and_route_label(self, app):
+        response = app.test_client().get('/items/1')
+
+        assert response.status_code == 200
+        assert 'db;dur=' in response.headers['Server-Timing']
+        assert 'desc="1 statements"' in response.headers['Server-Timing']
+        assert 'route="/items/<int:item_id>"' in render_metrics()
+
+    def test_budget_exceeded_raises_when_enforced(self, app):
+        app.config['PROPAGATE_EXCEPTIONS'] = True
+        with pytest.raises(QueryBudgetExceeded):
+            app.test_client().get('/items/3')
+
+    def test_budget_exceeded_logs_when_not_enforced(self, app, monkeypatch, caplog):
+        monkeypatch.setattr(telemetry_core, 'QUERY_BUDGET_ENFORCE', False)
+        response = app.test_client().get('/items/3')
+
+        assert response.status_code == 200
+        assert 'budget 2' in caplog.text
+        assert 'db_query_budget_exceeded_total{route="/items/<int:item_id>"}' in render_metrics()
+
+    def test_metrics_endpoint(self, app):
+        app.test_client().get('/items/1')
+        response = app.test_client().get('/metrics')
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == METRICS_CONTENT_TYPE
+        body = response.get_data(as_text=True)
+        assert '# TYPE http_request_duration_seconds histogram' in body
+        assert 'http_requests_total{method="GET",route="/items/<int:item_id>",status="200"}' in body
+
+
+class TestExternalCall:
+    """external_call: 외부 API 호출 시간/오류"""
+
+    def test_records_duration_and_errors(self):
+        with count_queries() as stats:
+            with external_call('test-ok'):
+                pass
+            with pytest.raises(RuntimeError):
+                with external_call('test-fail'):
+                    raise RuntimeError('timeout')
+
+        assert {'test-ok', 'test-fail'} <= set(stats.external)
+        body = render_metrics()
+        assert 'external_request_duration_seconds_count{service="test-ok"} 1' in body
+        assert 'external_request_errors_total{service="test-fail"} 1' in body
@@ -0,0 +1,105 @@
+"""
+Unit Tests for Time Series Chart Helpers
+Tests for LTTB downsampling, period parsing and ChartCache
+"""
+import sys
+import math
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+class TestLTTB:
+    """Tests for lttb_indices / downsample_rows"""
+
+    def test_keeps_endpoints_and_count(self):
+        """Test LTTB returns exactly max_points indices including both endpoints"""
+        from timeseries import lttb_indices
+
+        x = list(range(1000))
+        y = [math.sin(i / 20.0) for i in x]
+        indices = list(lttb_indices(x, y, 100))
+
+        assert len(indices) == 100
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert indices == sorted(set(indices))
+
+    def test_preserves_spike(self):
+        """Test a single extreme point survives downsampling"""
+        from timeseries import lttb_indices
+
+        y = [1.0] * 500
+        y[250] = 100.0
+        indices = list(lttb_indices(list(range(500)), y, 20))
+
+        assert 250 in indices
+
+    def test_no_downsampling_when_small(self):
+        """Test rows are returned untouched when under max_points or max_points is None"""
+        from timeseries import downsample_rows
+
+        rows = [{'d': f'2025-01-{i + 1:02d}', 'v': i} for i in range(10)]
+        assert downsample_rows(rows, 'd', 'v', 20) is rows
+        assert downsample_rows(rows, 'd', 'v', None) is rows
+
+    def test_downsample_rows(self):
+        """Test dict rows are downsampled on date ordinals"""
+        from timeseries import downsample_rows
+
+        start = date(2020, 1, 1)
+        rows = [{'d': (start + timedelta(days=i)).isoformat(), 'v': i % 7} for i in range(365)]
+        result = downsample_rows(rows, 'd', 'v', 50)
+
+        assert len(result) == 50
+        assert result[0] is rows[0]
+        assert result[-1] is rows[-1]
+
+
+class TestPeriodStartDate:
+    """Tests for period_start_date"""
+
+    def test_periods(self):
+        from timeseries import period_start_date
+
+        end = date(2025, 6, 30)
+        assert period_start_date('1W', end) == end - timedelta(days=7)
+        assert period_start_date('1Y', end) == end - timedelta(days=365)
+        assert period_start_date('ALL', end) == date(2000, 1, 1)
+        assert period_start_date('unknown', end) == end - timedelta(days=180)
+
+
+class TestChartCache:
+    """Tests for ChartCache"""
+
+    def test_get_set_invalidate(self):
+        """Test namespace invalidation only drops that namespace"""
+        from timeseries import ChartCache
+
+        cache = ChartCache()
+        cache.set('a', 'k', {'x': 1})
+        cache.set('b', 'k', {'x': 2})
+
+        assert cache.get('a', 'k') == {'x': 1}
+        assert cache.invalidate('a') == 1
+        assert cache.get('a', 'k') is None
+        assert cache.get('b', 'k') == {'x': 2}
+
+    def test_ttl_and_max_entries(self, monkeypatch):
+        """Test expired entries are dropped and oldest entries are evicted"""
+        import timeseries
+
+        cache = timeseries.ChartCache(ttl_seconds=10, max_entries=2)
+        now = [1000.0]
+        monkeypatch.setattr(timeseries.time, 'time', lambda: now[0])
+
+        cache.set('n', 1, 'one')
+        cache.set('n', 2, 'two')
+        cache.set('n', 3, 'three')
+        assert cache.get('n', 1) is None
+        assert cache.stats()['entries'] == 2
+
+        now[0] += 11
+        assert cache.get('n', 2) is None
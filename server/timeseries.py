@@ -0,0 +1,159 @@
+"""
+Time Series Chart Helpers
+차트 엔드포인트용 시계열 다운샘플링 및 응답 캐시
+
+- lttb_indices: LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 (NumPy)
+- ChartCache: 기간별 차트 응답 캐시 (데이터 임포트/수집 시 네임스페이스 단위 무효화)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, Hashable, Optional, Sequence
+
+from startup import lazy_module
+
+# NumPy는 첫 다운샘플링 때 import (캐시 히트/짧은 구간 응답은 NumPy 없이 처리)
+np = lazy_module('numpy')
+
+# max_points 하한 (첫/끝 점 + 최소 1개 버킷)
+MIN_POINTS = 3
+
+# 차트 캐시 기본 설정
+CHART_CACHE_TTL = 3600  # 1시간 (다른 프로세스에서 임포트한 경우 대비)
+CHART_CACHE_MAX_ENTRIES = 256
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], max_points: int) -> 'np.ndarray':
+    """
+    LTTB 알고리즘으로 남길 점의 인덱스를 선택합니다.
+
+    첫 점과 마지막 점은 항상 유지하고, 나머지는 (max_points - 2)개 버킷으로 나눠
+    이전 선택점·다음 버킷 평균점과 만드는 삼각형 넓이가 가장 큰 점을 고릅니다.
+
+    Args:
+        x: X 좌표 (오름차순, 예: 날짜 ordinal)
+        y: Y 값
+        max_points: 반환할 최대 점 개수
+
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(y)
+    if max_points >= n or n <= MIN_POINTS:
+        return np.arange(n)
+    max_points = max(max_points, MIN_POINTS)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # 버킷 경계 (첫/끝 점 제외한 구간을 균등 분할)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # 다음 버킷의 평균점 (마지막 버킷이면 끝 점)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs(
+            (x[prev] - avg_x) * (bucket_y - y[prev]) -
+            (x[prev] - bucket_x) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def downsample_rows(rows: list, date_key: str, value_key: str, max_points: Optional[int]) -> list:
+    """
+    dict 행 목록을 LTTB로 다운샘플링합니다 (날짜 오름차순 가정).
+
+    Args:
+        rows: 시계열 행 목록
+        date_key: ISO 날짜 필드명 (YYYY-MM-DD)
+        value_key: 값 필드명
+        max_points: 최대 점 개수 (None이면 그대로 반환)
+    """
+    if not max_points or len(rows) <= max_points:
+        return rows
+
+    x = [date.fromisoformat(str(r[date_key])[:10]).toordinal() for r in rows]
+    y = [r[value_key] or 0 for r in rows]
+    return [rows[i] for i in lttb_indices(x, y, max_points)]
+
+
+def period_start_date(period: str, end_date: date) -> date:
+    """기간 코드(1W, 1M, 3M, 6M, 1Y, ALL/MAX)를 시작일로 변환합니다 (기본 6M)."""
+    days = {'1W': 7, '1M': 30, '3M': 90, '6M': 180, '1Y': 365}
+    if period in ('ALL', 'MAX'):
+        return date(2000, 1, 1)
+    return end_date - timedelta(days=days.get(period, 180))
+
+
+class ChartCache:
+    """
+    차트 응답 캐시.
+
+    네임스페이스(예: 'shipping_indices', 'kcci') 단위로 무효화하며,
+    TTL과 최대 항목 수로 크기를 제한합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = CHART_CACHE_TTL, max_entries: int = CHART_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[(namespace, key)]
+                return None
+            self._entries.move_to_end((namespace, key))
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[(namespace, key)] = (value, time.time())
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """네임스페이스(없으면 전체)의 캐시를 비우고 삭제된 항목 수를 반환합니다."""
+        with self._lock:
+            if namespace is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            keys = [k for k in self._entries if k[0] == namespace]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'max_entries': self.max_entries}
+
+
+# 전역 차트 캐시
+chart_cache = ChartCache()
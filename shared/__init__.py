@@ -0,0 +1,11 @@
+"""
+Shared - 두 백엔드(server, quote_backend)가 함께 쓰는 모듈
+
+- shared.telemetry: 요청별 SQL 문 수/지연시간 집계, query_budget, Prometheus 렌더링
+- shared.sqlite_profile: SQLite 연결 PRAGMA 프로파일, 엔진 재사용, 단일 writer 큐(WriteQueue)
+- shared.benchmark_harness: 벤치마크 시나리오 측정/저장/기준선 비교
+
+각 앱은 자기 디렉토리에서 실행되므로 저장소 루트를 sys.path에 추가한 뒤 import합니다
+(server/telemetry.py, server/sqlite_profile.py, quote_backend/telemetry.py, quote_backend/database.py,
+각 앱의 benchmarks/__init__.py).
+"""
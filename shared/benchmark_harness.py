@@ -0,0 +1,239 @@
+"""
+Benchmark Harness
+각 앱 benchmarks.suite의 시나리오 실행, JSON 기준선(baseline) 저장, 두 결과 비교를 담당합니다.
+앱별로 다른 것은 합성 데이터(benchmarks/generators.py)와 시나리오(benchmarks/suite.py)뿐입니다.
+
+    @scenario('gdelt.parse_export', 'GDELT export 파일 하나 파싱')              # server
+    def parse_export(ctx):
+        return lambda: parse_gdelt_events(ctx.export_file)   # 반복 측정할 호출
+
+    @scenario('api.bidding_list', 'GET /api/bidding/list')                      # quote_backend
+    def bidding_list(ctx):
+        return lambda: ctx.client.get('/api/bidding/list?limit=100')
+
+- 시나리오 함수는 준비 작업을 마친 뒤 인자 없는 호출을 돌려주고, 하네스가 warmup 후 repeat번 측정
+- 호출마다 SQL 문 수를 함께 기록 (shared.telemetry.count_queries, HTTP 응답은 Server-Timing 헤더)
+- 결과 JSON에는 scale/seed/repeat와 실행 환경(Python, CPU 수, git 커밋)이 함께 저장됨
+- compare: 시나리오별 median 변화율이 threshold를 넘거나 SQL 문 수가 늘면 회귀로 표시 (종료 코드 1)
+"""
+
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_THRESHOLD = 0.20     # median 20% 이상 변화를 회귀/개선으로 판단 (같은 머신에서도 ±10%는 흔함)
+MIN_DELTA_MS = 0.5           # 이보다 작은 절대 변화는 측정 잡음으로 간주
+
+_STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+
+class Scenario:
+    def __init__(self, name: str, description: str, setup: Callable):
+        self.name = name
+        self.description = description
+        self.setup = setup
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str) -> Callable:
+    """시나리오 등록 데코레이터 (setup(ctx) → 측정할 인자 없는 호출)"""
+    def register(setup):
+        SCENARIOS[name] = Scenario(name, description, setup)
+        return setup
+    return register
+
+
+def _statements(result, stats) -> int:
+    """HTTP 응답이면 Server-Timing의 SQL 문 수, 아니면 블록 안에서 센 값"""
+    headers = getattr(result, 'headers', None)
+    if headers is not None:
+        match = _STATEMENTS.search(headers.get('Server-Timing', ''))
+        if match:
+            return int(match.group(1))
+    return stats.statements
+
+
+def _check(result, name: str):
+    status = getattr(result, 'status_code', 200)
+    if status >= 400:
+        raise RuntimeError(f"{name}: HTTP {status}")
+
+
+def measure(name: str, call: Callable, repeat: int, warmup: int = 1) -> Dict:
+    """warmup 후 repeat번 실행한 ms 분포와 호출당 SQL 문 수"""
+    from shared.telemetry import count_queries  # QUERY_BUDGET_ENFORCE 등은 suite가 환경 변수를 정한 뒤 import
+
+    for _ in range(warmup):
+        _check(call(), name)
+
+    timings = []
+    statements = 0
+    for _ in range(repeat):
+        with count_queries() as stats:
+            started = time.perf_counter()
+            result = call()
+            elapsed = time.perf_counter() - started
+        _check(result, name)
+        timings.append(elapsed * 1000)
+        statements = _statements(result, stats)
+
+    timings.sort()
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        'min_ms': round(timings[0], 3),
+        'max_ms': round(timings[-1], 3),
+        'runs': len(timings),
+        'statements': statements,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                timeout=10, cwd=str(Path(__file__).parent))
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': _git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def run(suite: str, ctx, names: List[str], params: Dict, repeat: int, log=print) -> Dict:
+    results = {}
+    for name in names:
+        item = SCENARIOS[name]
+        call = item.setup(ctx)
+        results[name] = measure(name, call, repeat)
+        log(f"  {name:<40}{results[name]['median_ms']:>10.3f} ms  ({results[name]['statements']} SQL)")
+    return {'suite': suite, 'params': dict(params, repeat=repeat), 'environment': environment(),
+            'scenarios': results}
+
+
+def save(result: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def load(path: Path) -> Dict:
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def compare(base: Dict, new: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """시나리오별 median/SQL 문 수 비교 (status: regressed/improved/same/added/removed)"""
+    rows = []
+    for name in sorted(set(base['scenarios']) | set(new['scenarios'])):
+        before = base['scenarios'].get(name)
+        after = new['scenarios'].get(name)
+        if before is None or after is None:
+            rows.append({'scenario': name, 'status': 'added' if before is None else 'removed',
+                         'base_ms': before and before['median_ms'], 'new_ms': after and after['median_ms']})
+            continue
+
+        delta = after['median_ms'] - before['median_ms']
+        change = delta / before['median_ms'] if before['median_ms'] else 0.0
+        more_sql = after.get('statements', 0) > before.get('statements', 0)
+        if more_sql or (change > threshold and delta > MIN_DELTA_MS):
+            status = 'regressed'
+        elif change < -threshold and -delta > MIN_DELTA_MS:
+            status = 'improved'
+        else:
+            status = 'same'
+        rows.append({
+            'scenario': name, 'status': status,
+            'base_ms': before['median_ms'], 'new_ms': after['median_ms'], 'change': round(change, 4),
+            'base_statements': before.get('statements'), 'new_statements': after.get('statements'),
+        })
+    return rows
+
+
+def print_comparison(base: Dict, new: Dict, rows: List[Dict], threshold: float):
+    if base.get('params') != new.get('params'):
+        print(f"warning: parameters differ ({base.get('params')} vs {new.get('params')})")
+    base_env, new_env = base.get('environment', {}), new.get('environment', {})
+    print(f"base: {base_env.get('git_commit')} {base_env.get('created_at')}   "
+          f"new: {new_env.get('git_commit')} {new_env.get('created_at')}   threshold ±{threshold:.0%}\n")
+    print(f"{'scenario':<40}{'base_ms':>11}{'new_ms':>11}{'change':>9}{'sql':>11}  status")
+    for row in rows:
+        if 'change' not in row:
+            print(f"{row['scenario']:<40}{str(row['base_ms']):>11}{str(row['new_ms']):>11}{'':>9}{'':>11}  {row['status']}")
+            continue
+        sql = f"{row['base_statements']}→{row['new_statements']}"
+        print(f"{row['scenario']:<40}{row['base_ms']:>11.3f}{row['new_ms']:>11.3f}{row['change']:>+9.1%}{sql:>11}"
+              f"  {row['status']}")
+
+
+def main(suite: str, scales: Dict[str, Dict], build_context: Callable, default_output: Path, argv=None):
+    """python -m benchmarks.suite {run,compare,list} 공통 CLI"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=f"{suite} benchmark suite")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run scenarios and write a JSON baseline")
+    run_parser.add_argument('--scale', choices=sorted(scales), default='small')
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--repeat', type=int, default=20)
+    run_parser.add_argument('--only', action='append', default=[], help="scenario name prefix (repeatable)")
+    run_parser.add_argument('--output', type=Path, default=None,
+                            help=f"result path (default: {default_output}/<scale>-<commit>.json)")
+    run_parser.add_argument('--json', action='store_true', help="print the result JSON to stdout")
+
+    compare_parser = commands.add_parser('compare', help="diff two result files")
+    compare_parser.add_argument('base', type=Path)
+    compare_parser.add_argument('new', type=Path)
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument('--json', action='store_true')
+
+    commands.add_parser('list', help="list scenarios")
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for item in SCENARIOS.values():
+            print(f"{item.name:<40}{item.description}")
+        return
+
+    if args.command == 'compare':
+        base, new = load(args.base), load(args.new)
+        rows = compare(base, new, args.threshold)
+        if args.json:
+            print(json.dumps({'threshold': args.threshold, 'scenarios': rows}, indent=2, ensure_ascii=False))
+        else:
+            print_comparison(base, new, rows, args.threshold)
+        if any(row['status'] == 'regressed' for row in rows):
+            sys.exit(1)
+        return
+
+    names = [name for name in SCENARIOS if not args.only or any(name.startswith(p) for p in args.only)]
+    if not names:
+        parser.error(f"no scenario matches {args.only}")
+    params = dict(scales[args.scale], scale=args.scale, seed=args.seed)
+    log = (lambda message: print(message, file=sys.stderr)) if args.json else print
+
+    log(f"{suite}: scale={args.scale} seed={args.seed} repeat={args.repeat}")
+    with build_context(scales[args.scale], args.seed) as ctx:
+        result = run(suite, ctx, names, params, args.repeat, log=log)
+
+    output = args.output or default_output / f"{args.scale}-{result['environment']['git_commit'] or 'local'}.json"
+    save(result, output)
+    log(f"saved {output}")
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -0,0 +1,164 @@
+"""
+SQLite Connection Profile
+SQLite 연결 공통 설정 및 단일 writer 큐 (server, quote_backend 공용)
+
+- apply_pragmas: WAL, synchronous=NORMAL, busy_timeout, mmap/cache, temp_store=MEMORY
+- connect: 프로파일이 적용된 sqlite3 연결 (raw SQL 엔드포인트용, 실행한 문은 telemetry에 집계)
+- get_engine: 프로파일이 적용된 SQLAlchemy 엔진 (URL별 1개 재사용)
+- WriteQueue: 데이터베이스별 단일 writer 스레드 (스케줄러/수집 쓰기 직렬화)
+
+WAL 모드에서는 읽기가 쓰기를 막지 않으므로, 쓰기만 한 스레드로 모으면
+"database is locked" 없이 읽기/쓰기를 동시에 처리할 수 있습니다.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+from shared.telemetry import trace_statement
+
+logger = logging.getLogger(__name__)
+
+# 연결 시 적용할 PRAGMA (순서 유지: journal_mode를 먼저 설정)
+SQLITE_PRAGMAS: Tuple[Tuple[str, Any], ...] = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('busy_timeout', int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))),
+    ('mmap_size', 256 * 1024 * 1024),   # 256MB
+    ('cache_size', -64 * 1024),         # 음수 = KiB 단위 (64MB)
+    ('temp_store', 'MEMORY'),
+)
+
+
+def apply_pragmas(dbapi_connection, pragmas: Tuple[Tuple[str, Any], ...] = SQLITE_PRAGMAS):
+    """
+    DB-API 연결에 PRAGMA를 적용합니다.
+
+    메모리 DB(:memory:)는 WAL을 지원하지 않으므로 journal_mode는 'memory'로 남습니다.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """프로파일이 적용된 sqlite3 연결을 반환합니다."""
+    conn = sqlite3.connect(db_path, **kwargs)
+    apply_pragmas(conn)
+    conn.set_trace_callback(trace_statement)  # 요청별 SQL 문 수 (telemetry)
+    return conn
+
+
+def configure_engine(engine: Engine) -> Engine:
+    """SQLite 엔진이면 새 연결마다 PRAGMA를 적용하도록 등록합니다."""
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', lambda dbapi_conn, _record: apply_pragmas(dbapi_conn))
+    return engine
+
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(database_url: str, **kwargs) -> Engine:
+    """
+    URL별 엔진을 한 번만 생성해 재사용합니다.
+
+    세션마다 엔진을 새로 만들면 연결 풀이 매번 버려지고 PRAGMA도 다시 적용되므로,
+    get_session() 계열 함수는 이 엔진을 공유합니다.
+    """
+    engine = _engines.get(database_url)
+    if engine is not None:
+        return engine
+
+    with _engines_lock:
+        engine = _engines.get(database_url)
+        if engine is None:
+            if database_url.startswith('sqlite'):
+                connect_args = kwargs.pop('connect_args', {})
+                connect_args.setdefault('check_same_thread', False)
+                kwargs['connect_args'] = connect_args
+            engine = configure_engine(create_engine(database_url, **kwargs))
+            _engines[database_url] = engine
+    return engine
+
+
+class WriteQueue:
+    """
+    단일 writer 스레드.
+
+    제출된 쓰기 작업을 한 스레드에서 순서대로 실행하므로 같은 데이터베이스에
+    동시에 두 개의 쓰기 트랜잭션이 열리지 않습니다.
+    writer 스레드 안에서 다시 제출하면 (중첩 호출) 즉시 실행합니다.
+    """
+
+    def __init__(self, name: str = 'sqlite-writer'):
+        self.name = name
+        self._queue: "queue.Queue[Tuple[Callable, tuple, dict, Future]]" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _worker(self):
+        while True:
+            fn, args, kwargs, future = self._queue.get()
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """쓰기 작업을 큐에 넣고 Future를 반환합니다."""
+        future: Future = Future()
+        if threading.current_thread() is self._thread:
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        self._ensure_started()
+        self._queue.put((fn, args, kwargs, future))
+        return future
+
+    def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """쓰기 작업을 실행하고 완료될 때까지 기다립니다 (예외는 호출자에게 전달)."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+_write_queues: Dict[str, WriteQueue] = {}
+_write_queues_lock = threading.Lock()
+
+
+def get_write_queue(database_url: str) -> WriteQueue:
+    """데이터베이스(URL 또는 파일 경로)별 WriteQueue를 반환합니다."""
+    with _write_queues_lock:
+        write_queue = _write_queues.get(database_url)
+        if write_queue is None:
+            write_queue = WriteQueue(name=f"sqlite-writer-{len(_write_queues) + 1}")
+            _write_queues[database_url] = write_queue
+        return write_queue
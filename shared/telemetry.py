@@ -0,0 +1,334 @@
+"""
+Request Telemetry (공용 코어)
+요청별 지연시간, SQL 문 수/시간, 외부 호출 시간을 기록하고 Prometheus 텍스트 형식으로 렌더링합니다.
+프레임워크 연동(요청 시작/끝에서 RequestStats 설정, /metrics 라우트)은 각 앱의 telemetry.py에 있습니다.
+
+    - server/telemetry.py: init_telemetry(app)  (Flask before/after_request)
+    - quote_backend/telemetry.py: TelemetryMiddleware  (ASGI)
+
+    @query_budget(6)                 # 이 라우트의 SQL 문 상한
+    def get_bidding_list(...): ...
+
+    with external_call('ecos'):      # 외부 호출 시간
+        response = requests.get(url, timeout=API_TIMEOUT)
+
+- SQL: SQLAlchemy before/after_cursor_execute 이벤트(모든 엔진) + trace_statement
+  (sqlite3 trace callback용, 시간 없이 개수만)
+- 라우트 라벨은 URL 규칙/경로 템플릿이므로 값별로 시계열이 늘어나지 않음
+- 가장 느린 SQL 문 TELEMETRY_SLOW_STATEMENTS개를 프로세스별로 보관 (db_slowest_statement_seconds)
+- query_budget을 넘으면 경고 로그 + db_query_budget_exceeded_total, QUERY_BUDGET_ENFORCE
+  (기본: TESTING 값)이면 QueryBudgetExceeded를 발생시켜 테스트를 실패시킴
+- Server-Timing 헤더 값(app/db/외부 호출)은 server_timing()으로 만듦
+
+집계는 프로세스별입니다 (워커마다 /metrics가 다름).
+"""
+
+import bisect
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 프로세스별로 보관할 가장 느린 SQL 문 개수
+TELEMETRY_SLOW_STATEMENTS = int(os.getenv('TELEMETRY_SLOW_STATEMENTS', '10'))
+# query_budget 초과 시 예외 (기본: 테스트 환경(TESTING=true)에서만, 운영은 경고 로그)
+QUERY_BUDGET_ENFORCE = os.getenv('QUERY_BUDGET_ENFORCE', os.getenv('TESTING', 'false')).lower() == 'true'
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+EXTERNAL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+NO_ROUTE = '<unmatched>'
+BACKGROUND = '<background>'  # 스케줄러/수집/outbox 스레드 (요청 밖)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """라우트가 선언한 SQL 문 상한을 넘음 (QUERY_BUDGET_ENFORCE일 때)"""
+
+
+class RequestStats:
+    """요청 하나 동안 누적되는 값"""
+
+    __slots__ = ('route', 'statements', 'sql_seconds', 'external')
+
+    def __init__(self, route: str = NO_ROUTE):
+        self.route = route
+        self.statements = 0
+        self.sql_seconds = 0.0
+        self.external: Dict[str, float] = {}
+
+
+_current: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar('request_stats', default=None)
+
+
+# ============================================================
+# Metric types (Prometheus text exposition format 0.0.4)
+# ============================================================
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple = (), amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Tuple = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_labels(self.labelnames, labels)} {value:g}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: Dict[Tuple, list] = {}  # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, labels: Tuple) -> int:
+        series = self._series.get(labels)
+        return series[-1] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, series):
+                    cumulative += bucket_count
+                    le = _labels(self.labelnames, labels, f'le="{bound:g}"')
+                    lines.append(f'{self.name}_bucket{le} {cumulative}')
+                le = _labels(self.labelnames, labels, 'le="+Inf"')
+                lines.append(f'{self.name}_bucket{le} {series[-1]}')
+                lines.append(f'{self.name}_sum{_labels(self.labelnames, labels)} {series[-2]:.6f}')
+                lines.append(f'{self.name}_count{_labels(self.labelnames, labels)} {series[-1]}')
+        return lines
+
+
+REQUEST_DURATION = Histogram('http_request_duration_seconds', 'Request latency by route',
+                             ('method', 'route'), LATENCY_BUCKETS)
+REQUESTS_TOTAL = Counter('http_requests_total', 'Requests by route and status', ('method', 'route', 'status'))
+REQUEST_STATEMENTS = Histogram('db_statements_per_request', 'SQL statements executed per request',
+                               ('method', 'route'), STATEMENT_COUNT_BUCKETS)
+STATEMENTS_TOTAL = Counter('db_statements_total', 'SQL statements by route', ('route',))
+STATEMENT_SECONDS = Counter('db_statement_seconds_total', 'Time spent in SQL statements by route', ('route',))
+BUDGET_EXCEEDED = Counter('db_query_budget_exceeded_total', 'Requests over their declared query budget', ('route',))
+EXTERNAL_DURATION = Histogram('external_request_duration_seconds', 'Outbound API call latency',
+                              ('service',), EXTERNAL_BUCKETS)
+EXTERNAL_ERRORS = Counter('external_request_errors_total', 'Outbound API calls that raised', ('service',))
+
+METRICS = (REQUEST_DURATION, REQUESTS_TOTAL, REQUEST_STATEMENTS, STATEMENTS_TOTAL, STATEMENT_SECONDS,
+           BUDGET_EXCEEDED, EXTERNAL_DURATION, EXTERNAL_ERRORS)
+
+
+# ============================================================
+# Slowest statements
+# ============================================================
+
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER_LIST = re.compile(r'\((?:\s*(?:\?|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|:\w+)\s*\)')
+
+_slowest: Dict[Tuple[str, str], float] = {}  # (route, statement) -> 가장 느린 시간
+_slowest_floor = 0.0  # 목록이 찼을 때 들어오려면 넘어야 하는 시간
+_slowest_lock = threading.Lock()
+
+
+def normalize_statement(statement: str, limit: int = 300) -> str:
+    """공백 정리 + IN (?, ?, ?) 목록을 (?...)로 (같은 문이 매개변수 수마다 따로 잡히지 않도록)"""
+    statement = _PLACEHOLDER_LIST.sub('(?...)', _WHITESPACE.sub(' ', statement).strip())
+    return statement[:limit]
+
+
+def _record_slow(seconds: float, route: str, statement: str):
+    global _slowest_floor
+    if TELEMETRY_SLOW_STATEMENTS <= 0 or seconds <= _slowest_floor:
+        return
+    key = (route, normalize_statement(statement))
+    with _slowest_lock:
+        if seconds <= _slowest.get(key, 0.0):
+            return
+        _slowest[key] = seconds
+        if len(_slowest) > TELEMETRY_SLOW_STATEMENTS:
+            del _slowest[min(_slowest, key=_slowest.get)]
+        if len(_slowest) >= TELEMETRY_SLOW_STATEMENTS:
+            _slowest_floor = min(_slowest.values())
+
+
+def slowest_statements() -> List[Dict]:
+    """가장 느린 SQL 문 (느린 순)"""
+    with _slowest_lock:
+        entries = sorted(_slowest.items(), key=lambda item: item[1], reverse=True)
+    return [{'seconds': round(seconds, 6), 'route': route, 'statement': statement}
+            for (route, statement), seconds in entries]
+
+
+# ============================================================
+# Recording
+# ============================================================
+
+def record_statement(statement: str, seconds: Optional[float] = None):
+    """SQL 문 하나 기록 (seconds=None: 시간을 알 수 없는 raw sqlite3 문)"""
+    stats = _current.get()
+    route = stats.route if stats is not None else BACKGROUND
+    if stats is not None:
+        stats.statements += 1
+        if seconds is not None:
+            stats.sql_seconds += seconds
+    STATEMENTS_TOTAL.inc((route,))
+    if seconds is not None:
+        STATEMENT_SECONDS.inc((route,), seconds)
+        _record_slow(seconds, route, statement)
+
+
+def trace_statement(statement: str):
+    """sqlite3.Connection.set_trace_callback용"""
+    record_statement(statement)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('telemetry_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('telemetry_started')
+    if started:
+        record_statement(statement, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    started = conn.info.get('telemetry_started') if conn is not None else None
+    if started:
+        record_statement(exception_context.statement or '', time.perf_counter() - started.pop())
+
+
+_listening = False
+_listen_lock = threading.Lock()
+
+
+def instrument_sqlalchemy():
+    """모든 SQLAlchemy 엔진의 SQL 문을 기록 (여러 번 호출해도 한 번만 등록)"""
+    global _listening
+    with _listen_lock:
+        if _listening:
+            return
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+        _listening = True
+
+
+@contextmanager
+def external_call(service: str):
+    """외부 호출 시간 기록 (service: 'ecos', 'gdelt', 'gemini', 'smtp' 등)"""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_ERRORS.inc((service,))
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        EXTERNAL_DURATION.observe((service,), seconds)
+        stats = _current.get()
+        if stats is not None:
+            stats.external[service] = stats.external.get(service, 0.0) + seconds
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 실행된 SQL 문 수/시간 (테스트용, 요청 밖에서도 사용 가능)"""
+    instrument_sqlalchemy()
+    parent = _current.get()
+    stats = RequestStats(parent.route if parent is not None else NO_ROUTE)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        if parent is not None:
+            parent.statements += stats.statements
+            parent.sql_seconds += stats.sql_seconds
+
+
+def query_budget(max_statements: int) -> Callable:
+    """뷰 함수의 요청당 SQL 문 상한 선언 (라우트 데코레이터 아래에 둡니다)"""
+    def decorator(view):
+        view._query_budget = max_statements
+        return view
+    return decorator
+
+
+def check_query_budget(view, stats: RequestStats, method: str):
+    budget = getattr(view, '_query_budget', None)
+    if budget is None or stats.statements <= budget:
+        return
+    BUDGET_EXCEEDED.inc((stats.route,))
+    message = f"{method} {stats.route} executed {stats.statements} SQL statements (budget {budget})"
+    if QUERY_BUDGET_ENFORCE:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+def server_timing(stats: RequestStats, total_seconds: float) -> str:
+    parts = [f'app;dur={total_seconds * 1000:.1f}',
+             f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.statements} statements"']
+    parts.extend(f'{service};dur={seconds * 1000:.1f}' for service, seconds in sorted(stats.external.items()))
+    return ', '.join(parts)
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    lines.append('# HELP db_slowest_statement_seconds Slowest SQL statements seen by this process')
+    lines.append('# TYPE db_slowest_statement_seconds gauge')
+    for entry in slowest_statements():
+        labels = _labels(('route', 'statement'), (entry['route'], entry['statement']))
+        lines.append(f"db_slowest_statement_seconds{labels} {entry['seconds']:.6f}")
+    return '\n'.join(lines) + '\n'